@@ -1,10 +1,13 @@
 """Google Document AI extraction module for NewEvolveo3pro."""
 
+import hashlib
 import json
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from src.core.ocr_recorder import get_ocr_recorder
+
 try:
     from google.cloud import documentai
     DOCAI_AVAILABLE = True
@@ -51,28 +54,40 @@ def process_with_docai(pdf_path: str, processor_type: str = "form") -> Optional[
             missing.append(processor_map[processor_type])
         raise ValueError(f"Missing environment variables: {missing}")
     
-    # Initialize client
-    client = documentai.DocumentProcessorServiceClient()
-    name = client.processor_path(project_id, location, processor_id)
+    name = documentai.DocumentProcessorServiceClient.processor_path(
+        project_id, location, processor_id
+    )
     
     # Read PDF
     pdf_path = Path(pdf_path)
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
     
-    with open(pdf_path, "rb") as f:
-        raw_document = documentai.RawDocument(
-            content=f.read(),
-            mime_type="application/pdf"
+    content = pdf_path.read_bytes()
+    
+    def process_live():
+        # Client is only created when the live service is actually called
+        client = documentai.DocumentProcessorServiceClient()
+        request = documentai.ProcessRequest(
+            name=name,
+            raw_document=documentai.RawDocument(
+                content=content,
+                mime_type="application/pdf"
+            )
         )
-    
-    # Process document
-    request = documentai.ProcessRequest(
-        name=name,
-        raw_document=raw_document
+        return client.process_document(request=request)
+    
+    # Process document (recorded / replayed per EVOLVE_OCR_MODE)
+    result = get_ocr_recorder().call(
+        "google_docai",
+        hashlib.sha256(content).hexdigest(),
+        {"processor": name},
+        process_live,
+        encode=documentai.ProcessResponse.to_json,
+        decode=lambda payload: documentai.ProcessResponse.from_json(
+            payload, ignore_unknown_fields=True
+        ),
     )
-    
-    result = client.process_document(request=request)
     document = result.document
     
     # Extract structured data
@@ -1,20 +1,19 @@
 from __future__ import annotations
 
-import re
 from typing import Literal
 
-from src.core.regex_catalogue import SUMMARY_KEYWORDS
+from src.core.line_classifier import get_line_classifier
 
 
 def classify_row(text: str) -> Literal["transaction", "summary", "noise"]:
     """
     Classify a raw row string into one of three buckets.
     """
-    lowered = text.lower()
-    if any(k in lowered for k in SUMMARY_KEYWORDS):
+    classifier = get_line_classifier()
+    if classifier.has_keyword("summary", text.lower()):
         return "summary"
 
-    if re.match(r"\d{2}/\d{2}", text):
+    if "dated" in classifier.classify(text).features:
         return "transaction"
 
     return "noise"
@@ -13,7 +13,9 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from .core.artifact_sink import configure_artifact_sink
 from .core.models import ExtractorType, ValidationResult
+from .core.ocr_recorder import set_ocr_recorder_mode
 from .merger.ensemble_merger import EnsembleMerger
 from .validators.golden_validator import GoldenValidator
 
@@ -43,7 +45,43 @@ def parse(
     confidence_threshold: float = typer.Option(
         0.90, "--threshold", help="Confidence threshold for race mode"
     ),
+    cascade: bool = typer.Option(
+        True,
+        "--cascade/--no-cascade",
+        help="Without --extractors, escalate to paid OCR only when free engines fall short",
+    ),
     save_raw: bool = typer.Option(False, "--save-raw", help="Save raw extraction data"),
+    page_workers: int | None = typer.Option(
+        None,
+        "--page-workers",
+        help="Worker processes for page-parallel pdfplumber extraction",
+    ),
+    use_cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reuse cached extractor results"
+    ),
+    refresh_cache: bool = typer.Option(
+        False, "--refresh", help="Re-run extractors and overwrite cached results"
+    ),
+    ocr_mode: str | None = typer.Option(
+        None,
+        "--ocr-mode",
+        help="Cloud OCR responses: passthrough, record or replay (default: EVOLVE_OCR_MODE)",
+    ),
+    artifacts: bool | None = typer.Option(
+        None,
+        "--artifacts/--no-artifacts",
+        help="Write per-extractor text/CSV artifacts (default: EVOLVE_ARTIFACTS)",
+    ),
+    output_format: str = typer.Option(
+        "csv",
+        "--format",
+        help="Output file format: csv, parquet or arrow (typed golden columns)",
+    ),
+    dataset_dir: Path | None = typer.Option(
+        None,
+        "--dataset",
+        help="Also append to a parquet/arrow dataset partitioned by statement month",
+    ),
 ) -> None:
     """Parse a single PDF file using the ensemble pipeline."""
 
@@ -51,6 +89,25 @@ def parse(
         rprint(f"[red]Error:[/red] PDF file not found: {pdf_path}")
         raise typer.Exit(1)
 
+    # Arrow/Parquet writers pull in pandas via csv_helpers; keep startup light
+    from .utils.golden_io import (
+        FILE_SUFFIXES,
+        OUTPUT_FORMATS,
+        append_golden_dataset,
+        write_golden,
+    )
+
+    output_format = output_format.lower()
+    if output_format not in OUTPUT_FORMATS:
+        rprint(
+            f"[red]Error:[/red] Unknown format '{output_format}' "
+            f"(expected {', '.join(OUTPUT_FORMATS)})"
+        )
+        raise typer.Exit(1)
+    if dataset_dir is not None and output_format == "csv":
+        rprint("[red]Error:[/red] --dataset needs --format parquet or arrow")
+        raise typer.Exit(1)
+
     # Set default output directory
     if output_dir is None:
         output_dir = Path("data/draft_csv")
@@ -69,6 +126,11 @@ def parse(
                     f"[yellow]Warning:[/yellow] Unknown extractor '{name}', skipping"
                 )
 
+    if ocr_mode:
+        _set_ocr_mode(ocr_mode)
+    if artifacts is not None:
+        configure_artifact_sink(enabled=artifacts)
+
     # Run extraction
     with Progress(
         SpinnerColumn(),
@@ -77,13 +139,18 @@ def parse(
     ) as progress:
         task = progress.add_task("Extracting transactions...", total=None)
 
-        merger = EnsembleMerger()
+        merger = EnsembleMerger(
+            page_workers=page_workers,
+            use_cache=use_cache,
+            refresh_cache=refresh_cache,
+        )
         result = asyncio.run(
             merger.extract_with_ensemble(
                 pdf_path=pdf_path,
                 enabled_extractors=enabled_extractors,
                 use_race_mode=race_mode,
                 confidence_threshold=confidence_threshold,
+                use_cascade=cascade,
             )
         )
 
@@ -93,10 +160,19 @@ def parse(
     _display_extraction_result(result, pdf_path.name)
 
     # Save results
-    output_file = output_dir / f"{pdf_path.stem}.csv"
-    _save_transactions_csv(result.final_transactions, output_file)
+    output_file = output_dir / f"{pdf_path.stem}{FILE_SUFFIXES[output_format]}"
+    if output_format == "csv":
+        _save_transactions_csv(result.final_transactions, output_file)
+    else:
+        write_golden(result.final_transactions, output_file, output_format)
     rprint(f"[green]Results saved to:[/green] {output_file}")
 
+    if dataset_dir is not None and result.final_transactions:
+        partition = append_golden_dataset(
+            result.final_transactions, dataset_dir, pdf_path.stem, output_format
+        )
+        rprint(f"[green]Appended to dataset:[/green] {partition}")
+
     # Save raw data if requested
     if save_raw:
         raw_dir = output_dir.parent / "raw_json"
@@ -135,6 +211,22 @@ def validate_all(
     save_results: bool = typer.Option(
         True, "--save/--no-save", help="Save extraction results"
     ),
+    use_cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reuse cached extractor results"
+    ),
+    refresh_cache: bool = typer.Option(
+        False, "--refresh", help="Re-run extractors and overwrite cached results"
+    ),
+    ocr_mode: str | None = typer.Option(
+        None,
+        "--ocr-mode",
+        help="Cloud OCR responses: passthrough, record or replay (default: EVOLVE_OCR_MODE)",
+    ),
+    artifacts: bool | None = typer.Option(
+        None,
+        "--artifacts/--no-artifacts",
+        help="Write per-extractor text/CSV artifacts (default: EVOLVE_ARTIFACTS)",
+    ),
 ) -> None:
     """Validate extraction results against all available golden files."""
 
@@ -166,7 +258,11 @@ def validate_all(
                 )
 
     # Process each PDF
-    merger = EnsembleMerger()
+    if ocr_mode:
+        _set_ocr_mode(ocr_mode)
+    if artifacts is not None:
+        configure_artifact_sink(enabled=artifacts)
+    merger = EnsembleMerger(use_cache=use_cache, refresh_cache=refresh_cache)
     results = {}
     validation_results = {}
 
@@ -291,6 +387,22 @@ def health_check() -> None:
 
     console.print(table)
 
+    from .ml.model_registry import get_model_registry
+
+    models = Table(title="Loaded Models (once per process)")
+    models.add_column("Artifact", style="cyan")
+    models.add_column("Load (ms)", justify="right")
+    models.add_column("Resident (MB)", justify="right")
+    models.add_column("SHA-256")
+    for entry in get_model_registry().stats():
+        resident = (
+            f"{entry.resident_bytes / 2**20:.1f}" if entry.resident_bytes is not None else "n/a"
+        )
+        models.add_row(
+            entry.path.name, f"{entry.load_seconds * 1000:.0f}", resident, entry.sha256[:12]
+        )
+    console.print(models)
+
 
 @app.command()
 def list_golden() -> None:
@@ -332,8 +444,30 @@ def benchmark(
     extractors: str | None = typer.Option(
         None, "--extractors", help="Comma-separated list of extractors"
     ),
+    use_cache: bool = typer.Option(
+        False,
+        "--cache/--no-cache",
+        help="Reuse cached extractor results (off: cache hits would time pickle loads)",
+    ),
+    refresh_cache: bool = typer.Option(
+        False, "--refresh", help="Re-run extractors and overwrite cached results"
+    ),
+    ocr_mode: str | None = typer.Option(
+        None,
+        "--ocr-mode",
+        help="Cloud OCR responses: passthrough, record or replay (default: EVOLVE_OCR_MODE)",
+    ),
+    artifacts: bool | None = typer.Option(
+        None,
+        "--artifacts/--no-artifacts",
+        help="Write per-extractor text/CSV artifacts (default: EVOLVE_ARTIFACTS)",
+    ),
 ) -> None:
-    """Benchmark extraction performance on a PDF file."""
+    """Benchmark extraction performance on a PDF file.
+
+    Extractors run on every iteration; unlike ``parse``, the result cache
+    is off unless ``--cache`` is given.
+    """
 
     if not pdf_path.exists():
         rprint(f"[red]Error:[/red] PDF file not found: {pdf_path}")
@@ -352,7 +486,11 @@ def benchmark(
                     f"[yellow]Warning:[/yellow] Unknown extractor '{name}', skipping"
                 )
 
-    merger = EnsembleMerger()
+    if ocr_mode:
+        _set_ocr_mode(ocr_mode)
+    if artifacts is not None:
+        configure_artifact_sink(enabled=artifacts)
+    merger = EnsembleMerger(use_cache=use_cache, refresh_cache=refresh_cache)
     results = []
 
     with Progress(console=console) as progress:
@@ -366,6 +504,7 @@ def benchmark(
                     pdf_path=pdf_path,
                     enabled_extractors=enabled_extractors,
                     use_race_mode=False,  # Full parallel for benchmarking
+                    use_cascade=False,
                 )
             )
 
@@ -376,6 +515,62 @@ def benchmark(
     _display_benchmark_results(results, pdf_path.name)
 
 
+@app.command()
+def startup_profile(
+    module: str = typer.Option("src.cli", "--module", help="Module to import"),
+    top: int = typer.Option(20, "--top", help="Number of modules to list"),
+    sort_by: str = typer.Option(
+        "cumulative", "--sort", help="Order modules by: cumulative or self"
+    ),
+) -> None:
+    """Report import time per module (python -X importtime)."""
+    from .utils.import_profile import package_totals, profile_imports
+
+    if sort_by not in ("cumulative", "self"):
+        rprint(f"[red]Error:[/red] Unknown sort key: {sort_by}")
+        raise typer.Exit(1)
+
+    try:
+        timings = profile_imports(module)
+    except RuntimeError as e:
+        rprint(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    total_us = sum(t.self_us for t in timings)
+    key = (lambda t: t.cumulative_us) if sort_by == "cumulative" else (lambda t: t.self_us)
+
+    table = Table(title=f"Import time: {module} ({total_us / 1000:.0f} ms, {len(timings)} modules)")
+    table.add_column("Module", style="cyan")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Cumulative (ms)", justify="right")
+    for timing in sorted(timings, key=key, reverse=True)[:top]:
+        table.add_row(
+            timing.module,
+            f"{timing.self_us / 1000:.1f}",
+            f"{timing.cumulative_us / 1000:.1f}",
+        )
+    console.print(table)
+
+    packages = Table(title="Self time per top-level package")
+    packages.add_column("Package", style="cyan")
+    packages.add_column("Self (ms)", justify="right")
+    packages.add_column("Share", justify="right")
+    for package, self_us in list(package_totals(timings).items())[:top]:
+        packages.add_row(
+            package, f"{self_us / 1000:.1f}", f"{self_us / max(total_us, 1):.1%}"
+        )
+    console.print(packages)
+
+
+def _set_ocr_mode(mode: str) -> None:
+    """Switch cloud extractors to passthrough, record or replay."""
+    try:
+        set_ocr_recorder_mode(mode)
+    except ValueError as e:
+        rprint(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
 def _display_extraction_result(result, pdf_name: str) -> None:
     """Display extraction results in a formatted table."""
     # Summary panel
@@ -387,6 +582,31 @@ def _display_extraction_result(result, pdf_name: str) -> None:
 [bold]Strategy:[/bold] {result.merge_strategy}
 [bold]Conflicts Resolved:[/bold] {result.conflicts_resolved}
 """
+    for decision in result.cascade_decisions:
+        engines = ", ".join(e.value for e in decision.extractors)
+        pages = (
+            f"; pages {', '.join(str(page + 1) for page in decision.pages)}"
+            if decision.pages
+            else ""
+        )
+        summary_text += (
+            f"[bold]Cascade {decision.stage}:[/bold] {decision.outcome} "
+            f"({engines}: {decision.reason}{pages})\n"
+        )
+    if result.cascade_decisions:
+        cost = result.cloud_cost
+        summary_text += (
+            f"[bold]Cloud OCR:[/bold] {cost.total_pages} pages, ${cost.total_cost_usd:.4f}\n"
+        )
+    if result.cancelled_pipelines:
+        stopped = ", ".join(
+            f"{c.pipeline_name.value} ({c.cpu_seconds:.2f}s CPU)"
+            for c in result.cancelled_pipelines
+        )
+        summary_text += (
+            f"[bold]Race Cancelled:[/bold] {stopped}\n"
+            f"[bold]Cloud Cost Avoided:[/bold] ${result.cost_avoided_usd:.4f}\n"
+        )
 
     console.print(
         Panel(summary_text.strip(), title="Extraction Summary", border_style="blue")
@@ -581,6 +801,7 @@ def _save_transactions_csv(transactions: list, output_file: Path) -> None:
 def _save_raw_data(result, output_file: Path) -> None:
     """Save raw extraction data to JSON file."""
     import json
+    from dataclasses import fields, is_dataclass
     from datetime import date
 
     def json_serializer(obj):
@@ -590,8 +811,8 @@ def _save_raw_data(result, output_file: Path) -> None:
             return obj.isoformat()
         elif hasattr(obj, "value"):  # Enum
             return obj.value
-        elif hasattr(obj, "__dict__"):  # Dataclass
-            return obj.__dict__
+        elif is_dataclass(obj):  # Slotted dataclasses have no __dict__
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
         return str(obj)
 
     with open(output_file, "w") as f:
@@ -1,5 +1,6 @@
 """Core models and utilities."""
 
+from .artifact_sink import ArtifactSink, get_artifact_sink
 from .confidence import (
     ConfidenceCalibrator,
     ConfidenceThresholds,
@@ -8,16 +9,21 @@ from .confidence import (
     get_calibrator,
     merge_confidence_scores,
 )
+from .document_session import DocumentSession, get_document_session
 from .models import (
+    CancelledPipeline,
     CostEstimate,
     EnsembleResult,
     ExtractorType,
+    PageResult,
     PipelineResult,
     RunMetrics,
     Transaction,
     TransactionType,
     ValidationResult,
 )
+from .ocr_recorder import OCRRecorder, get_ocr_recorder
+from .result_cache import ResultCache, get_result_cache
 from .patterns import (
     calculate_confidence,
     classify_transaction,
@@ -29,8 +35,10 @@ from .patterns import (
 __all__ = [
     "Transaction",
     "PipelineResult",
+    "PageResult",
     "ValidationResult",
     "EnsembleResult",
+    "CancelledPipeline",
     "RunMetrics",
     "CostEstimate",
     "ExtractorType",
@@ -46,4 +54,12 @@ __all__ = [
     "calculate_transaction_confidence",
     "merge_confidence_scores",
     "get_calibrator",
+    "DocumentSession",
+    "get_document_session",
+    "ResultCache",
+    "get_result_cache",
+    "OCRRecorder",
+    "get_ocr_recorder",
+    "ArtifactSink",
+    "get_artifact_sink",
 ]
@@ -0,0 +1,264 @@
+"""Background writer for per-extractor text/CSV artifacts.
+
+Extractors hand their output to the sink and return immediately; a
+background thread drains a bounded queue, renders each artifact and writes
+it under ``<root>/<extractor>/{text,csv}/<pdf>.{txt,csv}``, with one fsync
+barrier per batch instead of per file.
+
+Configuration:
+
+- ``EVOLVE_ARTIFACT_DIR``: root directory (default ``4outputs``)
+- ``EVOLVE_ARTIFACTS``: ``off``/``0``/``false`` disables writing entirely
+"""
+
+from __future__ import annotations
+
+import atexit
+import csv
+import io
+import os
+import queue
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final
+
+from .models import Transaction
+
+DEFAULT_ARTIFACT_DIR: Final[Path] = Path("4outputs")
+DEFAULT_QUEUE_SIZE: Final[int] = 64
+DEFAULT_BATCH_SIZE: Final[int] = 16
+
+GOLDEN_CSV_COLUMNS: Final[tuple[str, ...]] = (
+    "card_last4",
+    "post_date",
+    "desc_raw",
+    "amount_brl",
+    "installment_seq",
+    "installment_tot",
+    "fx_rate",
+    "iof_brl",
+    "category",
+    "merchant_city",
+    "ledger_hash",
+    "prev_bill_amount",
+    "interest_amount",
+    "amount_orig",
+    "currency_orig",
+    "amount_usd",
+)
+
+_DISABLED_VALUES: Final[frozenset[str]] = frozenset({"0", "off", "false", "no"})
+_STOP: Final[object] = object()
+
+
+@dataclass
+class ExtractorArtifacts:
+    """One extractor's output for one PDF, rendered off the hot path.
+
+    ``rows`` is a snapshot (see ``golden_rows``) so later enrichment of the
+    transactions does not leak into the artifact.
+    """
+
+    extractor: str
+    pdf_name: str
+    title: str
+    summary: Sequence[tuple[str, Any]] = ()
+    raw_text: str = ""
+    rows: list[tuple[str, ...]] = field(default_factory=list)
+
+    def render_text(self) -> str:
+        lines = [self.title, f"PDF: {self.pdf_name}"]
+        lines += [f"{label}: {value}" for label, value in self.summary]
+        return "\n".join(lines) + "\n" + "=" * 50 + "\n\n" + self.raw_text
+
+    def render_csv(self) -> str:
+        return rows_to_csv(self.rows)
+
+
+def golden_rows(transactions: list[Transaction]) -> list[tuple[str, ...]]:
+    """One row of ``GOLDEN_CSV_COLUMNS`` values per transaction."""
+    return [
+        (
+            "",  # card_last4: not available in Phase 1
+            t.date.strftime("%Y-%m-%d"),
+            t.description,
+            f"{t.amount_brl:.2f}",
+            "0",
+            "0",
+            "0.00",
+            "0.00",
+            t.category or "",
+            "",  # merchant_city: not available in Phase 1
+            "",  # ledger_hash: not available in Phase 1
+            "0",
+            "0",
+            "0.00",
+            "",
+            f"{t.amount_usd:.2f}".replace(".", ","),
+        )
+        for t in transactions
+    ]
+
+
+def rows_to_csv(rows: list[tuple[str, ...]]) -> str:
+    """Golden CSV text (``;``-separated, header always) for ``rows``."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=";", lineterminator="\n")
+    writer.writerow(GOLDEN_CSV_COLUMNS)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+class ArtifactSink:
+    """Bounded queue plus one writer thread for extractor artifacts."""
+
+    def __init__(
+        self,
+        root: Path | str | None = None,
+        enabled: bool | None = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.root = Path(root or os.getenv("EVOLVE_ARTIFACT_DIR") or DEFAULT_ARTIFACT_DIR)
+        if enabled is None:
+            enabled = os.getenv("EVOLVE_ARTIFACTS", "on").lower() not in _DISABLED_VALUES
+        self.enabled = enabled
+        self.batch_size = max(1, batch_size)
+        self.written = 0
+        self.failed = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, artifacts: ExtractorArtifacts) -> None:
+        """Queue artifacts for writing (blocks only if the queue is full)."""
+        if not self.enabled:
+            return
+        self._ensure_writer()
+        self._queue.put(artifacts)
+
+    def flush(self) -> None:
+        """Wait until everything submitted so far is on disk."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _ensure_writer(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="artifact-sink", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = _STOP in batch
+            try:
+                self._write_batch([item for item in batch if item is not _STOP])
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, batch: list[ExtractorArtifacts]) -> None:
+        """Write every file of the batch, then fsync them together.
+
+        A later artifact for the same PDF and extractor replaces an earlier
+        one still in the batch, so each destination is written once.
+        """
+        files: dict[Path, str] = {}
+        for artifacts in batch:
+            base = self.root / artifacts.extractor
+            stem = Path(artifacts.pdf_name).stem
+            try:
+                files[base / "text" / f"{stem}.txt"] = artifacts.render_text()
+                files[base / "csv" / f"{stem}.csv"] = artifacts.render_csv()
+            except Exception as e:
+                self.failed += 1
+                print(f"Failed to render {artifacts.extractor} artifacts: {e}")
+
+        pending: list[tuple[Any, Path, Path]] = []
+        for path, content in files.items():
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f"{path.suffix}.tmp")
+                handle = open(tmp_path, "w", encoding="utf-8")
+                try:
+                    handle.write(content)
+                    handle.flush()
+                except Exception:
+                    handle.close()
+                    raise
+                pending.append((handle, tmp_path, path))
+            except Exception as e:
+                self.failed += 1
+                print(f"Failed to write artifact {path}: {e}")
+
+        for handle, tmp_path, path in pending:
+            try:
+                try:
+                    os.fsync(handle.fileno())
+                finally:
+                    handle.close()
+                os.replace(tmp_path, path)
+                self.written += 1
+            except Exception as e:
+                self.failed += 1
+                print(f"Failed to write artifact {path}: {e}")
+
+        for directory in {path.parent for _, _, path in pending}:
+            try:
+                fd = os.open(directory, os.O_RDONLY)
+            except OSError:
+                continue  # e.g. directories cannot be opened on Windows
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+
+_global_artifact_sink = None
+
+
+def get_artifact_sink() -> ArtifactSink:
+    """Get the global artifact sink (configured from the environment)."""
+    global _global_artifact_sink
+    if _global_artifact_sink is None:
+        _global_artifact_sink = ArtifactSink()
+        atexit.register(_global_artifact_sink.close)
+    return _global_artifact_sink
+
+
+def configure_artifact_sink(
+    root: Path | str | None = None, enabled: bool | None = None
+) -> ArtifactSink:
+    """Replace the global sink (e.g. from CLI flags), flushing the old one."""
+    global _global_artifact_sink
+    if _global_artifact_sink is not None:
+        _global_artifact_sink.close()
+    _global_artifact_sink = ArtifactSink(root=root, enabled=enabled)
+    atexit.register(_global_artifact_sink.close)
+    return _global_artifact_sink
@@ -0,0 +1,133 @@
+"""Cooperative cancellation for extractors running on worker threads.
+
+A thread cannot be killed, so race mode hands every extractor a
+``CancellationToken`` and extractors check it where stopping is cheap and
+safe: between pages, between Camelot passes, before a paid cloud request
+and while polling for its result. The token is installed for the current
+thread with ``cancellation_scope``; extractors call the module functions
+(``check_cancelled``, ``sleep``, ``mark_billed``), which do nothing when
+no scope is active, so serial runs are unaffected.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class ExtractionCancelled(BaseException):
+    """Raised inside an extractor whose token was cancelled.
+
+    Derives from ``BaseException`` (like ``asyncio.CancelledError``) so the
+    extractors' broad ``except Exception`` handlers let it through instead
+    of turning it into a failed result.
+    """
+
+
+class CancellationToken:
+    """Cancel flag shared by race mode and one running extractor.
+
+    Besides the flag, the token records what the extractor did before it
+    stopped: CPU time on its thread, whether a paid cloud call was made,
+    and when it actually returned.
+    """
+
+    __slots__ = ("_cancelled", "_stopped", "reason", "billed", "cpu_seconds", "cancelled_at", "stopped_at")
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._stopped = threading.Event()
+        self.reason = ""
+        self.billed = False
+        self.cpu_seconds = 0.0
+        self.cancelled_at: float | None = None
+        self.stopped_at: float | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    @property
+    def stop_latency_ms(self) -> float:
+        """Time from ``cancel`` until the extractor returned (0 if it has not)."""
+        if self.cancelled_at is None or self.stopped_at is None:
+            return 0.0
+        return max(0.0, self.stopped_at - self.cancelled_at) * 1000
+
+    def cancel(self, reason: str = "") -> None:
+        if not self._cancelled.is_set():
+            self.reason = reason
+            self.cancelled_at = time.perf_counter()
+            self._cancelled.set()
+
+    def check(self) -> None:
+        """Raise ``ExtractionCancelled`` if the token was cancelled."""
+        if self._cancelled.is_set():
+            raise ExtractionCancelled(self.reason)
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep up to ``seconds``, waking (and raising) on cancellation."""
+        if self._cancelled.wait(seconds):
+            raise ExtractionCancelled(self.reason)
+
+
+_current_token: ContextVar[CancellationToken | None] = ContextVar(
+    "cancellation_token", default=None
+)
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Install ``token`` for the current thread and account for its work.
+
+    On exit the token records the CPU time spent in the scope and is
+    marked stopped, whether the body returned, raised or was cancelled.
+    """
+    reset = _current_token.set(token)
+    start = time.thread_time()
+    try:
+        yield token
+    finally:
+        token.cpu_seconds += time.thread_time() - start
+        token.stopped_at = time.perf_counter()
+        token._stopped.set()
+        _current_token.reset(reset)
+
+
+def current_token() -> CancellationToken | None:
+    return _current_token.get()
+
+
+def check_cancelled() -> None:
+    """Cancellation point: raise if this thread's extractor was cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.check()
+
+
+def sleep(seconds: float) -> None:
+    """``time.sleep`` that is also a cancellation point."""
+    token = _current_token.get()
+    if token is None:
+        time.sleep(seconds)
+    else:
+        token.sleep(seconds)
+
+
+def mark_billed() -> None:
+    """Last cancellation point before a paid request, then record the charge.
+
+    Call it right before sending the request: once it returns, stopping
+    the extractor no longer saves its cloud cost.
+    """
+    token = _current_token.get()
+    if token is not None:
+        token.check()
+        token.billed = True
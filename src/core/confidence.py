@@ -4,17 +4,22 @@ from __future__ import annotations
 
 import pickle
 from pathlib import Path
-
-from sklearn.linear_model import LogisticRegression
-import joblib
+from typing import TYPE_CHECKING
 
 from .models import ExtractorType
 
+if TYPE_CHECKING:  # sklearn is imported only when a model is trained or loaded
+    from sklearn.isotonic import IsotonicRegression
+    from sklearn.linear_model import LogisticRegression
+
 # Default confidence mappings (will be overridden by learned calibrations)
 DEFAULT_CONFIDENCE_MAPPINGS: dict[ExtractorType, callable] = {
     ExtractorType.PDFPLUMBER: lambda score: min(
         score * 0.9, 1.0
     ),  # Conservative for layout changes
+    ExtractorType.PYMUPDF: lambda score: min(
+        score * 0.9, 1.0
+    ),  # Same line parser as pdfplumber
     ExtractorType.CAMELOT: lambda score: min(
         score * 0.85, 1.0
     ),  # Table-specific reliability
@@ -27,11 +32,22 @@ DEFAULT_CONFIDENCE_MAPPINGS: dict[ExtractorType, callable] = {
 class ConfidenceCalibrator:
     """Calibrates confidence scores across different extractors."""
 
-    def __init__(self, model_path: str = "models/confidence_platt.joblib"):
+    def __init__(
+        self,
+        model_path: str = "models/confidence_platt.joblib",
+        calibration_path: str = "models/confidence_calibrations.pkl",
+    ):
         self.model_path = model_path
         self.model: LogisticRegression | None = self._load()
+        self.calibration_file = Path(calibration_path)
+        self.calibrators: dict[ExtractorType, IsotonicRegression] = {}
+        self.load_calibrations()
 
     def _load(self):
+        if not Path(self.model_path).exists():
+            return None
+        import joblib
+
         try:
             return joblib.load(self.model_path)
         except FileNotFoundError:
@@ -78,6 +94,8 @@ class ConfidenceCalibrator:
             )
             return
 
+        from sklearn.isotonic import IsotonicRegression
+
         calibrator = IsotonicRegression(out_of_bounds="clip")
         calibrator.fit(raw_scores, ground_truth_accuracy)
         self.calibrators[extractor_type] = calibrator
@@ -118,7 +136,11 @@ def calculate_extraction_confidence(
     )
 
     # Extractor-specific adjustments
-    if extractor_type in [ExtractorType.PDFPLUMBER, ExtractorType.CAMELOT]:
+    if extractor_type in [
+        ExtractorType.PDFPLUMBER,
+        ExtractorType.PYMUPDF,
+        ExtractorType.CAMELOT,
+    ]:
         # Text-based extractors: heavily weight pattern matching
         base_score = 0.6 * recovery_rate + 0.4 * pattern_quality
     else:
@@ -0,0 +1,294 @@
+"""Shared parsed-document session so a PDF is opened and parsed once per run."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from .normalise import StatementPeriod
+
+# Number of parsed documents kept alive by the process-wide registry
+MAX_OPEN_SESSIONS = 8
+
+# Same heuristic the extractors used: a single page with more than this many
+# text characters marks the PDF as born-digital.
+SCANNED_TEXT_THRESHOLD = 100
+
+
+class DocumentSession:
+    """Lazily parsed view of one PDF, shared by extractors and enrichment.
+
+    The session is keyed by the SHA-256 of the file content. Page objects,
+    per-page text, words and chars are computed on first access and cached,
+    so every consumer in a run sees the same parse. Access is serialised by
+    a lock because pdfplumber page objects are not thread-safe and the
+    ensemble runs extractors in worker threads.
+    """
+
+    def __init__(self, data: bytes, source_path: Path | None = None):
+        self.data = data
+        self.source_path = source_path
+        self.content_hash = hashlib.sha256(data).hexdigest()
+
+        self._lock = threading.RLock()
+        self._pdf: Any = None
+        self._fitz_doc: Any = None
+        self._page_text: dict[int, str] = {}
+        self._words: dict[int, list[dict[str, Any]]] = {}
+        self._chars: dict[int, list[dict[str, Any]]] = {}
+        self._fitz_words: dict[int, list[tuple]] = {}
+        self._is_scanned: bool | None = None
+        self._text: str | None = None
+        self._statement_period: StatementPeriod | None = None
+        self._period_resolved = False
+
+    @classmethod
+    def from_path(cls, pdf_path: Path | str) -> DocumentSession:
+        """Read a PDF from disk into a new session."""
+        path = Path(pdf_path)
+        return cls(path.read_bytes(), source_path=path)
+
+    # ------------------------------------------------------------------
+    # pdfplumber-backed accessors
+    # ------------------------------------------------------------------
+
+    @property
+    def pdf(self) -> Any:
+        """The underlying ``pdfplumber.PDF`` (opened on first use)."""
+        with self._lock:
+            if self._pdf is None:
+                import pdfplumber
+
+                self._pdf = pdfplumber.open(io.BytesIO(self.data))
+            return self._pdf
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the document."""
+        with self._lock:
+            if self._pdf is None and self._fitz_doc is not None:
+                return len(self._fitz_doc)
+            return len(self.pdf.pages)
+
+    def page(self, index: int) -> Any:
+        """pdfplumber page object for a zero-based page index."""
+        with self._lock:
+            return self.pdf.pages[index]
+
+    def page_text(self, index: int) -> str:
+        """Text of a single page (``""`` when the page has none)."""
+        with self._lock:
+            text = self._page_text.get(index)
+            if text is None:
+                text = self.page(index).extract_text() or ""
+                self._page_text[index] = text
+            return text
+
+    def has_page_text(self, index: int) -> bool:
+        """Whether the text of a page is already cached."""
+        with self._lock:
+            return index in self._page_text
+
+    def prime_page_text(self, index: int, text: str) -> None:
+        """Seed the cache with text extracted elsewhere (e.g. a worker process)."""
+        with self._lock:
+            self._page_text.setdefault(index, text)
+
+    def iter_page_texts(self) -> Iterator[tuple[int, str]]:
+        """Yield ``(page_index, text)`` in page order, parsing lazily."""
+        for index in range(self.page_count):
+            yield index, self.page_text(index)
+
+    def page_texts(self) -> list[str]:
+        """Text of every page in page order."""
+        return [text for _, text in self.iter_page_texts()]
+
+    def words(self, index: int) -> list[dict[str, Any]]:
+        """pdfplumber words of a page."""
+        with self._lock:
+            words = self._words.get(index)
+            if words is None:
+                words = self.page(index).extract_words()
+                self._words[index] = words
+            return words
+
+    def chars(self, index: int) -> list[dict[str, Any]]:
+        """pdfplumber chars of a page."""
+        with self._lock:
+            chars = self._chars.get(index)
+            if chars is None:
+                chars = self.page(index).chars
+                self._chars[index] = chars
+            return chars
+
+    @property
+    def text(self) -> str:
+        """Text of all non-empty pages joined by newlines."""
+        with self._lock:
+            if self._text is None:
+                self._text = "\n".join(text for text in self.page_texts() if text)
+            return self._text
+
+    @property
+    def lines(self) -> list[str]:
+        """Document text split into lines."""
+        return self.text.splitlines()
+
+    # ------------------------------------------------------------------
+    # PyMuPDF-backed accessors
+    # ------------------------------------------------------------------
+
+    @property
+    def fitz_document(self) -> Any:
+        """The underlying PyMuPDF document (opened on first use)."""
+        with self._lock:
+            if self._fitz_doc is None:
+                import fitz  # PyMuPDF
+
+                self._fitz_doc = fitz.open(stream=self.data, filetype="pdf")
+            return self._fitz_doc
+
+    def fitz_words(self, index: int) -> list[tuple]:
+        """PyMuPDF words of a page: ``(x0, y0, x1, y1, text, block, line, word)``."""
+        with self._lock:
+            words = self._fitz_words.get(index)
+            if words is None:
+                words = self.fitz_document[index].get_text("words")
+                self._fitz_words[index] = words
+            return words
+
+    def page_range_pdf(self, start: int, stop: int) -> bytes:
+        """A standalone PDF of pages ``[start, stop)``, for re-extracting them alone."""
+        import fitz  # PyMuPDF
+
+        with self._lock:
+            subset = fitz.open()
+            subset.insert_pdf(self.fitz_document, from_page=start, to_page=stop - 1)
+            try:
+                return subset.tobytes()
+            finally:
+                subset.close()
+
+    @property
+    def statement_period(self) -> StatementPeriod | None:
+        """Closing month of the statement, for the year of ``DD/MM`` dates.
+
+        Taken from the due or issue date on the first page, else from a
+        ``YYYY-MM`` in the file name; ``None`` if neither gives one.
+        """
+        with self._lock:
+            if not self._period_resolved:
+                self._statement_period = self._find_statement_period()
+                self._period_resolved = True
+            return self._statement_period
+
+    def _find_statement_period(self) -> StatementPeriod | None:
+        try:
+            first_page = self._page_text.get(0)
+            if first_page is None and len(self.fitz_document):
+                first_page = self.fitz_document[0].get_text()
+        except Exception:
+            first_page = None
+        period = StatementPeriod.from_text(first_page) if first_page else None
+        if period is None and self.source_path is not None:
+            period = StatementPeriod.from_name(self.source_path.stem)
+        return period
+
+    def is_scanned(self) -> bool:
+        """Detect if the PDF is scanned (requires OCR) or born-digital."""
+        with self._lock:
+            if self._is_scanned is None:
+                self._is_scanned = self._detect_scanned()
+            return self._is_scanned
+
+    def _detect_scanned(self) -> bool:
+        try:
+            for page in self.fitz_document:
+                text_blocks = page.get_text("dict")["blocks"]
+                text_chars = sum(
+                    len(line["spans"][0]["text"])
+                    for block in text_blocks
+                    if "lines" in block
+                    for line in block["lines"]
+                    if line["spans"]
+                )
+                if text_chars > SCANNED_TEXT_THRESHOLD:
+                    return False
+            return True
+        except Exception:
+            # Default to assuming it needs OCR if we can't determine
+            return True
+
+    def close(self) -> None:
+        """Release parser handles; cached text stays available."""
+        with self._lock:
+            if self._pdf is not None:
+                self._pdf.close()
+                self._pdf = None
+            if self._fitz_doc is not None:
+                self._fitz_doc.close()
+                self._fitz_doc = None
+
+    def __enter__(self) -> DocumentSession:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def document_text(source: str | DocumentSession | None) -> str | None:
+    """Return plain text for either a raw string or a document session."""
+    if isinstance(source, DocumentSession):
+        return source.text
+    return source
+
+
+_sessions: OrderedDict[str, DocumentSession] = OrderedDict()
+_path_hashes: dict[tuple[str, int, int], str] = {}
+_registry_lock = threading.Lock()
+
+
+def get_document_session(pdf_path: Path | str) -> DocumentSession:
+    """Get the shared session for a PDF, keyed by its content hash.
+
+    The hash of a path is memoised on ``(path, mtime, size)`` so repeated
+    lookups during a run do not re-read the file.
+    """
+    path = Path(pdf_path).resolve()
+    stat = path.stat()
+    stamp = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    with _registry_lock:
+        content_hash = _path_hashes.get(stamp)
+        if content_hash is not None and content_hash in _sessions:
+            _sessions.move_to_end(content_hash)
+            return _sessions[content_hash]
+
+    session = DocumentSession.from_path(path)
+
+    with _registry_lock:
+        _path_hashes[stamp] = session.content_hash
+        existing = _sessions.get(session.content_hash)
+        if existing is not None:
+            _sessions.move_to_end(session.content_hash)
+            return existing
+
+        _sessions[session.content_hash] = session
+        while len(_sessions) > MAX_OPEN_SESSIONS:
+            _, evicted = _sessions.popitem(last=False)
+            evicted.close()
+        return session
+
+
+def clear_document_sessions() -> None:
+    """Close and forget every shared session."""
+    with _registry_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _path_hashes.clear()
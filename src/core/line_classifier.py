@@ -0,0 +1,247 @@
+"""Single-pass line classifier compiled from the Itaú regex catalogue."""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Final
+
+from .patterns import (
+    ITAU_PARSING_RULES,
+    RE_DROP_HDR,
+    RE_PAYMENT,
+    RE_POSTING_FX,
+    RE_POSTING_NATIONAL,
+)
+from .regex_catalogue import (
+    RE_DOMESTIC_L1,
+    RE_DOMESTIC_L2,
+    RE_INTL_L1,
+    RE_INTL_L2,
+    RE_INTL_L3,
+    SUMMARY_KEYWORDS,
+)
+
+# Page furniture that never carries a posting (matched on upper-cased text)
+PAGE_HEADER_KEYWORDS: Final[tuple[str, ...]] = (
+    "ITAÚ UNIBANCO", "CARTÃO DE CRÉDITO", "DATA", "HISTÓRICO", "VALOR",
+    "PÁGINA", "ATENDIMENTO", "WWW.ITAU.COM.BR", "CENTRAL DE RELACIONAMENTO",
+)
+
+# Rules in priority order: the first rule that matches a line wins. The FX
+# posting shape is tried before the national one because every FX line also
+# matches the national pattern.
+ITAU_LINE_RULES: Final[tuple[tuple[str, re.Pattern[str]], ...]] = (
+    ("posting_fx", RE_POSTING_FX),
+    ("posting_national", RE_POSTING_NATIONAL),
+    ("payment", RE_PAYMENT),
+    ("intl_l1", RE_INTL_L1),
+    ("domestic_l1", RE_DOMESTIC_L1),
+    ("intl_l2", RE_INTL_L2),
+    ("domestic_l2", RE_DOMESTIC_L2),
+    ("intl_l3", RE_INTL_L3),
+    ("header", RE_DROP_HDR),
+)
+
+ITAU_KEYWORD_SETS: Final[dict[str, Iterable[str]]] = {
+    "summary": SUMMARY_KEYWORDS,
+    "page_header": PAGE_HEADER_KEYWORDS,
+    "skip": ITAU_PARSING_RULES["skip_keywords"],
+}
+
+# Zero-width probes evaluated in the same pass as the rules
+ITAU_FEATURES: Final[dict[str, str]] = {
+    "dated": r"\d{2}/\d{2}",
+}
+
+_RE_GROUP_NAME: Final[re.Pattern[str]] = re.compile(r"\(\?P<([A-Za-z_]\w*)>")
+_RE_BACKREFERENCE: Final[re.Pattern[str]] = re.compile(r"\(\?P=|\\[1-9]")
+_INLINE_FLAGS: Final[tuple[tuple[re.RegexFlag, str], ...]] = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LineMatch:
+    """Result of classifying one line."""
+
+    kind: str
+    groups: dict[str, str | None] = field(default_factory=dict)
+    features: frozenset[str] = frozenset()
+
+    def __bool__(self) -> bool:
+        return self.kind != "other"
+
+
+class KeywordAutomaton:
+    """Substring matcher for a keyword set, compiled to one regex alternation.
+
+    ``find(text)`` is equivalent to ``any(keyword in text for keyword in
+    keywords)`` but scans the text once in C instead of once per keyword.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(sorted(set(keywords), key=len, reverse=True))
+        self._pattern = (
+            re.compile("|".join(re.escape(keyword) for keyword in self.keywords))
+            if self.keywords
+            else None
+        )
+
+    def find(self, text: str) -> str | None:
+        """Return a keyword contained in ``text`` (or None)."""
+        if self._pattern is None:
+            return None
+        match = self._pattern.search(text)
+        return match.group() if match else None
+
+
+class LineClassifier:
+    """Classify lines against a whole regex catalogue in one pass.
+
+    Every rule is compiled into one prefix-anchored alternation, so a single
+    ``match()`` call tags a line with the first matching rule and its
+    captured groups. Features are zero-width lookaheads folded into the same
+    pattern. Keyword sets are compiled into ``KeywordAutomaton`` instances.
+    Hits per rule, feature and keyword set are reported by ``hits``.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[tuple[str, re.Pattern[str]]],
+        keyword_sets: Mapping[str, Iterable[str]] | None = None,
+        features: Mapping[str, str] | None = None,
+    ):
+        self.rules = tuple(rules)
+        self.keyword_sets = {
+            name: KeywordAutomaton(keywords)
+            for name, keywords in (keyword_sets or {}).items()
+        }
+
+        feature_names = tuple((features or {}).keys())
+        feature_parts = [
+            f"(?:(?P<f{index}>(?={pattern})))?"
+            for index, pattern in enumerate((features or {}).values())
+        ]
+        rule_parts = []
+        rule_groups = []
+        for index, (_kind, pattern) in enumerate(self.rules):
+            source, groups = self._namespace(pattern, f"r{index}")
+            rule_parts.append(f"(?P<r{index}>{source})")
+            rule_groups.append(groups)
+
+        self._combined = re.compile(
+            "".join(feature_parts) + "(?:" + "|".join(rule_parts) + ")?"
+        )
+
+        # Dispatch on match.lastindex: the outer group of the matching rule
+        # is always the last one to close.
+        self._feature_indexes = tuple(
+            self._combined.groupindex[f"f{index}"] for index in range(len(feature_names))
+        )
+        self._feature_sets = {
+            mask: frozenset(
+                name for bit, name in enumerate(feature_names) if mask & (1 << bit)
+            )
+            for mask in range(1 << len(feature_names))
+        }
+        self._dispatch: dict[int, tuple[int, str, tuple[str, ...], tuple[int, ...]]] = {}
+        for index, (kind, _pattern) in enumerate(self.rules):
+            names = tuple(name for name, _ in rule_groups[index])
+            group_indexes = tuple(
+                self._combined.groupindex[combined] for _, combined in rule_groups[index]
+            )
+            self._dispatch[self._combined.groupindex[f"r{index}"]] = (
+                index, kind, names, group_indexes
+            )
+
+        # Unmatched lines are the common case: share one result per feature mask
+        self._other = {
+            mask: LineMatch("other", {}, features)
+            for mask, features in self._feature_sets.items()
+        }
+
+        # Plain integer counters on the hot path; ``hits`` assembles a Counter
+        self._feature_names = feature_names
+        self.reset_hits()
+
+    @staticmethod
+    def _namespace(pattern: re.Pattern[str], tag: str) -> tuple[str, tuple[tuple[str, str], ...]]:
+        """Rewrite a rule so its groups are unique inside the alternation."""
+        if _RE_BACKREFERENCE.search(pattern.pattern):
+            raise ValueError(f"Backreferences are not supported: {pattern.pattern!r}")
+
+        groups = tuple(
+            (name, f"{tag}_{name}") for name in _RE_GROUP_NAME.findall(pattern.pattern)
+        )
+        source = _RE_GROUP_NAME.sub(lambda m: f"(?P<{tag}_{m.group(1)}>", pattern.pattern)
+        flags = "".join(letter for flag, letter in _INLINE_FLAGS if pattern.flags & flag)
+        return f"(?{flags}:{source})" if flags else f"(?:{source})", groups
+
+    def classify(self, text: str) -> LineMatch:
+        """Tag ``text`` with its kind, captured groups and features."""
+        match = self._combined.match(text)
+
+        mask = 0
+        for bit, group_index in enumerate(self._feature_indexes):
+            if match.group(group_index) is not None:
+                mask |= 1 << bit
+                self._feature_hits[bit] += 1
+
+        rule = self._dispatch.get(match.lastindex)
+        if rule is None:
+            self._other_hits += 1
+            return self._other[mask]
+
+        index, kind, names, group_indexes = rule
+        self._rule_hits[index] += 1
+        if len(group_indexes) == 1:
+            groups = {names[0]: match.group(group_indexes[0])}
+        else:
+            groups = dict(zip(names, match.group(*group_indexes)))
+        return LineMatch(kind, groups, self._feature_sets[mask])
+
+    def has_keyword(self, set_name: str, text: str) -> bool:
+        """Whether ``text`` contains any keyword of a keyword set."""
+        found = self.keyword_sets[set_name].find(text) is not None
+        if found:
+            self._keyword_hits[set_name] += 1
+        return found
+
+    @property
+    def hits(self) -> Counter[str]:
+        """Hits per rule kind, ``other``, ``feature:<name>`` and ``keyword:<set>``."""
+        hits: Counter[str] = Counter()
+        for (kind, _pattern), count in zip(self.rules, self._rule_hits):
+            hits[kind] += count
+        hits["other"] += self._other_hits
+        for name, count in zip(self._feature_names, self._feature_hits):
+            hits[f"feature:{name}"] += count
+        for name, count in self._keyword_hits.items():
+            hits[f"keyword:{name}"] += count
+        return +hits
+
+    def reset_hits(self) -> None:
+        """Clear the hit counters."""
+        self._rule_hits = [0] * len(self.rules)
+        self._other_hits = 0
+        self._feature_hits = [0] * len(self._feature_names)
+        self._keyword_hits = dict.fromkeys(self.keyword_sets, 0)
+
+
+_global_line_classifier = None
+
+
+def get_line_classifier() -> LineClassifier:
+    """Get the global classifier compiled from the Itaú catalogue."""
+    global _global_line_classifier
+    if _global_line_classifier is None:
+        _global_line_classifier = LineClassifier(
+            ITAU_LINE_RULES, ITAU_KEYWORD_SETS, ITAU_FEATURES
+        )
+    return _global_line_classifier
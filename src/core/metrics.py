@@ -32,6 +32,7 @@ class ExtractionMetrics:
         })
         self.error_counts = Counter()
         self.confidence_scores = []
+        self.prediction_cache = defaultdict(lambda: {"hits": 0, "misses": 0})
     
     def record_extraction(self, result, cost: float = 0.0):
         """Record an extraction result."""
@@ -68,6 +69,12 @@ class ExtractionMetrics:
         if result.success:
             self.confidence_scores.append(result.confidence_score)
     
+    def record_prediction_cache(self, namespace: str, hits: int, misses: int):
+        """Record prediction cache lookups of one model."""
+        stats = self.prediction_cache[namespace]
+        stats["hits"] += hits
+        stats["misses"] += misses
+
     def get_summary(self) -> Dict:
         """Get metrics summary."""
         total_extractions = len(self.extractions)
@@ -91,7 +98,15 @@ class ExtractionMetrics:
             "total_processing_time_ms": total_time,
             "average_time_per_extraction_ms": total_time / total_extractions if total_extractions > 0 else 0,
             "method_breakdown": dict(self.method_stats),
-            "top_errors": self.error_counts.most_common(5)
+            "top_errors": self.error_counts.most_common(5),
+            "prediction_cache": {
+                namespace: {
+                    **stats,
+                    "hit_rate": stats["hits"] / (stats["hits"] + stats["misses"])
+                    if stats["hits"] + stats["misses"] > 0 else 0,
+                }
+                for namespace, stats in self.prediction_cache.items()
+            }
         }
     
     def print_report(self, console: Optional[Console] = None):
@@ -138,6 +153,13 @@ class ExtractionMetrics:
             
             console.print(table)
         
+        # Prediction cache
+        for namespace, stats in summary["prediction_cache"].items():
+            console.print(
+                f"🗃️ Prediction cache {namespace}: {stats['hit_rate']:.1%} hit "
+                f"({stats['hits']}/{stats['hits'] + stats['misses']})"
+            )
+        
         # Error summary
         if self.error_counts:
             console.print("\n❌ Top Errors:")
@@ -175,6 +197,11 @@ class ExtractionMetrics:
 metrics = ExtractionMetrics()
 
 
+def get_metrics() -> ExtractionMetrics:
+    """Get the global metrics instance."""
+    return metrics
+
+
 def record_extraction_metrics(result, method_cost: float = 0.0):
     """Convenience function to record extraction metrics."""
     metrics.record_extraction(result, method_cost)
@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import date
 from decimal import Decimal
 from enum import Enum
-from typing import Any
+from typing import Any, Final
+
+from .patterns import generate_ledger_hash
 
 
 class ExtractorType(Enum):
     """Available extraction engines."""
 
     PDFPLUMBER = "pdfplumber"
+    PYMUPDF = "pymupdf"
     CAMELOT = "camelot"
     TEXTRACT = "textract"
     AZURE_DOC_INTELLIGENCE = "azure_doc_intelligence"
@@ -29,9 +32,27 @@ class TransactionType(Enum):
     REFUND = "refund"
 
 
-@dataclass
+# Money fields held as Decimal; ``Transaction.from_raw`` coerces them
+DECIMAL_FIELDS: Final[tuple[str, ...]] = (
+    "amount_brl",
+    "fx_rate",
+    "iof_brl",
+    "prev_bill_amount",
+    "interest_amount",
+    "amount_orig",
+    "amount_usd",
+)
+
+
+@dataclass(slots=True)
 class Transaction:
-    """A single bank statement transaction with full metadata."""
+    """A single bank statement transaction with full metadata.
+
+    Slotted, and does no conversion on construction: money fields must
+    already be ``Decimal`` (use ``from_raw`` at a parse boundary). An empty
+    ``ledger_hash`` is computed from date, description and amount on first
+    access and cached.
+    """
 
     # Core transaction data
     date: date
@@ -62,36 +83,58 @@ class Transaction:
     raw_text: str | None = None
 
     def __post_init__(self):
-        """Validate and normalize transaction data."""
-        # Convert amounts to Decimal
-        if not isinstance(self.amount_brl, Decimal):
-            self.amount_brl = Decimal(str(self.amount_brl))
-        if not isinstance(self.fx_rate, Decimal):
-            self.fx_rate = Decimal(str(self.fx_rate))
-        if not isinstance(self.iof_brl, Decimal):
-            self.iof_brl = Decimal(str(self.iof_brl))
-        if not isinstance(self.prev_bill_amount, Decimal):
-            self.prev_bill_amount = Decimal(str(self.prev_bill_amount))
-        if not isinstance(self.interest_amount, Decimal):
-            self.interest_amount = Decimal(str(self.interest_amount))
-        if not isinstance(self.amount_orig, Decimal):
-            self.amount_orig = Decimal(str(self.amount_orig))
-        if not isinstance(self.amount_usd, Decimal):
-            self.amount_usd = Decimal(str(self.amount_usd))
-        
-        # Generate ledger hash if not provided
-        if not self.ledger_hash:
-            from ..core.patterns import generate_ledger_hash
-            self.ledger_hash = generate_ledger_hash(
-                self.date.isoformat(), 
-                self.description, 
-                self.amount_brl
-            )
-        
-        # Set amount_usd for USD transactions
+        """Derive amount_usd for USD transactions."""
         if self.currency_orig == "USD" and self.amount_orig > 0:
             self.amount_usd = self.amount_orig
 
+    @classmethod
+    def from_raw(cls, **fields: Any) -> Transaction:
+        """Build from parsed values, coercing money fields to ``Decimal``."""
+        for name in DECIMAL_FIELDS:
+            value = fields.get(name)
+            if value is not None and not isinstance(value, Decimal):
+                fields[name] = Decimal(str(value))
+        return cls(**fields)
+
+
+def _lazy_ledger_hash(slot: Any) -> property:
+    """Wrap the ``ledger_hash`` slot so an empty value is filled on first read."""
+    read, write = slot.__get__, slot.__set__
+
+    def get(self: Transaction) -> str:
+        value = read(self)
+        if not value:
+            value = generate_ledger_hash(
+                self.date.isoformat(), self.description, self.amount_brl
+            )
+            write(self, value)
+        return value
+
+    return property(get, write, doc="Transaction ledger hash (lazy, cached).")
+
+
+Transaction.ledger_hash = _lazy_ledger_hash(Transaction.ledger_hash)
+
+
+@dataclass
+class PageResult:
+    """Transactions one extractor found on pages ``[start, stop)``.
+
+    Text extractors report one page at a time; a cloud engine given a page
+    range reports the range as a whole.
+    """
+
+    start: int
+    stop: int
+    transactions: list[Transaction]
+    confidence_score: float
+    error_message: str | None = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the pages were read (an empty page is still a success)."""
+        return self.error_message is None
+
 
 @dataclass
 class PipelineResult:
@@ -104,6 +147,7 @@ class PipelineResult:
     raw_data: dict[str, Any] | None = None
     error_message: str | None = None
     page_count: int = 0
+    page_results: list[PageResult] = field(default_factory=list)
 
     @property
     def success(self) -> bool:
@@ -160,6 +204,18 @@ class ValidationResult:
         )
 
 
+@dataclass
+class CancelledPipeline:
+    """An extractor race mode stopped after another one won."""
+
+    pipeline_name: ExtractorType
+    cpu_seconds: float  # CPU the extractor used before it stopped
+    stop_latency_ms: float  # From cancellation to the extractor returning
+    stopped: bool  # False if it was still running after the grace period
+    billed: bool  # A paid cloud request had already been sent
+    cost_avoided_usd: float = 0.0
+
+
 @dataclass
 class EnsembleResult:
     """Result from ensemble merging of multiple pipelines."""
@@ -171,12 +227,24 @@ class EnsembleResult:
     merge_strategy: str
     conflicts_resolved: int
     validation_metrics: dict[str, bool] = field(default_factory=dict)
+    cancelled_pipelines: list[CancelledPipeline] = field(default_factory=list)
+    cascade_decisions: list[CascadeDecision] = field(default_factory=list)
 
     @property
     def total_amount_brl(self) -> Decimal:
         """Sum of all final transaction amounts."""
         return sum(t.amount_brl for t in self.final_transactions)
 
+    @property
+    def cost_avoided_usd(self) -> float:
+        """Cloud cost race mode saved by stopping losing extractors."""
+        return sum(c.cost_avoided_usd for c in self.cancelled_pipelines)
+
+    @property
+    def cloud_cost(self) -> CostEstimate:
+        """Paid OCR the cascade spent on this statement."""
+        return sum((d.cost for d in self.cascade_decisions), CostEstimate())
+
 
 @dataclass
 class RunMetrics:
@@ -219,3 +287,22 @@ class CostEstimate:
     def total_pages(self) -> int:
         """Total pages to be processed via cloud OCR."""
         return self.textract_pages + self.azure_pages + self.google_pages
+
+    def __add__(self, other: CostEstimate) -> CostEstimate:
+        return CostEstimate(
+            *(getattr(self, f.name) + getattr(other, f.name) for f in fields(self))
+        )
+
+
+@dataclass
+class CascadeDecision:
+    """One stage of the extractor cascade and why it stopped or escalated."""
+
+    stage: str  # "text", "tables" or "paid"
+    extractors: list[ExtractorType]
+    outcome: str  # "accepted", "escalated" or "over_budget"
+    reason: str = ""
+    confidence: float = 0.0
+    totals_match: bool | None = None  # None: the statement shows no totals
+    cost: CostEstimate = field(default_factory=CostEstimate)
+    pages: list[int] = field(default_factory=list)  # zero-based pages escalated or re-extracted
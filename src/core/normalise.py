@@ -1,20 +1,153 @@
-from datetime import datetime
-from typing import Optional
+"""Brazilian amount and date parsing, one value at a time or a column at a time.
 
+Both paths follow the same rules:
 
-def parse_brazil_number(text: str) -> Optional[float]:
-    """Convert '71.543,24' or '- 1.234,56' → -1234.56 (float)."""
+* Amounts: everything but digits, ``,``, ``.`` and ``-`` is dropped (``R$``,
+  spaces) and a ``-`` anywhere makes the value negative. The rightmost
+  separator is the decimal point when the other separator also occurs or it
+  occurs once, so ``1.234,56``, ``1,234.56``, ``156,78`` and ``156.78`` all
+  parse; a separator repeated alone (``1.234.567``) groups thousands.
+* Dates: ``YYYY-MM-DD``, ``DD/MM/YYYY``, ``DD/MM/YY`` or ``DD/MM``. A
+  ``DD/MM`` date takes its year from the ``StatementPeriod``: statements
+  list the twelve months up to their closing month, so a December purchase
+  on a January statement belongs to the previous year. Extractors read the
+  period from the statement itself (``DocumentSession.statement_period``);
+  without one, ``DEFAULT_PERIOD`` applies, never the current date.
+
+The scalar functions (``parse_amount``, ``parse_date``) are for parsers
+working line by line. The batch functions (``parse_amounts``,
+``parse_dates``) take an Arrow, NumPy, Polars or Python string column and
+return an Arrow ``decimal128(38, 10)`` or ``date32`` array. Polars is
+imported on first batch use, keeping ``src.core`` light.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Any, Final, Optional
+
+if TYPE_CHECKING:
+    import polars as pl
+    import pyarrow as pa
+
+_AMOUNT_JUNK: Final[re.Pattern[str]] = re.compile(r"[^\d,.\-]")
+
+# ISO date, or DD/MM with an optional 4- or 2-digit year
+_DATE_PATTERN: Final[str] = (
+    r"^\s*(?:(\d{4})-(\d{1,2})-(\d{1,2})|(\d{1,2})/(\d{1,2})(?:/(\d{4}|\d{2}))?)"
+)
+RE_DATE: Final[re.Pattern[str]] = re.compile(_DATE_PATTERN)
+
+RE_PERIOD: Final[re.Pattern[str]] = re.compile(r"(20\d{2})-(0[1-9]|1[0-2])")
+
+# Due date, else issue date, printed on the first page of an Itaú statement
+RE_DUE_DATE: Final[re.Pattern[str]] = re.compile(r"Vencimento:\s*\d{1,2}/(\d{1,2})/(\d{4})", re.I)
+RE_ISSUE_DATE: Final[re.Pattern[str]] = re.compile(r"Emiss[ãa]o:\s*\d{1,2}/(\d{1,2})/(\d{4})", re.I)
+
+
+@dataclass(frozen=True, slots=True)
+class StatementPeriod:
+    """Closing month of a statement, used to place ``DD/MM`` dates in a year."""
+
+    year: int
+    month: int
+
+    def year_of(self, month: int) -> int:
+        """Year of a ``DD/MM`` date in ``month`` on this statement."""
+        return self.year if month <= self.month else self.year - 1
+
+    @property
+    def start(self) -> date:
+        """First day of the closing month, the date given to undated rows."""
+        return date(self.year, self.month, 1)
+
+    @classmethod
+    def containing(cls, day: date) -> StatementPeriod:
+        """Period closing in the month of ``day``."""
+        return cls(day.year, day.month)
+
+    @classmethod
+    def from_name(cls, name: str) -> Optional[StatementPeriod]:
+        """Period named in a file stem such as ``golden_2024-10``, if any."""
+        match = RE_PERIOD.search(name)
+        if not match:
+            return None
+        return cls(int(match.group(1)), int(match.group(2)))
+
+    @classmethod
+    def from_text(cls, text: str) -> Optional[StatementPeriod]:
+        """Period of the due (or issue) date printed in statement text, if any."""
+        for pattern in (RE_DUE_DATE, RE_ISSUE_DATE):
+            match = pattern.search(text)
+            if match and 1 <= int(match.group(1)) <= 12:
+                return cls(int(match.group(2)), int(match.group(1)))
+        return None
+
+
+# Period of DD/MM dates with no statement context: the 2024-10 statement the
+# parsers were written against, so results never depend on the clock
+DEFAULT_PERIOD: Final[StatementPeriod] = StatementPeriod(2024, 10)
+
+
+# -- Scalar path ---------------------------------------------------------
+
+
+def parse_amount(text: Optional[str]) -> Optional[Decimal]:
+    """Parse ``'R$ -1.234,56'``-style text to ``Decimal``; ``None`` if no number."""
     if text is None:
         return None
-    txt = text.strip().replace(" ", "").replace("-", "-")
-    if "," in txt and txt.rfind(",") > txt.rfind("."):
-        txt = txt.replace(".", "").replace(",", ".")
+    body = _AMOUNT_JUNK.sub("", text)
+    negative = "-" in body
+    if negative:
+        body = body.replace("-", "")
+    last = max(body.rfind(","), body.rfind("."))
+    if last >= 0:
+        head, sep, tail = body[:last], body[last], body[last + 1:]
+        other = "." if sep == "," else ","
+        digits = head.replace(",", "").replace(".", "")
+        # A repeated separator with no other one in sight groups thousands
+        body = digits + tail if sep in head and other not in head else f"{digits}.{tail}"
+    try:
+        value = Decimal(body)
+    except InvalidOperation:
+        return None
+    return -value if negative else value
+
+
+def parse_date(text: Optional[str], period: Optional[StatementPeriod] = None) -> Optional[date]:
+    """Parse a statement date; ``None`` if it is not one.
+
+    ``DD/MM`` dates take their year from ``period`` (default:
+    ``DEFAULT_PERIOD``).
+    """
+    if not text:
+        return None
+    match = RE_DATE.match(text)
+    if not match:
+        return None
+    iso_year, iso_month, iso_day, day, month, year = match.groups()
     try:
-        return float(txt)
+        if iso_year:
+            return date(int(iso_year), int(iso_month), int(iso_day))
+        month_number = int(month)
+        if year:
+            year_number = int(year) + (2000 if len(year) == 2 else 0)
+        else:
+            year_number = (period or DEFAULT_PERIOD).year_of(month_number)
+        return date(year_number, month_number, int(day))
     except ValueError:
         return None
 
 
+def parse_brazil_number(text: str) -> Optional[float]:
+    """Convert '71.543,24' or '- 1.234,56' → -1234.56 (float)."""
+    value = parse_amount(text)
+    return None if value is None else float(value)
+
+
 def normalise_date(day_month: str, year_hint: int) -> str:
     """
     Convert '03/10' + 2024 → '2024-10-03'.
@@ -22,3 +155,112 @@ def normalise_date(day_month: str, year_hint: int) -> str:
     """
     day, month = day_month.split("/")
     return datetime(year_hint, int(month), int(day)).strftime("%Y-%m-%d")
+
+
+# -- Batch path ----------------------------------------------------------
+#
+# Each step is its own ``select`` over named columns: Polars does not share
+# a regex extraction between nested expressions, so one kernel expression
+# would re-run it for every reference.
+
+
+def _as_series(values: Any) -> pl.Series:
+    """A Polars string series over an Arrow, NumPy, Polars or Python column."""
+    import polars as pl
+    import pyarrow as pa
+
+    if isinstance(values, pl.Series):
+        series = values
+    elif isinstance(values, (pa.Array, pa.ChunkedArray)):
+        series = pl.from_arrow(values)
+    else:
+        series = pl.Series(values, dtype=pl.String)
+    return series.cast(pl.String).alias("text")
+
+
+def parse_amounts(values: Any) -> pa.Array:
+    """Column version of ``parse_amount`` (``decimal128(38, 10)``, null if unparsable)."""
+    import polars as pl
+
+    from .transaction_batch import MONEY_DTYPE
+
+    cleaned = _as_series(values).str.replace_all(_AMOUNT_JUNK.pattern, "")
+    frame = pl.DataFrame(
+        {
+            "negative": cleaned.str.contains("-", literal=True),
+            "body": cleaned.str.replace_all("-", "", literal=True),
+        }
+    )
+    # Split at the last separator: head, separator, decimals
+    frame = frame.with_columns(
+        pl.col("body").str.extract_groups(r"^(.*)([.,])(\d*)$").struct.unnest()
+    ).select(
+        "negative",
+        "body",
+        pl.col("2").alias("sep"),
+        pl.col("3").alias("tail"),
+        pl.col("1").str.replace_all(r"[.,]", "").alias("head"),
+        pl.col("1").str.contains(",", literal=True).alias("head_comma"),
+        pl.col("1").str.contains(".", literal=True).alias("head_dot"),
+    )
+    sep = pl.col("sep")
+    decimal = ((sep == ",") & (~pl.col("head_comma") | pl.col("head_dot"))) | (
+        (sep == ".") & (~pl.col("head_dot") | pl.col("head_comma"))
+    )
+    frame = frame.select(
+        "negative",
+        pl.when(sep.is_null())
+        .then(pl.col("body"))
+        .when(decimal)
+        .then(pl.col("head") + "." + pl.col("tail"))
+        .otherwise(pl.col("head") + pl.col("tail"))
+        .alias("number"),
+    )
+    number = pl.col("number")
+    amounts = frame.select(
+        pl.when(number.str.contains(r"\d"))
+        .then(pl.when(pl.col("negative")).then("-" + number).otherwise(number))
+        .cast(MONEY_DTYPE, strict=False)
+    )
+    return amounts.to_series().to_arrow()
+
+
+def parse_dates(values: Any, period: Optional[StatementPeriod] = None) -> pa.Array:
+    """Column version of ``parse_date`` (``date32``, null if unparsable).
+
+    Without a ``period`` the statement is taken to close in the month of the
+    latest fully dated value in the column (``DEFAULT_PERIOD`` if there is none).
+    """
+    import polars as pl
+
+    parts = _as_series(values).str.extract_groups(_DATE_PATTERN).struct.unnest()
+    frame = parts.select(
+        pl.coalesce("1", "6").str.len_chars().alias("year_digits"),
+        pl.coalesce("1", "6").cast(pl.Int32).alias("year"),
+        pl.coalesce("2", "5").cast(pl.Int32).alias("month"),
+        pl.coalesce("3", "4").cast(pl.Int32).alias("day"),
+    ).select(
+        pl.when(pl.col("year_digits") == 2)
+        .then(pl.col("year") + 2000)
+        .otherwise(pl.col("year"))
+        .alias("year"),
+        "month",
+        "day",
+    )
+    month = pl.col("month")
+
+    if period is None:
+        latest = frame.select(_ymd_date(pl.col("year"), month, pl.col("day")).max()).item()
+        period = StatementPeriod.containing(latest) if latest else DEFAULT_PERIOD
+    inferred = pl.when(month <= period.month).then(period.year).otherwise(period.year - 1)
+
+    dates = frame.select(_ymd_date(pl.coalesce("year", inferred), month, pl.col("day")))
+    return dates.to_series().to_arrow()
+
+
+def _ymd_date(year: pl.Expr, month: pl.Expr, day: pl.Expr) -> pl.Expr:
+    """Date from integer parts; impossible dates (31/02) become null."""
+    import polars as pl
+
+    text = pl.format("{}-{}-{}", year, month, day)
+    return text.str.strptime(pl.Date, "%Y-%m-%d", strict=False)
@@ -0,0 +1,151 @@
+"""Record-and-replay store for raw cloud OCR responses.
+
+Modes (``EVOLVE_OCR_MODE``):
+
+- ``passthrough``: call the live service, store nothing (default)
+- ``record``: call the live service and store its raw response
+- ``replay``: serve stored responses only; never touch the network
+
+Responses are gzipped JSON files keyed by service, PDF SHA-256 and the
+request parameters, so parser changes can be re-run over a recorded corpus
+offline, at zero cost and with deterministic latency.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Final
+
+RECORDER_MODES: Final[tuple[str, ...]] = ("passthrough", "record", "replay")
+DEFAULT_STORE_DIR: Final[Path] = Path("data/ocr_recordings")
+
+
+class RecordingNotFoundError(LookupError):
+    """Raised in replay mode when no response was recorded for a request."""
+
+
+class OCRRecorder:
+    """Persist raw service responses and serve them back on request."""
+
+    def __init__(self, store_dir: Path | str | None = None, mode: str | None = None):
+        self.store_dir = Path(
+            store_dir or os.getenv("EVOLVE_OCR_STORE") or DEFAULT_STORE_DIR
+        )
+        self.mode = (mode or os.getenv("EVOLVE_OCR_MODE") or "passthrough").lower()
+        if self.mode not in RECORDER_MODES:
+            raise ValueError(
+                f"Unknown OCR recorder mode: {self.mode}. Available: {list(RECORDER_MODES)}"
+            )
+        self._lock = threading.Lock()
+
+    @property
+    def replaying(self) -> bool:
+        """Whether responses come from the store instead of the service."""
+        return self.mode == "replay"
+
+    @staticmethod
+    def make_key(service: str, content_hash: str, params: dict[str, Any]) -> str:
+        """Key for one request: service, document hash and canonical params."""
+        canonical = json.dumps(params, sort_keys=True, default=str)
+        raw = f"{service}:{content_hash}:{canonical}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, service: str, key: str) -> Path:
+        return self.store_dir / service / f"{key}.json.gz"
+
+    def call(
+        self,
+        service: str,
+        content_hash: str,
+        params: dict[str, Any],
+        live: Callable[[], Any],
+        encode: Callable[[Any], Any] = lambda response: response,
+        decode: Callable[[Any], Any] = lambda payload: payload,
+    ) -> Any:
+        """Return the service response for a request, honouring the mode.
+
+        ``live`` performs the real call; ``encode``/``decode`` convert the
+        response to and from a JSON-serialisable payload.
+        """
+        key = self.make_key(service, content_hash, params)
+
+        if self.replaying:
+            payload = self.load(service, key)
+            if payload is None:
+                raise RecordingNotFoundError(
+                    f"No recorded {service} response for document {content_hash[:12]} "
+                    f"with params {params}"
+                )
+            return decode(payload)
+
+        start_time = time.time()
+        response = live()
+        latency_ms = (time.time() - start_time) * 1000
+
+        if self.mode == "record":
+            self.save(service, key, encode(response), content_hash, params, latency_ms)
+        return response
+
+    def load(self, service: str, key: str) -> Any | None:
+        """Stored payload for ``key`` (or None)."""
+        path = self._path(service, key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)["response"]
+        except FileNotFoundError:
+            return None
+
+    def save(
+        self,
+        service: str,
+        key: str,
+        payload: Any,
+        content_hash: str,
+        params: dict[str, Any],
+        latency_ms: float,
+    ) -> None:
+        """Write one recording (atomically) to the store."""
+        path = self._path(service, key)
+        record = {
+            "service": service,
+            "content_hash": content_hash,
+            "params": params,
+            "recorded_at": datetime.now().isoformat(),
+            "latency_ms": latency_ms,
+            "response": payload,
+        }
+        try:
+            with self._lock:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                    json.dump(record, f, default=str)
+                os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Failed to record {service} response: {e}")
+
+
+_global_ocr_recorder = None
+
+
+def get_ocr_recorder() -> OCRRecorder:
+    """Get the global OCR recorder (configured from the environment)."""
+    global _global_ocr_recorder
+    if _global_ocr_recorder is None:
+        _global_ocr_recorder = OCRRecorder()
+    return _global_ocr_recorder
+
+
+def set_ocr_recorder_mode(mode: str) -> OCRRecorder:
+    """Switch the global recorder to ``mode`` (e.g. from a CLI flag)."""
+    global _global_ocr_recorder
+    _global_ocr_recorder = OCRRecorder(mode=mode)
+    return _global_ocr_recorder
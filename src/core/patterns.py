@@ -8,6 +8,8 @@ from datetime import date
 from decimal import Decimal, InvalidOperation
 from typing import Final, Optional, Tuple
 
+from .normalise import StatementPeriod, parse_amount, parse_date
+
 # Core posting patterns from proven codex.py
 RE_POSTING_NATIONAL: Final[re.Pattern[str]] = re.compile(
     r"^(?P<date>\d{2}/\d{2})\s+(?P<desc>.+?)\s+(?P<amount>-?\d{1,3}(?:\.\d{3})*,\d{2})$"
@@ -106,25 +108,9 @@ def clean_line(raw: str) -> str:
 
 
 def normalize_amount(amount_str: str) -> Decimal:
-    """Normalize Brazilian currency format to Decimal."""
-    try:
-        # Remove spaces
-        cleaned = amount_str.replace(" ", "")
-        
-        # Handle Brazilian format: 1.234,56 -> 1234.56
-        if "," in cleaned and "." in cleaned:
-            # Has both comma and dot - Brazilian format with thousands separators
-            cleaned = cleaned.replace(".", "").replace(",", ".")
-        elif "," in cleaned:
-            # Only comma - treat as decimal separator
-            cleaned = cleaned.replace(",", ".")
-        # If only dots, leave as-is (already decimal format)
-        
-        # Remove any remaining non-digit characters except decimal point and minus
-        cleaned = re.sub(r"[^\d\.\-]", "", cleaned)
-        return Decimal(cleaned)
-    except (InvalidOperation, ValueError):
-        return Decimal("0")
+    """Normalize Brazilian (or US) currency text to Decimal, 0 if unparsable."""
+    amount = parse_amount(amount_str)
+    return Decimal("0") if amount is None else amount
 
 
 def extract_card_number(description: str) -> Optional[str]:
@@ -280,29 +266,17 @@ def is_international_transaction(description: str) -> bool:
     return any(indicator in description_upper for indicator in international_indicators)
 
 
-def normalize_date(date_str: str, ref_year: int = 2024, ref_month: int = 10) -> str:
-    """Normalize date string to YYYY-MM-DD format."""
-    if not date_str:
-        return ""
-    
-    # Pattern for DD/MM or DD/MM/YYYY
-    date_pattern = re.compile(r"(\d{1,2})/(\d{1,2})(?:/(\d{4}))?")
-    match = date_pattern.match(date_str.strip())
-    
-    if not match:
-        return date_str  # Return as-is if no match
-    
-    day = int(match.group(1))
-    month = int(match.group(2))
-    year = int(match.group(3)) if match.group(3) else ref_year
-    
-    # Validate date components
-    if month < 1 or month > 12:
-        return date_str
-    if day < 1 or day > 31:
-        return date_str
-    
-    return f"{year:04d}-{month:02d}-{day:02d}"
+def normalize_date(date_str: str, period: Optional[StatementPeriod] = None) -> str:
+    """Normalize date string to YYYY-MM-DD format.
+
+    ``DD/MM`` dates take their year from the statement ``period`` (default:
+    ``DEFAULT_PERIOD``, closing 2024-10; never the current date). Months
+    after the closing month fall in the previous year, so without a period
+    ``20/11`` is ``2023-11-20`` (the old ``ref_year=2024`` gave 2024).
+    Unparsable text is returned as-is.
+    """
+    parsed = parse_date(date_str, period)
+    return parsed.isoformat() if parsed else date_str
 
 
 def validate_date(date_str: str) -> bool:
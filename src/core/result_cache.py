@@ -0,0 +1,152 @@
+"""Content-addressed on-disk cache of extractor results."""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Final
+
+from .models import ExtractorType, PipelineResult
+
+DEFAULT_CACHE_DIR: Final[Path] = Path.home() / ".cache" / "evolve" / "results"
+DEFAULT_MAX_MB: Final[int] = 256
+
+# Bump to invalidate every cached result (e.g. when PipelineResult changes shape)
+CACHE_FORMAT_VERSION: Final[int] = 2
+
+# Modules whose source feeds every extractor's output
+_SHARED_SOURCES: Final[tuple[str, ...]] = (
+    "core/models.py",
+    "core/patterns.py",
+    "core/regex_catalogue.py",
+    "core/line_classifier.py",
+    "core/normalise.py",
+    "core/document_session.py",
+    "core/word_table.py",
+    "extractors/base_extractor.py",
+    "extractors/line_pipeline.py",
+    "extractors/itau_patterns.py",
+)
+
+_SRC_ROOT: Final[Path] = Path(__file__).resolve().parent.parent
+
+_version_lock = threading.Lock()
+_version_cache: dict[type, str] = {}
+
+
+def extractor_version(extractor: object) -> str:
+    """Hash of the extractor's module plus the shared parsing/pattern modules.
+
+    Any edit to the code that produces a result yields a new version, so
+    stale entries are never served after a parser or pattern change.
+    """
+    cls = type(extractor)
+    with _version_lock:
+        version = _version_cache.get(cls)
+        if version is None:
+            digest = hashlib.sha256(str(CACHE_FORMAT_VERSION).encode())
+            sources = [Path(inspect.getfile(cls))]
+            sources += [_SRC_ROOT / name for name in _SHARED_SOURCES]
+            for source in sources:
+                try:
+                    digest.update(source.read_bytes())
+                except OSError:
+                    digest.update(str(source).encode())
+            version = digest.hexdigest()[:16]
+            _version_cache[cls] = version
+        return version
+
+
+class ResultCache:
+    """Persistent ``PipelineResult`` cache keyed by PDF hash, extractor and version.
+
+    Entries are pickled files named by the SHA-256 of the key. Reads touch
+    the file's mtime and writes evict the least recently used entries once
+    the directory grows past ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: Path | str | None = None, max_bytes: int | None = None):
+        self.cache_dir = Path(
+            cache_dir or os.getenv("EVOLVE_CACHE_DIR") or DEFAULT_CACHE_DIR
+        )
+        self.max_bytes = max_bytes or (
+            int(os.getenv("EVOLVE_CACHE_MAX_MB", str(DEFAULT_MAX_MB))) * 1024 * 1024
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(content_hash: str, extractor_type: ExtractorType, version: str) -> str:
+        """Cache key for one extractor run over one PDF."""
+        raw = f"{content_hash}:{extractor_type.value}:{version}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> PipelineResult | None:
+        """Cached result for ``key`` (or None on a miss or unreadable entry)."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+            os.utime(path)
+            return result
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, result: PipelineResult) -> None:
+        """Store ``result`` (including its ``raw_data``) under ``key``."""
+        path = self._path(key)
+        try:
+            payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_bytes(payload)
+                os.replace(tmp_path, path)
+                self._evict()
+        except Exception as e:
+            print(f"Failed to cache result: {e}")
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits ``max_bytes``."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*/*.pkl"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            for path in self.cache_dir.glob("*/*.pkl"):
+                path.unlink(missing_ok=True)
+
+
+_global_result_cache = None
+
+
+def get_result_cache() -> ResultCache:
+    """Get the global extractor result cache."""
+    global _global_result_cache
+    if _global_result_cache is None:
+        _global_result_cache = ResultCache()
+    return _global_result_cache
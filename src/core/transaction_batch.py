@@ -0,0 +1,236 @@
+"""Columnar batch of transactions backed by an Arrow table."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import MISSING, fields
+from decimal import Decimal
+from enum import Enum
+from operator import attrgetter
+from typing import Final
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .models import DECIMAL_FIELDS, ExtractorType, Transaction, TransactionType
+
+# Money columns share one fixed-point type; 10 places covers FX ratios
+MONEY_SCALE: Final[int] = 10
+MONEY_TYPE: Final[pa.DataType] = pa.decimal128(38, MONEY_SCALE)
+MONEY_DTYPE: Final[pl.Decimal] = pl.Decimal(38, MONEY_SCALE)
+
+_QUANTUM: Final[Decimal] = Decimal(1).scaleb(-MONEY_SCALE)
+_CENT: Final[Decimal] = Decimal("0.01")
+
+# Field order follows the Transaction dataclass, so rows map positionally
+TRANSACTION_SCHEMA: Final[pa.Schema] = pa.schema(
+    [
+        ("date", pa.date32()),
+        ("description", pa.large_string()),
+        ("amount_brl", MONEY_TYPE),
+        ("card_last4", pa.large_string()),
+        ("installment_seq", pa.int32()),
+        ("installment_tot", pa.int32()),
+        ("fx_rate", MONEY_TYPE),
+        ("iof_brl", MONEY_TYPE),
+        ("category", pa.large_string()),
+        ("merchant_city", pa.large_string()),
+        ("ledger_hash", pa.large_string()),
+        ("prev_bill_amount", MONEY_TYPE),
+        ("interest_amount", MONEY_TYPE),
+        ("amount_orig", MONEY_TYPE),
+        ("currency_orig", pa.large_string()),
+        ("amount_usd", MONEY_TYPE),
+        ("transaction_type", pa.large_string()),
+        ("confidence_score", pa.float64()),
+        ("bbox", pa.list_(pa.float64(), 4)),
+        ("source_extractor", pa.large_string()),
+        ("raw_text", pa.large_string()),
+    ]
+)
+
+COLUMNS: Final[tuple[str, ...]] = tuple(TRANSACTION_SCHEMA.names)
+
+_ENUM_COLUMNS: Final[dict[str, type]] = {
+    "transaction_type": TransactionType,
+    "source_extractor": ExtractorType,
+}
+
+
+def _column_defaults() -> dict[str, object]:
+    """Arrow-ready defaults of the optional ``Transaction`` fields."""
+    defaults = {}
+    for field in fields(Transaction):
+        if field.default is not MISSING:
+            value = field.default
+            defaults[field.name] = value.value if isinstance(value, Enum) else value
+    return defaults
+
+
+_DEFAULTS: Final[dict[str, object]] = _column_defaults()
+
+
+def _to_money(value: Decimal | None) -> Decimal | None:
+    """Fit a Decimal into ``MONEY_TYPE``, rounding digits past its scale."""
+    if value is None:
+        return None
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    if value.as_tuple().exponent < -MONEY_SCALE:
+        return value.quantize(_QUANTUM)
+    return value
+
+
+def from_money(value: Decimal | None) -> Decimal | None:
+    """Drop the padding zeros Arrow adds, keeping at least cents."""
+    if value is None:
+        return None
+    trimmed = value.normalize()
+    if trimmed.as_tuple().exponent > -2:
+        return value.quantize(_CENT)
+    return trimmed
+
+
+def money(value: Decimal | str | int) -> pl.Expr:
+    """Polars literal of ``value`` in the batch money type."""
+    return pl.lit(Decimal(str(value)), dtype=MONEY_DTYPE)
+
+
+def money_text(column: pa.ChunkedArray, places: int) -> pa.ChunkedArray:
+    """Format a money column like ``f"{value:.{places}f}"`` (half-even)."""
+    rounded = pc.round(column, ndigits=places, round_mode="half_to_even")
+    return rounded.cast(pa.decimal128(38, places)).cast(pa.large_string())
+
+
+class TransactionBatch:
+    """Immutable column-oriented set of transactions.
+
+    Wraps a ``pyarrow.Table`` with ``TRANSACTION_SCHEMA``. Conversion to and
+    from Arrow is zero-copy, and ``to_polars``/``from_polars`` share the
+    numeric and date buffers (Polars re-encodes strings), so stages can run
+    Polars expressions over whole columns and hand the result on.
+    ``from_transactions``/``to_transactions`` adapt to and from the row
+    model at the edges. Money columns are ``decimal128(38, 10)``; enums are
+    stored by value.
+    """
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: pa.Table):
+        if table.schema != TRANSACTION_SCHEMA:
+            for name in COLUMNS:
+                if name not in table.column_names and name in _DEFAULTS:
+                    kind = TRANSACTION_SCHEMA.field(name).type
+                    column = pa.repeat(pa.scalar(_DEFAULTS[name], kind), table.num_rows)
+                    table = table.append_column(name, column)
+            table = table.select(list(COLUMNS)).cast(TRANSACTION_SCHEMA)
+        self._table = table
+
+    # -- Arrow / Polars ----------------------------------------------------
+
+    @classmethod
+    def from_arrow(cls, table: pa.Table) -> TransactionBatch:
+        """Wrap an Arrow table (no copy when it already has the schema).
+
+        Other tables are cast to the schema; absent optional columns take
+        the ``Transaction`` defaults.
+        """
+        return cls(table)
+
+    def to_arrow(self) -> pa.Table:
+        """The underlying Arrow table."""
+        return self._table
+
+    @classmethod
+    def from_polars(cls, frame: pl.DataFrame) -> TransactionBatch:
+        """Wrap a Polars frame holding (at least the required) columns."""
+        present = [name for name in COLUMNS if name in frame.columns]
+        return cls(frame.select(present).to_arrow())
+
+    def to_polars(self) -> pl.DataFrame:
+        """The columns as a Polars frame."""
+        return pl.from_arrow(self._table)
+
+    def with_columns(self, *exprs: pl.Expr, **named: pl.Expr) -> TransactionBatch:
+        """New batch with Polars expressions applied to the columns."""
+        return self.from_polars(self.to_polars().with_columns(*exprs, **named))
+
+    # -- Row model adapters ------------------------------------------------
+
+    @classmethod
+    def empty(cls) -> TransactionBatch:
+        """Batch with no rows."""
+        return cls(TRANSACTION_SCHEMA.empty_table())
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[Transaction]) -> TransactionBatch:
+        """Build a batch from ``Transaction`` objects in one pass."""
+        rows = list(map(attrgetter(*COLUMNS), transactions))
+        if not rows:
+            return cls.empty()
+        columns = [list(values) for values in zip(*rows)]
+        arrays = []
+        for name, values in zip(COLUMNS, columns):
+            if name in DECIMAL_FIELDS:
+                values = [_to_money(v) for v in values]
+            elif name in _ENUM_COLUMNS:
+                values = [None if v is None else v.value for v in values]
+            arrays.append(pa.array(values, type=TRANSACTION_SCHEMA.field(name).type))
+        return cls(pa.Table.from_arrays(arrays, schema=TRANSACTION_SCHEMA))
+
+    def to_transactions(self) -> list[Transaction]:
+        """Rebuild ``Transaction`` objects, one per row."""
+        columns = []
+        for name in COLUMNS:
+            values = self._table.column(name).to_pylist()
+            if name in DECIMAL_FIELDS:
+                values = [from_money(v) for v in values]
+            elif name in _ENUM_COLUMNS:
+                enum = _ENUM_COLUMNS[name]
+                values = [None if v is None else enum(v) for v in values]
+            elif name == "bbox":
+                values = [None if v is None else tuple(v) for v in values]
+            columns.append(values)
+        return [Transaction(*row) for row in zip(*columns)]
+
+    # -- Accessors ---------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._table.num_rows
+
+    def __repr__(self) -> str:
+        return f"TransactionBatch(rows={len(self)})"
+
+    def column(self, name: str) -> pa.ChunkedArray:
+        """One column as an Arrow array."""
+        return self._table.column(name)
+
+    def take(self, indices: Sequence[int]) -> TransactionBatch:
+        """Rows at ``indices``, in that order."""
+        return TransactionBatch(self._table.take(pa.array(indices, type=pa.int64())))
+
+    def concat(self, *others: TransactionBatch) -> TransactionBatch:
+        """This batch followed by ``others``."""
+        tables = [self._table, *(other._table for other in others)]
+        return TransactionBatch(pa.concat_tables(tables))
+
+    def replace_rows(
+        self, indices: Sequence[int], rows: TransactionBatch
+    ) -> TransactionBatch:
+        """Copy with the rows at ``indices`` replaced by ``rows`` (same order)."""
+        if not indices:
+            return self
+        index = pa.array(indices, type=pa.int64())
+        keep = pc.invert(pc.is_in(pa.array(range(len(self))), value_set=index))
+        order = pc.sort_indices(
+            pa.concat_arrays([pc.indices_nonzero(keep).cast(pa.int64()), index])
+        )
+        merged = pa.concat_tables([self._table.filter(keep), rows._table])
+        return TransactionBatch(merged.take(order))
+
+    @property
+    def total_amount_brl(self) -> Decimal:
+        """Sum of ``amount_brl``."""
+        total = pc.sum(self._table.column("amount_brl")).as_py()
+        return Decimal("0") if total is None else from_money(total)
@@ -0,0 +1,160 @@
+"""NumPy-backed word geometry shared by the text and OCR extractors."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from operator import itemgetter
+from typing import Any, Final
+
+import numpy as np
+
+# Words whose tops are this close (in points) share a visual line;
+# pdfplumber's default y_tolerance
+DEFAULT_ROW_TOLERANCE: Final[float] = 3.0
+
+# Row ids are scaled past any page width so one sort orders rows, then x0
+_ROW_KEY_SCALE: Final[float] = 1e6
+
+
+def _first(word: Mapping[str, Any], keys: tuple[str, ...], default: float) -> float:
+    for key in keys:
+        value = word.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+class WordTable:
+    """Column arrays (``x0``, ``x1``, ``top``, ``bottom``) plus word texts.
+
+    Row grouping is one sort by ``(top, x0)`` and a split wherever the gap
+    between consecutive tops exceeds the tolerance (a word joins the current
+    row while it is within the tolerance of the previous word). Rows are
+    returned as ``(order, starts)``: ``order`` lists word indexes row by row,
+    left to right, and ``starts`` holds the offset of each row in ``order``.
+    """
+
+    __slots__ = ("x0", "x1", "top", "bottom", "texts")
+
+    def __init__(
+        self,
+        x0: Sequence[float] | np.ndarray,
+        x1: Sequence[float] | np.ndarray,
+        top: Sequence[float] | np.ndarray,
+        bottom: Sequence[float] | np.ndarray,
+        texts: Sequence[str],
+    ):
+        self.x0 = np.asarray(x0, dtype=np.float64)
+        self.x1 = np.asarray(x1, dtype=np.float64)
+        self.top = np.asarray(top, dtype=np.float64)
+        self.bottom = np.asarray(bottom, dtype=np.float64)
+        self.texts = list(texts)
+
+    @classmethod
+    def from_dicts(cls, words: Iterable[Mapping[str, Any]]) -> WordTable:
+        """Build from word dicts (pdfplumber, or Textract/Azure-normalised).
+
+        Accepts ``x0``/``left``, ``x1``/``right`` (or ``x0 + width``),
+        ``top``/``y``/``y0`` and ``bottom``/``y1`` (or ``top + height``).
+        """
+        words = words if isinstance(words, Sequence) else list(words)
+        try:
+            # pdfplumber words carry every key: one C-level pass per column
+            columns = [
+                np.fromiter(map(itemgetter(key), words), np.float64, len(words))
+                for key in ("x0", "x1", "top", "bottom")
+            ]
+            return cls(*columns, list(map(itemgetter("text"), words)))
+        except (KeyError, TypeError):
+            pass
+
+        x0, x1, top, bottom, texts = [], [], [], [], []
+        for word in words:
+            left = _first(word, ("x0", "left"), 0.0)
+            upper = _first(word, ("top", "y", "y0"), 0.0)
+            x0.append(left)
+            top.append(upper)
+            x1.append(_first(word, ("x1", "right"), left + word.get("width", 0)))
+            bottom.append(_first(word, ("bottom", "y1"), upper + word.get("height", 0)))
+            texts.append(word.get("text", ""))
+        return cls(x0, x1, top, bottom, texts)
+
+    @classmethod
+    def from_tuples(cls, words: Sequence[Sequence[Any]]) -> WordTable:
+        """Build from PyMuPDF ``get_text("words")`` tuples."""
+        x0, top, x1, bottom = (
+            np.fromiter(map(itemgetter(i), words), np.float64, len(words))
+            for i in range(4)
+        )
+        return cls(x0, x1, top, bottom, list(map(itemgetter(4), words)))
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def group_rows(
+        self, tolerance: float = DEFAULT_ROW_TOLERANCE
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Group words into rows; returns ``(order, starts)``."""
+        if not len(self):
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+        by_top = np.argsort(self.top, kind="stable")
+        tops = self.top[by_top]
+        breaks = np.flatnonzero(tops[1:] - tops[:-1] > tolerance) + 1
+
+        # Within a row, order left to right: one sort on (row id, x0)
+        row_ids = np.zeros(len(by_top), dtype=np.float64)
+        row_ids[breaks] = 1.0
+        key = np.cumsum(row_ids, out=row_ids)
+        key *= _ROW_KEY_SCALE
+        key += self.x0[by_top] - self.x0.min()
+        order = by_top[np.argsort(key, kind="stable")]
+        return order, np.concatenate(([0], breaks))
+
+    def split_rows(
+        self, items: Sequence[Any], order: np.ndarray, starts: np.ndarray
+    ) -> list[list[Any]]:
+        """Lay ``items`` (one per word) out row by row, left to right."""
+        ordered = [items[i] for i in order.tolist()]
+        bounds = starts.tolist() + [len(ordered)]
+        return [ordered[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
+    def row_texts(self, order: np.ndarray, starts: np.ndarray) -> list[str]:
+        """Text of each row: its words joined by single spaces."""
+        return [" ".join(row) for row in self.split_rows(self.texts, order, starts)]
+
+    def row_bboxes(self, order: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """``(n_rows, 4)`` array of ``(x0, top, x1, bottom)`` per row."""
+        if not len(order):
+            return np.empty((0, 4))
+        return np.column_stack(
+            (
+                np.minimum.reduceat(self.x0[order], starts),
+                np.minimum.reduceat(self.top[order], starts),
+                np.maximum.reduceat(self.x1[order], starts),
+                np.maximum.reduceat(self.bottom[order], starts),
+            )
+        )
+
+    def bbox(self) -> tuple[float, float, float, float]:
+        """Bounding box of every word (``(0, 0, 0, 0)`` when empty)."""
+        if not len(self):
+            return (0, 0, 0, 0)
+        return (
+            float(self.x0.min()),
+            float(self.top.min()),
+            float(self.x1.max()),
+            float(self.bottom.max()),
+        )
+
+    def text(self, tolerance: float = DEFAULT_ROW_TOLERANCE) -> str:
+        """Page text with one visual row per line."""
+        order, starts = self.group_rows(tolerance)
+        if not len(order):
+            return ""
+        # Separator after each word: newline at row ends, space elsewhere
+        separators = np.full(len(order), " ", dtype=object)
+        separators[starts[1:] - 1] = "\n"
+        texts = self.texts
+        words = [texts[i] for i in order.tolist()]
+        return "".join(map(str.__add__, words, separators.tolist()))[:-1]
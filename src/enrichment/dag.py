@@ -0,0 +1,61 @@
+"""Dependency-aware concurrent scheduling of enrichment stages."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EnrichmentStage:
+    """One enrichment step and the ``Transaction`` fields it reads and writes."""
+
+    name: str
+    run: Callable[[], object]
+    reads: frozenset[str]
+    writes: frozenset[str]
+
+    def conflicts_with(self, other: EnrichmentStage) -> bool:
+        """Whether running both at once could change what either sees."""
+        return bool(self.writes & (other.reads | other.writes) or other.writes & self.reads)
+
+
+def stage_dependencies(stages: Sequence[EnrichmentStage]) -> dict[str, list[str]]:
+    """Earlier stages each stage has to wait for.
+
+    ``stages`` is in sequential order. A stage waits for every earlier stage
+    it conflicts with, so any schedule that respects the dependencies gives
+    the same transactions as running the stages one after another.
+    """
+    return {
+        stage.name: [earlier.name for earlier in stages[:i] if earlier.conflicts_with(stage)]
+        for i, stage in enumerate(stages)
+    }
+
+
+async def run_stages(stages: Sequence[EnrichmentStage], executor: Executor | None = None) -> None:
+    """Run ``stages`` on ``executor``, each once its dependencies are done.
+
+    Independent stages run concurrently and the event loop only awaits, so
+    other documents in flight keep making progress. If a stage raises, the
+    stages not yet finished are cancelled and the error propagates.
+    """
+    loop = asyncio.get_running_loop()
+    dependencies = stage_dependencies(stages)
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def run(stage: EnrichmentStage) -> None:
+        await asyncio.gather(*(tasks[name] for name in dependencies[stage.name]))
+        await loop.run_in_executor(executor, stage.run)
+
+    for stage in stages:
+        tasks[stage.name] = asyncio.create_task(run(stage), name=f"enrich-{stage.name}")
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
@@ -7,6 +7,7 @@ from decimal import Decimal
 from typing import Final, Optional
 
 from src.core.models import Transaction
+from src.core.patterns import normalize_amount
 
 # Advanced FX parsing patterns from codex.py
 RE_FX_MAIN: Final[re.Pattern[str]] = re.compile(
@@ -35,11 +36,7 @@ class AdvancedFXParser:
 
     def _normalize_amount(self, amount_str: str) -> Decimal:
         """Normalize Brazilian currency format to Decimal."""
-        # Remove spaces and non-digit characters except comma and dot
-        cleaned = re.sub(r"[^\d,\-]", "", amount_str.replace(" ", ""))
-        # Convert dots and commas to proper decimal format
-        cleaned = cleaned.replace(".", "").replace(",", ".")
-        return Decimal(cleaned)
+        return normalize_amount(amount_str)
 
     def parse_fx_chunk(self, lines: list[str]) -> Optional[dict]:
         """
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 from src.core.models import Transaction
 
+if TYPE_CHECKING:  # Polars/Arrow load on first batch use
+    from src.core.transaction_batch import TransactionBatch
+
 # IOF rates based on Brazilian regulation
 IOF_RATE_NATIONAL: Final[Decimal] = Decimal("0.0038")  # 0.38% for national transactions
 IOF_RATE_INTERNATIONAL: Final[Decimal] = Decimal("0.0638")  # 6.38% for international transactions
@@ -32,3 +35,23 @@ class IOFCalculator:
         if transaction.iof_brl is None:
             transaction.iof_brl = self.calculate_iof(transaction)
         return transaction
+
+    def enrich_batch(self, batch: TransactionBatch) -> TransactionBatch:
+        """Fill missing ``iof_brl`` for a whole batch (see ``calculate_iof``)."""
+        import polars as pl
+
+        from src.core.transaction_batch import MONEY_DTYPE, money
+
+        amount = pl.col("amount_brl")
+        currency = pl.col("currency_orig")
+        international = currency.is_not_null() & (currency != "") & (currency != "BRL")
+        iof = (
+            pl.when(amount.is_null() | (amount == 0))
+            .then(money(0))
+            .when(international)
+            .then(amount.abs() * money(IOF_RATE_INTERNATIONAL))
+            .otherwise(amount.abs() * money(IOF_RATE_NATIONAL))
+        )
+        return batch.with_columns(
+            pl.col("iof_brl").fill_null(iof.cast(MONEY_DTYPE))
+        )
@@ -5,10 +5,13 @@ from __future__ import annotations
 import hashlib
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from src.core.models import Transaction
 
+if TYPE_CHECKING:  # Polars/Arrow load on first batch use
+    from src.core.transaction_batch import TransactionBatch
+
 
 class MetadataEnricher:
     """Enriches transactions with missing metadata fields."""
@@ -75,3 +78,59 @@ class MetadataEnricher:
             transaction.prev_bill_amount = Decimal("0")
         
         return transaction
+
+    def enrich_batch(self, batch: TransactionBatch) -> TransactionBatch:
+        """Fill missing metadata for a whole batch with column expressions.
+
+        Mirrors ``enrich_transaction``. Rows without a ledger hash get the
+        hash the row model computes lazily, so both paths agree.
+        """
+        import polars as pl
+
+        from src.core.transaction_batch import MONEY_DTYPE, TransactionBatch, money
+
+        amount_brl = pl.col("amount_brl")
+        amount_orig = pl.col("amount_orig")
+        fx_rate = pl.col("fx_rate")
+        currency = pl.col("currency_orig")
+
+        usd_rate = amount_brl / amount_orig
+        inferred_currency = (
+            pl.when(amount_orig.is_null() | (amount_orig == 0))
+            .then(pl.lit("BRL"))
+            .when((amount_orig - amount_brl).abs() < money("0.01"))
+            .then(pl.lit("BRL"))
+            .when(usd_rate.is_between(money("4.5"), money("6.5")))
+            .then(pl.lit("USD"))
+            .otherwise(pl.lit("BRL"))
+        )
+        has_fx = fx_rate.is_not_null() & (fx_rate != 0)
+        missing_usd = pl.col("amount_usd").is_null() | (pl.col("amount_usd") == 0)
+
+        frame = batch.to_polars().with_columns(
+            pl.when(currency.is_null() | (currency == ""))
+            .then(inferred_currency)
+            .otherwise(currency)
+            .alias("currency_orig"),
+            pl.when(missing_usd & has_fx)
+            .then((amount_brl / fx_rate).cast(MONEY_DTYPE))
+            .otherwise(pl.col("amount_usd"))
+            .alias("amount_usd"),
+            pl.col("installment_seq").fill_null(1),
+            pl.col("installment_tot").fill_null(1),
+            pl.col("interest_amount").fill_null(money(0)),
+            pl.col("prev_bill_amount").fill_null(money(0)),
+        )
+
+        missing_hash = frame.select(
+            pl.col("ledger_hash").is_null() | (pl.col("ledger_hash") == "")
+        ).to_series()
+        if missing_hash.any():
+            indices = missing_hash.arg_true().to_list()
+            rows = batch.take(indices).to_transactions()
+            hashes = frame.get_column("ledger_hash").scatter(
+                indices, [t.ledger_hash for t in rows]
+            )
+            frame = frame.with_columns(hashes)
+
+        return TransactionBatch.from_polars(frame)
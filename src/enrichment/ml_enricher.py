@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 import logging
+from decimal import Decimal
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from src.core.models import Transaction
-from src.ml.models.category_classifier import CategoryClassifier
-from src.ml.models.merchant_extractor import MerchantCityExtractor
-from src.ml.models.fx_predictor import FXRatePredictor
+from src.core.metrics import get_metrics
+from src.ml.model_registry import get_model_registry
+from src.ml.prediction_cache import PredictionCache, get_prediction_cache
+
+if TYPE_CHECKING:  # pandas/sklearn load only when a trained model is present
+    import polars as pl
+
+    from src.core.transaction_batch import TransactionBatch
+    from src.ml.models.category_classifier import CategoryClassifier
+    from src.ml.models.fx_predictor import FXRatePredictor
+    from src.ml.models.merchant_extractor import MerchantCityExtractor
 
 logger = logging.getLogger(__name__)
 
@@ -17,13 +26,21 @@ logger = logging.getLogger(__name__)
 class MLEnricher:
     """ML-based transaction enrichment using trained models."""
 
-    def __init__(self, models_dir: Path = Path("models")):
+    def __init__(
+        self,
+        models_dir: Path = Path("models"),
+        prediction_cache: Optional[PredictionCache] = None,
+    ):
         self.models_dir = models_dir
+        # Predictions of loaded models persist across statements and runs
+        self.prediction_cache = prediction_cache or get_prediction_cache()
         self.category_classifier: Optional[CategoryClassifier] = None
         self.merchant_extractor: Optional[MerchantCityExtractor] = None
         self.fx_predictor: Optional[FXRatePredictor] = None
-        
-        # Load models if available
+        # Registry generation of each artifact the models were loaded from
+        self._generations: dict[Path, int] = {}
+
+        # Load models if available; the registry loads each artifact once per process
         self._load_models()
 
     def _load_models(self):
@@ -32,8 +49,11 @@ class MLEnricher:
         category_model_path = self.models_dir / "category_classifier.joblib"
         if category_model_path.exists():
             try:
+                from src.ml.models.category_classifier import CategoryClassifier
+
                 self.category_classifier = CategoryClassifier()
                 self.category_classifier.load_model(category_model_path)
+                self.category_classifier.prediction_cache = self.prediction_cache
                 logger.info("Category classifier loaded successfully")
             except Exception as e:
                 logger.warning(f"Failed to load category classifier: {e}")
@@ -42,8 +62,11 @@ class MLEnricher:
         merchant_patterns_path = self.models_dir / "merchant_patterns.json"
         if merchant_patterns_path.exists():
             try:
+                from src.ml.models.merchant_extractor import MerchantCityExtractor
+
                 self.merchant_extractor = MerchantCityExtractor()
                 self.merchant_extractor.load_patterns(merchant_patterns_path)
+                self.merchant_extractor.prediction_cache = self.prediction_cache
                 logger.info("Merchant extractor loaded successfully")
             except Exception as e:
                 logger.warning(f"Failed to load merchant extractor: {e}")
@@ -52,12 +75,32 @@ class MLEnricher:
         fx_model_path = self.models_dir / "fx_predictor.joblib"
         if fx_model_path.exists():
             try:
+                from src.ml.models.fx_predictor import FXRatePredictor
+
                 self.fx_predictor = FXRatePredictor()
                 self.fx_predictor.load_model(fx_model_path)
                 logger.info("FX predictor loaded successfully")
             except Exception as e:
                 logger.warning(f"Failed to load FX predictor: {e}")
 
+        registry = get_model_registry()
+        self._generations = {
+            path: registry.generation(path)
+            for path in (category_model_path, merchant_patterns_path, fx_model_path)
+            if path.exists()
+        }
+
+    def refresh_models(self) -> bool:
+        """Reload the models if an artifact changed on disk; True if they were."""
+        registry = get_model_registry()
+        if all(
+            registry.generation(path) == generation
+            for path, generation in self._generations.items()
+        ):
+            return False
+        self._load_models()
+        return True
+
     def enrich_transaction(self, transaction: Transaction) -> Transaction:
         """Enrich a single transaction using ML models."""
         # ML-based category classification
@@ -118,27 +161,244 @@ class MLEnricher:
         return transaction
 
     def enrich_transactions(self, transactions: list[Transaction]) -> list[Transaction]:
-        """Enrich multiple transactions using ML models."""
+        """Enrich multiple transactions using ML models.
+
+        Same result as ``enrich_transaction`` on each, but every model sees
+        the rows it applies to in one batch call.
+        """
         if not transactions:
             return transactions
 
         logger.info(f"ML enriching {len(transactions)} transactions")
-        
-        enriched_count = 0
-        for transaction in transactions:
-            original_fields = self._count_filled_fields(transaction)
-            
-            # Apply ML enrichment
-            self.enrich_transaction(transaction)
-            
-            # Count improvement
-            enhanced_fields = self._count_filled_fields(transaction)
-            if enhanced_fields > original_fields:
-                enriched_count += 1
+        self.refresh_models()
+        before_stats = {name: dict(stats) for name, stats in self.prediction_cache.stats.items()}
+        original_fields = [self._count_filled_fields(t) for t in transactions]
+
+        self._classify_categories([t for t in transactions if not t.category])
+        self._extract_cities(transactions)
+        self._predict_fx_rates(
+            [
+                t
+                for t in transactions
+                if t.currency_orig and t.currency_orig != "BRL" and not t.fx_rate
+            ]
+        )
 
+        enriched_count = sum(
+            self._count_filled_fields(t) > before
+            for t, before in zip(transactions, original_fields)
+        )
         logger.info(f"ML enrichment improved {enriched_count}/{len(transactions)} transactions")
+        self._report_cache(before_stats)
         return transactions
 
+    def enrich_batch(self, batch: TransactionBatch) -> TransactionBatch:
+        """Columnar ``enrich_transactions`` for a ``TransactionBatch``.
+
+        The models read the description, amount and currency columns, and
+        their predictions are written back to the rows they apply to, so
+        the batch never goes back to ``Transaction`` objects.
+        """
+        import polars as pl
+
+        from src.core.transaction_batch import TransactionBatch
+
+        if not len(batch):
+            return batch
+
+        logger.info(f"ML enriching {len(batch)} transactions")
+        self.refresh_models()
+        before_stats = {name: dict(stats) for name, stats in self.prediction_cache.stats.items()}
+        frame = batch.to_polars()
+        improved = pl.Series([False] * len(frame))
+
+        columns = []
+        for step in (self._classify_category_column, self._extract_city_column, self._predict_fx_columns):
+            filled, updates = step(frame)
+            improved = improved | filled
+            columns += updates
+
+        logger.info(f"ML enrichment improved {improved.sum()}/{len(frame)} transactions")
+        self._report_cache(before_stats)
+        if not columns:
+            return batch
+        return TransactionBatch.from_polars(frame.with_columns(columns))
+
+    def _classify_category_column(self, frame: pl.DataFrame) -> tuple[pl.Series, list[pl.Series]]:
+        """Columnar ``_classify_categories``: rows filled and updated columns."""
+        import polars as pl
+
+        category = frame["category"]
+        missing = (category.is_null() | (category == "")).fill_null(True)
+        rows = missing.arg_true()
+        if not self.category_classifier or not len(rows):
+            return missing & False, []
+        try:
+            predictions = self.category_classifier.predict_batch(
+                frame["description"].gather(rows).to_list()
+            )
+        except Exception as e:
+            logger.warning(f"Category prediction failed: {e}")
+            return missing & False, []
+
+        labels, confidences = zip(*predictions)
+        # Boost transaction confidence based on ML confidence
+        scores = frame["confidence_score"]
+        boosted = (scores.gather(rows) + pl.Series(confidences) * 0.1).clip(upper_bound=1.0)
+        return missing, [
+            category.clone().scatter(rows, pl.Series(labels, dtype=pl.String)),
+            scores.clone().scatter(rows, boosted),
+        ]
+
+    def _extract_city_column(self, frame: pl.DataFrame) -> tuple[pl.Series, list[pl.Series]]:
+        """Columnar ``_extract_cities``: rows filled and updated columns."""
+        import polars as pl
+
+        current = frame["merchant_city"]
+        if not self.merchant_extractor:
+            return current.is_null() & False, []
+        try:
+            extracted = self.merchant_extractor.extract_batch(frame["description"].to_list())
+        except Exception as e:
+            logger.warning(f"Merchant extraction failed: {e}")
+            return current.is_null() & False, []
+
+        cities = pl.Series([city for _merchant, city in extracted], dtype=pl.String)
+        # Only update if we found something and field is empty
+        fill = (
+            (current.is_null() | (current == "")) & cities.is_not_null() & (cities != "")
+        ).fill_null(False)
+        return fill, [cities.zip_with(fill, current).alias("merchant_city")]
+
+    def _predict_fx_columns(self, frame: pl.DataFrame) -> tuple[pl.Series, list[pl.Series]]:
+        """Columnar ``_predict_fx_rates``: rows filled and updated columns."""
+        import polars as pl
+
+        from src.core.transaction_batch import MONEY_DTYPE, MONEY_SCALE
+
+        currency, fx_rate = frame["currency_orig"], frame["fx_rate"]
+        missing = (
+            currency.is_not_null()
+            & (currency != "")
+            & (currency != "BRL")
+            & (fx_rate.is_null() | (fx_rate == 0))
+        ).fill_null(False)
+        rows = missing.arg_true()
+        if not self.fx_predictor or not len(rows):
+            return missing & False, []
+
+        subset = frame[rows]
+        amounts_brl = [float(v) if v else 0 for v in subset["amount_brl"].to_list()]
+        try:
+            predictions = self.fx_predictor.predict_batch(
+                amounts_brl,
+                [float(v) if v else 0 for v in subset["amount_orig"].to_list()],
+                subset["currency_orig"].to_list(),
+                subset["description"].to_list(),
+            )
+        except Exception as e:
+            logger.warning(f"FX rate prediction failed: {e}")
+            return missing & False, []
+
+        # The row model stores these floats; convert them as from_transactions does
+        quantum = Decimal(1).scaleb(-MONEY_SCALE)
+
+        def to_money(value: float) -> Decimal:
+            return Decimal(str(value)).quantize(quantum)
+
+        filled, rates, usd_rows, usd = [], [], [], []
+        for row, amount_brl, amount_usd, (rate, _confidence) in zip(
+            rows.to_list(), amounts_brl, subset["amount_usd"].to_list(), predictions
+        ):
+            if rate > 0:
+                filled.append(row)
+                rates.append(to_money(rate))
+                # Calculate USD amount if missing
+                if not amount_usd and amount_brl:
+                    usd_rows.append(row)
+                    usd.append(to_money(amount_brl / rate))
+
+        done = missing & False
+        if not filled:
+            return done, []
+        return done.scatter(filled, True), [
+            fx_rate.clone().scatter(filled, pl.Series(rates, dtype=MONEY_DTYPE)),
+            frame["amount_usd"].clone().scatter(usd_rows, pl.Series(usd, dtype=MONEY_DTYPE)),
+        ]
+
+    def _report_cache(self, before: dict[str, dict[str, int]]):
+        """Log and record the prediction cache hits of one enrichment."""
+        for namespace, stats in self.prediction_cache.stats.items():
+            previous = before.get(namespace, {})
+            hits = sum(
+                stats[tier] - previous.get(tier, 0) for tier in ("memory_hits", "disk_hits")
+            )
+            misses = stats["misses"] - previous.get("misses", 0)
+            if hits + misses:
+                get_metrics().record_prediction_cache(namespace, hits, misses)
+                logger.info(
+                    f"Prediction cache {namespace}: {hits}/{hits + misses} hits "
+                    f"({hits / (hits + misses):.0%})"
+                )
+
+    def _classify_categories(self, transactions: list[Transaction]):
+        """Batch category classification for transactions without one."""
+        if not self.category_classifier or not transactions:
+            return
+        try:
+            predictions = self.category_classifier.predict_batch(
+                [t.description for t in transactions]
+            )
+        except Exception as e:
+            logger.warning(f"Category prediction failed: {e}")
+            return
+
+        for transaction, (category, confidence) in zip(transactions, predictions):
+            transaction.category = category
+            # Boost transaction confidence based on ML confidence
+            transaction.confidence_score = min(
+                transaction.confidence_score + (confidence * 0.1), 1.0
+            )
+
+    def _extract_cities(self, transactions: list[Transaction]):
+        """Batch merchant and city extraction."""
+        if not self.merchant_extractor:
+            return
+        try:
+            extracted = self.merchant_extractor.extract_batch(
+                [t.description for t in transactions]
+            )
+        except Exception as e:
+            logger.warning(f"Merchant extraction failed: {e}")
+            return
+
+        for transaction, (_merchant, city) in zip(transactions, extracted):
+            # Only update if we found something and field is empty
+            if city and not transaction.merchant_city:
+                transaction.merchant_city = city
+
+    def _predict_fx_rates(self, transactions: list[Transaction]):
+        """Batch FX rate prediction for international transactions without one."""
+        if not self.fx_predictor or not transactions:
+            return
+        try:
+            predictions = self.fx_predictor.predict_batch(
+                [float(t.amount_brl) if t.amount_brl else 0 for t in transactions],
+                [float(t.amount_orig) if t.amount_orig else 0 for t in transactions],
+                [t.currency_orig for t in transactions],
+                [t.description for t in transactions],
+            )
+        except Exception as e:
+            logger.warning(f"FX rate prediction failed: {e}")
+            return
+
+        for transaction, (fx_rate, _confidence) in zip(transactions, predictions):
+            if fx_rate > 0:
+                transaction.fx_rate = fx_rate
+                # Calculate USD amount if missing
+                if not transaction.amount_usd and transaction.amount_brl:
+                    transaction.amount_usd = float(transaction.amount_brl) / fx_rate
+
     def _count_filled_fields(self, transaction: Transaction) -> int:
         """Count how many fields are filled in the transaction."""
         count = 0
@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import re
 from decimal import Decimal
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
+from src.core.document_session import DocumentSession, document_text
 from src.core.models import EnsembleResult
+from src.core.patterns import normalize_amount
+
+if TYPE_CHECKING:  # Polars/Arrow load on first batch use
+    from src.core.transaction_batch import TransactionBatch
 
 # Patterns to extract totals from PDF statements
 RE_TOTAL_NACIONAL: Final[re.Pattern[str]] = re.compile(
@@ -25,12 +30,11 @@ class PDFValidator:
 
     def _normalize_amount(self, amount_str: str) -> Decimal:
         """Normalize Brazilian currency format to Decimal."""
-        # Remove thousands separators and convert comma to dot
-        cleaned = amount_str.replace(".", "").replace(",", ".")
-        return Decimal(cleaned)
+        return normalize_amount(amount_str)
 
-    def extract_pdf_totals(self, pdf_text: str) -> dict[str, Decimal]:
-        """Extract statement totals from PDF text."""
+    def extract_pdf_totals(self, pdf_text: str | DocumentSession) -> dict[str, Decimal]:
+        """Extract statement totals from PDF text (or a document session)."""
+        pdf_text = document_text(pdf_text) or ""
         totals = {}
         
         if match := RE_TOTAL_NACIONAL.search(pdf_text):
@@ -44,13 +48,13 @@ class PDFValidator:
         
         return totals
 
-    def validate_totals(self, result: EnsembleResult, pdf_text: str) -> dict[str, bool]:
+    def validate_totals(
+        self, result: EnsembleResult, pdf_text: str | DocumentSession
+    ) -> dict[str, bool]:
         """Validate extracted transaction totals against PDF statement."""
         pdf_totals = self.extract_pdf_totals(pdf_text)
-        validation_results = {}
-        
         if not result.final_transactions:
-            return validation_results
+            return {}
 
         # Calculate totals from extracted transactions
         nacional_total = sum(
@@ -63,6 +67,36 @@ class PDFValidator:
             if t.amount_brl and t.currency_orig and t.currency_orig != "BRL"
         )
         
+        return self._compare_totals(pdf_totals, nacional_total, internacional_total)
+
+    def validate_batch_totals(
+        self, batch: TransactionBatch, pdf_text: str | DocumentSession
+    ) -> dict[str, bool]:
+        """Columnar ``validate_totals`` for a ``TransactionBatch``."""
+        import polars as pl
+
+        pdf_totals = self.extract_pdf_totals(pdf_text)
+        if not len(batch):
+            return {}
+
+        amount = pl.col("amount_brl")
+        currency = pl.col("currency_orig")
+        international = currency.is_not_null() & (currency != "") & (currency != "BRL")
+        counted = amount.is_not_null() & (amount != 0)
+        totals = batch.to_polars().select(
+            amount.abs().filter(counted & ~international).sum().alias("nacional"),
+            amount.abs().filter(counted & international).sum().alias("internacional"),
+        ).row(0)
+        return self._compare_totals(pdf_totals, *(Decimal(str(t)) for t in totals))
+
+    def _compare_totals(
+        self,
+        pdf_totals: dict[str, Decimal],
+        nacional_total: Decimal,
+        internacional_total: Decimal,
+    ) -> dict[str, bool]:
+        """Check extracted totals against the statement's, within 5%."""
+        validation_results = {}
         geral_total = nacional_total + internacional_total
 
         # Validate with 5% tolerance
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Final, Optional
 
+from src.core.document_session import DocumentSession
 from src.core.models import EnsembleResult, Transaction
+from src.enrichment.dag import EnrichmentStage, run_stages
 from src.enrichment.fx_parser import AdvancedFXParser
 from src.enrichment.iof_calculator import IOFCalculator
 from src.enrichment.metadata_enricher import MetadataEnricher
@@ -13,13 +18,75 @@ from src.enrichment.ml_enricher import MLEnricher
 from src.enrichment.pdf_validator import PDFValidator
 from src.enrichment.template_matcher import ItauTemplateMatcher
 
+if TYPE_CHECKING:  # Polars/Arrow load on first batch use
+    from src.core.transaction_batch import TransactionBatch
+
 logger = logging.getLogger(__name__)
 
+# ``Transaction`` fields each step reads and writes; the DAG derives the
+# step order from these, so keep them in sync with the enrichers
+TEMPLATE_FIELDS: Final = (frozenset({"card_last4"}), frozenset({"card_last4"}))
+FX_FIELDS: Final = (
+    frozenset({"currency_orig", "amount_brl", "fx_rate", "amount_usd"}),
+    frozenset({"fx_rate", "iof_brl", "amount_orig", "currency_orig", "amount_usd"}),
+)
+IOF_FIELDS: Final = (
+    frozenset({"iof_brl", "amount_brl", "currency_orig"}),
+    frozenset({"iof_brl"}),
+)
+ML_FIELDS: Final = (
+    frozenset(
+        {
+            "description",
+            "category",
+            "merchant_city",
+            "currency_orig",
+            "fx_rate",
+            "amount_brl",
+            "amount_orig",
+            "amount_usd",
+            "confidence_score",
+        }
+    ),
+    frozenset({"category", "confidence_score", "merchant_city", "fx_rate", "amount_usd"}),
+)
+METADATA_FIELDS: Final = (
+    frozenset(
+        {
+            "ledger_hash",
+            "date",
+            "description",
+            "amount_brl",
+            "card_last4",
+            "currency_orig",
+            "amount_orig",
+            "amount_usd",
+            "fx_rate",
+            "installment_seq",
+            "installment_tot",
+            "interest_amount",
+            "prev_bill_amount",
+        }
+    ),
+    frozenset(
+        {
+            "ledger_hash",
+            "currency_orig",
+            "amount_usd",
+            "installment_seq",
+            "installment_tot",
+            "interest_amount",
+            "prev_bill_amount",
+        }
+    ),
+)
+VALIDATION_FIELDS: Final = (frozenset({"amount_brl", "currency_orig"}), frozenset())
+
 
 class EnrichmentPipeline:
     """Orchestrates Phase 2 post-processing enrichment pipeline."""
 
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
         self.fx_parser = AdvancedFXParser()
         self.iof_calculator = IOFCalculator()
         self.metadata_enricher = MetadataEnricher()
@@ -27,49 +94,156 @@ class EnrichmentPipeline:
         self.pdf_validator = PDFValidator()
         self.template_matcher = ItauTemplateMatcher()
 
+        # Stages run here, off the event loop; shared by documents in flight
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="enrichment")
+
     async def enrich_extraction_result(
         self,
         result: EnsembleResult,
         pdf_text: Optional[str] = None,
-        source_lines: Optional[list[str]] = None
+        source_lines: Optional[list[str]] = None,
+        session: Optional[DocumentSession] = None,
     ) -> EnsembleResult:
-        """Apply complete enrichment pipeline to extraction result."""
+        """Apply complete enrichment pipeline to extraction result.
+
+        When a ``DocumentSession`` is given, the statement text and lines are
+        taken from it instead of re-reading the PDF.
+
+        The steps run as a DAG (see ``enrichment_stages``): each step runs on
+        the worker pool once the steps whose fields it touches are done, and
+        independent steps run concurrently. Callers already holding a
+        ``TransactionBatch`` use ``enrich_batch``; converting a result to a
+        batch and back costs more than the columnar steps save.
+        """
         if not result.final_transactions:
             logger.warning("No transactions to enrich")
             return result
 
+        pdf_text, source_lines = self._session_inputs(session, pdf_text, source_lines)
+
         logger.info(f"Starting enrichment pipeline for {len(result.final_transactions)} transactions")
 
-        # Step 1: Template matching for Itau-specific processing
+        await run_stages(self.enrichment_stages(result, pdf_text, source_lines), self.executor)
+
+        # Update confidence scores based on enrichment
+        self._update_confidence_scores(result)
+
+        logger.info(f"Enrichment pipeline completed for {len(result.final_transactions)} transactions")
+        return result
+
+    async def enrich_batch(
+        self,
+        batch: TransactionBatch,
+        pdf_text: Optional[str] = None,
+        source_lines: Optional[list[str]] = None,
+        session: Optional[DocumentSession] = None,
+    ) -> TransactionBatch:
+        """Apply enrichment steps 1-5 to a ``TransactionBatch``.
+
+        Template, IOF and metadata steps are column expressions and ML
+        enrichment runs the models over whole columns. Only FX parsing
+        converts rows, and only the foreign-currency ones.
+        """
+        import polars as pl
+
+        if not len(batch):
+            logger.warning("No transactions to enrich")
+            return batch
+
+        pdf_text, source_lines = self._session_inputs(session, pdf_text, source_lines)
+        logger.info(f"Starting batch enrichment for {len(batch)} transactions")
+
         if pdf_text:
-            await self._apply_template_matching(result.final_transactions, pdf_text)
+            card_info = self.template_matcher.extract_card_info(pdf_text)
+            if card_info:
+                card = pl.col("card_last4")
+                batch = batch.with_columns(
+                    pl.when(card.is_null() | (card == ""))
+                    .then(pl.lit(card_info))
+                    .otherwise(card)
+                    .alias("card_last4")
+                )
 
-        # Step 2: Advanced FX parsing for multi-line international transactions
         if source_lines:
-            await self._apply_fx_parsing(result.final_transactions, source_lines)
+            batch = self._apply_fx_parsing_batch(batch, source_lines)
+
+        batch = self.iof_calculator.enrich_batch(batch)
 
-        # Step 3: IOF calculation for all transactions
-        await self._apply_iof_calculation(result.final_transactions)
+        batch = await asyncio.get_running_loop().run_in_executor(
+            self.executor, self._apply_ml_enrichment_batch, batch
+        )
 
-        # Step 4: ML-based enrichment using trained models
-        await self._apply_ml_enrichment(result.final_transactions)
+        batch = self.metadata_enricher.enrich_batch(batch)
 
-        # Step 5: Metadata enrichment for missing fields
-        await self._apply_metadata_enrichment(result.final_transactions)
+        logger.info(f"Batch enrichment completed for {len(batch)} transactions")
+        return batch
 
+    def enrichment_stages(
+        self,
+        result: EnsembleResult,
+        pdf_text: Optional[str] = None,
+        source_lines: Optional[list[str]] = None,
+    ) -> list[EnrichmentStage]:
+        """The enrichment steps for ``result``, in sequential order."""
+        transactions = result.final_transactions
+        stages = []
+        # Step 1: Template matching for Itau-specific processing
+        if pdf_text:
+            stages.append(
+                EnrichmentStage(
+                    "template",
+                    partial(self._apply_template_matching, transactions, pdf_text),
+                    *TEMPLATE_FIELDS,
+                )
+            )
+        # Step 2: Advanced FX parsing for multi-line international transactions
+        if source_lines:
+            stages.append(
+                EnrichmentStage(
+                    "fx", partial(self._apply_fx_parsing, transactions, source_lines), *FX_FIELDS
+                )
+            )
+        # Steps 3-5: IOF, ML-based enrichment, metadata for missing fields
+        stages += [
+            EnrichmentStage(
+                "iof", partial(self._apply_iof_calculation, transactions), *IOF_FIELDS
+            ),
+            EnrichmentStage("ml", partial(self._apply_ml_enrichment, transactions), *ML_FIELDS),
+            EnrichmentStage(
+                "metadata",
+                partial(self._apply_metadata_enrichment, transactions),
+                *METADATA_FIELDS,
+            ),
+        ]
         # Step 6: PDF validation against statement totals
         if pdf_text:
-            validation_results = self.pdf_validator.validate_totals(result, pdf_text)
-            result.validation_metrics.update(validation_results)
-            logger.info(f"PDF validation results: {validation_results}")
+            stages.append(
+                EnrichmentStage(
+                    "validation",
+                    partial(self._apply_validation, result, pdf_text),
+                    *VALIDATION_FIELDS,
+                )
+            )
+        return stages
 
-        # Update confidence scores based on enrichment
-        self._update_confidence_scores(result)
-
-        logger.info(f"Enrichment pipeline completed for {len(result.final_transactions)} transactions")
-        return result
+    def _session_inputs(
+        self,
+        session: Optional[DocumentSession],
+        pdf_text: Optional[str],
+        source_lines: Optional[list[str]],
+    ) -> tuple[Optional[str], Optional[list[str]]]:
+        """Take statement text and lines from the session when not given."""
+        if session is not None and pdf_text is None:
+            try:
+                pdf_text = session.text
+            except Exception as e:
+                logger.warning(f"Could not read PDF text for enrichment: {e}")
+            else:
+                if source_lines is None:
+                    source_lines = session.lines
+        return pdf_text, source_lines
 
-    async def _apply_template_matching(self, transactions: list[Transaction], pdf_text: str):
+    def _apply_template_matching(self, transactions: list[Transaction], pdf_text: str):
         """Apply Itau template matching to transactions."""
         logger.info("Applying Itau template matching")
         
@@ -86,7 +260,7 @@ class EnrichmentPipeline:
             # This is a simplified version - full implementation would parse
             # the PDF text line by line to match transactions to template patterns
 
-    async def _apply_fx_parsing(self, transactions: list[Transaction], source_lines: list[str]):
+    def _apply_fx_parsing(self, transactions: list[Transaction], source_lines: list[str]):
         """Apply advanced FX parsing to international transactions."""
         logger.info("Applying advanced FX parsing")
         
@@ -102,14 +276,42 @@ class EnrichmentPipeline:
                         self.fx_parser.enhance_fx_transaction(transaction, fx_item)
                         break
 
-    async def _apply_iof_calculation(self, transactions: list[Transaction]):
+    def _apply_fx_parsing_batch(
+        self, batch: TransactionBatch, source_lines: list[str]
+    ) -> TransactionBatch:
+        """FX parsing for a batch; only foreign-currency rows leave Arrow."""
+        import polars as pl
+
+        from src.core.transaction_batch import TransactionBatch
+
+        logger.info("Applying advanced FX parsing")
+        currency = pl.col("currency_orig")
+        foreign = (
+            batch.to_polars()
+            .select(currency.is_not_null() & (currency != "") & (currency != "BRL"))
+            .to_series()
+        )
+        if not foreign.any():
+            return batch
+
+        fx_data = self.fx_parser.parse_multi_line_fx(source_lines)
+        indices = foreign.arg_true().to_list()
+        rows = batch.take(indices).to_transactions()
+        for transaction in rows:
+            for fx_item in fx_data:
+                if self._transactions_match(transaction, fx_item):
+                    self.fx_parser.enhance_fx_transaction(transaction, fx_item)
+                    break
+        return batch.replace_rows(indices, TransactionBatch.from_transactions(rows))
+
+    def _apply_iof_calculation(self, transactions: list[Transaction]):
         """Apply IOF calculation to all transactions."""
         logger.info("Applying IOF calculations")
         
         for transaction in transactions:
             self.iof_calculator.enrich_transaction(transaction)
 
-    async def _apply_ml_enrichment(self, transactions: list[Transaction]):
+    def _apply_ml_enrichment(self, transactions: list[Transaction]):
         """Apply ML-based enrichment using trained models."""
         logger.info("Applying ML-based enrichment")
         
@@ -120,13 +322,26 @@ class EnrichmentPipeline:
         # Apply ML enrichment
         self.ml_enricher.enrich_transactions(transactions)
 
-    async def _apply_metadata_enrichment(self, transactions: list[Transaction]):
+    def _apply_ml_enrichment_batch(self, batch: TransactionBatch) -> TransactionBatch:
+        """Columnar ``_apply_ml_enrichment``."""
+        logger.info("Applying ML-based enrichment")
+        model_status = self.ml_enricher.get_model_status()
+        logger.info(f"ML models loaded: {model_status['models_loaded']}/3")
+        return self.ml_enricher.enrich_batch(batch)
+
+    def _apply_metadata_enrichment(self, transactions: list[Transaction]):
         """Apply metadata enrichment to fill missing fields."""
         logger.info("Applying metadata enrichment")
         
         for transaction in transactions:
             self.metadata_enricher.enrich_transaction(transaction)
 
+    def _apply_validation(self, result: EnsembleResult, pdf_text: str):
+        """Validate the transactions against the statement totals."""
+        validation_results = self.pdf_validator.validate_totals(result, pdf_text)
+        result.validation_metrics.update(validation_results)
+        logger.info(f"PDF validation results: {validation_results}")
+
     def _transactions_match(self, transaction: Transaction, fx_data: dict) -> bool:
         """Check if transaction matches FX parsing data."""
         # Simple matching based on amount and description similarity
@@ -144,12 +359,17 @@ class EnrichmentPipeline:
         """Update confidence scores based on enrichment quality."""
         if not result.final_transactions:
             return
+        self._apply_confidence_boost(
+            result, self._enrichment_completeness(result.final_transactions)
+        )
 
+    def _enrichment_completeness(self, transactions: list[Transaction]) -> float:
+        """Share of the 16 golden fields filled across ``transactions``."""
         # Calculate enrichment completeness
         total_fields = 0
         filled_fields = 0
         
-        for transaction in result.final_transactions:
+        for transaction in transactions:
             total_fields += 16  # Total number of fields in Transaction model
             
             # Count filled fields
@@ -182,8 +402,46 @@ class EnrichmentPipeline:
             # Always count core fields
             filled_fields += 3  # date, description, amount_brl
 
-        completeness = filled_fields / total_fields if total_fields > 0 else 0
-        
+        return filled_fields / total_fields if total_fields > 0 else 0
+
+    def _batch_completeness(self, batch: TransactionBatch) -> float:
+        """Columnar ``_enrichment_completeness``."""
+        if not len(batch):
+            return 0
+
+        import polars as pl
+
+        present = [
+            pl.col(name).is_not_null()
+            for name in (
+                "installment_seq",
+                "installment_tot",
+                "fx_rate",
+                "iof_brl",
+                "prev_bill_amount",
+                "interest_amount",
+                "amount_orig",
+                "amount_usd",
+            )
+        ]
+        truthy = [
+            pl.col(name).is_not_null() & (pl.col(name) != "")
+            for name in (
+                "card_last4",
+                "category",
+                "merchant_city",
+                "ledger_hash",
+                "currency_orig",
+            )
+        ]
+        filled = batch.to_polars().select(
+            pl.sum_horizontal(*present, *truthy).sum()
+        ).item()
+        # Core fields (date, description, amount_brl) always count
+        return (filled + 3 * len(batch)) / (16 * len(batch))
+
+    def _apply_confidence_boost(self, result: EnsembleResult, completeness: float):
+        """Raise the result confidence by up to 20% of ``completeness``."""
         # Boost confidence based on enrichment
         confidence_boost = completeness * 0.2  # Up to 20% boost
         result.confidence_score = min(1.0, result.confidence_score + confidence_boost)
@@ -5,7 +5,9 @@ from __future__ import annotations
 import re
 from typing import Final, Optional
 
+from src.core.document_session import DocumentSession, document_text
 from src.core.models import Transaction
+from src.core.patterns import normalize_amount
 
 # Itau-specific section headers
 RE_SECTION_NACIONAL: Final[re.Pattern[str]] = re.compile(
@@ -67,8 +69,9 @@ class ItauTemplateMatcher:
         self.statement_period = None
         self.due_date = None
 
-    def identify_section(self, text: str) -> Optional[str]:
+    def identify_section(self, text: str | DocumentSession) -> Optional[str]:
         """Identify which section of the statement we're in."""
+        text = document_text(text) or ""
         if RE_SECTION_NACIONAL.search(text):
             return "nacional"
         elif RE_SECTION_INTERNACIONAL.search(text):
@@ -77,13 +80,15 @@ class ItauTemplateMatcher:
             return "pagamentos"
         return None
 
-    def extract_card_info(self, text: str) -> Optional[str]:
+    def extract_card_info(self, text: str | DocumentSession) -> Optional[str]:
         """Extract card number from header."""
+        text = document_text(text) or ""
         match = RE_CARD_HEADER.search(text)
         return match.group(1) if match else None
 
-    def extract_statement_metadata(self, text: str) -> dict:
+    def extract_statement_metadata(self, text: str | DocumentSession) -> dict:
         """Extract statement period and due date."""
+        text = document_text(text) or ""
         metadata = {}
         
         period_match = RE_STATEMENT_PERIOD.search(text)
@@ -206,8 +211,11 @@ class ItauTemplateMatcher:
         
         return transaction
 
-    def validate_itau_totals(self, text: str, transactions: list[Transaction]) -> dict:
+    def validate_itau_totals(
+        self, text: str | DocumentSession, transactions: list[Transaction]
+    ) -> dict:
         """Validate transactions against Itau statement totals."""
+        text = document_text(text) or ""
         validation = {}
         
         # Extract totals from statement
@@ -233,5 +241,4 @@ class ItauTemplateMatcher:
 
     def _normalize_amount(self, amount_str: str) -> float:
         """Normalize Brazilian currency format."""
-        cleaned = amount_str.replace(".", "").replace(",", ".")
-        return float(cleaned)
+        return float(normalize_amount(amount_str))
@@ -1,17 +1,45 @@
-"""Extraction engines for various PDF formats."""
+"""Extraction engines for various PDF formats.
+
+Engines are imported lazily (PEP 562): ``from src.extractors import
+TextractExtractor`` loads boto3 only at that point, and the
+``ExtractorRegistry`` resolves engines by ``ExtractorType`` on first use.
+"""
+
+from importlib import import_module
 
-from .azure_extractor import AzureDocIntelligenceExtractor
 from .base_extractor import BaseExtractor
-from .camelot_extractor import CamelotExtractor
-from .google_extractor import GoogleDocumentAIExtractor
-from .pdfplumber_extractor import PdfplumberExtractor
-from .textract_extractor import TextractExtractor
+from .registry import (
+    EXTRACTOR_SPECS,
+    ExtractorRegistry,
+    ExtractorSpec,
+    get_extractor_class,
+)
+
+_LAZY_CLASSES = {spec.class_name: spec.module for spec in EXTRACTOR_SPECS.values()}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_CLASSES:
+        value = getattr(import_module(_LAZY_CLASSES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_CLASSES))
+
 
 __all__ = [
     "BaseExtractor",
     "PdfplumberExtractor",
+    "PyMuPDFExtractor",
     "CamelotExtractor",
     "TextractExtractor",
     "AzureDocIntelligenceExtractor",
     "GoogleDocumentAIExtractor",
+    "ExtractorRegistry",
+    "ExtractorSpec",
+    "EXTRACTOR_SPECS",
+    "get_extractor_class",
 ]
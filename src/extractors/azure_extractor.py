@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Any
 
 try:
-    from azure.ai.formrecognizer import DocumentAnalysisClient
+    from azure.ai.formrecognizer import AnalyzeResult, DocumentAnalysisClient
     from azure.core.credentials import AzureKeyCredential
     from azure.core.exceptions import HttpResponseError
 except ImportError:
@@ -20,7 +20,10 @@ try:
 except ImportError:
     load_dotenv = None
 
+from ..core import cancellation
 from ..core.models import ExtractorType, PipelineResult, Transaction, TransactionType
+from ..core.normalise import DEFAULT_PERIOD, StatementPeriod
+from ..core.ocr_recorder import get_ocr_recorder
 from ..core.patterns import (
     classify_transaction,
     is_international_transaction,
@@ -33,6 +36,9 @@ from .base_extractor import BaseExtractor
 class AzureDocIntelligenceExtractor(BaseExtractor):
     """Azure Document Intelligence-based extraction."""
 
+    artifact_name = "azure"
+    artifact_title = "Azure Document Intelligence Extractor"
+
     def __init__(self, endpoint: str | None = None, api_key: str | None = None):
         super().__init__(ExtractorType.AZURE_DOC_INTELLIGENCE)
         if DocumentAnalysisClient is None:
@@ -48,6 +54,7 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
         self.endpoint = endpoint or os.getenv("AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT")
         self.api_key = api_key or os.getenv("AZURE_DOCUMENT_INTELLIGENCE_KEY")
         self.client = None
+        self.recorder = get_ocr_recorder()
         self._initialize_client()
 
     def _initialize_client(self):
@@ -70,7 +77,7 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
         self, pdf_path: Path, model_id: str = "prebuilt-layout"
     ) -> PipelineResult:
         """Extract transactions using Azure Document Intelligence."""
-        if not self.client:
+        if not self.client and not self.recorder.replaying:
             return self._create_result(
                 transactions=[],
                 confidence_score=0.0,
@@ -115,19 +122,26 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
     ) -> tuple[list[Transaction], dict[str, Any], int]:
         """Core extraction logic using Azure Document Intelligence."""
 
-        with open(pdf_path, "rb") as pdf_file:
-            poller = self.client.begin_analyze_document(
-                model_id=model_id, document=pdf_file
-            )
-            result = poller.result()
+        session = self.get_session(pdf_path)
+        result = self.recorder.call(
+            "azure",
+            session.content_hash,
+            {"model_id": model_id},
+            lambda: self._analyze_document(session.data, model_id),
+            encode=lambda response: response.to_dict(),
+            decode=AnalyzeResult.from_dict,
+        )
+
+        # Year of DD/MM dates: the due date Azure read, else the session's
+        period = StatementPeriod.from_text(result.content or "") or session.statement_period
 
         # Process different model types
         if model_id == "prebuilt-layout":
-            transactions = self._process_layout_result(result)
+            transactions = self._process_layout_result(result, period)
         elif "bank" in model_id.lower():
-            transactions = self._process_bank_statement_result(result)
+            transactions = self._process_bank_statement_result(result, period)
         else:
-            transactions = self._process_generic_result(result)
+            transactions = self._process_generic_result(result, period)
 
         raw_data = {
             "extractor": "azure_doc_intelligence",
@@ -140,19 +154,33 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
 
         return transactions, raw_data, len(result.pages)
 
-    def _process_layout_result(self, result) -> list[Transaction]:
+    def _analyze_document(self, data: bytes, model_id: str):
+        """Submit ``data`` for analysis and poll until the result is ready.
+
+        Polls in one-second steps instead of blocking in ``result()``, so
+        race mode can stop waiting once another extractor has won.
+        """
+        cancellation.mark_billed()
+        poller = self.client.begin_analyze_document(model_id=model_id, document=data)
+        while not poller.done():
+            cancellation.sleep(1)
+        return poller.result()
+
+    def _process_layout_result(
+        self, result, period: StatementPeriod | None = None
+    ) -> list[Transaction]:
         """Process layout analysis result."""
         transactions = []
 
         # Process tables first
         if result.tables:
             for table in result.tables:
-                table_transactions = self._process_azure_table(table)
+                table_transactions = self._process_azure_table(table, period)
                 transactions.extend(table_transactions)
 
         # If no tables or few transactions, process paragraphs
         if len(transactions) < 5:
-            paragraph_transactions = self._process_paragraphs(result)
+            paragraph_transactions = self._process_paragraphs(result, period)
 
             # Merge without duplicates
             for transaction in paragraph_transactions:
@@ -161,7 +189,9 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
 
         return transactions
 
-    def _process_bank_statement_result(self, result) -> list[Transaction]:
+    def _process_bank_statement_result(
+        self, result, period: StatementPeriod | None = None
+    ) -> list[Transaction]:
         """Process bank statement model result."""
         transactions = []
 
@@ -176,15 +206,19 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
 
         # Fallback to layout processing
         if not transactions:
-            transactions = self._process_layout_result(result)
+            transactions = self._process_layout_result(result, period)
 
         return transactions
 
-    def _process_generic_result(self, result) -> list[Transaction]:
+    def _process_generic_result(
+        self, result, period: StatementPeriod | None = None
+    ) -> list[Transaction]:
         """Process generic model result."""
-        return self._process_layout_result(result)
+        return self._process_layout_result(result, period)
 
-    def _process_azure_table(self, table) -> list[Transaction]:
+    def _process_azure_table(
+        self, table, period: StatementPeriod | None = None
+    ) -> list[Transaction]:
         """Process an Azure table into transactions."""
         transactions = []
 
@@ -205,13 +239,15 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
                 continue
 
             row_data = rows[row_index]
-            transaction = self._parse_azure_table_row(row_data)
+            transaction = self._parse_azure_table_row(row_data, period)
             if transaction:
                 transactions.append(transaction)
 
         return transactions
 
-    def _parse_azure_table_row(self, row_data: dict[int, dict]) -> Transaction | None:
+    def _parse_azure_table_row(
+        self, row_data: dict[int, dict], period: StatementPeriod | None = None
+    ) -> Transaction | None:
         """Parse an Azure table row into a transaction."""
         try:
             # Extract cell contents
@@ -246,7 +282,9 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
                 return None
 
             # Parse components
-            parsed_date = self._parse_date(date_text) if date_text else date.today()
+            parsed_date = (
+                self._parse_date(date_text, period) if date_text else (period or DEFAULT_PERIOD).start
+            )
             amount = normalize_amount(amount_text)
             description = description_text or "Unknown transaction"
 
@@ -276,7 +314,9 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
             print(f"Error parsing Azure table row: {e}")
             return None
 
-    def _process_paragraphs(self, result) -> list[Transaction]:
+    def _process_paragraphs(
+        self, result, period: StatementPeriod | None = None
+    ) -> list[Transaction]:
         """Process paragraphs when table extraction is insufficient."""
         transactions = []
 
@@ -293,13 +333,15 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
                 if not self._looks_like_amount(line_content):
                     continue
 
-                transaction = self._parse_azure_line(line)
+                transaction = self._parse_azure_line(line, period)
                 if transaction:
                     transactions.append(transaction)
 
         return transactions
 
-    def _parse_azure_line(self, line) -> Transaction | None:
+    def _parse_azure_line(
+        self, line, period: StatementPeriod | None = None
+    ) -> Transaction | None:
         """Parse an Azure line into a transaction."""
         try:
             content = line.content.strip()
@@ -321,10 +363,10 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
             # Extract date
             date_match = re.search(r"\d{1,2}/\d{1,2}", content)
             if date_match:
-                parsed_date = self._parse_date(date_match.group())
+                parsed_date = self._parse_date(date_match.group(), period)
                 description = description.replace(date_match.group(), "").strip()
             else:
-                parsed_date = date.today()
+                parsed_date = (period or DEFAULT_PERIOD).start
 
             if not description:
                 description = "Unknown transaction"
@@ -365,14 +407,14 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
 
         return bool(re.search(r"\d+[,.]?\d*", text))
 
-    def _parse_date(self, date_str: str) -> date:
-        """Parse date string to date object."""
-        normalized = normalize_date(date_str)
+    def _parse_date(self, date_str: str, period: StatementPeriod | None = None) -> date:
+        """Parse date string to date object (year of ``DD/MM`` from ``period``)."""
+        normalized = normalize_date(date_str, period)
         try:
             year, month, day = normalized.split("-")
             return date(int(year), int(month), int(day))
         except:
-            return date.today()
+            return (period or DEFAULT_PERIOD).start
 
     def _is_duplicate(
         self, transaction: Transaction, existing: list[Transaction]
@@ -409,76 +451,12 @@ class AzureDocIntelligenceExtractor(BaseExtractor):
         # Combine scores
         return 0.8 * avg_confidence + 0.2 * table_quality
 
-    def _save_individual_outputs(self, pdf_path: Path, raw_data: dict, transactions: list) -> None:
-        """Save individual extractor outputs to 4outputs folder."""
-        try:
-            pdf_name = pdf_path.stem
-            
-            # Base output directory
-            output_base = Path("/Users/lech/Install/NewEvolveo3pro/4outputs/azure")
-            
-            # Save raw text
-            text_dir = output_base / "text"
-            text_dir.mkdir(parents=True, exist_ok=True)
-            text_file = text_dir / f"{pdf_name}.txt"
-            
-            # Generate raw text from transactions
-            raw_text = ""
-            if transactions:
-                raw_text = "\n".join([t.raw_text for t in transactions if t.raw_text])
-            
-            with open(text_file, 'w', encoding='utf-8') as f:
-                f.write(f"Azure Document Intelligence Extractor Output\n")
-                f.write(f"PDF: {pdf_path.name}\n")
-                f.write(f"Transactions found: {len(transactions)}\n")
-                f.write(f"Model ID: {raw_data.get('model_id', 'N/A')}\n")
-                f.write(f"Table count: {raw_data.get('table_count', 0)}\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(raw_text)
-            
-            # Save CSV
-            if transactions:
-                csv_dir = output_base / "csv"
-                csv_dir.mkdir(parents=True, exist_ok=True)
-                csv_file = csv_dir / f"{pdf_name}.csv"
-                self._save_transactions_to_csv(transactions, csv_file)
-        
-        except Exception as e:
-            print(f"Failed to save azure outputs: {e}")
-
-    def _save_transactions_to_csv(self, transactions: list, output_file: Path) -> None:
-        """Save transactions to CSV file using golden CSV format."""
-        try:
-            import pandas as pd
-
-            if not transactions:
-                return
-
-            data = []
-            for t in transactions:
-                data.append(
-                    {
-                        "card_last4": "",  # Not available in Phase 1
-                        "post_date": t.date.strftime("%Y-%m-%d"),
-                        "desc_raw": t.description,
-                        "amount_brl": f"{t.amount_brl:.2f}",
-                        "installment_seq": "0",
-                        "installment_tot": "0", 
-                        "fx_rate": "0.00",
-                        "iof_brl": "0.00",
-                        "category": t.category or "",
-                        "merchant_city": "",  # Not available in Phase 1
-                        "ledger_hash": "",  # Not available in Phase 1
-                        "prev_bill_amount": "0",
-                        "interest_amount": "0",
-                        "amount_orig": "0.00",
-                        "currency_orig": "",
-                        "amount_usd": "0.00"
-                    }
-                )
-
-            df = pd.DataFrame(data)
-            df.to_csv(output_file, index=False, sep=";")
-        
-        except Exception as e:
-            print(f"Failed to save CSV: {e}")
+    def _artifact_summary(
+        self, raw_data: dict[str, Any], transactions: list[Transaction]
+    ) -> list[tuple[str, Any]]:
+        """Header lines of the text artifact."""
+        return [
+            ("Transactions found", len(transactions)),
+            ("Model ID", raw_data.get("model_id", "N/A")),
+            ("Table count", raw_data.get("table_count", 0)),
+        ]
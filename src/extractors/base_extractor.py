@@ -7,12 +7,24 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
-from ..core.models import ExtractorType, PipelineResult, Transaction
+from ..core.artifact_sink import (
+    ExtractorArtifacts,
+    get_artifact_sink,
+    golden_rows,
+    rows_to_csv,
+)
+from ..core.document_session import DocumentSession, get_document_session
+from ..core.models import ExtractorType, PageResult, PipelineResult, Transaction
+from ..core.normalise import StatementPeriod
 
 
 class BaseExtractor(ABC):
     """Abstract base class for PDF extractors."""
 
+    # Artifact directory under the sink root and title of the text artifact
+    artifact_name: str = ""
+    artifact_title: str = "Extractor"
+
     def __init__(self, extractor_type: ExtractorType):
         self.extractor_type = extractor_type
 
@@ -37,6 +49,7 @@ class BaseExtractor(ABC):
         raw_data: dict[str, Any] | None = None,
         error_message: str | None = None,
         page_count: int = 0,
+        page_results: list[PageResult] | None = None,
     ) -> PipelineResult:
         """Create a standardized PipelineResult."""
         return PipelineResult(
@@ -47,34 +60,60 @@ class BaseExtractor(ABC):
             raw_data=raw_data,
             error_message=error_message,
             page_count=page_count,
+            page_results=page_results or [],
         )
 
-    def is_scanned_pdf(self, pdf_path: Path) -> bool:
-        """Detect if PDF is scanned (requires OCR) or born-digital."""
-        try:
-            import fitz  # PyMuPDF
+    def get_session(self, pdf_path: Path) -> DocumentSession:
+        """Shared parsed-document session for ``pdf_path``."""
+        return get_document_session(pdf_path)
 
-            doc = fitz.open(pdf_path)
-            text_ratio = 0.0
-
-            for page in doc:
-                text_blocks = page.get_text("dict")["blocks"]
-                text_chars = sum(
-                    len(line["spans"][0]["text"])
-                    for block in text_blocks
-                    if "lines" in block
-                    for line in block["lines"]
-                    if line["spans"]
-                )
-
-                # Rough heuristic: if very little text found, likely scanned
-                if text_chars > 100:  # Arbitrary threshold
-                    text_ratio = 1.0
-                    break
+    def statement_period(self, pdf_path: Path) -> StatementPeriod | None:
+        """Statement period of ``pdf_path``, for the year of ``DD/MM`` dates."""
+        try:
+            return self.get_session(pdf_path).statement_period
+        except Exception:
+            return StatementPeriod.from_name(Path(pdf_path).stem)
+
+    def _save_individual_outputs(
+        self, pdf_path: Path, raw_data: dict[str, Any], transactions: list[Transaction]
+    ) -> None:
+        """Queue this run's text/CSV artifacts; the sink writes them off-thread."""
+        get_artifact_sink().submit(
+            ExtractorArtifacts(
+                extractor=self.artifact_name or self.extractor_type.value,
+                pdf_name=pdf_path.name,
+                title=f"{self.artifact_title} Output",
+                summary=self._artifact_summary(raw_data, transactions),
+                raw_text=raw_data.get("raw_text")
+                or "\n".join(t.raw_text for t in transactions if t.raw_text),
+                rows=golden_rows(transactions),
+            )
+        )
 
-            doc.close()
-            return text_ratio < 0.5
+    def _artifact_summary(
+        self, raw_data: dict[str, Any], transactions: list[Transaction]
+    ) -> list[tuple[str, Any]]:
+        """Header lines of the text artifact."""
+        return [
+            ("Transactions found", len(transactions)),
+            ("Page count", raw_data.get("page_count", 0)),
+        ]
+
+    def _save_transactions_to_csv(
+        self, transactions: list[Transaction], output_file: Path
+    ) -> None:
+        """Write transactions to ``output_file`` now, in the golden CSV layout."""
+        try:
+            Path(output_file).write_text(
+                rows_to_csv(golden_rows(transactions)), encoding="utf-8"
+            )
+        except Exception as e:
+            print(f"Failed to save CSV: {e}")
 
+    def is_scanned_pdf(self, pdf_path: Path) -> bool:
+        """Detect if PDF is scanned (requires OCR) or born-digital."""
+        try:
+            return self.get_session(pdf_path).is_scanned()
         except Exception:
             # Default to assuming it needs OCR if we can't determine
             return True
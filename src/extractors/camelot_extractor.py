@@ -14,7 +14,9 @@ try:
 except ImportError:
     camelot = None
 
+from ..core.cancellation import check_cancelled
 from ..core.models import ExtractorType, PipelineResult, Transaction, TransactionType
+from ..core.normalise import DEFAULT_PERIOD, StatementPeriod
 from ..core.patterns import (
     calculate_confidence,
     classify_transaction,
@@ -27,6 +29,9 @@ from .base_extractor import BaseExtractor
 class CamelotExtractor(BaseExtractor):
     """Table-focused extraction using Camelot."""
 
+    artifact_name = "camelot"
+    artifact_title = "Camelot Extractor"
+
     def __init__(self):
         super().__init__(ExtractorType.CAMELOT)
         if camelot is None:
@@ -72,33 +77,48 @@ class CamelotExtractor(BaseExtractor):
         """Core extraction logic using Camelot."""
         transactions = []
 
+        # Only hand Camelot the pages whose text contains a date: a table on
+        # any other page can never yield a date column.
+        session = self.get_session(pdf_path)
+        pages = self._candidate_pages(session)
+        period = session.statement_period
+        if not pages:
+            return transactions, {
+                "extractor": "camelot",
+                "lattice_tables": 0,
+                "stream_tables": 0,
+                "aggressive_tables": 0,
+                "total_transactions": 0,
+                "page_count": session.page_count,
+            }, session.page_count
+
         # Try lattice method first (for tables with borders)
         try:
-            lattice_tables = camelot.read_pdf(
-                str(pdf_path), 
-                flavor="lattice", 
-                pages="all",
+            lattice_tables = self._read_tables(
+                pdf_path,
+                flavor="lattice",
+                pages=pages,
                 line_scale=40,  # More sensitive line detection
                 copy_text=["v", "h"],  # Copy text from vertical and horizontal
                 shift_text=["l", "t", "r"]  # Shift text alignment
             )
-            lattice_transactions = self._process_tables(lattice_tables, "lattice")
+            lattice_transactions = self._process_tables(lattice_tables, "lattice", period)
             transactions.extend(lattice_transactions)
         except Exception as e:
             print(f"Lattice extraction failed: {e}")
 
         # Try stream method with enhanced parameters (for tables without borders)
         try:
-            stream_tables = camelot.read_pdf(
-                str(pdf_path), 
-                flavor="stream", 
-                pages="all",
+            stream_tables = self._read_tables(
+                pdf_path,
+                flavor="stream",
+                pages=pages,
                 table_areas=None,  # Auto-detect table areas
                 columns=None,  # Auto-detect columns
                 row_tol=2,  # Row tolerance for grouping
                 column_tol=0  # Column tolerance
             )
-            stream_transactions = self._process_tables(stream_tables, "stream")
+            stream_transactions = self._process_tables(stream_tables, "stream", period)
 
             # Merge with lattice results, avoiding duplicates
             for transaction in stream_transactions:
@@ -111,27 +131,23 @@ class CamelotExtractor(BaseExtractor):
         # Try aggressive stream mode if nothing found
         if not transactions:
             try:
-                aggressive_tables = camelot.read_pdf(
-                    str(pdf_path),
+                aggressive_tables = self._read_tables(
+                    pdf_path,
                     flavor="stream",
-                    pages="all",
+                    pages=pages,
                     edge_tol=500,  # Very large edge tolerance
                     row_tol=10,  # Larger row tolerance
                     column_tol=5  # Some column tolerance
                 )
-                aggressive_transactions = self._process_tables(aggressive_tables, "aggressive")
+                aggressive_transactions = self._process_tables(aggressive_tables, "aggressive", period)
                 transactions.extend(aggressive_transactions)
             except Exception as e:
                 print(f"Aggressive extraction failed: {e}")
 
         # Get page count
         try:
-            import fitz
-
-            doc = fitz.open(pdf_path)
-            page_count = len(doc)
-            doc.close()
-        except:
+            page_count = session.page_count
+        except Exception:
             page_count = 1
 
         raw_data = {
@@ -147,7 +163,39 @@ class CamelotExtractor(BaseExtractor):
 
         return transactions, raw_data, page_count
 
-    def _process_tables(self, tables, method: str) -> list[Transaction]:
+    def _read_tables(self, pdf_path: Path, pages: str, **kwargs) -> list:
+        """``camelot.read_pdf`` one page at a time, checking for cancellation.
+
+        Camelot parses each page independently anyway, so the tables are
+        the same as one call over ``pages``; splitting the call lets race
+        mode stop a losing run between pages instead of after the pass.
+        """
+        if pages == "all":
+            pages = ",".join(
+                str(number)
+                for number in range(1, self.get_session(pdf_path).page_count + 1)
+            )
+        tables = []
+        for page in pages.split(","):
+            check_cancelled()
+            tables.extend(camelot.read_pdf(str(pdf_path), pages=page, **kwargs))
+        return tables
+
+    def _candidate_pages(self, session) -> str:
+        """Camelot page spec for pages that may contain transaction tables."""
+        try:
+            pages = [
+                str(index + 1)
+                for index, text in session.iter_page_texts()
+                if self._looks_like_date(text)
+            ]
+        except Exception:
+            return "all"
+        return ",".join(pages)
+
+    def _process_tables(
+        self, tables, method: str, period: StatementPeriod | None = None
+    ) -> list[Transaction]:
         """Process extracted tables into transactions."""
         transactions = []
 
@@ -170,7 +218,7 @@ class CamelotExtractor(BaseExtractor):
                 # Process each row
                 for _idx, row in df.iterrows():
                     transaction = self._parse_table_row(
-                        row, date_col, desc_col, amount_col, method
+                        row, date_col, desc_col, amount_col, method, period
                     )
                     if transaction:
                         transactions.append(transaction)
@@ -245,6 +293,7 @@ class CamelotExtractor(BaseExtractor):
         desc_col: int | None,
         amount_col: int,
         method: str,
+        period: StatementPeriod | None = None,
     ) -> Transaction | None:
         """Parse a table row into a Transaction."""
         try:
@@ -259,11 +308,11 @@ class CamelotExtractor(BaseExtractor):
             if date_col is not None:
                 date_str = str(row.iloc[date_col])
                 if self._looks_like_date(date_str):
-                    parsed_date = self._parse_date(date_str)
+                    parsed_date = self._parse_date(date_str, period)
                 else:
-                    parsed_date = date.today()
+                    parsed_date = (period or DEFAULT_PERIOD).start
             else:
-                parsed_date = date.today()
+                parsed_date = (period or DEFAULT_PERIOD).start
 
             # Extract description
             if desc_col is not None:
@@ -306,14 +355,14 @@ class CamelotExtractor(BaseExtractor):
             print(f"Error parsing table row: {e}")
             return None
 
-    def _parse_date(self, date_str: str) -> date:
-        """Parse date string to date object."""
-        normalized = normalize_date(date_str)
+    def _parse_date(self, date_str: str, period: StatementPeriod | None = None) -> date:
+        """Parse date string to date object (year of ``DD/MM`` from ``period``)."""
+        normalized = normalize_date(date_str, period)
         try:
             year, month, day = normalized.split("-")
             return date(int(year), int(month), int(day))
         except:
-            return date.today()
+            return (period or DEFAULT_PERIOD).start
 
     def _looks_international(self, description: str) -> bool:
         """Simple heuristic to detect international transactions."""
@@ -356,81 +405,8 @@ class CamelotExtractor(BaseExtractor):
         # Combine scores
         return 0.8 * avg_confidence + 0.2 * table_quality
 
-    def _save_individual_outputs(self, pdf_path: Path, raw_data: dict, transactions: list) -> None:
-        """Save individual extractor outputs to 4outputs folder."""
-        try:
-
-            pdf_name = pdf_path.stem
-            
-            # Base output directory
-            output_base = Path("/Users/lech/Install/NewEvolveo3pro/4outputs/camelot")
-            
-            # Remove previous files for this PDF first
-            for old in (output_base / "text").glob(f"{pdf_name}_*.txt"):
-                old.unlink()
-            for old in (output_base / "csv").glob(f"{pdf_name}_*.csv"):
-                old.unlink()
-
-            # Save raw text
-            text_dir = output_base / "text"
-            text_dir.mkdir(parents=True, exist_ok=True)
-            text_file = text_dir / f"{pdf_name}.txt"
-            
-            raw_text = raw_data.get("raw_text", "")
-            if not raw_text and transactions:
-                # Generate raw text from transactions if not available
-                raw_text = "\n".join([t.raw_text for t in transactions if t.raw_text])
-            
-            with open(text_file, 'w', encoding='utf-8') as f:
-                f.write(f"Camelot Extractor Output\n")
-                f.write(f"PDF: {pdf_path.name}\n")
-
-                f.write(f"Transactions found: {len(transactions)}\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(raw_text)
-            
-            # Save CSV (always, even if zero transactions)
-            csv_dir = output_base / "csv"
-            csv_dir.mkdir(parents=True, exist_ok=True)
-            csv_file = csv_dir / f"{pdf_name}.csv"
-            self._save_transactions_to_csv(transactions, csv_file)
-        
-        except Exception as e:
-            print(f"Failed to save camelot outputs: {e}")
-
-    def _save_transactions_to_csv(self, transactions: list, output_file: Path) -> None:
-        """Save transactions to CSV file using golden CSV format."""
-        try:
-            import pandas as pd
-
-            if not transactions:
-                return
-
-            data = []
-            for t in transactions:
-                data.append(
-                    {
-                        "card_last4": "",  # Not available in Phase 1
-                        "post_date": t.date.strftime("%Y-%m-%d"),
-                        "desc_raw": t.description,
-                        "amount_brl": f"{t.amount_brl:.2f}",
-                        "installment_seq": "0",
-                        "installment_tot": "0", 
-                        "fx_rate": "0.00",
-                        "iof_brl": "0.00",
-                        "category": t.category or "",
-                        "merchant_city": "",  # Not available in Phase 1
-                        "ledger_hash": "",  # Not available in Phase 1
-                        "prev_bill_amount": "0",
-                        "interest_amount": "0",
-                        "amount_orig": "0.00",
-                        "currency_orig": "",
-                        "amount_usd": "0.00"
-                    }
-                )
-
-            df = pd.DataFrame(data)
-            df.to_csv(output_file, index=False, sep=";")
-        
-        except Exception as e:
-            print(f"Failed to save CSV: {e}")
+    def _artifact_summary(
+        self, raw_data: dict[str, Any], transactions: list[Transaction]
+    ) -> list[tuple[str, Any]]:
+        """Header lines of the text artifact."""
+        return [("Transactions found", len(transactions))]
@@ -11,31 +11,27 @@ from google.cloud import documentai
 from google.oauth2 import service_account
 
 from ..core.models import ExtractorType, PipelineResult, Transaction
-from ..core.normalise import parse_brazil_number, normalise_date
+from ..core.normalise import StatementPeriod, parse_amount, parse_date
+from ..core.ocr_recorder import get_ocr_recorder
 from .base_extractor import BaseExtractor
 
 
-def normalize_amount(text: str) -> Optional[float]:
-    """Wrapper for parse_brazil_number."""
-    return parse_brazil_number(text)
+def normalize_amount(text: str) -> Optional[Decimal]:
+    """Wrapper for parse_amount."""
+    return parse_amount(text)
 
 
-def normalize_date(text: str) -> Optional[str]:
-    """Simple date normalization - try to extract a date from text."""
+def normalize_date(text: str, period: Optional[StatementPeriod] = None) -> Optional[str]:
+    """Simple date normalization - try to extract a date from text.
+
+    ``DD/MM`` dates take their year from the statement ``period``.
+    """
     import re
     
     # Look for DD/MM/YYYY or DD/MM patterns
-    date_pattern = r'(\d{1,2})/(\d{1,2})(?:/(\d{4}))?'
-    match = re.search(date_pattern, text)
-    
-    if match:
-        day, month, year = match.groups()
-        year = year or "2024"  # Default year
-        try:
-            return normalise_date(f"{day}/{month}", int(year))
-        except:
-            return None
-    return None
+    match = re.search(r'\d{1,2}/\d{1,2}(?:/\d{4})?', text)
+    parsed = parse_date(match.group(0), period) if match else None
+    return parsed.isoformat() if parsed else None
 
 
 def clean_description(text: str) -> str:
@@ -94,6 +90,7 @@ class GoogleDocumentAIExtractor(BaseExtractor):
         
         # Initialize client
         self._client = None
+        self.recorder = get_ocr_recorder()
 
     @property
     def client(self) -> documentai.DocumentProcessorServiceClient:
@@ -122,8 +119,8 @@ class GoogleDocumentAIExtractor(BaseExtractor):
         
         try:
             # Read PDF file
-            with open(pdf_path, "rb") as pdf_file:
-                document_content = pdf_file.read()
+            session = self.get_session(pdf_path)
+            document_content = session.data
 
             # Configure the process request
             processor_name = f"projects/{self.project_id}/locations/{self.location}/processors/{self.processor_id}"
@@ -138,13 +135,25 @@ class GoogleDocumentAIExtractor(BaseExtractor):
 
             # Process the document
             start_time = self._get_timestamp()
-            result = self.client.process_document(request=request)
+            result = self.recorder.call(
+                "google_docai",
+                session.content_hash,
+                {"processor": processor_name},
+                lambda: self.client.process_document(request=request),
+                encode=documentai.ProcessResponse.to_json,
+                decode=lambda payload: documentai.ProcessResponse.from_json(
+                    payload, ignore_unknown_fields=True
+                ),
+            )
             end_time = self._get_timestamp()
             
             document = result.document
+
+            # Year of DD/MM dates: the due date Document AI read, else the session's
+            period = StatementPeriod.from_text(document.text or "") or session.statement_period
             
             # Extract transactions from the processed document
-            transactions = self._parse_document(document)
+            transactions = self._parse_document(document, period)
             
             # Calculate processing time
             processing_time_ms = (end_time - start_time) * 1000 if start_time and end_time else 0
@@ -173,7 +182,9 @@ class GoogleDocumentAIExtractor(BaseExtractor):
                 error_message=f"Google Document AI extraction failed: {str(e)}"
             )
 
-    def _parse_document(self, document: documentai.Document) -> list[Transaction]:
+    def _parse_document(
+        self, document: documentai.Document, period: Optional[StatementPeriod] = None
+    ) -> list[Transaction]:
         """Parse Google Document AI document into transactions.
         
         Args:
@@ -187,7 +198,7 @@ class GoogleDocumentAIExtractor(BaseExtractor):
         # Strategy 1: Use specialized table parser (works best for Form Parser)
         try:
             from ..postprocessors.google_table_parser import extract_transactions_from_docai
-            table_transactions = extract_transactions_from_docai(document)
+            table_transactions = extract_transactions_from_docai(document, period)
             if table_transactions:
                 transactions.extend(table_transactions)
                 return transactions  # If tables found, use them
@@ -196,19 +207,21 @@ class GoogleDocumentAIExtractor(BaseExtractor):
             pass
         
         # Strategy 2: Extract from entities if available
-        transactions.extend(self._extract_from_entities(document))
+        transactions.extend(self._extract_from_entities(document, period))
         
         # Strategy 3: Extract from tables (fallback method)
         if not transactions:
-            transactions.extend(self._extract_from_tables(document))
+            transactions.extend(self._extract_from_tables(document, period))
         
         # Strategy 4: Fallback to text parsing
         if not transactions:
-            transactions.extend(self._extract_from_text(document))
+            transactions.extend(self._extract_from_text(document, period))
         
         return transactions
 
-    def _extract_from_entities(self, document: documentai.Document) -> list[Transaction]:
+    def _extract_from_entities(
+        self, document: documentai.Document, period: Optional[StatementPeriod] = None
+    ) -> list[Transaction]:
         """Extract transactions from document entities."""
         transactions = []
         
@@ -227,7 +240,7 @@ class GoogleDocumentAIExtractor(BaseExtractor):
                 continue
                 
             if entity_type in ["date", "transaction_date"]:
-                normalized_date = normalize_date(mention_text)
+                normalized_date = normalize_date(mention_text, period)
                 if normalized_date:
                     dates.append((normalized_date, confidence))
                     
@@ -249,26 +262,10 @@ class GoogleDocumentAIExtractor(BaseExtractor):
             description = descriptions[i][0] if i < len(descriptions) else "Transaction"
             
             if date or amount:  # At least one meaningful field
-                # Convert date string to date object
+                # Convert the normalized YYYY-MM-DD string to a date object
                 from datetime import date as date_class
                 if isinstance(date, str):
-                    parsed_date = normalize_date(date)
-                    if parsed_date:
-                        try:
-                            # Parse DD/MM/YYYY or DD/MM format
-                            parts = parsed_date.split('/')
-                            if len(parts) == 3:
-                                day, month, year = int(parts[0]), int(parts[1]), int(parts[2])
-                            elif len(parts) == 2:
-                                day, month = int(parts[0]), int(parts[1])
-                                year = 2024  # Default year
-                            else:
-                                continue
-                            date = date_class(year, month, day)
-                        except (ValueError, IndexError):
-                            date = date_class(2024, 1, 1)  # Fallback date
-                    else:
-                        date = date_class(2024, 1, 1)  # Fallback date
+                    date = date_class.fromisoformat(date)
                 elif not date:
                     date = date_class(2024, 1, 1)  # Fallback date
                 
@@ -283,7 +280,9 @@ class GoogleDocumentAIExtractor(BaseExtractor):
         
         return transactions
 
-    def _extract_from_tables(self, document: documentai.Document) -> list[Transaction]:
+    def _extract_from_tables(
+        self, document: documentai.Document, period: Optional[StatementPeriod] = None
+    ) -> list[Transaction]:
         """Extract transactions from document tables."""
         transactions = []
         
@@ -296,13 +295,19 @@ class GoogleDocumentAIExtractor(BaseExtractor):
                 
                 # Extract table data
                 for row in table.body_rows:
-                    transaction_data = self._parse_table_row(row, header_row, document)
+                    transaction_data = self._parse_table_row(row, header_row, document, period)
                     if transaction_data:
                         transactions.append(transaction_data)
         
         return transactions
 
-    def _parse_table_row(self, row, header_row, document: documentai.Document) -> Optional[Transaction]:
+    def _parse_table_row(
+        self,
+        row,
+        header_row,
+        document: documentai.Document,
+        period: Optional[StatementPeriod] = None,
+    ) -> Optional[Transaction]:
         """Parse a single table row into a transaction."""
         if len(row.cells) < 2:  # Need at least 2 columns
             return None
@@ -325,7 +330,7 @@ class GoogleDocumentAIExtractor(BaseExtractor):
         
         for cell_text in cells:
             if not date:
-                date = normalize_date(cell_text)
+                date = normalize_date(cell_text, period)
             if not amount:
                 amount = normalize_amount(cell_text)
             if not description or len(cell_text) > len(description):
@@ -334,9 +339,10 @@ class GoogleDocumentAIExtractor(BaseExtractor):
                     description = clean_desc
         
         if date or amount:
+            from datetime import date as date_class
             return Transaction(
-                date=date,
-                amount_brl=amount,
+                date=date_class.fromisoformat(date) if date else None,
+                amount_brl=amount or Decimal("0.00"),
                 description=description or "Transaction",
                 category="UNKNOWN",
                 source_extractor=ExtractorType.GOOGLE_DOC_AI
@@ -344,7 +350,9 @@ class GoogleDocumentAIExtractor(BaseExtractor):
         
         return None
 
-    def _extract_from_text(self, document: documentai.Document) -> list[Transaction]:
+    def _extract_from_text(
+        self, document: documentai.Document, period: Optional[StatementPeriod] = None
+    ) -> list[Transaction]:
         """Fallback: extract transactions from raw text using patterns."""
         from .itau_patterns import ItauPatterns
         
@@ -352,7 +360,7 @@ class GoogleDocumentAIExtractor(BaseExtractor):
         patterns = ItauPatterns()
         raw_text = document.text
         
-        return patterns.extract_transactions(raw_text, ExtractorType.GOOGLE_DOC_AI)
+        return patterns.extract_transactions(raw_text, ExtractorType.GOOGLE_DOC_AI, period)
 
     def _calculate_confidence(self, document: documentai.Document) -> float:
         """Calculate overall confidence score from Document AI results."""
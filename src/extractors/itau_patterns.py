@@ -7,9 +7,12 @@ Based on production field manual.
 import re
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime, date
 from decimal import Decimal
 
+from ..core.normalise import StatementPeriod, parse_brazil_number, parse_date
+from ..core.patterns import normalize_date as normalize_statement_date
+from ..core.word_table import WordTable
+
 
 @dataclass
 class ItauTransaction:
@@ -42,54 +45,18 @@ class ItauPatterns:
     @staticmethod
     def parse_amount(amount_str: str) -> Optional[float]:
         """Parse Brazilian currency amount."""
-        try:
-            # Remove thousands separators (.) and replace decimal comma with dot
-            cleaned = amount_str.replace('.', '').replace(',', '.')
-            return float(cleaned)
-        except (ValueError, AttributeError):
-            return None
+        return parse_brazil_number(amount_str)
     
     @staticmethod
-    def normalize_date(date_str: str) -> str:
-        """Normalize DD/MM to YYYY-MM-DD."""
-        try:
-            current_year = datetime.now().year
-            day, month = date_str.split('/')
-            return f"{current_year}-{month.zfill(2)}-{day.zfill(2)}"
-        except (ValueError, AttributeError):
-            return date_str
+    def normalize_date(date_str: str, period: Optional[StatementPeriod] = None) -> str:
+        """Normalize DD/MM to YYYY-MM-DD (year from the statement period)."""
+        return normalize_statement_date(date_str, period)
     
     @staticmethod
     def group_by_y(words: List[Dict], tolerance: float = 3.0) -> List[List[Dict]]:
         """Group words by Y coordinate (for line detection)."""
-        if not words:
-            return []
-        
-        # Sort by Y coordinate (top to bottom)
-        sorted_words = sorted(words, key=lambda w: w.get('top', w.get('y0', 0)))
-        
-        rows = []
-        current_row = [sorted_words[0]]
-        current_y = sorted_words[0].get('top', sorted_words[0].get('y0', 0))
-        
-        for word in sorted_words[1:]:
-            word_y = word.get('top', word.get('y0', 0))
-            
-            if abs(word_y - current_y) <= tolerance:
-                current_row.append(word)
-            else:
-                # Sort current row by X coordinate (left to right)
-                current_row.sort(key=lambda w: w.get('x0', w.get('left', 0)))
-                rows.append(current_row)
-                current_row = [word]
-                current_y = word_y
-        
-        # Add final row
-        if current_row:
-            current_row.sort(key=lambda w: w.get('x0', w.get('left', 0)))
-            rows.append(current_row)
-        
-        return rows
+        table = WordTable.from_dicts(words)
+        return table.split_rows(words, *table.group_rows(tolerance))
     
     @staticmethod
     def words_to_text(words: List[Dict]) -> str:
@@ -99,19 +66,12 @@ class ItauPatterns:
     @staticmethod
     def calculate_bbox(words: List[Dict]) -> Tuple[float, float, float, float]:
         """Calculate bounding box for a group of words."""
-        if not words:
-            return (0, 0, 0, 0)
-        
-        x0s = [w.get('x0', w.get('left', 0)) for w in words]
-        y0s = [w.get('top', w.get('y0', 0)) for w in words]
-        x1s = [w.get('x1', w.get('right', 0)) for w in words]
-        y1s = [w.get('bottom', w.get('y1', 0)) for w in words]
-        
-        return (min(x0s), min(y0s), max(x1s), max(y1s))
+        return WordTable.from_dicts(words).bbox()
     
     @classmethod
     def parse_domestic_transaction(cls, line1_words: List[Dict], line2_words: List[Dict], 
-                                 card_last4: str = "") -> Optional[ItauTransaction]:
+                                 card_last4: str = "",
+                                 period: Optional[StatementPeriod] = None) -> Optional[ItauTransaction]:
         """Parse domestic 2-line transaction."""
         line1_text = cls.words_to_text(line1_words)
         line2_text = cls.words_to_text(line2_words)
@@ -140,7 +100,7 @@ class ItauPatterns:
         bbox = cls.calculate_bbox(all_words)
         
         return ItauTransaction(
-            date=cls.normalize_date(date_str),
+            date=cls.normalize_date(date_str, period),
             merchant=merchant.strip(),
             amount_brl=amount,
             category=category.strip(),
@@ -151,7 +111,8 @@ class ItauPatterns:
     
     @classmethod
     def parse_international_transaction(cls, line1_words: List[Dict], line2_words: List[Dict], 
-                                      line3_words: List[Dict], card_last4: str = "") -> Optional[ItauTransaction]:
+                                      line3_words: List[Dict], card_last4: str = "",
+                                      period: Optional[StatementPeriod] = None) -> Optional[ItauTransaction]:
         """Parse international 3-line transaction."""
         line1_text = cls.words_to_text(line1_words)
         line2_text = cls.words_to_text(line2_words)
@@ -187,7 +148,7 @@ class ItauPatterns:
         bbox = cls.calculate_bbox(all_words)
         
         return ItauTransaction(
-            date=cls.normalize_date(date_str),
+            date=cls.normalize_date(date_str, period),
             merchant=merchant.strip(),
             amount_brl=amount_brl,
             category="INTERNACIONAL",
@@ -216,7 +177,9 @@ class ItauPatterns:
         """Check if line looks like a category/city line."""
         return bool(cls.RE_CAT.match(text))
     
-    def extract_transactions(self, raw_text: str, extractor_type=None):
+    def extract_transactions(
+        self, raw_text: str, extractor_type=None, period: Optional[StatementPeriod] = None
+    ):
         """Extract transactions from raw text for compatibility with Google extractor."""
         from ..core.models import Transaction, ExtractorType
         
@@ -234,11 +197,9 @@ class ItauPatterns:
                 date_str, merchant, amount_str = match.groups()
                 
                 try:
-                    # Parse date (add current year if missing)
-                    if '/' in date_str:
-                        day, month = date_str.split('/')
-                        transaction_date = date(2024, int(month), int(day))  # Default to 2024
-                    else:
+                    # Parse date (year from the statement period)
+                    transaction_date = parse_date(date_str, period)
+                    if transaction_date is None:
                         continue
                     
                     # Parse amount
@@ -0,0 +1,460 @@
+"""Streaming line-parser pipeline for Itaú statement text.
+
+Text flows through generator stages::
+
+    pages -> lines -> cleaned lines -> classified lines -> Transactions
+
+Each line is stripped, cleaned and upper-cased exactly once, and the card
+suffix / FX conversion tail is removed once before the line is classified
+against the whole regex catalogue in a single ``LineClassifier`` pass.
+Because every stage is lazy, transactions are emitted while later pages are
+still being read and memory stays flat regardless of statement length.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Final
+
+from ..core.line_classifier import LineClassifier, LineMatch, get_line_classifier
+from ..core.models import ExtractorType, PageResult, Transaction, TransactionType
+from ..core.normalise import DEFAULT_PERIOD, StatementPeriod, parse_date
+from ..core.patterns import (
+    RE_POSTING_NATIONAL,
+    calculate_confidence,
+    classify_transaction,
+    clean_line,
+    extract_card_number,
+    extract_installment_info,
+    extract_merchant_city,
+    normalize_amount,
+    normalize_date,
+    parse_fx_currency_line,
+)
+
+RE_CARD_SUFFIX: Final[re.Pattern[str]] = re.compile(r"\bfinal\s+\d{4}\b", re.I)
+RE_FX_CONVERSION: Final[re.Pattern[str]] = re.compile(
+    r"(USD|EUR|GBP|JPY|CHF|CAD|AUD)\s+([\d,\.]+)\s*=\s*([\d,\.]+)\s*BRL"
+)
+RE_BR_AMOUNT: Final[re.Pattern[str]] = re.compile(r"-?\d{1,3}(?:\.\d{3})*,\d{2}")
+RE_DAY_MONTH: Final[re.Pattern[str]] = re.compile(r"\d{1,2}/\d{1,2}")
+
+# Characters of raw text kept in ``raw_data`` for debugging
+RAW_TEXT_PREVIEW_CHARS: Final[int] = 1000
+
+# Confidence multiplier for lines only the fallback pattern could parse
+FALLBACK_CONFIDENCE_FACTOR: Final[float] = 0.7
+
+
+@dataclass(slots=True)
+class ParseStats:
+    """Running statistics collected while text streams through the pipeline."""
+
+    lines: int = 1  # str.split() on the joined text always yields a trailing line
+    preview: str = ""
+    page_lines: list[int] = field(default_factory=list)  # 0 for an empty page
+    failed_pages: list[int] = field(default_factory=list)  # Pages given as None
+
+
+@dataclass(slots=True)
+class ParsedLine:
+    """One source line with every normalised form computed once."""
+
+    page_num: int
+    raw: str
+    upper: str
+    cleaned: str
+    segment: str = ""
+    card_last4: str | None = None
+    fx_result: tuple | None = None
+    kind: str = "other"
+    match: LineMatch | None = None
+
+
+def calculate_parse_confidence(transactions: list[Transaction], raw_text: str) -> float:
+    """Overall confidence of a text-backend parse.
+
+    Blends the average transaction confidence with the ratio of parsed
+    transactions to lines in the raw-text preview.
+    """
+    return _parse_confidence(transactions, raw_text.count("\n"))
+
+
+def page_results(
+    page_transactions: Iterable[tuple[int, Transaction]], stats: ParseStats
+) -> list[PageResult]:
+    """One ``PageResult`` per page read, from ``iter_page_transactions`` output.
+
+    A page the extractor could not read, or whose text is empty (no text
+    layer), is reported as failed so it can be sent to OCR on its own.
+    """
+    by_page: defaultdict[int, list[Transaction]] = defaultdict(list)
+    for page_num, transaction in page_transactions:
+        by_page[page_num].append(transaction)
+
+    failed = set(stats.failed_pages)
+    results = []
+    for page_num, lines in enumerate(stats.page_lines):
+        transactions = by_page.get(page_num, [])
+        if page_num in failed:
+            error = "text extraction failed"
+        elif not lines:
+            error = "no text layer"
+        else:
+            error = None
+        confidence = _parse_confidence(transactions, lines) if error is None else 0.0
+        results.append(PageResult(page_num, page_num + 1, transactions, confidence, error))
+    return results
+
+
+def _parse_confidence(transactions: list[Transaction], line_count: int) -> float:
+    if transactions:
+        avg_transaction_confidence = sum(
+            t.confidence_score for t in transactions
+        ) / len(transactions)
+    else:
+        avg_transaction_confidence = 0.0
+
+    pattern_match_ratio = len(transactions) / max(line_count, 1)
+
+    confidence = 0.7 * avg_transaction_confidence + 0.3 * min(pattern_match_ratio, 1.0)
+    return min(confidence, 1.0)
+
+
+class ItauLineParser:
+    """Parse Itaú statement lines into transactions with streaming stages."""
+
+    def __init__(
+        self, extractor_type: ExtractorType, classifier: LineClassifier | None = None
+    ):
+        self.extractor_type = extractor_type
+        self.classifier = classifier or get_line_classifier()
+
+    def iter_transactions(
+        self,
+        page_texts: Iterable[str],
+        stats: ParseStats | None = None,
+        period: StatementPeriod | None = None,
+    ) -> Iterator[Transaction]:
+        """Stream transactions out of an iterable of page texts.
+
+        ``DD/MM`` dates take their year from the statement ``period``.
+        """
+        lines = self.iter_lines(page_texts, stats)
+        return self.build(self.classify(self.clean(lines)), period)
+
+    def iter_page_transactions(
+        self,
+        page_texts: Iterable[str | None],
+        stats: ParseStats | None = None,
+        period: StatementPeriod | None = None,
+    ) -> Iterator[tuple[int, Transaction]]:
+        """Like ``iter_transactions``, paired with each transaction's page.
+
+        ``None`` marks a page that could not be read; it is recorded in
+        ``stats.failed_pages`` and otherwise skipped like an empty page.
+        """
+        lines = self.iter_lines(page_texts, stats)
+        return self.build_pages(self.classify(self.clean(lines)), period)
+
+    def parse_lines(
+        self, lines: Iterable[str], page_num: int = 0, period: StatementPeriod | None = None
+    ) -> list[Transaction]:
+        """Parse already-split lines (non-streaming convenience wrapper)."""
+        lines = ((page_num, line) for line in lines)
+        return list(self.build(self.classify(self.clean(lines)), period))
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def iter_lines(
+        self, page_texts: Iterable[str], stats: ParseStats | None = None
+    ) -> Iterator[tuple[int, str]]:
+        """Split each non-empty page into ``(page_num, line)`` pairs."""
+        for page_num, page_text in enumerate(page_texts):
+            if stats is not None:
+                stats.page_lines.append(
+                    page_text.count("\n") + 1 if page_text and page_text.strip() else 0
+                )
+                if page_text is None:
+                    stats.failed_pages.append(page_num)
+            if not page_text:
+                continue
+
+            if stats is not None:
+                stats.lines += page_text.count("\n") + 1
+                missing = RAW_TEXT_PREVIEW_CHARS - len(stats.preview)
+                if missing > 0:
+                    stats.preview += (page_text + "\n")[:missing]
+
+            for line in page_text.split("\n"):
+                yield page_num, line
+
+    def clean(self, lines: Iterable[tuple[int, str]]) -> Iterator[ParsedLine]:
+        """Normalise each line once and drop blanks and page furniture."""
+        for page_num, line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            upper = line.upper()
+            if self.classifier.has_keyword("page_header", upper):
+                continue
+
+            yield ParsedLine(
+                page_num=page_num, raw=line, upper=upper, cleaned=clean_line(line)
+            )
+
+    def classify(self, parsed_lines: Iterable[ParsedLine]) -> Iterator[ParsedLine]:
+        """Tag each line with the catalogue rule it matches, if any."""
+        for parsed in parsed_lines:
+            if parsed.cleaned:
+                self._prepare_segment(parsed)
+                parsed.match = self.classifier.classify(parsed.segment)
+                parsed.kind = parsed.match.kind
+            yield parsed
+
+    def build(
+        self, parsed_lines: Iterable[ParsedLine], period: StatementPeriod | None = None
+    ) -> Iterator[Transaction]:
+        """Turn classified lines into transactions."""
+        for _, transaction in self.build_pages(parsed_lines, period):
+            yield transaction
+
+    def build_pages(
+        self, parsed_lines: Iterable[ParsedLine], period: StatementPeriod | None = None
+    ) -> Iterator[tuple[int, Transaction]]:
+        """Turn classified lines into ``(page_num, transaction)`` pairs."""
+        for parsed in parsed_lines:
+            transaction = None
+            # The classifier ranks the FX shape first, as FX postings also
+            # satisfy the national pattern
+            if parsed.kind == "posting_fx":
+                transaction = self._build_fx(parsed, period)
+            if transaction is None and parsed.kind in ("posting_national", "posting_fx"):
+                transaction = self._build_national(parsed, period)
+
+            if transaction is None:
+                transaction = self._build_fallback(parsed, period)
+                if transaction:
+                    transaction.confidence_score *= FALLBACK_CONFIDENCE_FACTOR
+
+            if transaction:
+                transaction.source_extractor = self.extractor_type
+                yield parsed.page_num, transaction
+
+    # ------------------------------------------------------------------
+    # Builders
+    # ------------------------------------------------------------------
+
+    def _prepare_segment(self, parsed: ParsedLine) -> None:
+        """Strip the card suffix and FX conversion tail from the cleaned line."""
+        line = parsed.cleaned
+        parsed.card_last4 = extract_card_number(line)
+        line_no_card = RE_CARD_SUFFIX.sub("", line).strip()
+
+        parsed.fx_result = parse_fx_currency_line(line_no_card)
+        segment = line_no_card
+        if parsed.fx_result and parsed.fx_result[0]:
+            fx_match = RE_FX_CONVERSION.search(line_no_card)
+            if fx_match:
+                segment = line_no_card[:fx_match.start()].strip()
+        parsed.segment = segment
+
+    def _build_national(
+        self, parsed: ParsedLine, period: StatementPeriod | None = None
+    ) -> Transaction | None:
+        """Build a national transaction with enhanced metadata."""
+        # Skip lines with keywords that aren't transactions
+        upper_line = parsed.cleaned.upper()
+        if self.classifier.has_keyword("skip", upper_line):
+            if not RE_DAY_MONTH.search(upper_line):
+                return None
+
+        if parsed.kind == "posting_national":
+            groups = parsed.match.groups
+        else:
+            # FX-shaped lines also satisfy the national pattern
+            match = RE_POSTING_NATIONAL.match(parsed.segment)
+            if not match:
+                return None
+            groups = match.groupdict()
+
+        city = parsed.fx_result[0] if parsed.fx_result else None
+
+        try:
+            # DD/MM, the only form posting lines carry
+            parsed_date = parse_date(groups["date"], period)
+            if parsed_date is None:
+                return None
+            description = groups["desc"].strip()
+
+            # Parse components with enhanced metadata
+            amount = normalize_amount(groups["amount"])
+            inst_seq, inst_tot = extract_installment_info(description)
+            category = classify_transaction(description, amount)["category"]
+
+            confidence = calculate_confidence(description, amount,
+                has_date=True,
+                has_amount=True,
+                description_length=len(description),
+                pattern_matched=True,
+            )
+
+            return Transaction(
+                date=parsed_date,
+                description=description,
+                amount_brl=amount,
+                card_last4=parsed.card_last4,
+                installment_seq=inst_seq,
+                installment_tot=inst_tot,
+                fx_rate=self._conversion_rate(parsed) or Decimal("0.00"),
+                category=category,
+                merchant_city=city or "",
+                transaction_type=TransactionType.DOMESTIC,
+                currency_orig="BRL",
+                confidence_score=confidence,
+                raw_text=parsed.raw,
+            )
+
+        except Exception as e:
+            print(f"Error parsing national transaction: {e}")
+            return None
+
+    def _build_fx(
+        self, parsed: ParsedLine, period: StatementPeriod | None = None
+    ) -> Transaction | None:
+        """Build an FX transaction with enhanced metadata."""
+        groups = parsed.match.groups
+        if parsed.fx_result:
+            city, currency, _ = parsed.fx_result
+        else:
+            city, currency = None, None
+
+        try:
+            # DD/MM, the only form posting lines carry
+            parsed_date = parse_date(groups["date"], period)
+            if parsed_date is None:
+                return None
+            description = groups["desc"].strip()
+
+            # Parse components with enhanced metadata
+            amount_orig = normalize_amount(groups["orig"])
+            amount_brl = normalize_amount(groups["brl"])
+            inst_seq, inst_tot = extract_installment_info(description)
+            category = classify_transaction(description, amount_brl)["category"]
+
+            # Extract merchant city for international transactions
+            merchant_city = extract_merchant_city(description)
+            if not merchant_city and city:
+                merchant_city = city
+
+            # Exchange rate from the "USD 1,00 = 5,52 BRL" tail, else the amounts
+            fx_rate = self._conversion_rate(parsed)
+            if fx_rate is None:
+                fx_rate = amount_brl / amount_orig if amount_orig > 0 else Decimal("0.00")
+
+            # Determine currency (default to USD if not detected)
+            if not currency:
+                fx_match = RE_FX_CONVERSION.search(parsed.cleaned)
+                currency = fx_match.group(1) if fx_match else "USD"
+
+            confidence = calculate_confidence(description, amount_brl,
+                has_date=True,
+                has_amount=True,
+                description_length=len(description),
+                pattern_matched=True,
+            )
+
+            return Transaction(
+                date=parsed_date,
+                description=description,
+                amount_brl=amount_brl,
+                card_last4=parsed.card_last4,
+                installment_seq=inst_seq,
+                installment_tot=inst_tot,
+                fx_rate=fx_rate,
+                category=category,
+                merchant_city=merchant_city,
+                amount_orig=amount_orig,
+                currency_orig=currency,
+                amount_usd=amount_orig if currency == "USD" else Decimal("0.00"),
+                transaction_type=TransactionType.INTERNATIONAL,
+                confidence_score=confidence,
+                raw_text=parsed.raw,
+            )
+
+        except Exception as e:
+            print(f"Error parsing FX transaction: {e}")
+            return None
+
+    @staticmethod
+    def _conversion_rate(parsed: ParsedLine) -> Decimal | None:
+        """BRL per unit from a "USD 1,00 = 5,52 BRL" tail, if the line has one."""
+        fx_match = RE_FX_CONVERSION.search(parsed.cleaned)
+        if not fx_match or not normalize_amount(fx_match.group(2)) > 0:
+            return None
+        return normalize_amount(fx_match.group(3)) / normalize_amount(fx_match.group(2))
+
+    def _build_fallback(
+        self, parsed: ParsedLine, period: StatementPeriod | None = None
+    ) -> Transaction | None:
+        """Fallback pattern for lines with amount but no clear structure."""
+        line = parsed.raw
+
+        # Look for any Brazilian amount in the line
+        amount_patterns = RE_BR_AMOUNT.findall(line)
+        if not amount_patterns:
+            return None
+
+        # Use the last amount found (usually the transaction amount)
+        amount_str = amount_patterns[-1]
+        amount = normalize_amount(amount_str)
+
+        # Remove amount from description
+        description = line.replace(amount_str, "").strip()
+
+        # Try to extract date
+        date_match = RE_DAY_MONTH.search(line)
+        if date_match:
+            parsed_date = self.parse_date(date_match.group(), period)
+            description = description.replace(date_match.group(), "").strip()
+        else:
+            parsed_date = (period or DEFAULT_PERIOD).start
+
+        if not description:
+            description = "Unknown transaction"
+
+        confidence = calculate_confidence(description, amount,
+            has_date=date_match is not None,
+            has_amount=True,
+            description_length=len(description),
+            pattern_matched=False,
+        )
+
+        return Transaction(
+            date=parsed_date,
+            description=description,
+            amount_brl=amount,
+            category=classify_transaction(description, amount)["category"],
+            transaction_type=TransactionType.DOMESTIC,
+            currency_orig="BRL",
+            confidence_score=confidence,
+            raw_text=line,
+        )
+
+    @staticmethod
+    def parse_date(date_str: str, period: StatementPeriod | None = None) -> date:
+        """Parse date string to date object (year of ``DD/MM`` from ``period``)."""
+        normalized = normalize_date(date_str, period)
+        try:
+            year, month, day = normalized.split("-")
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            return (period or DEFAULT_PERIOD).start
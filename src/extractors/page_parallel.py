@@ -0,0 +1,70 @@
+"""Page-parallel pdfplumber text extraction using a process pool."""
+
+from __future__ import annotations
+
+import io
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+
+def split_page_ranges(page_count: int, workers: int) -> list[tuple[int, int]]:
+    """Split ``range(page_count)`` into at most ``workers`` contiguous chunks.
+
+    Chunks are balanced to within one page and returned in page order.
+    """
+    workers = max(1, min(workers, page_count))
+    base, extra = divmod(page_count, workers)
+
+    ranges = []
+    start = 0
+    for index in range(workers):
+        stop = start + base + (1 if index < extra else 0)
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _extract_page_range(source: str | bytes, start: int, stop: int) -> list[str | None]:
+    """Worker: extract text for pages ``[start, stop)``.
+
+    A page that fails yields ``None`` so the caller can retry (and report) it
+    on the serial path.
+    """
+    import pdfplumber
+
+    stream = io.BytesIO(source) if isinstance(source, bytes) else source
+    texts: list[str | None] = []
+    with pdfplumber.open(stream) as pdf:
+        for index in range(start, stop):
+            try:
+                texts.append(pdf.pages[index].extract_text() or "")
+            except Exception:
+                texts.append(None)
+    return texts
+
+
+def extract_page_texts(
+    source: Path | bytes, page_count: int, workers: int
+) -> list[str | None]:
+    """Extract the text of every page across a pool of worker processes.
+
+    Each worker opens the PDF once and handles one contiguous page range;
+    results are concatenated in page order, so the output is identical to
+    walking ``pdf.pages`` serially.
+    """
+    if isinstance(source, Path):
+        source = str(source)
+
+    ranges = split_page_ranges(page_count, workers)
+    if len(ranges) <= 1:
+        return _extract_page_range(source, 0, page_count)
+
+    texts: list[str | None] = []
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        starts, stops = zip(*ranges, strict=True)
+        for chunk in executor.map(
+            _extract_page_range, [source] * len(ranges), starts, stops
+        ):
+            texts.extend(chunk)
+    return texts
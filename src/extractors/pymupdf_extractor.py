@@ -0,0 +1,124 @@
+"""PyMuPDF-based PDF extraction (fast text backend)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+from ..core.cancellation import check_cancelled
+from ..core.document_session import DocumentSession
+from ..core.models import ExtractorType, PageResult, PipelineResult, Transaction
+from ..core.word_table import DEFAULT_ROW_TOLERANCE, WordTable
+from .base_extractor import BaseExtractor
+from .line_pipeline import (
+    ItauLineParser,
+    ParseStats,
+    calculate_parse_confidence,
+    page_results,
+)
+
+
+def words_to_text(words: list[tuple], y_tolerance: float = DEFAULT_ROW_TOLERANCE) -> str:
+    """Rebuild page text from PyMuPDF words, one visual line per text line.
+
+    Rows are clustered with the same tolerance pdfplumber uses for
+    ``extract_text()``, so both backends feed the parser the same lines.
+    """
+    return WordTable.from_tuples(words).text(y_tolerance)
+
+
+class PyMuPDFExtractor(BaseExtractor):
+    """Fast text-based extraction using PyMuPDF."""
+
+    artifact_name = "pymupdf"
+    artifact_title = "PyMuPDF Extractor"
+
+    def __init__(self):
+        super().__init__(ExtractorType.PYMUPDF)
+        if fitz is None:
+            raise ImportError("PyMuPDF is required but not installed")
+
+        self.line_parser = ItauLineParser(self.extractor_type)
+
+    def extract(self, pdf_path: Path) -> PipelineResult:
+        """Extract transactions using PyMuPDF."""
+        if self.is_scanned_pdf(pdf_path):
+            return self._create_result(
+                transactions=[],
+                confidence_score=0.0,
+                processing_time_ms=0.0,
+                error_message="PDF appears to be scanned - requires OCR",
+            )
+
+        try:
+            (transactions, raw_data, page_count, pages), duration_ms = self._time_extraction(
+                self._extract_with_pymupdf, pdf_path
+            )
+
+            result = self._create_result(
+                transactions=transactions,
+                confidence_score=self._calculate_confidence(transactions, raw_data),
+                processing_time_ms=duration_ms,
+                raw_data=raw_data,
+                page_count=page_count,
+                page_results=pages,
+            )
+            self._save_individual_outputs(pdf_path, raw_data, transactions)
+            return result
+
+        except Exception as e:
+            return self._create_result(
+                transactions=[],
+                confidence_score=0.0,
+                processing_time_ms=0.0,
+                error_message=f"PyMuPDF extraction failed: {str(e)}",
+            )
+
+    def _extract_with_pymupdf(
+        self, pdf_path: Path
+    ) -> tuple[list[Transaction], dict[str, Any], int, list[PageResult]]:
+        """Core extraction: stream page text through the line-parser pipeline."""
+        session = self.get_session(pdf_path)
+        page_count = len(session.fitz_document)
+
+        stats = ParseStats()
+        page_transactions = list(
+            self.line_parser.iter_page_transactions(
+                self._iter_page_texts(session, page_count), stats, session.statement_period
+            )
+        )
+        transactions = [transaction for _, transaction in page_transactions]
+
+        raw_data = {
+            "extractor": "pymupdf",
+            "page_count": page_count,
+            "lines_extracted": stats.lines,
+            "transaction_count": len(transactions),
+            "raw_text": stats.preview,  # First 1000 chars for debugging
+        }
+
+        return transactions, raw_data, page_count, page_results(page_transactions, stats)
+
+    def _iter_page_texts(
+        self, session: DocumentSession, page_count: int
+    ) -> Iterator[str | None]:
+        """Yield page text lazily; ``None`` for a page that fails to extract."""
+        for page_num in range(page_count):
+            check_cancelled()
+            try:
+                yield words_to_text(session.fitz_words(page_num))
+            except Exception as e:
+                print(f"Error processing page {page_num + 1}: {e}")
+                yield None
+
+    def _calculate_confidence(
+        self, transactions: list[Transaction], raw_data: dict[str, Any]
+    ) -> float:
+        """Calculate overall extraction confidence."""
+        return calculate_parse_confidence(transactions, raw_data.get("raw_text", ""))
@@ -0,0 +1,136 @@
+"""Lazy extractor registry: engines are imported on first use.
+
+Each ``ExtractorType`` maps to the module and class implementing it, so
+importing the package never loads boto3, the Azure/Google SDKs, camelot
+or pandas; a pdfplumber-only run imports only pdfplumber.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from importlib import import_module
+from typing import Any, Final, NamedTuple
+
+from ..core.models import ExtractorType
+
+
+class ExtractorSpec(NamedTuple):
+    """Where an extractor lives and how to name it in messages."""
+
+    module: str
+    class_name: str
+    label: str
+
+
+EXTRACTOR_SPECS: Final[dict[ExtractorType, ExtractorSpec]] = {
+    ExtractorType.PYMUPDF: ExtractorSpec(
+        ".pymupdf_extractor", "PyMuPDFExtractor", "PyMuPDF"
+    ),
+    ExtractorType.PDFPLUMBER: ExtractorSpec(
+        ".pdfplumber_extractor", "PdfplumberExtractor", "pdfplumber"
+    ),
+    ExtractorType.CAMELOT: ExtractorSpec(
+        ".camelot_extractor", "CamelotExtractor", "Camelot"
+    ),
+    ExtractorType.TEXTRACT: ExtractorSpec(
+        ".textract_extractor", "TextractExtractor", "Textract"
+    ),
+    ExtractorType.AZURE_DOC_INTELLIGENCE: ExtractorSpec(
+        ".azure_extractor",
+        "AzureDocIntelligenceExtractor",
+        "Azure Document Intelligence",
+    ),
+    ExtractorType.GOOGLE_DOC_AI: ExtractorSpec(
+        ".google_extractor", "GoogleDocumentAIExtractor", "Google Document AI"
+    ),
+}
+
+
+def get_extractor_class(extractor_type: ExtractorType) -> type:
+    """Import and return the class implementing ``extractor_type``."""
+    spec = EXTRACTOR_SPECS[extractor_type]
+    module = import_module(spec.module, __package__)
+    return getattr(module, spec.class_name)
+
+
+class ExtractorRegistry:
+    """Extractor instances keyed by ``ExtractorType``, built on first use.
+
+    Behaves like a read-only mapping of the *available* extractors: looking
+    up a type imports and constructs it once; a type whose dependencies are
+    missing (``ImportError``) is reported once and treated as absent.
+    Iterating resolves every registered type, in registration order.
+    """
+
+    def __init__(
+        self,
+        extractor_types: Iterable[ExtractorType] | None = None,
+        options: dict[ExtractorType, dict[str, Any]] | None = None,
+    ):
+        self.extractor_types = list(extractor_types or EXTRACTOR_SPECS)
+        self.options = options or {}
+        self._instances: dict[ExtractorType, Any] = {}
+        self._unavailable: dict[ExtractorType, str] = {}
+
+    def get(self, extractor_type: ExtractorType, default: Any = None) -> Any:
+        """The extractor for ``extractor_type``, or ``default`` if unavailable."""
+        if extractor_type in self._instances:
+            return self._instances[extractor_type]
+        if (
+            extractor_type in self._unavailable
+            or extractor_type not in self.extractor_types
+        ):
+            return default
+
+        try:
+            extractor_class = get_extractor_class(extractor_type)
+            extractor = extractor_class(**self.options.get(extractor_type, {}))
+        except ImportError as e:
+            self._unavailable[extractor_type] = str(e)
+            print(f"⚠️  {EXTRACTOR_SPECS[extractor_type].label} not available: {e}")
+            return default
+
+        self._instances[extractor_type] = extractor
+        return extractor
+
+    def register(self, extractor_type: ExtractorType, extractor: Any) -> None:
+        """Use an already-built extractor for ``extractor_type``."""
+        if extractor_type not in self.extractor_types:
+            self.extractor_types.append(extractor_type)
+        self._unavailable.pop(extractor_type, None)
+        self._instances[extractor_type] = extractor
+
+    @property
+    def loaded(self) -> dict[ExtractorType, Any]:
+        """Extractors built so far (never triggers an import)."""
+        return dict(self._instances)
+
+    @property
+    def unavailable(self) -> dict[ExtractorType, str]:
+        """Types that failed to import, with the error message."""
+        return dict(self._unavailable)
+
+    def __getitem__(self, extractor_type: ExtractorType) -> Any:
+        extractor = self.get(extractor_type)
+        if extractor is None:
+            raise KeyError(extractor_type)
+        return extractor
+
+    def __contains__(self, extractor_type: object) -> bool:
+        return self.get(extractor_type) is not None  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[ExtractorType]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def keys(self) -> list[ExtractorType]:
+        """Available extractor types (resolves every registered type)."""
+        return [t for t in self.extractor_types if t in self]
+
+    def values(self) -> list[Any]:
+        return [self._instances[t] for t in self.keys()]
+
+    def items(self) -> list[tuple[ExtractorType, Any]]:
+        return [(t, self._instances[t]) for t in self.keys()]
@@ -19,7 +19,10 @@ try:
 except ImportError:
     load_dotenv = None
 
+from ..core import cancellation
 from ..core.models import ExtractorType, PipelineResult, Transaction, TransactionType
+from ..core.normalise import DEFAULT_PERIOD, StatementPeriod
+from ..core.ocr_recorder import get_ocr_recorder
 from ..core.patterns import (
     classify_transaction,
     is_international_transaction,
@@ -29,9 +32,15 @@ from ..core.patterns import (
 from .base_extractor import BaseExtractor, ExtractionError
 
 
+TEXTRACT_FEATURE_TYPES = ["TABLES", "FORMS"]
+
+
 class TextractExtractor(BaseExtractor):
     """AWS Textract-based extraction with async job handling."""
 
+    artifact_name = "textract"
+    artifact_title = "Textract Extractor"
+
     def __init__(self, region_name: str = "us-east-1", default_s3_bucket: str | None = None):
         super().__init__(ExtractorType.TEXTRACT)
         if boto3 is None:
@@ -49,6 +58,7 @@ class TextractExtractor(BaseExtractor):
         )
         self.textract = None
         self.s3 = None
+        self.recorder = get_ocr_recorder()
         self._initialize_clients()
 
     def _initialize_clients(self):
@@ -63,7 +73,7 @@ class TextractExtractor(BaseExtractor):
 
     def extract(self, pdf_path: Path, s3_bucket: str | None = None) -> PipelineResult:
         """Extract transactions using AWS Textract."""
-        if not self.textract:
+        if not self.textract and not self.recorder.replaying:
             return self._create_result(
                 transactions=[],
                 confidence_score=0.0,
@@ -110,6 +120,42 @@ class TextractExtractor(BaseExtractor):
         self, pdf_path: Path, s3_bucket: str | None
     ) -> tuple[list[Transaction], dict[str, Any], int]:
         """Core extraction logic using Textract."""
+        session = self.get_session(pdf_path)
+        result = self.recorder.call(
+            "textract",
+            session.content_hash,
+            {"FeatureTypes": TEXTRACT_FEATURE_TYPES},
+            lambda: self._analyze_document(pdf_path, s3_bucket),
+        )
+
+        # Year of DD/MM dates: the due date Textract read, else the session's
+        period = (
+            StatementPeriod.from_text(self._extract_raw_text(result["Blocks"]))
+            or session.statement_period
+        )
+
+        # Process results
+        transactions = self._process_textract_result(result, period)
+
+        raw_data = {
+            "extractor": "textract",
+            "job_id": result.get("JobId"),
+            "page_count": len(
+                [b for b in result["Blocks"] if b["BlockType"] == "PAGE"]
+            ),
+            "total_blocks": len(result["Blocks"]),
+            "table_count": len(
+                [b for b in result["Blocks"] if b["BlockType"] == "TABLE"]
+            ),
+            "transaction_count": len(transactions),
+        }
+
+        page_count = raw_data["page_count"]
+
+        return transactions, raw_data, page_count
+
+    def _analyze_document(self, pdf_path: Path, s3_bucket: str | None) -> dict:
+        """Call Textract and return its raw analysis response."""
         # Decide strategy based on file type & bucket availability
         is_pdf = pdf_path.suffix.lower() == ".pdf"
 
@@ -123,54 +169,36 @@ class TextractExtractor(BaseExtractor):
         # Prepare document location
         if s3_bucket:
             s3_key = f"textract-input/{pdf_path.stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            cancellation.check_cancelled()
             self._upload_to_s3(pdf_path, s3_bucket, s3_key)
             document_location = {"S3Object": {"Bucket": s3_bucket, "Name": s3_key}}
         else:
-            with open(pdf_path, "rb") as f:
-                document_bytes = f.read()
-            document_location = {"Bytes": document_bytes}
+            document_location = {"Bytes": self.get_session(pdf_path).data}
 
-        # Start async analysis
+        # Start async analysis; race mode can no longer save the job's cost
+        cancellation.mark_billed()
         try:
             if s3_bucket:
                 response = self.textract.start_document_analysis(
                     DocumentLocation=document_location,
-                    FeatureTypes=["TABLES", "FORMS"],
+                    FeatureTypes=TEXTRACT_FEATURE_TYPES,
                 )
                 job_id = response["JobId"]
                 result = self._wait_for_job_completion(job_id)
             else:
                 result = self.textract.analyze_document(
                     Document=document_location,
-                    FeatureTypes=["TABLES", "FORMS"],
+                    FeatureTypes=TEXTRACT_FEATURE_TYPES,
                 )
 
         except ClientError as e:
             error_code = e.response["Error"].get("Code", "")
             if error_code in {"InvalidParameterException", "UnsupportedDocumentException"} and s3_bucket:
                 # Retry path: maybe initial strategy wrong; try alternate.
-                return self._extract_with_textract(pdf_path, s3_bucket)
+                return self._analyze_document(pdf_path, s3_bucket)
             raise
 
-        # Process results
-        transactions = self._process_textract_result(result)
-
-        raw_data = {
-            "extractor": "textract",
-            "job_id": result.get("JobId"),
-            "page_count": len(
-                [b for b in result["Blocks"] if b["BlockType"] == "PAGE"]
-            ),
-            "total_blocks": len(result["Blocks"]),
-            "table_count": len(
-                [b for b in result["Blocks"] if b["BlockType"] == "TABLE"]
-            ),
-            "transaction_count": len(transactions),
-        }
-
-        page_count = raw_data["page_count"]
-
-        return transactions, raw_data, page_count
+        return result
 
     def _upload_to_s3(self, pdf_path: Path, bucket: str, key: str):
         """Upload PDF to S3."""
@@ -191,11 +219,13 @@ class TextractExtractor(BaseExtractor):
                     f"Textract job failed: {response.get('StatusMessage', 'Unknown error')}"
                 )
 
-            time.sleep(5)  # Wait 5 seconds before polling again
+            cancellation.sleep(5)  # Poll every 5 seconds; stops early if cancelled
 
         raise ExtractionError(f"Textract job timed out after {max_wait_time} seconds")
 
-    def _process_textract_result(self, result: dict) -> list[Transaction]:
+    def _process_textract_result(
+        self, result: dict, period: StatementPeriod | None = None
+    ) -> list[Transaction]:
         """Process Textract result blocks into transactions."""
         transactions = []
 
@@ -210,18 +240,18 @@ class TextractExtractor(BaseExtractor):
         tables = [block for block in result["Blocks"] if block["BlockType"] == "TABLE"]
 
         for table in tables:
-            table_transactions = self._process_table_block(table, result["Blocks"])
+            table_transactions = self._process_table_block(table, result["Blocks"], period)
             transactions.extend(table_transactions)
 
         # If no tables found, process raw text
         if not transactions:
             raw_text = self._extract_raw_text(result["Blocks"])
-            transactions = self._parse_raw_text(raw_text)
+            transactions = self._parse_raw_text(raw_text, period)
 
         return transactions
 
     def _process_table_block(
-        self, table_block: dict, all_blocks: list[dict]
+        self, table_block: dict, all_blocks: list[dict], period: StatementPeriod | None = None
     ) -> list[Transaction]:
         """Process a Textract table block."""
         transactions = []
@@ -258,7 +288,7 @@ class TextractExtractor(BaseExtractor):
                 continue
 
             row_data = rows[row_index]
-            transaction = self._parse_table_row(row_data)
+            transaction = self._parse_table_row(row_data, period)
             if transaction:
                 transactions.append(transaction)
 
@@ -279,7 +309,9 @@ class TextractExtractor(BaseExtractor):
 
         return " ".join(text_parts)
 
-    def _parse_table_row(self, row_data: dict[int, str]) -> Transaction | None:
+    def _parse_table_row(
+        self, row_data: dict[int, str], period: StatementPeriod | None = None
+    ) -> Transaction | None:
         """Parse a table row into a transaction."""
         try:
             # Try to identify columns (heuristic-based)
@@ -307,7 +339,9 @@ class TextractExtractor(BaseExtractor):
                 return None
 
             # Parse components
-            parsed_date = self._parse_date(date_text) if date_text else date.today()
+            parsed_date = (
+                self._parse_date(date_text, period) if date_text else (period or DEFAULT_PERIOD).start
+            )
             amount = normalize_amount(amount_text)
             description = description_text or "Unknown transaction"
 
@@ -348,7 +382,9 @@ class TextractExtractor(BaseExtractor):
                 lines.append(block["Text"])
         return "\n".join(lines)
 
-    def _parse_raw_text(self, raw_text: str) -> list[Transaction]:
+    def _parse_raw_text(
+        self, raw_text: str, period: StatementPeriod | None = None
+    ) -> list[Transaction]:
         """Parse raw text when table extraction fails."""
         transactions = []
         lines = raw_text.split("\n")
@@ -362,13 +398,15 @@ class TextractExtractor(BaseExtractor):
             if not self._looks_like_amount(line):
                 continue
 
-            transaction = self._parse_text_line(line)
+            transaction = self._parse_text_line(line, period)
             if transaction:
                 transactions.append(transaction)
 
         return transactions
 
-    def _parse_text_line(self, line: str) -> Transaction | None:
+    def _parse_text_line(
+        self, line: str, period: StatementPeriod | None = None
+    ) -> Transaction | None:
         """Parse a single text line into a transaction."""
         try:
             # Find amount in line
@@ -387,10 +425,10 @@ class TextractExtractor(BaseExtractor):
             # Try to find date
             date_match = re.search(r"\d{1,2}/\d{1,2}", line)
             if date_match:
-                parsed_date = self._parse_date(date_match.group())
+                parsed_date = self._parse_date(date_match.group(), period)
                 description = description.replace(date_match.group(), "").strip()
             else:
-                parsed_date = date.today()
+                parsed_date = (period or DEFAULT_PERIOD).start
 
             if not description:
                 description = "Unknown transaction"
@@ -422,14 +460,14 @@ class TextractExtractor(BaseExtractor):
 
         return bool(re.search(r"\d+[,.]?\d*", text))
 
-    def _parse_date(self, date_str: str) -> date:
-        """Parse date string to date object."""
-        normalized = normalize_date(date_str)
+    def _parse_date(self, date_str: str, period: StatementPeriod | None = None) -> date:
+        """Parse date string to date object (year of ``DD/MM`` from ``period``)."""
+        normalized = normalize_date(date_str, period)
         try:
             year, month, day = normalized.split("-")
             return date(int(year), int(month), int(day))
         except:
-            return date.today()
+            return (period or DEFAULT_PERIOD).start
 
     def _calculate_confidence(
         self, transactions: list[Transaction], raw_data: dict[str, Any]
@@ -454,77 +492,12 @@ class TextractExtractor(BaseExtractor):
         # Combine scores
         return 0.6 * avg_confidence + 0.2 * table_quality + 0.2 * block_quality
 
-    def _save_individual_outputs(self, pdf_path: Path, raw_data: dict, transactions: list) -> None:
-        """Save individual extractor outputs to 4outputs folder."""
-        try:
-
-            pdf_name = pdf_path.stem
-            
-            # Base output directory
-            output_base = Path("/Users/lech/Install/NewEvolveo3pro/4outputs/textract")
-            
-            # Save raw text
-            text_dir = output_base / "text"
-            text_dir.mkdir(parents=True, exist_ok=True)
-            text_file = text_dir / f"{pdf_name}.txt"
-            
-            # Generate raw text from transactions
-            raw_text = ""
-            if transactions:
-                raw_text = "\n".join([t.raw_text for t in transactions if t.raw_text])
-            
-            with open(text_file, 'w', encoding='utf-8') as f:
-                f.write(f"Textract Extractor Output\n")
-                f.write(f"PDF: {pdf_path.name}\n")
-
-                f.write(f"Transactions found: {len(transactions)}\n")
-                f.write(f"Total blocks: {raw_data.get('total_blocks', 0)}\n")
-                f.write(f"Table count: {raw_data.get('table_count', 0)}\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(raw_text)
-            
-            # Save CSV (always, even if zero transactions)
-            csv_dir = output_base / "csv"
-            csv_dir.mkdir(parents=True, exist_ok=True)
-            csv_file = csv_dir / f"{pdf_name}.csv"
-            self._save_transactions_to_csv(transactions, csv_file)
-        
-        except Exception as e:
-            print(f"Failed to save textract outputs: {e}")
-
-    def _save_transactions_to_csv(self, transactions: list, output_file: Path) -> None:
-        """Save transactions to CSV file using golden CSV format."""
-        try:
-            import pandas as pd
-
-            if not transactions:
-                return
-
-            data = []
-            for t in transactions:
-                data.append(
-                    {
-                        "card_last4": "",  # Not available in Phase 1
-                        "post_date": t.date.strftime("%Y-%m-%d"),
-                        "desc_raw": t.description,
-                        "amount_brl": f"{t.amount_brl:.2f}",
-                        "installment_seq": "0",
-                        "installment_tot": "0", 
-                        "fx_rate": "0.00",
-                        "iof_brl": "0.00",
-                        "category": t.category or "",
-                        "merchant_city": "",  # Not available in Phase 1
-                        "ledger_hash": "",  # Not available in Phase 1
-                        "prev_bill_amount": "0",
-                        "interest_amount": "0",
-                        "amount_orig": "0.00",
-                        "currency_orig": "",
-                        "amount_usd": "0.00"
-                    }
-                )
-
-            df = pd.DataFrame(data)
-            df.to_csv(output_file, index=False, sep=";")
-        
-        except Exception as e:
-            print(f"Failed to save CSV: {e}")
+    def _artifact_summary(
+        self, raw_data: dict[str, Any], transactions: list[Transaction]
+    ) -> list[tuple[str, Any]]:
+        """Header lines of the text artifact."""
+        return [
+            ("Transactions found", len(transactions)),
+            ("Total blocks", raw_data.get("total_blocks", 0)),
+            ("Table count", raw_data.get("table_count", 0)),
+        ]
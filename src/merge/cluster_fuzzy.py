@@ -1,17 +1,75 @@
 from __future__ import annotations
 
+import math
+from decimal import Decimal
 from typing import List
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from src.core.models import Transaction
 
+SIMILARITY_CUTOFF = 90
+AMOUNT_TOLERANCE = Decimal("0.01")
+
+# Buckets smaller than this are scored on one thread; spinning up workers
+# costs more than scoring a handful of descriptions
+PARALLEL_BUCKET_ROWS = 256
+
 
 def _similar(a: str, b: str) -> bool:
-    return fuzz.token_set_ratio(a, b) >= 90
+    return fuzz.token_set_ratio(a, b) >= SIMILARITY_CUTOFF
+
+
+class _UnionFind:
+    """Disjoint sets over ``0..size-1`` (path halving, union by index)."""
+
+    __slots__ = ("parent",)
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # The earlier row stays the root, so clusters keep input order
+            if root_b < root_a:
+                root_a, root_b = root_b, root_a
+            self.parent[root_b] = root_a
+
 
+def _bucket_windows(txns: List[Transaction]) -> tuple[np.ndarray, list[tuple[int, int, int]]]:
+    """Rows sorted by (date, amount cents) and the windows worth scoring.
 
-def merge_transactions(txns: List[Transaction]) -> List[Transaction]:
+    Each window ``(start, end, stop)`` covers one bucket ``order[start:end]``
+    plus, when it exists, the bucket one cent up on the same day
+    (``order[end:stop]``); amounts within 0.01 of each other always fall in
+    one bucket or in adjacent ones. Windows with a single row are dropped.
+    """
+    days = np.fromiter((tx.date.toordinal() for tx in txns), np.int64, len(txns))
+    cents = np.fromiter((math.floor(tx.amount_brl * 100) for tx in txns), np.int64, len(txns))
+    order = np.lexsort((cents, days))  # stable: input order within a bucket
+    days, cents = days[order], cents[order]
+
+    starts = np.flatnonzero(np.r_[True, (days[1:] != days[:-1]) | (cents[1:] != cents[:-1])])
+    ends = np.r_[starts[1:], len(txns)]
+    stops = ends.copy()
+    following = starts[1:]
+    adjacent = (days[following] == days[starts[:-1]]) & (cents[following] == cents[starts[:-1]] + 1)
+    stops[:-1][adjacent] = ends[1:][adjacent]
+
+    worth = np.flatnonzero(stops - starts >= 2)
+    return order, list(zip(starts[worth].tolist(), ends[worth].tolist(), stops[worth].tolist()))
+
+
+def merge_transactions(txns: List[Transaction], workers: int = 1) -> List[Transaction]:
     """
     Fuzzy-merge rows coming from different extractors.
 
@@ -19,28 +77,45 @@ def merge_transactions(txns: List[Transaction]) -> List[Transaction]:
         – same ISO date
         – amount_brl equal within 0.01
         – description fuzzy-match ≥90
+
+    Rows are bucketed by (date, amount cents). Each bucket's descriptions
+    are scored against the bucket and the next cent up in one
+    ``process.cdist`` call, and matching pairs are joined with union-find,
+    so a cluster is every row linked to another by a match. ``workers`` is
+    passed to ``cdist`` for buckets of ``PARALLEL_BUCKET_ROWS`` rows or
+    more (``-1``: all cores).
     """
-    clusters: list[list[Transaction]] = []
-
-    for tx in txns:
-        match = None
-        for cluster in clusters:
-            cand = cluster[0]
-            if (
-                cand.date == tx.date
-                and abs(cand.amount_brl - tx.amount_brl) < 0.01
-                and _similar(cand.description, tx.description)
-            ):
-                match = cluster
-                break
-        if match:
-            match.append(tx)
-        else:
-            clusters.append([tx])
-
-    merged: list[Transaction] = []
-    for cluster in clusters:
-        best = max(cluster, key=lambda t: t.confidence_score)
-        merged.append(best)
-
-    return merged
+    if not txns:
+        return []
+    order, windows = _bucket_windows(txns)
+    descriptions = [tx.description for tx in txns]
+    clusters = _UnionFind(len(txns))
+
+    for start, end, stop in windows:
+        rows = order[start:end].tolist()
+        neighbours = order[start:stop].tolist()
+        scores = process.cdist(
+            [descriptions[i] for i in rows],
+            [descriptions[j] for j in neighbours],
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=SIMILARITY_CUTOFF,
+            workers=workers if len(neighbours) >= PARALLEL_BUCKET_ROWS else 1,
+        )
+        # Scores under the cutoff come back as 0
+        for row, column in zip(*np.nonzero(scores)):
+            i, j = rows[row], neighbours[column]
+            if i != j and abs(txns[i].amount_brl - txns[j].amount_brl) <= AMOUNT_TOLERANCE:
+                clusters.union(i, j)
+
+    # Roots are each cluster's first row; keep its most confident row
+    # (the first one on ties), clusters in order of their first row
+    roots = [clusters.find(i) for i in range(len(txns))]
+    best: dict[int, Transaction] = {}
+    for i, root in enumerate(roots):
+        if root != i:
+            current = best.get(root, txns[root])
+            if txns[i].confidence_score > current.confidence_score:
+                current = txns[i]
+            best[root] = current
+
+    return [best.get(i, tx) for i, tx in enumerate(txns) if roots[i] == i]
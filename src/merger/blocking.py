@@ -0,0 +1,65 @@
+"""Blocking index for pairing transactions across extractor outputs."""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from collections.abc import Iterable
+from decimal import Decimal
+
+from ..core.models import Transaction
+
+
+class BlockingIndex:
+    """Buckets transactions by (day, amount step) for candidate lookup.
+
+    Two transactions within ``date_tolerance_days`` and ``amount_tolerance``
+    of each other always land in neighbouring blocks: the day ordinals
+    differ by at most the tolerance and the amount steps
+    (``floor(amount / amount_tolerance)``) by at most one. ``candidates``
+    therefore returns a superset of the matches, and the fuzzy description
+    check only runs on that superset instead of on every pair. The default
+    tolerances are those of ``EnsembleMerger._transactions_similar``.
+    """
+
+    __slots__ = ("date_tolerance_days", "amount_tolerance", "_blocks", "_size")
+
+    def __init__(
+        self,
+        transactions: Iterable[Transaction] = (),
+        date_tolerance_days: int = 1,
+        amount_tolerance: Decimal = Decimal("0.01"),
+    ):
+        self.date_tolerance_days = date_tolerance_days
+        self.amount_tolerance = amount_tolerance
+        self._blocks: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+        self._size = 0
+        for transaction in transactions:
+            self.add(transaction)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, transaction: Transaction) -> int:
+        """Index ``transaction`` at the next position and return that position."""
+        position = self._size
+        self._blocks[self._key(transaction)].append(position)
+        self._size += 1
+        return position
+
+    def _key(self, transaction: Transaction) -> tuple[int, int]:
+        return (
+            transaction.date.toordinal(),
+            math.floor(transaction.amount_brl / self.amount_tolerance),
+        )
+
+    def candidates(self, transaction: Transaction) -> list[int]:
+        """Positions in the blocks around ``transaction``, ascending."""
+        day, step = self._key(transaction)
+        days = range(day - self.date_tolerance_days, day + self.date_tolerance_days + 1)
+        found = []
+        for neighbour_day in days:
+            for neighbour_step in (step - 1, step, step + 1):
+                found.extend(self._blocks.get((neighbour_day, neighbour_step), ()))
+        found.sort()
+        return found
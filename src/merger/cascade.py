@@ -0,0 +1,329 @@
+"""Staged extractor cascade: free local engines first, paid OCR on demand."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from datetime import date
+from decimal import Decimal
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from ..core.cancellation import CancellationToken
+from ..core.document_session import get_document_session
+from ..core.metrics import get_metrics
+from ..core.models import (
+    CancelledPipeline,
+    CascadeDecision,
+    CostEstimate,
+    EnsembleResult,
+    ExtractorType,
+    PipelineResult,
+)
+from .page_ensemble import failing_pages, page_ranges, stitch
+
+if TYPE_CHECKING:
+    from .ensemble_merger import EnsembleMerger
+
+# ExtractionMetrics.estimate_costs pricing key of each paid extractor
+CLOUD_COST_METHODS: Final[dict[ExtractorType, str]] = {
+    ExtractorType.TEXTRACT: "textract",
+    ExtractorType.AZURE_DOC_INTELLIGENCE: "azure",
+    ExtractorType.GOOGLE_DOC_AI: "docai",
+}
+
+# CostEstimate field prefix of each paid extractor
+_COST_FIELDS: Final[dict[ExtractorType, str]] = {
+    ExtractorType.TEXTRACT: "textract",
+    ExtractorType.AZURE_DOC_INTELLIGENCE: "azure",
+    ExtractorType.GOOGLE_DOC_AI: "google",
+}
+
+# Stages in escalation order; paid engines run one at a time, cheapest first
+TEXT_STAGE: Final[tuple[ExtractorType, ...]] = (ExtractorType.PYMUPDF, ExtractorType.PDFPLUMBER)
+TABLE_STAGE: Final[tuple[ExtractorType, ...]] = (ExtractorType.CAMELOT,)
+PAID_STAGE: Final[tuple[ExtractorType, ...]] = (
+    ExtractorType.AZURE_DOC_INTELLIGENCE,
+    ExtractorType.TEXTRACT,
+)
+
+DEFAULT_LEDGER_PATH: Final[Path] = Path.home() / ".cache" / "evolve" / "cost_ledger.json"
+DEFAULT_RUN_PAGES: Final[int] = 50
+DEFAULT_DAILY_PAGES: Final[int] = 1000
+
+
+def estimate_cost(extractor_type: ExtractorType, pages: int) -> CostEstimate:
+    """``CostEstimate`` of running a paid extractor over ``pages`` pages."""
+    prefix = _COST_FIELDS.get(extractor_type)
+    if prefix is None:
+        return CostEstimate()
+    cost = get_metrics().estimate_costs(pages, CLOUD_COST_METHODS[extractor_type])
+    return CostEstimate(**{f"{prefix}_pages": pages, f"{prefix}_cost_usd": cost})
+
+
+class CostGuard:
+    """Per-run and per-day page budgets for paid OCR.
+
+    Pages spent today are kept in a small JSON ledger so the daily budget
+    holds across runs. Budgets come from ``EVOLVE_RUN_PAGE_BUDGET`` and
+    ``EVOLVE_DAILY_PAGE_BUDGET`` unless given; the ledger lives at
+    ``EVOLVE_COST_LEDGER`` (default ``~/.cache/evolve/cost_ledger.json``).
+    """
+
+    def __init__(
+        self,
+        run_pages: int | None = None,
+        daily_pages: int | None = None,
+        ledger_path: Path | str | None = None,
+    ):
+        self.run_pages = (
+            run_pages
+            if run_pages is not None
+            else int(os.getenv("EVOLVE_RUN_PAGE_BUDGET", str(DEFAULT_RUN_PAGES)))
+        )
+        self.daily_pages = (
+            daily_pages
+            if daily_pages is not None
+            else int(os.getenv("EVOLVE_DAILY_PAGE_BUDGET", str(DEFAULT_DAILY_PAGES)))
+        )
+        self.ledger_path = Path(
+            ledger_path or os.getenv("EVOLVE_COST_LEDGER") or DEFAULT_LEDGER_PATH
+        )
+        self._lock = threading.Lock()
+
+    def pages_today(self) -> int:
+        with self._lock:
+            return self._read_ledger().get(date.today().isoformat(), {}).get("pages", 0)
+
+    def check(self, estimate: CostEstimate, spent_this_run: CostEstimate) -> str | None:
+        """Reason ``estimate`` would exceed a budget, or None if it fits."""
+        pages = estimate.total_pages
+        if spent_this_run.total_pages + pages > self.run_pages:
+            return (
+                f"{pages} pages would exceed the run budget "
+                f"({spent_this_run.total_pages}/{self.run_pages} used)"
+            )
+        today = self.pages_today()
+        if today + pages > self.daily_pages:
+            return f"{pages} pages would exceed the daily budget ({today}/{self.daily_pages} used)"
+        return None
+
+    def charge(self, estimate: CostEstimate) -> None:
+        """Add ``estimate`` to today's ledger entry."""
+        with self._lock:
+            ledger = self._read_ledger()
+            today = ledger.setdefault(date.today().isoformat(), {"pages": 0, "cost_usd": "0"})
+            today["pages"] += estimate.total_pages
+            today["cost_usd"] = str(
+                Decimal(today["cost_usd"]) + Decimal(str(estimate.total_cost_usd))
+            )
+            self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.ledger_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(ledger, indent=2, sort_keys=True))
+            os.replace(tmp, self.ledger_path)
+
+    def _read_ledger(self) -> dict[str, dict]:
+        try:
+            return json.loads(self.ledger_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+
+class CascadeScheduler:
+    """Run extractor stages in cost order until one result is good enough.
+
+    1. ``text``: PyMuPDF and pdfplumber, raced.
+    2. ``tables``: Camelot, plus text engines the race cancelled.
+    3. ``paid``: each cloud engine alone, cheapest first, if ``CostGuard``
+       allows its pages.
+
+    After each stage the successful results so far are merged. The stage is
+    accepted when the best calibrated confidence reaches the threshold, or
+    when every page reconciles across engines (see ``page_ensemble``), and
+    the merged transactions agree with the statement totals (a statement
+    without totals counts as agreeing). Every stage appends a
+    ``CascadeDecision``.
+
+    When the local stages leave only some pages unreconciled, paid engines
+    see just those page ranges; their output is stitched over the local
+    pages and the budget is charged for the pages sent.
+
+    ``run`` hands each extractor result to ``on_result`` as it completes.
+    """
+
+    def __init__(self, merger: EnsembleMerger, cost_guard: CostGuard | None = None):
+        self.merger = merger
+        self.cost_guard = cost_guard or CostGuard()
+
+    async def run(
+        self,
+        pdf_path: Path,
+        confidence_threshold: float,
+        on_result: Callable[[PipelineResult], None] | None = None,
+    ) -> tuple[list[PipelineResult], list[CancelledPipeline], list[CascadeDecision]]:
+        results: list[PipelineResult] = []
+        cancelled: list[CancelledPipeline] = []
+        decisions: list[CascadeDecision] = []
+        attempted: set[ExtractorType] = set()
+
+        # Local stages: free, so only availability limits them
+        for stage, extractor_types in (("text", TEXT_STAGE), ("tables", TABLE_STAGE)):
+            if stage == "tables":
+                retry = tuple(c.pipeline_name for c in cancelled)
+                attempted.difference_update(retry)
+                extractor_types += retry
+            available = self._available(extractor_types, attempted)
+            if not available:
+                continue
+            attempted.update(available)
+            stage_results, stage_cancelled = await self.merger._run_race_extraction(
+                pdf_path, available, confidence_threshold, on_result
+            )
+            results += stage_results
+            cancelled = [c for c in cancelled if c.pipeline_name not in available]
+            cancelled += stage_cancelled
+            decision = self._evaluate(stage, available, results, pdf_path, confidence_threshold)
+            decisions.append(decision)
+            if decision.outcome == "accepted":
+                return results, cancelled, decisions
+
+        # Paid stage: one engine at a time, within budget
+        pages = self.merger._page_count(pdf_path)
+        escalated = decisions[-1].pages if decisions else []
+        if 0 < len(escalated) < pages:
+            ranges = page_ranges(escalated)
+        else:
+            escalated, ranges = list(range(pages)), [(0, pages)]
+        local_results = list(results)
+        spent = CostEstimate()
+        for extractor_type in PAID_STAGE:
+            if not self._available((extractor_type,), attempted):
+                continue
+            attempted.add(extractor_type)
+            estimate = estimate_cost(extractor_type, len(escalated))
+            over_budget = self.cost_guard.check(estimate, spent)
+            if over_budget:
+                decisions.append(
+                    CascadeDecision(
+                        "paid", [extractor_type], "over_budget", over_budget, pages=escalated
+                    )
+                )
+                continue
+
+            if ranges == [(0, pages)]:
+                token = CancellationToken()
+                result = await self.merger._run_single_extractor(extractor_type, pdf_path, token)
+                billed_pages = pages if token.billed else 0
+                results.append(result)
+                decision = self._evaluate(
+                    "paid", [extractor_type], results, pdf_path, confidence_threshold
+                )
+            else:
+                replacements, billed_pages = await self._extract_ranges(
+                    extractor_type, pdf_path, ranges
+                )
+                result = stitch(local_results, replacements, pages, extractor_type)
+                # The stitched result already carries the reconciled local pages
+                decision = self._evaluate(
+                    "paid", [extractor_type], [result], pdf_path, confidence_threshold
+                )
+                results.append(result)
+            if on_result is not None:
+                on_result(result)
+            decision.pages = escalated
+            if billed_pages:
+                # Recorded replays and cache hits never reach the cloud
+                charged = estimate_cost(extractor_type, billed_pages)
+                self.cost_guard.charge(charged)
+                spent += charged
+                decision.cost = charged
+            decisions.append(decision)
+            if decision.outcome == "accepted":
+                if ranges != [(0, pages)]:
+                    results = [result]
+                break
+
+        return results, cancelled, decisions
+
+    async def _extract_ranges(
+        self, extractor_type: ExtractorType, pdf_path: Path, ranges: list[tuple[int, int]]
+    ) -> tuple[list[tuple[int, int, PipelineResult]], int]:
+        """Run ``extractor_type`` on each page range as its own PDF.
+
+        Returns ``(start, stop, result)`` per range and the number of pages
+        the extractor billed.
+        """
+        session = get_document_session(pdf_path)
+        replacements = []
+        billed_pages = 0
+        with tempfile.TemporaryDirectory(prefix="cascade-pages-") as tmp:
+            for start, stop in ranges:
+                subset = Path(tmp) / f"{Path(pdf_path).stem}.p{start + 1}-{stop}.pdf"
+                subset.write_bytes(session.page_range_pdf(start, stop))
+                token = CancellationToken()
+                result = await self.merger._run_single_extractor(extractor_type, subset, token)
+                replacements.append((start, stop, result))
+                if token.billed:
+                    billed_pages += stop - start
+        return replacements, billed_pages
+
+    def _available(
+        self, extractor_types: tuple[ExtractorType, ...], attempted: set[ExtractorType]
+    ) -> list[ExtractorType]:
+        return [
+            extractor_type
+            for extractor_type in dict.fromkeys(extractor_types)
+            if extractor_type not in attempted and extractor_type in self.merger.extractors
+        ]
+
+    def _evaluate(
+        self,
+        stage: str,
+        extractor_types: list[ExtractorType],
+        results: list[PipelineResult],
+        pdf_path: Path,
+        confidence_threshold: float,
+    ) -> CascadeDecision:
+        """Accept or escalate on the merged successful results so far."""
+        successful = [r for r in results if r.success]
+        if not successful:
+            return CascadeDecision(stage, extractor_types, "escalated", "no extractor succeeded")
+
+        confidence = max(r.confidence_score for r in successful)
+        transactions, _, _ = self.merger._merge_pipeline_results(successful)
+        totals_match = self._totals_match(transactions, pdf_path)
+        page_count = self.merger._page_count(pdf_path)
+        paged = any(r.page_results for r in successful)
+        failing = failing_pages(successful, page_count, confidence_threshold) if paged else []
+
+        if totals_match is False:
+            outcome, reason = "escalated", "transactions disagree with the statement totals"
+        elif confidence >= confidence_threshold:
+            outcome, reason = "accepted", f"confidence {confidence:.2f}"
+        elif paged and page_count and not failing:
+            outcome, reason = "accepted", f"all {page_count} pages reconcile"
+        elif failing:
+            outcome = "escalated"
+            reason = (
+                f"confidence {confidence:.2f} < {confidence_threshold:.2f}; "
+                f"{len(failing)}/{page_count} pages do not reconcile"
+            )
+        else:
+            outcome, reason = "escalated", f"confidence {confidence:.2f} < {confidence_threshold:.2f}"
+        return CascadeDecision(
+            stage, extractor_types, outcome, reason, confidence, totals_match, pages=failing
+        )
+
+    def _totals_match(self, transactions, pdf_path: Path) -> bool | None:
+        validator = self.merger.enrichment_pipeline.pdf_validator
+        try:
+            session = get_document_session(pdf_path)
+        except Exception:
+            return None
+        checks = validator.validate_totals(
+            EnsembleResult(transactions, [], 0.0, [], "cascade", 0), session
+        )
+        return all(checks.values()) if checks else None
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator, Callable
 from decimal import Decimal
 from pathlib import Path
 
@@ -12,54 +13,71 @@ try:
 except ImportError:
     fuzz = None
 
+from ..core.cancellation import (
+    CancellationToken,
+    ExtractionCancelled,
+    cancellation_scope,
+)
 from ..core.confidence import (
     get_calibrator,
     merge_confidence_scores,
 )
+from ..core.document_session import get_document_session
 from ..core.metrics import get_metrics
-from ..core.models import EnsembleResult, ExtractorType, PipelineResult, Transaction
-from ..enrichment.pipeline import EnrichmentPipeline
-from ..extractors import (
-    AzureDocIntelligenceExtractor,
-    CamelotExtractor,
-    PdfplumberExtractor,
-    TextractExtractor,
+from ..core.result_cache import ResultCache, extractor_version, get_result_cache
+from ..core.models import (
+    CancelledPipeline,
+    EnsembleResult,
+    ExtractorType,
+    PipelineResult,
+    Transaction,
 )
+from ..enrichment.pipeline import EnrichmentPipeline
+from ..extractors.registry import ExtractorRegistry
+from .cascade import CLOUD_COST_METHODS, CascadeScheduler, CostGuard
+from .incremental import IncrementalMerge
+
+# Receives each extractor result as soon as it completes
+ResultCallback = Callable[[PipelineResult], None]
 
 
 class EnsembleMerger:
     """Intelligent merging of multiple extraction pipeline results."""
 
-    def __init__(self):
-        self.extractors = {}
+    def __init__(
+        self,
+        page_workers: int | None = None,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+        race_grace_seconds: float = 5.0,
+        cost_guard: CostGuard | None = None,
+    ):
+        # Extractors are imported and built on first use, in priority order
+        self.extractors = ExtractorRegistry(
+            [
+                ExtractorType.PYMUPDF,
+                ExtractorType.PDFPLUMBER,
+                ExtractorType.CAMELOT,
+                ExtractorType.TEXTRACT,
+                ExtractorType.AZURE_DOC_INTELLIGENCE,
+            ],
+            options={ExtractorType.PDFPLUMBER: {"page_workers": page_workers}},
+        )
         self.enrichment_pipeline = EnrichmentPipeline()
 
-        # Initialize extractors that are available
-        try:
-            self.extractors[ExtractorType.PDFPLUMBER] = PdfplumberExtractor()
-        except ImportError as e:
-            print(f"⚠️  pdfplumber not available: {e}")
-
-        try:
-            self.extractors[ExtractorType.CAMELOT] = CamelotExtractor()
-        except ImportError as e:
-            print(f"⚠️  Camelot not available: {e}")
+        self.calibrator = get_calibrator()
+        self.metrics = get_metrics()
 
-        try:
-            self.extractors[ExtractorType.TEXTRACT] = TextractExtractor()
-        except ImportError as e:
-            print(f"⚠️  Textract not available: {e}")
+        # Persistent extractor results; refresh re-runs and overwrites entries
+        self.result_cache: ResultCache | None = get_result_cache() if use_cache else None
+        self.refresh_cache = refresh_cache
 
-        try:
-            self.extractors[ExtractorType.AZURE_DOC_INTELLIGENCE] = (
-                AzureDocIntelligenceExtractor()
-            )
-        except ImportError as e:
-            print(f"⚠️  Azure Document Intelligence not available: {e}")
+        # How long race mode waits for cancelled extractors to stop
+        self.race_grace_seconds = race_grace_seconds
 
-        self.calibrator = get_calibrator()
-        self.metrics = get_metrics()
-        # self.cost_guard = CostGuard()  # TODO: Implement cost guard
+        # Paid OCR only runs when the free engines fall short, within budget
+        self.cost_guard = cost_guard or CostGuard()
+        self.cascade = CascadeScheduler(self, self.cost_guard)
 
     async def extract_with_ensemble(
         self,
@@ -67,6 +85,8 @@ class EnsembleMerger:
         enabled_extractors: list[ExtractorType] | None = None,
         use_race_mode: bool = True,
         confidence_threshold: float = 0.90,
+        use_cascade: bool = True,
+        on_provisional: Callable[[EnsembleResult], None] | None = None,
     ) -> EnsembleResult:
         """
         Extract using multiple pipelines and merge results intelligently.
@@ -76,20 +96,42 @@ class EnsembleMerger:
             enabled_extractors: List of extractors to use (None = auto-select)
             use_race_mode: If True, stop others when one reaches threshold
             confidence_threshold: Confidence level to trigger early termination
+            use_cascade: Without ``enabled_extractors``, run free engines
+                first and escalate to paid OCR only when they fall short
+                (see ``CascadeScheduler``)
+            on_provisional: Called with an unenriched merge of the successful
+                results so far each time another extractor succeeds
         """
-        # Auto-select extractors if not specified
-        if enabled_extractors is None:
-            enabled_extractors = self._auto_select_extractors(pdf_path)
-
-        # Run extractions
-        if use_race_mode:
-            pipeline_results = await self._run_race_extraction(
-                pdf_path, enabled_extractors, confidence_threshold
+        # Results are folded into the merge as they arrive, not after the last
+        merge = IncrementalMerge(self)
+
+        def on_result(result: PipelineResult) -> None:
+            if not result.success:
+                return
+            merge.add(result)
+            if on_provisional is not None:
+                on_provisional(self._provisional_result(merge))
+
+        cancelled_pipelines = []
+        cascade_decisions = []
+        if enabled_extractors is None and use_cascade:
+            pipeline_results, cancelled_pipelines, cascade_decisions = await self.cascade.run(
+                pdf_path, confidence_threshold, on_result
             )
         else:
-            pipeline_results = await self._run_parallel_extraction(
-                pdf_path, enabled_extractors
-            )
+            # Auto-select extractors if not specified
+            if enabled_extractors is None:
+                enabled_extractors = self._auto_select_extractors(pdf_path)
+
+            # Run extractions
+            if use_race_mode:
+                pipeline_results, cancelled_pipelines = await self._run_race_extraction(
+                    pdf_path, enabled_extractors, confidence_threshold, on_result
+                )
+            else:
+                pipeline_results = await self._run_parallel_extraction(
+                    pdf_path, enabled_extractors, on_result
+                )
 
         # Filter successful results
         successful_results = [r for r in pipeline_results if r.success]
@@ -103,12 +145,22 @@ class EnsembleMerger:
                 pipeline_results=pipeline_results,
                 merge_strategy="all_failed",
                 conflicts_resolved=0,
+                cancelled_pipelines=cancelled_pipelines,
+                cascade_decisions=cascade_decisions,
             )
 
-        # Merge results intelligently
-        final_transactions, merge_strategy, conflicts = self._merge_pipeline_results(
-            successful_results
-        )
+        # Merge results intelligently; the running merge already holds them
+        # unless the final order differs (parallel mode) or the cascade
+        # replaced results (stitched pages). Compared by identity: dataclass
+        # equality would walk every transaction of every result
+        if len(merge.results) == len(successful_results) and all(
+            merged is result for merged, result in zip(merge.results, successful_results)
+        ):
+            final_transactions, merge_strategy, conflicts = merge.merged()
+        else:
+            final_transactions, merge_strategy, conflicts = self._merge_pipeline_results(
+                successful_results
+            )
 
         # Apply Phase 2 enrichment pipeline
         enriched_result = EnsembleResult(
@@ -118,29 +170,69 @@ class EnsembleMerger:
             pipeline_results=pipeline_results,
             merge_strategy=merge_strategy,
             conflicts_resolved=conflicts,
+            cancelled_pipelines=cancelled_pipelines,
+            cascade_decisions=cascade_decisions,
         )
         
-        # Read PDF text for enrichment
-        pdf_text = None
-        source_lines = None
+        # Enrichment reuses the parse the extractors already paid for
+        session = None
         try:
-            import pdfplumber
-            with pdfplumber.open(str(pdf_path)) as pdf:
-                pdf_text = "\n".join(
-                    page.extract_text() for page in pdf.pages 
-                    if page.extract_text()
-                )
-                source_lines = pdf_text.splitlines()
+            session = get_document_session(pdf_path)
         except Exception as e:
             print(f"Could not read PDF for enrichment: {e}")
         
         # Apply enrichment
         enriched_result = await self.enrichment_pipeline.enrich_extraction_result(
-            enriched_result, pdf_text, source_lines
+            enriched_result, session=session
         )
 
         return enriched_result
 
+    async def stream_ensemble(
+        self, pdf_path: Path, **options
+    ) -> AsyncIterator[EnsembleResult]:
+        """Yield provisional merged results as extractors finish, then the final one.
+
+        Accepts the keyword options of ``extract_with_ensemble``. The
+        provisional results are unenriched (``merge_strategy`` starts with
+        ``provisional_``); the last item is the enriched ``EnsembleResult``.
+        """
+        provisional: asyncio.Queue[EnsembleResult] = asyncio.Queue()
+        extraction = asyncio.create_task(
+            self.extract_with_ensemble(
+                pdf_path, on_provisional=provisional.put_nowait, **options
+            )
+        )
+        try:
+            while True:
+                next_result = asyncio.create_task(provisional.get())
+                done, _ = await asyncio.wait(
+                    {next_result, extraction}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if next_result in done:
+                    yield next_result.result()
+                    continue
+                next_result.cancel()
+                while not provisional.empty():
+                    yield provisional.get_nowait()
+                yield extraction.result()
+                return
+        finally:
+            if not extraction.done():
+                extraction.cancel()
+
+    def _provisional_result(self, merge: IncrementalMerge) -> EnsembleResult:
+        """Unenriched ``EnsembleResult`` of the results folded into ``merge``."""
+        transactions, strategy, conflicts = merge.merged()
+        return EnsembleResult(
+            final_transactions=transactions,
+            contributing_pipelines=[r.pipeline_name for r in merge.results],
+            confidence_score=self._calculate_ensemble_confidence(merge.results, transactions),
+            pipeline_results=list(merge.results),
+            merge_strategy=f"provisional_{strategy}",
+            conflicts_resolved=conflicts,
+        )
+
     def _auto_select_extractors(self, pdf_path: Path) -> list[ExtractorType]:
         """Auto-select extractors based on PDF characteristics."""
         # Always try all available extractors for maximum coverage
@@ -151,6 +243,13 @@ class EnsembleMerger:
             # Skip TEXTRACT due to AWS credentials requirement
         ]
 
+        # Born-digital statements start with the fast PyMuPDF text backend
+        try:
+            if not get_document_session(pdf_path).is_scanned():
+                extractors.insert(0, ExtractorType.PYMUPDF)
+        except Exception as e:
+            print(f"Could not inspect PDF for extractor selection: {e}")
+
         return extractors
 
     async def _run_race_extraction(
@@ -158,62 +257,106 @@ class EnsembleMerger:
         pdf_path: Path,
         extractor_types: list[ExtractorType],
         confidence_threshold: float,
-    ) -> list[PipelineResult]:
-        """Run extractors in race mode - stop when one reaches confidence threshold."""
-        tasks = []
+        on_result: ResultCallback | None = None,
+    ) -> tuple[list[PipelineResult], list[CancelledPipeline]]:
+        """Run extractors in race mode - stop when one reaches confidence threshold.
+
+        Each extractor gets a ``CancellationToken``. Once a result reaches
+        the threshold, the others are cancelled and given
+        ``race_grace_seconds`` to reach a cancellation point and return;
+        what each of them spent (and saved) is reported alongside the
+        results.
+        """
+        tokens: dict[ExtractorType, CancellationToken] = {}
+        remaining_tasks: dict[asyncio.Task, ExtractorType] = {}
         results = []
 
         # Create async tasks for each extractor
         for extractor_type in extractor_types:
             if extractor_type in self.extractors:
+                token = tokens[extractor_type] = CancellationToken()
                 task = asyncio.create_task(
-                    self._run_single_extractor(extractor_type, pdf_path)
+                    self._run_single_extractor(extractor_type, pdf_path, token)
                 )
-                tasks.append((extractor_type, task))
-
-        # Wait for tasks, checking for early completion
-        remaining_tasks = dict(tasks)
+                remaining_tasks[task] = extractor_type
 
         while remaining_tasks:
             # Wait for next completion
-            done, pending = await asyncio.wait(
-                remaining_tasks.values(), return_when=asyncio.FIRST_COMPLETED
+            done, _ = await asyncio.wait(
+                remaining_tasks, return_when=asyncio.FIRST_COMPLETED
             )
 
-            # Process completed tasks
             for task in done:
+                del remaining_tasks[task]
                 result = task.result()
                 results.append(result)
-
-                # Remove from remaining
-                for ext_type, t in list(remaining_tasks.items()):
-                    if t == task:
-                        del remaining_tasks[ext_type]
-                        break
+                if on_result is not None:
+                    on_result(result)
 
                 # Check if we should stop early
                 if result.success and result.confidence_score >= confidence_threshold:
-                    # Cancel remaining tasks
-                    for pending_task in pending:
-                        pending_task.cancel()
-
-                    # Wait for cancellations
-                    try:
-                        await asyncio.gather(*pending, return_exceptions=True)
-                    except Exception:  # noqa: broad-except
-                        pass
-
                     print(
                         f"Early termination: {result.pipeline_name.value} reached {result.confidence_score:.2f} confidence"
                     )
-                    return results
+                    for ext_type in remaining_tasks.values():
+                        tokens[ext_type].cancel(f"{result.pipeline_name.value} won the race")
+                    return results, await self._stop_losers(
+                        pdf_path, remaining_tasks, tokens
+                    )
 
-        return results
+        return results, []
+
+    async def _stop_losers(
+        self,
+        pdf_path: Path,
+        pending: dict[asyncio.Task, ExtractorType],
+        tokens: dict[ExtractorType, CancellationToken],
+    ) -> list[CancelledPipeline]:
+        """Wait for cancelled extractors to stop and report what they cost."""
+        if pending:
+            _, still_running = await asyncio.wait(pending, timeout=self.race_grace_seconds)
+            for task in still_running:
+                # Stuck between cancellation points; stop waiting for it
+                task.cancel()
+
+        cancelled = []
+        for task, extractor_type in pending.items():
+            token = tokens[extractor_type]
+            cost_avoided = 0.0
+            if not token.billed and extractor_type in CLOUD_COST_METHODS:
+                cost_avoided = self.metrics.estimate_costs(
+                    self._page_count(pdf_path), CLOUD_COST_METHODS[extractor_type]
+                )
+            cancelled.append(
+                CancelledPipeline(
+                    pipeline_name=extractor_type,
+                    cpu_seconds=token.cpu_seconds,
+                    stop_latency_ms=token.stop_latency_ms,
+                    stopped=token.stopped,
+                    billed=token.billed,
+                    cost_avoided_usd=cost_avoided,
+                )
+            )
+        return cancelled
+
+    @staticmethod
+    def _page_count(pdf_path: Path) -> int:
+        try:
+            return get_document_session(pdf_path).page_count
+        except Exception:
+            return 0
 
     async def _run_parallel_extraction(
-        self, pdf_path: Path, extractor_types: list[ExtractorType]
+        self,
+        pdf_path: Path,
+        extractor_types: list[ExtractorType],
+        on_result: ResultCallback | None = None,
     ) -> list[PipelineResult]:
-        """Run all extractors in parallel, wait for all to complete."""
+        """Run all extractors in parallel, wait for all to complete.
+
+        ``on_result`` sees results in completion order; the returned list
+        keeps the order of ``extractor_types``.
+        """
         tasks = []
 
         for extractor_type in extractor_types:
@@ -223,28 +366,47 @@ class EnsembleMerger:
                 )
                 tasks.append(task)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if on_result is not None and task.exception() is None:
+                    on_result(task.result())
 
         # Filter out exceptions
         valid_results = []
-        for result in results:
-            if isinstance(result, PipelineResult):
-                valid_results.append(result)
+        for task in tasks:
+            if task.exception() is None:
+                valid_results.append(task.result())
             else:
-                print(f"Extraction error: {result}")
+                print(f"Extraction error: {task.exception()}")
 
         return valid_results
 
     async def _run_single_extractor(
-        self, extractor_type: ExtractorType, pdf_path: Path
+        self,
+        extractor_type: ExtractorType,
+        pdf_path: Path,
+        token: CancellationToken | None = None,
     ) -> PipelineResult:
-        """Run a single extractor asynchronously."""
+        """Run a single extractor asynchronously.
+
+        With a ``token``, the extractor runs inside its cancellation scope;
+        if the token is cancelled, the result is a failed ``PipelineResult``.
+        """
         # Wrap synchronous extractor in async
         loop = asyncio.get_event_loop()
         extractor = self.extractors[extractor_type]
 
         try:
-            result = await loop.run_in_executor(None, extractor.extract, pdf_path)
+            if token is None:
+                result = await loop.run_in_executor(
+                    None, self._extract_cached, extractor, pdf_path
+                )
+            else:
+                result = await loop.run_in_executor(
+                    None, self._extract_cancellable, extractor, pdf_path, token
+                )
 
             # Apply confidence calibration
             calibrated_confidence = self.calibrator.calibrate_score(
@@ -254,6 +416,15 @@ class EnsembleMerger:
 
             return result
 
+        except ExtractionCancelled as e:
+            return PipelineResult(
+                transactions=[],
+                confidence_score=0.0,
+                pipeline_name=extractor_type,
+                processing_time_ms=0.0,
+                error_message=f"Cancelled: {e}",
+            )
+
         except Exception as e:
             return PipelineResult(
                 transactions=[],
@@ -263,64 +434,51 @@ class EnsembleMerger:
                 error_message=f"Extractor error: {str(e)}",
             )
 
+    def _extract_cancellable(
+        self, extractor, pdf_path: Path, token: CancellationToken
+    ) -> PipelineResult:
+        """``_extract_cached`` on a worker thread, under ``token``'s scope."""
+        with cancellation_scope(token):
+            token.check()
+            return self._extract_cached(extractor, pdf_path)
+
+    def _extract_cached(self, extractor, pdf_path: Path) -> PipelineResult:
+        """Run ``extractor`` unless an unchanged result is already cached."""
+        if self.result_cache is None:
+            return extractor.extract(pdf_path)
+
+        key = ResultCache.make_key(
+            get_document_session(pdf_path).content_hash,
+            extractor.extractor_type,
+            extractor_version(extractor),
+        )
+        if not self.refresh_cache:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                return cached
+
+        result = extractor.extract(pdf_path)
+        if result.success:
+            self.result_cache.put(key, result)
+        return result
+
     def _merge_pipeline_results(
         self, pipeline_results: list[PipelineResult]
     ) -> tuple[list[Transaction], str, int]:
         """Merge results from multiple pipelines intelligently."""
-        if len(pipeline_results) == 1:
-            return pipeline_results[0].transactions, "single_pipeline", 0
-
-        # Group transactions by similarity
-        transaction_groups = self._group_similar_transactions(pipeline_results)
-
-        # Resolve conflicts within each group
-        final_transactions = []
-        total_conflicts = 0
-
-        for group in transaction_groups:
-            best_transaction, conflicts = self._resolve_transaction_group(group)
-            final_transactions.append(best_transaction)
-            total_conflicts += conflicts
-
-        strategy = f"ensemble_merge_{len(pipeline_results)}_pipelines"
-        return final_transactions, strategy, total_conflicts
+        merge = IncrementalMerge(self)
+        for result in pipeline_results:
+            merge.add(result)
+        return merge.merged()
 
     def _group_similar_transactions(
         self, pipeline_results: list[PipelineResult]
     ) -> list[list[tuple[Transaction, ExtractorType, float]]]:
-        """Group similar transactions across pipelines."""
-        # Collect all transactions with metadata
-        all_transactions = []
+        """Group similar transactions across pipelines (see ``IncrementalMerge``)."""
+        merge = IncrementalMerge(self)
         for result in pipeline_results:
-            for transaction in result.transactions:
-                all_transactions.append(
-                    (transaction, result.pipeline_name, result.confidence_score)
-                )
-
-        # Group by similarity
-        groups = []
-        used_indices = set()
-
-        for i, (trans_i, _, _) in enumerate(all_transactions):
-            if i in used_indices:
-                continue
-
-            # Start new group
-            group = [all_transactions[i]]
-            used_indices.add(i)
-
-            # Find similar transactions
-            for j, (trans_j, _, _) in enumerate(all_transactions):
-                if j in used_indices:
-                    continue
-
-                if self._transactions_similar(trans_i, trans_j):
-                    group.append(all_transactions[j])
-                    used_indices.add(j)
-
-            groups.append(group)
-
-        return groups
+            merge.add(result)
+        return merge.groups
 
     def _transactions_similar(
         self,
@@ -398,6 +556,7 @@ class EnsembleMerger:
             ExtractorType.TEXTRACT: 1.0,  # Highest for OCR quality
             ExtractorType.AZURE_DOC_INTELLIGENCE: 0.95,  # Slightly lower
             ExtractorType.PDFPLUMBER: 0.9,  # Good for born-digital
+            ExtractorType.PYMUPDF: 0.9,  # Same parser as pdfplumber
             ExtractorType.CAMELOT: 0.85,  # Good for tables
             ExtractorType.GOOGLE_DOC_AI: 0.9,  # If implemented
         }
@@ -492,11 +651,11 @@ class EnsembleMerger:
         ``enabled_extractors``) without applying race-mode early termination or
         ensemble merging.
 
-        Each extractor's ``extract`` implementation already writes its own
-        text/CSV artefacts via ``_save_individual_outputs``.
-        Therefore, running this helper guarantees **one** text and **one** CSV
+        Each extractor's ``extract`` implementation queues its own text/CSV
+        artefacts on the artifact sink via ``_save_individual_outputs``.
+        Therefore, running this helper yields **one** text and **one** CSV
         file per extractor for the given PDF (assuming the extractor completes
-        successfully).
+        successfully and artifacts are enabled).
 
         Args:
             pdf_path: The PDF to process.
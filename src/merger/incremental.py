@@ -0,0 +1,61 @@
+"""Incremental transaction grouping for streaming ensemble merges."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..core.models import ExtractorType, PipelineResult, Transaction
+from .blocking import BlockingIndex
+
+if TYPE_CHECKING:
+    from .ensemble_merger import EnsembleMerger
+
+GroupMember = tuple[Transaction, ExtractorType, float]
+
+
+class IncrementalMerge:
+    """Running transaction groups that pipeline results are folded into.
+
+    Each transaction joins the first group, in creation order, whose anchor
+    (first member) it is similar to, or anchors a new group. That is the
+    greedy grouping ``EnsembleMerger`` always used, so folding results one
+    by one gives the same groups as grouping them all at once in that
+    order. Only anchors are indexed, and only groups a fold touched are
+    resolved again by ``merged``.
+    """
+
+    def __init__(self, merger: EnsembleMerger):
+        self.merger = merger
+        self.results: list[PipelineResult] = []
+        self.groups: list[list[GroupMember]] = []
+        self._anchors = BlockingIndex()
+        self._resolved: list[tuple[Transaction, int] | None] = []
+
+    def add(self, result: PipelineResult) -> None:
+        """Fold the transactions of ``result`` into the groups."""
+        self.results.append(result)
+        for transaction in result.transactions:
+            member = (transaction, result.pipeline_name, result.confidence_score)
+            for position in self._anchors.candidates(transaction):
+                anchor = self.groups[position][0][0]
+                if self.merger._transactions_similar(anchor, transaction):
+                    self.groups[position].append(member)
+                    self._resolved[position] = None
+                    break
+            else:
+                self._anchors.add(transaction)
+                self.groups.append([member])
+                self._resolved.append(None)
+
+    def merged(self) -> tuple[list[Transaction], str, int]:
+        """``(transactions, strategy, conflicts)`` of the results folded so far."""
+        if len(self.results) == 1:
+            return self.results[0].transactions, "single_pipeline", 0
+
+        for position, group in enumerate(self.groups):
+            if self._resolved[position] is None:
+                self._resolved[position] = self.merger._resolve_transaction_group(group)
+
+        transactions = [transaction for transaction, _ in self._resolved]
+        conflicts = sum(conflict for _, conflict in self._resolved)
+        return transactions, f"ensemble_merge_{len(self.results)}_pipelines", conflicts
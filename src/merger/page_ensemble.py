@@ -0,0 +1,123 @@
+"""Page-level reconciliation and stitching of extractor results.
+
+Text extractors report a ``PageResult`` per page. A page reconciles when
+two engines found the same ``(date, amount)`` postings on it, or when the
+only engine that read it is confident enough. Pages that do not reconcile
+are grouped into contiguous ranges, re-extracted on their own by the next
+engine, and stitched back over the local pages.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+from ..core.models import ExtractorType, PageResult, PipelineResult
+
+
+def _pages_by_index(
+    results: Iterable[PipelineResult], page_count: int
+) -> list[list[PageResult]]:
+    """Every engine's ``PageResult`` covering each page."""
+    covering: list[list[PageResult]] = [[] for _ in range(page_count)]
+    for result in results:
+        for page_result in result.page_results:
+            for page in range(page_result.start, min(page_result.stop, page_count)):
+                covering[page].append(page_result)
+    return covering
+
+
+def _postings(page_result: PageResult) -> Counter:
+    return Counter((t.date, t.amount_brl) for t in page_result.transactions)
+
+
+def failing_pages(
+    results: Iterable[PipelineResult], page_count: int, confidence_threshold: float
+) -> list[int]:
+    """Zero-based pages that no engine read, or that do not reconcile.
+
+    Results without page-level output do not count. With no page-level
+    output at all, every page fails.
+    """
+    failing = []
+    for page, page_results in enumerate(_pages_by_index(results, page_count)):
+        usable = [p for p in page_results if p.success]
+        if not usable:
+            failing.append(page)
+        elif len(usable) > 1:
+            first = _postings(usable[0])
+            if any(_postings(other) != first for other in usable[1:]):
+                failing.append(page)
+        elif usable[0].transactions and usable[0].confidence_score < confidence_threshold:
+            failing.append(page)
+    return failing
+
+
+def page_ranges(pages: Iterable[int]) -> list[tuple[int, int]]:
+    """Contiguous ``[start, stop)`` ranges covering ``pages``."""
+    ranges: list[tuple[int, int]] = []
+    for page in sorted(set(pages)):
+        if ranges and ranges[-1][1] == page:
+            ranges[-1] = (ranges[-1][0], page + 1)
+        else:
+            ranges.append((page, page + 1))
+    return ranges
+
+
+def stitch(
+    local_results: list[PipelineResult],
+    replacements: list[tuple[int, int, PipelineResult]],
+    page_count: int,
+    pipeline_name: ExtractorType,
+) -> PipelineResult:
+    """One result for the document: re-extracted ranges over local pages.
+
+    ``replacements`` holds ``(start, stop, result)`` for each range sent to
+    ``pipeline_name``; a range whose re-extraction failed keeps its local
+    pages. Every other page takes its most confident local ``PageResult``.
+    The stitched confidence is that of the weakest re-extracted range: the
+    remaining pages already reconciled.
+    """
+    chosen: dict[int, PageResult] = {}
+    sources: dict[int, str] = {}
+    for start, stop, result in replacements:
+        if not result.success:
+            continue
+        range_result = PageResult(start, stop, result.transactions, result.confidence_score)
+        for page in range(start, stop):
+            chosen[page] = range_result
+            sources[page] = result.pipeline_name.value
+
+    covering = _pages_by_index(local_results, page_count)
+    for page in range(page_count):
+        if page in chosen:
+            continue
+        usable = [p for p in covering[page] if p.success]
+        if usable:
+            best = max(usable, key=lambda p: p.confidence_score)
+            chosen[page] = best
+            sources[page] = next(
+                r.pipeline_name.value for r in local_results if best in r.page_results
+            )
+        else:
+            chosen[page] = PageResult(page, page + 1, [], 0.0, "no engine read this page")
+
+    page_results = list({id(p): p for p in (chosen[i] for i in range(page_count))}.values())
+    replaced = [p for p in page_results if sources.get(p.start) == pipeline_name.value]
+    confidence = min(
+        (p.confidence_score for p in replaced),
+        default=max((r.confidence_score for r in local_results), default=0.0),
+    )
+
+    return PipelineResult(
+        transactions=[t for p in page_results for t in p.transactions],
+        confidence_score=confidence,
+        pipeline_name=pipeline_name,
+        processing_time_ms=sum(r.processing_time_ms for _, _, r in replacements),
+        raw_data={
+            "page_sources": sources,
+            "replaced_ranges": [(start, stop) for start, stop, _ in replacements],
+        },
+        page_count=page_count,
+        page_results=page_results,
+    )
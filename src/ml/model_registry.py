@@ -0,0 +1,155 @@
+"""Process-wide registry of loaded model artifacts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+Loader = Callable[[Path], Any]
+
+
+def load_joblib(path: Path) -> Any:
+    """``joblib.load`` with numpy arrays memory-mapped read-only.
+
+    Mapped pages are shared between forked workers and only become
+    resident when touched. Compressed artifacts cannot be mapped and load
+    normally.
+    """
+    import joblib
+
+    return joblib.load(path, mmap_mode="r")
+
+
+def load_json(path: Path) -> Any:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _resident_bytes() -> Optional[int]:
+    """Resident set size of this process, where ``/proc`` reports it."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class ModelEntry:
+    """One loaded artifact and what loading it cost."""
+
+    path: Path
+    model: Any
+    loader: Loader
+    stamp: tuple[int, int]  # (mtime_ns, size) when loaded or last verified
+    sha256: str
+    load_seconds: float
+    resident_bytes: Optional[int]  # RSS growth while loading; None off Linux
+    generation: int = 1  # incremented by every reload
+
+
+class ModelRegistry:
+    """Load each model artifact once per process and reload it when it changes.
+
+    Artifacts are keyed by resolved path. Every lookup stats the file; a new
+    ``(mtime, size)`` triggers a hash check, and a new hash a reload, so an
+    artifact retrained in place is picked up by the next lookup while a
+    touched but identical file is not loaded again.
+    """
+
+    def __init__(self):
+        self._entries: dict[Path, ModelEntry] = {}
+        self._lock = threading.RLock()
+
+    def get(self, path: Path | str, loader: Loader = load_joblib) -> Any:
+        """The loaded artifact at ``path``, loading or reloading it if needed."""
+        return self._entry(Path(path).resolve(), loader).model
+
+    def generation(self, path: Path | str) -> int:
+        """How many times ``path`` has been loaded (0 if never), after a freshness check."""
+        key = Path(path).resolve()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return 0
+            return self._entry(key, entry.loader).generation
+
+    def sha256(self, path: Path | str) -> Optional[str]:
+        """Content hash of the loaded artifact at ``path`` (None if never loaded)."""
+        key = Path(path).resolve()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            return self._entry(key, entry.loader).sha256
+
+    def stats(self) -> list[ModelEntry]:
+        """Entries of every loaded artifact, in load order."""
+        with self._lock:
+            return list(self._entries.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _entry(self, path: Path, loader: Loader) -> ModelEntry:
+        with self._lock:
+            stat = path.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            entry = self._entries.get(path)
+            if entry is not None and entry.stamp == stamp:
+                return entry
+
+            sha256 = _file_hash(path)
+            if entry is not None and entry.sha256 == sha256:
+                entry.stamp = stamp
+                return entry
+
+            rss_before = _resident_bytes()
+            start = time.perf_counter()
+            model = loader(path)
+            load_seconds = time.perf_counter() - start
+            rss_after = _resident_bytes()
+            resident = (
+                max(rss_after - rss_before, 0)
+                if rss_before is not None and rss_after is not None
+                else None
+            )
+
+            self._entries[path] = ModelEntry(
+                path=path,
+                model=model,
+                loader=loader,
+                stamp=stamp,
+                sha256=sha256,
+                load_seconds=load_seconds,
+                resident_bytes=resident,
+                generation=entry.generation + 1 if entry is not None else 1,
+            )
+            return self._entries[path]
+
+
+_global_model_registry = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide model registry."""
+    global _global_model_registry
+    if _global_model_registry is None:
+        _global_model_registry = ModelRegistry()
+    return _global_model_registry
@@ -14,6 +14,9 @@ from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import LabelEncoder
 
+from src.ml.model_registry import get_model_registry
+from src.ml.prediction_cache import PredictionCache, model_version
+
 
 class CategoryClassifier:
     """ML-based transaction category classifier."""
@@ -23,6 +26,9 @@ class CategoryClassifier:
         self.label_encoder: Optional[LabelEncoder] = None
         self.categories: list[str] = []
         self.is_trained = False
+        # Set by load_model; predictions are cached only for a loaded artifact
+        self.model_version: Optional[str] = None
+        self.prediction_cache: Optional[PredictionCache] = None
 
     def prepare_features(self, descriptions: list[str]) -> list[str]:
         """Prepare text features for classification."""
@@ -103,6 +109,7 @@ class CategoryClassifier:
         # Train the model
         self.pipeline.fit(X_train, y_train)
         self.is_trained = True
+        self.model_version = None
         
         # Evaluate
         train_score = self.pipeline.score(X_train, y_train)
@@ -192,11 +199,15 @@ class CategoryClassifier:
         if not model_path.exists():
             raise FileNotFoundError(f"Model file not found: {model_path}")
         
-        model_data = joblib.load(model_path)
+        # Shared, memory-mapped copy; loaded once per process
+        model_data = get_model_registry().get(model_path)
         self.pipeline = model_data['pipeline']
         self.label_encoder = model_data['label_encoder']
         self.categories = model_data['categories']
         self.is_trained = model_data['is_trained']
+        self.model_version = model_version(
+            get_model_registry().sha256(model_path), CategoryClassifier
+        )
         
         print(f"   • Model loaded from {model_path}")
         print(f"   • Categories: {len(self.categories)}")
@@ -227,7 +238,39 @@ class CategoryClassifier:
 
     def predict_single(self, description: str) -> tuple[str, float]:
         """Predict category for a single description with confidence."""
-        predictions = self.predict([description])
-        confidences = self.get_confidence([description])
-        
-        return predictions[0], confidences[0]
+        return self.predict_batch([description])[0]
+
+    def predict_batch(self, descriptions: list[str]) -> list[tuple[str, float]]:
+        """Predict ``(category, confidence)`` for many descriptions at once.
+
+        One TF-IDF transform and one ``predict_proba`` for the distinct
+        normalised descriptions; the category is the most probable class, as
+        ``predict`` returns. With a ``prediction_cache``, only descriptions
+        it has not seen for this model version reach the model.
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before prediction")
+        if not descriptions:
+            return []
+
+        features = self.prepare_features(descriptions)
+        cache = self.prediction_cache if self.model_version else None
+        known = cache.get_many("category", self.model_version, features) if cache else {}
+        missing = [f for f in dict.fromkeys(features) if f not in known]
+
+        if missing:
+            probabilities = self.pipeline.predict_proba(missing)
+            best = probabilities.argmax(axis=1)
+            labels = self.label_encoder.inverse_transform(self.pipeline.classes_[best])
+            confidences = probabilities[range(len(best)), best]
+            predicted = {
+                feature: [label, confidence]
+                for feature, label, confidence in zip(
+                    missing, labels.tolist(), confidences.tolist()
+                )
+            }
+            if cache:
+                cache.put_many("category", self.model_version, predicted)
+            known = {**known, **predicted}
+
+        return [tuple(known[feature]) for feature in features]
@@ -14,6 +14,8 @@ from sklearn.metrics import mean_absolute_error, r2_score
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 
+from src.ml.model_registry import get_model_registry
+
 
 class FXRatePredictor:
     """ML-based FX rate prediction for missing rates."""
@@ -196,23 +198,21 @@ class FXRatePredictor:
         predictions = self.model.predict(X_scaled)
         
         # Post-process predictions with validation
-        validated_predictions = []
-        for i, pred in enumerate(predictions):
-            currency = data.iloc[i].get('currency_orig', 'USD')
-            validated_pred = self._validate_prediction(pred, currency)
-            validated_predictions.append(validated_pred)
-        
-        return validated_predictions
+        return [
+            self._validate_prediction(pred, currency)
+            for pred, currency in zip(predictions, self._column(data, 'currency_orig', 'USD'))
+        ]
 
     def _fallback_predict(self, data: pd.DataFrame) -> list[float]:
         """Fallback prediction using currency averages and heuristics."""
         predictions = []
-        
-        for _, row in data.iterrows():
-            currency = row.get('currency_orig', 'USD')
-            amount_brl = pd.to_numeric(row.get('amount_brl', 0), errors='coerce') or 0
-            amount_orig = pd.to_numeric(row.get('amount_orig', 0), errors='coerce') or 0
-            
+        rows = zip(
+            self._column(data, 'currency_orig', 'USD'),
+            pd.to_numeric(self._column(data, 'amount_brl', 0), errors='coerce'),
+            pd.to_numeric(self._column(data, 'amount_orig', 0), errors='coerce'),
+        )
+
+        for currency, amount_brl, amount_orig in rows:
             # Try to calculate from amounts first
             if amount_orig > 0 and amount_brl > 0:
                 calculated_rate = amount_brl / amount_orig
@@ -230,6 +230,13 @@ class FXRatePredictor:
         
         return predictions
 
+    @staticmethod
+    def _column(data: pd.DataFrame, name: str, default) -> list:
+        """Values of a column, or ``default`` for every row when it is missing."""
+        if name in data.columns:
+            return data[name].tolist()
+        return [default] * len(data)
+
     def _validate_prediction(self, prediction: float, currency: str) -> float:
         """Validate and clamp prediction to reasonable range."""
         if currency in self.currency_ranges:
@@ -249,25 +256,45 @@ class FXRatePredictor:
 
     def predict_single(self, amount_brl: float, amount_orig: float, currency: str, description: str = "") -> tuple[float, float]:
         """Predict FX rate for a single transaction with confidence."""
-        # Create dataframe for single prediction
-        data = pd.DataFrame([{
-            'amount_brl': amount_brl,
-            'amount_orig': amount_orig,
-            'currency_orig': currency,
-            'description_text': description
-        }])
-        
+        return self.predict_batch([amount_brl], [amount_orig], [currency], [description])[0]
+
+    def predict_batch(
+        self,
+        amounts_brl: list[float],
+        amounts_orig: list[float],
+        currencies: list[str],
+        descriptions: Optional[list[str]] = None,
+    ) -> list[tuple[float, float]]:
+        """Predict ``(fx_rate, confidence)`` for many transactions at once.
+
+        Builds one feature frame and makes one model call. A reasonable
+        rate implied by the two amounts wins with high confidence, as in
+        ``predict_single``.
+        """
+        if not amounts_brl:
+            return []
+
+        data = pd.DataFrame({
+            'amount_brl': amounts_brl,
+            'amount_orig': amounts_orig,
+            'currency_orig': currencies,
+            'description_text': descriptions if descriptions is not None else [""] * len(amounts_brl),
+        })
         predictions = self.predict(data)
-        
-        # Calculate confidence based on prediction method
-        if amount_orig > 0 and amount_brl > 0:
-            implied_rate = amount_brl / amount_orig
-            if self._is_reasonable_rate(implied_rate, currency):
-                return implied_rate, 0.95  # High confidence from calculation
-        
+
         # ML or fallback prediction
-        confidence = 0.7 if self.is_trained else 0.5
-        return predictions[0], confidence
+        model_confidence = 0.7 if self.is_trained else 0.5
+        results = []
+        for amount_brl, amount_orig, currency, prediction in zip(
+            amounts_brl, amounts_orig, currencies, predictions
+        ):
+            if amount_orig > 0 and amount_brl > 0:
+                implied_rate = amount_brl / amount_orig
+                if self._is_reasonable_rate(implied_rate, currency):
+                    results.append((implied_rate, 0.95))  # High confidence from calculation
+                    continue
+            results.append((float(prediction), model_confidence))
+        return results
 
     def analyze_feature_importance(self) -> dict:
         """Analyze feature importance for FX rate prediction."""
@@ -311,7 +338,8 @@ class FXRatePredictor:
         if not model_path.exists():
             raise FileNotFoundError(f"Model file not found: {model_path}")
         
-        model_data = joblib.load(model_path)
+        # Shared, memory-mapped copy; loaded once per process
+        model_data = get_model_registry().get(model_path)
         self.model = model_data['model']
         self.scaler = model_data['scaler']
         self.currency_averages = model_data['currency_averages']
@@ -3,41 +3,88 @@
 from __future__ import annotations
 
 import re
-from typing import Optional
+from collections.abc import Iterable
+from typing import Final, Optional
 
 import pandas as pd
 from pathlib import Path
 
+from src.ml.model_registry import get_model_registry, load_json
+from src.ml.prediction_cache import PredictionCache, model_version
+from src.ml.vocabulary_matcher import VocabularyMatcher
+
+# Common Brazilian city patterns
+CITY_PATTERNS: Final[tuple[re.Pattern[str], ...]] = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'\b([A-Z][a-z]+(?: [A-Z][a-z]+)*)\s+(?:SP|RJ|MG|RS|PR|SC|BA|PE|CE|GO|AM|PA|MT|MS|ES|PB|RN|AL|SE|AC|RO|RR|AP|TO|DF)\b',
+        r'\b([A-Z][a-z]+(?: [A-Z][a-z]+)*)\s+BR\b',
+        r'\b([A-Z][A-Z\s]+)\s+BR\b',
+        r'\b(SAO PAULO|RIO DE JANEIRO|BELO HORIZONTE|SALVADOR|BRASILIA|FORTALEZA|MANAUS|CURITIBA|RECIFE|PORTO ALEGRE)\b',
+        r'\s+([A-Z]{2,}(?:\s+[A-Z]{2,})*)\s*$',  # City at end
+    )
+)
+
+# Merchant patterns
+MERCHANT_PATTERNS: Final[tuple[re.Pattern[str], ...]] = (
+    re.compile(r'^([A-Z][A-Za-z\s&\.]+?)(?:\s+\d|\s+[A-Z]{2,}\s|$)'),  # Merchant before numbers/city
+    re.compile(r'^([A-Z][A-Za-z\s&\.]{3,20})'),  # First capitalized words
+)
+
+RE_WHITESPACE: Final[re.Pattern[str]] = re.compile(r'\s+')
+
 
 class MerchantCityExtractor:
     """NLP-based merchant and city extraction."""
 
     def __init__(self):
-        self.brazilian_cities = set()
-        self.common_merchants = set()
+        self.brazilian_cities = frozenset()
+        self.common_merchants = frozenset()
         self.trained_patterns = []
         self.is_trained = False
-        
-        # Common Brazilian city patterns
-        self.city_patterns = [
-            r'\b([A-Z][a-z]+(?: [A-Z][a-z]+)*)\s+(?:SP|RJ|MG|RS|PR|SC|BA|PE|CE|GO|AM|PA|MT|MS|ES|PB|RN|AL|SE|AC|RO|RR|AP|TO|DF)\b',
-            r'\b([A-Z][a-z]+(?: [A-Z][a-z]+)*)\s+BR\b',
-            r'\b([A-Z][A-Z\s]+)\s+BR\b',
-            r'\b(SAO PAULO|RIO DE JANEIRO|BELO HORIZONTE|SALVADOR|BRASILIA|FORTALEZA|MANAUS|CURITIBA|RECIFE|PORTO ALEGRE)\b',
-            r'\s+([A-Z]{2,}(?:\s+[A-Z]{2,})*)\s*$',  # City at end
-        ]
-        
-        # Merchant patterns
-        self.merchant_patterns = [
-            r'^([A-Z][A-Za-z\s&\.]+?)(?:\s+\d|\s+[A-Z]{2,}\s|$)',  # Merchant before numbers/city
-            r'^([A-Z][A-Za-z\s&\.]{3,20})',  # First capitalized words
-        ]
+        # Set by load_patterns; extractions are cached only for loaded patterns
+        self.model_version: Optional[str] = None
+        self.prediction_cache: Optional[PredictionCache] = None
+        self.city_patterns = list(CITY_PATTERNS)
+        self.merchant_patterns = list(MERCHANT_PATTERNS)
         
         # Online indicators
         self.online_indicators = {
             'PAYPAL', 'AMAZON', 'NETFLIX', 'SPOTIFY', 'UBER', 'IFOOD', 'INTERNET', 'ONLINE', 'WEB'
         }
 
+    @property
+    def brazilian_cities(self) -> frozenset[str]:
+        return self._cities
+
+    @brazilian_cities.setter
+    def brazilian_cities(self, cities: Iterable[str]):
+        self._cities = frozenset(cities)
+        self._city_matcher: Optional[VocabularyMatcher] = None
+
+    @property
+    def common_merchants(self) -> frozenset[str]:
+        return self._merchants
+
+    @common_merchants.setter
+    def common_merchants(self, merchants: Iterable[str]):
+        self._merchants = frozenset(merchants)
+        self._merchant_matcher: Optional[VocabularyMatcher] = None
+
+    @property
+    def city_matcher(self) -> VocabularyMatcher:
+        """Automaton over ``brazilian_cities``, built on first use."""
+        if self._city_matcher is None:
+            self._city_matcher = VocabularyMatcher(self._cities)
+        return self._city_matcher
+
+    @property
+    def merchant_matcher(self) -> VocabularyMatcher:
+        """Automaton over ``common_merchants``, built on first use."""
+        if self._merchant_matcher is None:
+            self._merchant_matcher = VocabularyMatcher(self._merchants)
+        return self._merchant_matcher
+
     def train(self, training_data: pd.DataFrame) -> dict:
         """Train the extractor using golden data."""
         print("🔧 Training Merchant City Extractor...")
@@ -64,6 +111,7 @@ class MerchantCityExtractor:
         self.brazilian_cities = cities_found
         self.common_merchants = merchants_found
         self.is_trained = True
+        self.model_version = None
         
         print(f"   • Learned {len(cities_found)} cities")
         print(f"   • Learned {len(merchants_found)} merchant patterns")
@@ -88,15 +136,15 @@ class MerchantCityExtractor:
         if any(indicator in desc_upper for indicator in self.online_indicators):
             return "ONLINE"
         
-        # Try learned cities first
+        # Try learned cities first, preferring the longest one named
         if self.is_trained:
-            for city in self.brazilian_cities:
-                if city in desc_upper:
-                    return city
+            city = self.city_matcher.longest(desc_upper)
+            if city:
+                return city
         
         # Try regex patterns
         for pattern in self.city_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
+            match = pattern.search(description)
             if match:
                 city = match.group(1).strip().upper()
                 # Filter out obvious non-cities
@@ -115,19 +163,19 @@ class MerchantCityExtractor:
         description = description.strip()
         desc_upper = description.upper()
         
-        # Check for known merchants
+        # Check for known merchants, preferring the longest one named
         if self.is_trained:
-            for merchant in self.common_merchants:
-                if merchant in desc_upper:
-                    return merchant
+            merchant = self.merchant_matcher.longest(desc_upper)
+            if merchant:
+                return merchant
         
         # Try regex patterns
         for pattern in self.merchant_patterns:
-            match = re.search(pattern, description)
+            match = pattern.search(description)
             if match:
                 merchant = match.group(1).strip()
                 # Clean up merchant name
-                merchant = re.sub(r'\s+', ' ', merchant)
+                merchant = RE_WHITESPACE.sub(' ', merchant)
                 if len(merchant) > 3:
                     return merchant.title()
         
@@ -148,6 +196,28 @@ class MerchantCityExtractor:
         
         return merchant, city
 
+    def extract_batch(self, descriptions: list[str]) -> list[tuple[Optional[str], Optional[str]]]:
+        """``extract_merchant_and_city`` for many descriptions.
+
+        Extraction is rule-based, so there is no model call to vectorise;
+        each distinct description is extracted once. Statements repeat
+        merchants, so this is the saving. With a ``prediction_cache``,
+        descriptions seen for these patterns before are not extracted at
+        all. The rules are case-sensitive, so the cache key is the
+        description itself.
+        """
+        cache = self.prediction_cache if self.model_version else None
+        known = cache.get_many("merchant_city", self.model_version, descriptions) if cache else {}
+        extracted = {
+            description: list(self.extract_merchant_and_city(description))
+            for description in dict.fromkeys(descriptions)
+            if description not in known
+        }
+        if cache:
+            cache.put_many("merchant_city", self.model_version, extracted)
+        known = {**known, **extracted}
+        return [tuple(known[description]) for description in descriptions]
+
     def analyze_patterns(self, descriptions: list[str]) -> dict:
         """Analyze patterns in descriptions for improvement."""
         results = {
@@ -204,8 +274,8 @@ class MerchantCityExtractor:
             raise ValueError("Cannot save untrained patterns")
         
         patterns_data = {
-            'brazilian_cities': list(self.brazilian_cities),
-            'common_merchants': list(self.common_merchants),
+            'brazilian_cities': sorted(self.brazilian_cities),
+            'common_merchants': sorted(self.common_merchants),
             'is_trained': self.is_trained
         }
         
@@ -220,13 +290,14 @@ class MerchantCityExtractor:
         if not patterns_path.exists():
             raise FileNotFoundError(f"Patterns file not found: {patterns_path}")
         
-        import json
-        with open(patterns_path, 'r', encoding='utf-8') as f:
-            patterns_data = json.load(f)
-        
-        self.brazilian_cities = set(patterns_data['brazilian_cities'])
-        self.common_merchants = set(patterns_data['common_merchants'])
+        patterns_data = get_model_registry().get(patterns_path, load_json)
+
+        self.brazilian_cities = patterns_data['brazilian_cities']
+        self.common_merchants = patterns_data['common_merchants']
         self.is_trained = patterns_data['is_trained']
+        self.model_version = model_version(
+            get_model_registry().sha256(patterns_path), MerchantCityExtractor, VocabularyMatcher
+        )
         
         print(f"   • Patterns loaded from {patterns_path}")
         print(f"   • Cities: {len(self.brazilian_cities)}, Merchants: {len(self.common_merchants)}")
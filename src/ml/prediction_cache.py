@@ -0,0 +1,175 @@
+"""Two-tier cache of per-description model predictions."""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Final
+
+DEFAULT_CACHE_PATH: Final[Path] = Path.home() / ".cache" / "evolve" / "predictions.sqlite"
+DEFAULT_MEMORY_ENTRIES: Final[int] = 50_000
+
+
+def model_version(artifact_sha256: str, model_class: type, *helpers: type) -> str:
+    """Version of a model: its artifact plus the source of the code that applies it.
+
+    ``helpers`` are classes from other modules the model's predictions
+    depend on; their module source is hashed in as well.
+    """
+    digest = hashlib.sha256(artifact_sha256.encode())
+    for code in (model_class, *helpers):
+        digest.update(inspect.getsource(inspect.getmodule(code)).encode())
+    return digest.hexdigest()[:16]
+
+
+class PredictionCache:
+    """In-memory LRU over an on-disk SQLite store of model predictions.
+
+    Entries are keyed by ``(namespace, version, key)``: the namespace names
+    the model, the version is ``model_version`` and the key is the model's
+    normalised input. The first lookup of a new version of a namespace
+    deletes that namespace's entries for every other version, so a retrained
+    model never sees stale predictions. Values must be JSON serialisable.
+
+    The store lives at ``EVOLVE_PREDICTION_CACHE`` (default
+    ``~/.cache/evolve/predictions.sqlite``); if it cannot be opened, only the
+    memory tier is used.
+    """
+
+    def __init__(self, path: Path | str | None = None, max_entries: int = DEFAULT_MEMORY_ENTRIES):
+        self.path = Path(path or os.getenv("EVOLVE_PREDICTION_CACHE") or DEFAULT_CACHE_PATH)
+        self.max_entries = max_entries
+        self._memory: OrderedDict[tuple[str, str, str], Any] = OrderedDict()
+        self._current: dict[str, str] = {}
+        self._db: sqlite3.Connection | None = None
+        self._db_failed = False
+        self._lock = threading.Lock()
+        self.stats: defaultdict[str, dict[str, int]] = defaultdict(
+            lambda: {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        )
+
+    def get_many(self, namespace: str, version: str, keys: Iterable[str]) -> dict[str, Any]:
+        """Cached values for those of ``keys`` that have one."""
+        keys = list(dict.fromkeys(keys))
+        found: dict[str, Any] = {}
+        with self._lock:
+            self._use_version(namespace, version)
+            stats = self.stats[namespace]
+            for key in keys:
+                entry = (namespace, version, key)
+                if entry in self._memory:
+                    self._memory.move_to_end(entry)
+                    found[key] = self._memory[entry]
+            stats["memory_hits"] += len(found)
+
+            missing = [key for key in keys if key not in found]
+            from_disk = self._read(namespace, version, missing)
+            stats["disk_hits"] += len(from_disk)
+            stats["misses"] += len(missing) - len(from_disk)
+            for key, value in from_disk.items():
+                self._remember((namespace, version, key), value)
+            found.update(from_disk)
+        return found
+
+    def put_many(self, namespace: str, version: str, values: dict[str, Any]) -> None:
+        """Store ``values`` (key -> prediction) in both tiers."""
+        if not values:
+            return
+        with self._lock:
+            self._use_version(namespace, version)
+            for key, value in values.items():
+                self._remember((namespace, version, key), value)
+            db = self._connection()
+            if db is not None:
+                with db:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?)",
+                        [(namespace, version, k, json.dumps(v)) for k, v in values.items()],
+                    )
+
+    def hit_rate(self, namespace: str) -> float:
+        stats = self.stats[namespace]
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        total = hits + stats["misses"]
+        return hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            db = self._connection()
+            if db is not None:
+                with db:
+                    db.execute("DELETE FROM predictions")
+
+    def _remember(self, entry: tuple[str, str, str], value: Any) -> None:
+        self._memory[entry] = value
+        self._memory.move_to_end(entry)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _use_version(self, namespace: str, version: str) -> None:
+        """Forget other versions of ``namespace`` the first time ``version`` is seen."""
+        if self._current.get(namespace) == version:
+            return
+        self._current[namespace] = version
+        for entry in [e for e in self._memory if e[0] == namespace and e[1] != version]:
+            del self._memory[entry]
+        db = self._connection()
+        if db is not None:
+            with db:
+                db.execute(
+                    "DELETE FROM predictions WHERE namespace = ? AND version != ?",
+                    (namespace, version),
+                )
+
+    def _read(self, namespace: str, version: str, keys: list[str]) -> dict[str, Any]:
+        db = self._connection()
+        if db is None or not keys:
+            return {}
+        found = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            rows = db.execute(
+                "SELECT key, value FROM predictions WHERE namespace = ? AND version = ? "
+                f"AND key IN ({', '.join('?' * len(chunk))})",
+                (namespace, version, *chunk),
+            )
+            found.update((key, json.loads(value)) for key, value in rows)
+        return found
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if self._db is None and not self._db_failed:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(self.path, check_same_thread=False, timeout=5.0)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS predictions ("
+                    "namespace TEXT, version TEXT, key TEXT, value TEXT, "
+                    "PRIMARY KEY (namespace, version, key))"
+                )
+                self._db = db
+            except (OSError, sqlite3.Error) as e:
+                print(f"Prediction cache on disk unavailable, using memory only: {e}")
+                self._db_failed = True
+        return self._db
+
+
+_global_prediction_cache = None
+
+
+def get_prediction_cache() -> PredictionCache:
+    """Get the process-wide prediction cache."""
+    global _global_prediction_cache
+    if _global_prediction_cache is None:
+        _global_prediction_cache = PredictionCache()
+    return _global_prediction_cache
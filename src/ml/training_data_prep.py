@@ -6,7 +6,11 @@ import csv
 from pathlib import Path
 from typing import Any
 
+import polars as pl
+
 from src.core.models import Transaction
+from src.core.normalise import StatementPeriod, parse_amount, parse_amounts, parse_dates
+from src.core.transaction_batch import TransactionBatch
 
 
 class TrainingDataPreparator:
@@ -14,37 +18,59 @@ class TrainingDataPreparator:
 
     def load_golden_transactions(self, csv_path: Path) -> list[Transaction]:
         """Load golden transactions from CSV file."""
-        transactions = []
-        
-        with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
-            # Handle semicolon delimiter
-            reader = csv.DictReader(csvfile, delimiter=';')
-            
-            for row in reader:
-                # Convert CSV row to Transaction object
-                transaction = self._row_to_transaction(row)
-                if transaction:
-                    transactions.append(transaction)
-        
-        return transactions
+        return self.load_golden_batch(csv_path).to_transactions()
+
+    def load_golden_batch(self, csv_path: Path) -> TransactionBatch:
+        """Load a golden CSV as a ``TransactionBatch``, parsing whole columns.
+
+        Same rules as ``_row_to_transaction``; rows without a valid
+        ``post_date`` are dropped. ``DD/MM`` dates take their year from the
+        period in the file name (``golden_2024-10``).
+        """
+        # Handle semicolon delimiter
+        raw = pl.read_csv(csv_path, separator=';', infer_schema=False)
+
+        def text(name: str) -> pl.Expr:
+            if name in raw.columns:
+                return pl.col(name).fill_null('')
+            return pl.lit('', dtype=pl.String)
+
+        def count(name: str) -> pl.Expr:
+            value = text(name).cast(pl.Int32, strict=False)
+            return pl.when(value.is_null() | (value == 0)).then(1).otherwise(value).alias(name)
+
+        money_fields = (
+            'amount_brl', 'amount_orig', 'amount_usd', 'fx_rate', 'iof_brl', 'prev_bill_amount'
+        )
+        columns = raw.select(text(name).alias(name) for name in ('post_date', *money_fields))
+        period = StatementPeriod.from_name(csv_path.stem)
+        currency = text('currency_orig')
+        frame = raw.select(
+            text('desc_raw').alias('description'),
+            text('card_last4').alias('card_last4'),
+            count('installment_seq'),
+            count('installment_tot'),
+            pl.when(currency == '').then(pl.lit('BRL')).otherwise(currency).alias('currency_orig'),
+            text('category').alias('category'),
+            text('merchant_city').alias('merchant_city'),
+            text('ledger_hash').alias('ledger_hash'),
+        ).with_columns(
+            pl.Series('date', parse_dates(columns['post_date'], period)),
+            *(pl.Series(name, parse_amounts(columns[name])).fill_null(0) for name in money_fields),
+        )
+        return TransactionBatch.from_polars(frame.drop_nulls('date'))
 
     def _normalize_brazilian_number(self, value_str: str) -> float:
         """Normalize Brazilian number format (comma as decimal separator)."""
-        if not value_str or value_str.strip() == '':
-            return 0.0
-        try:
-            # Handle Brazilian format: 123,45 or 1.234,56
-            cleaned = value_str.replace('.', '').replace(',', '.')
-            return float(cleaned)
-        except (ValueError, TypeError):
-            return 0.0
+        value = parse_amount(value_str)
+        return 0.0 if value is None else float(value)
 
     def _row_to_transaction(self, row: dict[str, Any]) -> Transaction | None:
         """Convert CSV row to Transaction object."""
         try:
             # Map CSV columns to Transaction fields
             # This needs to match your golden CSV format
-            transaction = Transaction(
+            transaction = Transaction.from_raw(
                 date=row.get('post_date', ''),
                 description=row.get('desc_raw', ''),
                 amount_brl=self._normalize_brazilian_number(row.get('amount_brl', '0')),
@@ -0,0 +1,73 @@
+"""Aho-Corasick lookup of a fixed vocabulary in free text."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from typing import Optional
+
+
+class VocabularyMatcher:
+    """Find the longest vocabulary term occurring anywhere in a text.
+
+    The terms are compiled into an Aho-Corasick automaton once, so a lookup
+    scans the text a single time and costs time proportional to its length,
+    however many terms there are. Matching is case-sensitive and by
+    substring, like ``term in text``; callers normalise case themselves.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Length of the longest term that is a suffix of each state's prefix
+        self._longest: list[int] = [0]
+        self._size = 0
+
+        for term in set(terms):
+            if term:
+                self._insert(term)
+        self._link()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def longest(self, text: str) -> Optional[str]:
+        """The longest term in ``text``; the leftmost one if several tie."""
+        goto, fail, longest = self._goto, self._fail, self._longest
+        state = best_length = best_end = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if longest[state] > best_length:
+                best_length, best_end = longest[state], end
+        return text[best_end - best_length : best_end] if best_length else None
+
+    def _insert(self, term: str) -> None:
+        state = 0
+        for char in term:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._longest.append(0)
+            state = next_state
+        if not self._longest[state]:
+            self._longest[state] = len(term)
+            self._size += 1
+
+    def _link(self) -> None:
+        """Set failure links breadth-first, and inherit matches through them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                if not self._longest[child]:
+                    self._longest[child] = self._longest[self._fail[child]]
@@ -8,12 +8,15 @@ from typing import List, Optional
 
 from google.cloud import documentai
 from ..core.models import Transaction, ExtractorType
+from ..core.normalise import DEFAULT_PERIOD, StatementPeriod
 
 
 class GoogleTableParser:
     """Extract transactions from Google Document AI table results."""
     
-    def __init__(self):
+    def __init__(self, period: Optional[StatementPeriod] = None):
+        # Statement period giving the year of DD/MM dates
+        self.period = period or DEFAULT_PERIOD
         # Regex patterns for Brazilian financial data
         self.date_pattern = re.compile(r'(\d{1,2})/(\d{1,2})(?:/(\d{4}))?')
         self.amount_pattern = re.compile(r'[\d.,]+,\d{2}')
@@ -107,7 +110,7 @@ class GoogleTableParser:
                 if date_match:
                     try:
                         day, month = int(date_match.group(1)), int(date_match.group(2))
-                        year = int(date_match.group(3)) if date_match.group(3) else 2024
+                        year = int(date_match.group(3)) if date_match.group(3) else self.period.year_of(month)
                         # Only accept reasonable dates
                         if 1 <= day <= 31 and 1 <= month <= 12:
                             date_found = date(year, month, day)
@@ -180,7 +183,9 @@ class GoogleTableParser:
         )
 
 
-def extract_transactions_from_docai(document: documentai.Document) -> List[Transaction]:
+def extract_transactions_from_docai(
+    document: documentai.Document, period: Optional[StatementPeriod] = None
+) -> List[Transaction]:
     """Main function to extract transactions from Google Document AI document."""
-    parser = GoogleTableParser()
+    parser = GoogleTableParser(period)
     return parser.extract_transactions_from_document(document)
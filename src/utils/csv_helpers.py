@@ -1,12 +1,20 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List
 
 import pandas as pd  # type: ignore[import-not-found]
 
 from ..core.models import Transaction
 
+if TYPE_CHECKING:  # Polars/Arrow load on first batch use
+    import polars as pl
+
+    from ..core.transaction_batch import TransactionBatch
+
 GOLDEN_COLUMNS: list[str] = [
     "date",
     "description",
@@ -59,11 +67,61 @@ def golden_placeholder() -> dict:
     return to_golden_row(tmp)
 
 
-def write_golden_csv(transactions: List[Transaction], output_file: Path) -> None:
-    """Write list of transactions to *output_file* with the golden schema.
+# Decimal places per money column in the golden CSV
+GOLDEN_MONEY_PLACES: dict[str, int] = {
+    "amount_brl": 2,
+    "fx_rate": 4,
+    "iof_brl": 2,
+    "prev_bill_amount": 2,
+    "interest_amount": 2,
+    "amount_orig": 2,
+    "amount_usd": 2,
+}
+
+
+def to_golden_frame(batch: TransactionBatch) -> pl.DataFrame:
+    """Columnar counterpart of ``to_golden_row`` for a whole batch."""
+    import polars as pl
+    import pyarrow as pa
+    import pyarrow.compute as pc
 
-    Always writes at least the header row. Uses semicolon delimiter.
+    from ..core.transaction_batch import money_text
+
+    table = batch.to_arrow()
+    columns = {}
+    for name in GOLDEN_COLUMNS:
+        column = table.column(name)
+        if name == "date":
+            column = pc.strftime(column, "%d/%m/%Y")
+        elif name in GOLDEN_MONEY_PLACES:
+            column = money_text(column, GOLDEN_MONEY_PLACES[name])
+            column = pc.replace_substring(column, ".", ",")
+        elif pa.types.is_large_string(column.type):
+            column = column.fill_null("")
+        columns[name] = column
+    return pl.from_arrow(pa.table(columns))
+
+
+def write_golden_csv(
+    transactions: List[Transaction] | TransactionBatch, output_file: Path
+) -> None:
+    """Write transactions to *output_file* with the golden schema.
+
+    Accepts a list of transactions or a ``TransactionBatch``; a batch is
+    formatted column-wise. Always writes at least the header row. Uses
+    semicolon delimiter.
     """
+    if not isinstance(transactions, Sequence):
+        import polars as pl
+
+        if len(transactions):
+            # Empty strings as nulls, so they are written unquoted like pandas
+            frame = to_golden_frame(transactions).with_columns(
+                pl.col(pl.String).replace("", None)
+            )
+            frame.write_csv(output_file, separator=";")
+            return
+        transactions = []
     rows: list[dict[str, str | int]] = (
         [to_golden_row(t) for t in transactions]
         if transactions
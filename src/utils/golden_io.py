@@ -0,0 +1,140 @@
+"""Typed columnar golden output: Parquet and Arrow IPC files and datasets.
+
+The same 16 columns as the semicolon golden CSV, but typed: dates are
+``date32``, money is ``decimal128`` at the CSV's precision (2 places, 4 for
+``fx_rate``), installments are ``int32``. Warehouse loads read these files
+directly instead of re-parsing ``1234,56`` strings.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Final
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from ..core.models import Transaction
+from ..core.transaction_batch import TRANSACTION_SCHEMA, TransactionBatch
+from .csv_helpers import GOLDEN_COLUMNS, GOLDEN_MONEY_PLACES, write_golden_csv
+
+OUTPUT_FORMATS: Final[tuple[str, ...]] = ("csv", "parquet", "arrow")
+
+FILE_SUFFIXES: Final[dict[str, str]] = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+}
+
+# Hive-style partition key of golden datasets (``statement_month=2024-10``)
+PARTITION_COLUMN: Final[str] = "statement_month"
+
+_DATASET_FORMATS: Final[dict[str, str]] = {"parquet": "parquet", "arrow": "ipc"}
+
+
+def _golden_type(name: str) -> pa.DataType:
+    """Column type in ``GOLDEN_SCHEMA``."""
+    if name in GOLDEN_MONEY_PLACES:
+        return pa.decimal128(18, GOLDEN_MONEY_PLACES[name])
+    source = TRANSACTION_SCHEMA.field(name).type
+    return pa.string() if pa.types.is_large_string(source) else source
+
+
+GOLDEN_SCHEMA: Final[pa.Schema] = pa.schema(
+    [(name, _golden_type(name)) for name in GOLDEN_COLUMNS]
+)
+
+
+def golden_table(transactions: Sequence[Transaction] | TransactionBatch) -> pa.Table:
+    """Typed golden table; money is rounded half-even like the CSV."""
+    if not isinstance(transactions, TransactionBatch):
+        transactions = TransactionBatch.from_transactions(transactions)
+    table = transactions.to_arrow()
+    columns = []
+    for field in GOLDEN_SCHEMA:
+        column = table.column(field.name)
+        if field.name in GOLDEN_MONEY_PLACES:
+            places = GOLDEN_MONEY_PLACES[field.name]
+            column = pc.round(column, ndigits=places, round_mode="half_to_even")
+        columns.append(column.cast(field.type))
+    return pa.Table.from_arrays(columns, schema=GOLDEN_SCHEMA)
+
+
+def write_golden(
+    transactions: Sequence[Transaction] | TransactionBatch,
+    output_file: Path,
+    fmt: str = "csv",
+) -> None:
+    """Write *transactions* to *output_file* as ``csv``, ``parquet`` or ``arrow``."""
+    if fmt == "csv":
+        write_golden_csv(transactions, output_file)
+    elif fmt == "parquet":
+        pq.write_table(golden_table(transactions), output_file)
+    elif fmt == "arrow":
+        table = golden_table(transactions)
+        with pa.OSFile(str(output_file), "wb") as sink:
+            with pa.ipc.new_file(sink, GOLDEN_SCHEMA) as writer:
+                writer.write_table(table)
+    else:
+        raise ValueError(f"Unknown output format {fmt!r}; expected one of {OUTPUT_FORMATS}")
+
+
+def read_golden(path: Path) -> pa.Table:
+    """Read a Parquet or Arrow IPC golden file back as a typed table."""
+    if path.suffix == FILE_SUFFIXES["arrow"]:
+        with pa.memory_map(str(path)) as source:
+            return pa.ipc.open_file(source).read_all()
+    return pq.read_table(path)
+
+
+def statement_month(transactions: Sequence[Transaction] | TransactionBatch) -> str:
+    """``YYYY-MM`` of the latest transaction, i.e. the statement's closing month."""
+    if isinstance(transactions, TransactionBatch):
+        latest = pc.max(transactions.column("date")).as_py()
+    else:
+        latest = max((t.date for t in transactions), default=None)
+    if latest is None:
+        raise ValueError("Cannot infer the statement month of an empty statement")
+    return latest.strftime("%Y-%m")
+
+
+def append_golden_dataset(
+    transactions: Sequence[Transaction] | TransactionBatch,
+    root: Path,
+    statement: str,
+    fmt: str = "parquet",
+    month: str | None = None,
+) -> Path:
+    """Add one statement to a dataset partitioned by statement month.
+
+    Files land in ``<root>/statement_month=<YYYY-MM>/<statement>-0.<ext>``.
+    Re-running the same statement replaces its file; other statements in
+    the partition are left alone. Returns the partition directory.
+    """
+    if fmt not in _DATASET_FORMATS:
+        raise ValueError(f"Datasets are written as parquet or arrow, not {fmt!r}")
+    month = month or statement_month(transactions)
+    table = golden_table(transactions)
+    table = table.append_column(
+        PARTITION_COLUMN, pa.array([month] * table.num_rows, pa.string())
+    )
+    ds.write_dataset(
+        table,
+        root,
+        format=_DATASET_FORMATS[fmt],
+        partitioning=ds.partitioning(
+            pa.schema([(PARTITION_COLUMN, pa.string())]), flavor="hive"
+        ),
+        basename_template=f"{statement}-{{i}}{FILE_SUFFIXES[fmt]}",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    return root / f"{PARTITION_COLUMN}={month}"
+
+
+def read_golden_dataset(root: Path, fmt: str = "parquet") -> pa.Table:
+    """Read every statement in a golden dataset, with its ``statement_month``."""
+    dataset = ds.dataset(root, format=_DATASET_FORMATS[fmt], partitioning="hive")
+    return dataset.to_table()
@@ -0,0 +1,67 @@
+"""Per-module import timings, measured with ``python -X importtime``."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """One line of ``-X importtime`` output (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        return self.module.split(".")[0]
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parse ``import time: self | cumulative | module`` lines."""
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            timing = ImportTiming(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+            )
+        except ValueError:
+            continue  # the "self [us] | cumulative | imported package" header
+        timings.append(timing)
+    return timings
+
+
+def profile_imports(module: str = "src.cli") -> list[ImportTiming]:
+    """Import ``module`` in a fresh interpreter and return its timings."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()
+        raise RuntimeError(f"import {module} failed: {error[-1] if error else ''}")
+    return parse_importtime(completed.stderr)
+
+
+def package_totals(timings: list[ImportTiming]) -> dict[str, int]:
+    """Self time summed per top-level package, slowest first."""
+    totals: dict[str, int] = defaultdict(int)
+    for timing in timings:
+        totals[timing.package] += timing.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
@@ -11,12 +11,15 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
+import polars as pl
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
 from ..core.models import Transaction
+from ..core.normalise import StatementPeriod, parse_amount, parse_amounts, parse_date, parse_dates
+from ..core.transaction_batch import TransactionBatch, from_money
 
 
 @dataclass
@@ -95,20 +98,77 @@ class CellAccuracyAnalyzer:
         
         # Analyze each field
         field_accuracies = {}
-        for field in self.critical_fields + ['currency_orig', 'merchant_city', 'fx_rate', 'card_last4']:
-            if hasattr(Transaction, field):  # Only analyze fields that exist in model
-                result = self._analyze_field_accuracy(aligned_pairs, field)
-                field_accuracies[field] = result
-        
-        # Calculate overall metrics
-        overall_accuracy = self._calculate_overall_accuracy(field_accuracies)
-        critical_fields_accuracy = self._calculate_critical_fields_accuracy(field_accuracies)
+        for field in self._analyzed_fields():
+            result = self._analyze_field_accuracy(aligned_pairs, field)
+            field_accuracies[field] = result
         
         # Transaction-level metrics
-        tx_precision, tx_recall, tx_f1 = self._calculate_transaction_level_metrics(
+        tx_metrics = self._calculate_transaction_level_metrics(
             extracted_transactions, golden_transactions
         )
         
+        return self._build_report(extractor_name, pdf_file, field_accuracies, tx_metrics)
+    
+    def analyze_batch_health(
+        self,
+        extracted: TransactionBatch,
+        golden_csv_path: Path,
+        extractor_name: str,
+        pdf_file: str
+    ) -> ExtractionHealthReport:
+        """Columnar ``analyze_extraction_health`` for a ``TransactionBatch``.
+        
+        Golden rows are read straight into columns, aligned with one join
+        and scored with column expressions; empty golden cells are nulls.
+        """
+        golden = self._load_golden_frame(golden_csv_path)
+        
+        if golden.is_empty():
+            raise ValueError(f"No golden transactions found in {golden_csv_path}")
+        
+        fields = self._analyzed_fields()
+        aligned = self._align_frames(extracted.to_polars().select(fields), golden)
+        
+        field_accuracies = {
+            field: self._analyze_batch_field_accuracy(aligned, field)
+            for field in fields
+        }
+        
+        # Transaction-level metrics on the (date, amount) key sets
+        keys_ext = self._alignment_keys(extracted.to_polars()).unique()
+        keys_gold = self._alignment_keys(golden).unique()
+        tp = keys_ext.join(keys_gold, on=["date", "amount_key"], how="semi").height
+        fp = keys_ext.height - tp
+        fn = keys_gold.height - tp
+        
+        precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
+        recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
+        f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
+        
+        return self._build_report(
+            extractor_name, pdf_file, field_accuracies, (precision, recall, f1)
+        )
+    
+    def _analyzed_fields(self) -> List[str]:
+        """Fields scored in a health report."""
+        fields = self.critical_fields + ['currency_orig', 'merchant_city', 'fx_rate', 'card_last4']
+        # Only analyze fields that exist in model
+        return [field for field in fields if hasattr(Transaction, field)]
+    
+    def _build_report(
+        self,
+        extractor_name: str,
+        pdf_file: str,
+        field_accuracies: Dict[str, CellAccuracyResult],
+        tx_metrics: Tuple[float, float, float]
+    ) -> ExtractionHealthReport:
+        """Assemble the health report from per-field and transaction metrics."""
+        
+        # Calculate overall metrics
+        overall_accuracy = self._calculate_overall_accuracy(field_accuracies)
+        critical_fields_accuracy = self._calculate_critical_fields_accuracy(field_accuracies)
+        tx_precision, tx_recall, tx_f1 = tx_metrics
+        
         # Generate health assessment
         health_grade = self._calculate_health_grade(overall_accuracy, critical_fields_accuracy)
         recommended_action = self._generate_recommendation(health_grade, field_accuracies)
@@ -130,20 +190,22 @@ class CellAccuracyAnalyzer:
         """Load transactions from golden CSV file."""
         try:
             df = pd.read_csv(csv_path, sep=';', dtype=str)
+            period = StatementPeriod.from_name(csv_path.stem)
             
             transactions = []
             for _, row in df.iterrows():
                 try:
                     # Parse date
-                    date_str = row.get('post_date', '')
-                    if date_str:
-                        tx_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                    else:
+                    tx_date = parse_date(row.get('post_date', ''), period)
+                    if tx_date is None:
                         continue
                     
                     # Parse amount
                     amount_str = row.get('amount_brl', '0')
-                    amount_brl = Decimal(amount_str.replace(',', '.')) if amount_str else Decimal('0')
+                    amount_brl = parse_amount(amount_str) if amount_str else Decimal('0')
+                    fx_rate = parse_amount(row.get('fx_rate')) if row.get('fx_rate') else Decimal('0')
+                    if amount_brl is None or fx_rate is None:
+                        continue
                     
                     transaction = Transaction(
                         date=tx_date,
@@ -152,7 +214,7 @@ class CellAccuracyAnalyzer:
                         category=row.get('category', ''),
                         currency_orig=row.get('currency_orig', 'BRL'),
                         merchant_city=row.get('merchant_city', ''),
-                        fx_rate=Decimal(row.get('fx_rate', '0')) if row.get('fx_rate') else Decimal('0'),
+                        fx_rate=fx_rate,
                         card_last4=row.get('card_last4', '')
                     )
                     transactions.append(transaction)
@@ -166,6 +228,142 @@ class CellAccuracyAnalyzer:
             self.console.print(f"[red]Error loading golden CSV {csv_path}: {e}[/red]")
             return []
     
+    def _load_golden_frame(self, csv_path: Path) -> pl.DataFrame:
+        """Load golden CSV rows as columns named after ``Transaction`` fields.
+        
+        Rows are kept or skipped on the same rules as
+        ``_load_golden_transactions``.
+        """
+        try:
+            raw = pl.read_csv(csv_path, separator=';', infer_schema=False)
+        except Exception as e:
+            self.console.print(f"[red]Error loading golden CSV {csv_path}: {e}[/red]")
+            return pl.DataFrame()
+        
+        if 'post_date' not in raw.columns:
+            return pl.DataFrame()
+        
+        def text(name: str, default: Optional[str] = None) -> pl.Expr:
+            if name in raw.columns:
+                return pl.col(name)
+            return pl.lit(default, dtype=pl.String)
+        
+        def money_text(name: str) -> pl.Expr:
+            value = text(name)
+            return pl.when(value.is_null() | (value == '')).then(pl.lit('0')).otherwise(value).alias(name)
+        
+        money_columns = raw.select(money_text('amount_brl'), money_text('fx_rate'))
+        frame = raw.select(
+            text('desc_raw', '').alias('description'),
+            text('category', '').alias('category'),
+            text('currency_orig', 'BRL').alias('currency_orig'),
+            text('merchant_city', '').alias('merchant_city'),
+            text('card_last4', '').alias('card_last4'),
+        ).with_columns(
+            pl.Series('date', parse_dates(raw['post_date'], StatementPeriod.from_name(csv_path.stem))),
+            pl.Series('amount_brl', parse_amounts(money_columns['amount_brl'])),
+            pl.Series('fx_rate', parse_amounts(money_columns['fx_rate'])),
+        )
+        # Skip rows without a date and malformed rows
+        return frame.drop_nulls(['date', 'amount_brl', 'fx_rate'])
+    
+    def _alignment_keys(self, frame: pl.DataFrame) -> pl.DataFrame:
+        """The (date, amount rounded to cents) key used to pair transactions."""
+        return frame.select(
+            'date',
+            pl.col('amount_brl').cast(pl.Float64).round(2).alias('amount_key'),
+        )
+    
+    def _align_frames(self, extracted: pl.DataFrame, golden: pl.DataFrame) -> pl.DataFrame:
+        """Columnar ``_align_transactions``: one row per aligned pair.
+        
+        The k-th extracted and k-th golden transaction sharing a key form a
+        pair, as in the greedy row alignment. Extracted columns keep their
+        names, golden columns get a ``_gold`` suffix; ``has_ext`` and
+        ``has_gold`` mark which side is present.
+        """
+        keys = ['key_date', 'amount_key', 'occurrence']
+        
+        def keyed(frame: pl.DataFrame, flag: str, order: str) -> pl.DataFrame:
+            return frame.with_columns(
+                pl.int_range(pl.len()).alias(order),
+                pl.col('date').alias('key_date'),
+                pl.col('amount_brl').cast(pl.Float64).round(2).alias('amount_key'),
+                pl.lit(True).alias(flag),
+            ).with_columns(
+                pl.int_range(pl.len()).over(['key_date', 'amount_key']).alias('occurrence')
+            )
+        
+        aligned = keyed(extracted, 'has_ext', 'ext_row').join(
+            keyed(golden.select(extracted.columns), 'has_gold', 'gold_row'),
+            on=keys,
+            how='full',
+            coalesce=True,
+            suffix='_gold',
+        )
+        # Extracted order first, then the unmatched golden rows
+        return aligned.sort(['ext_row', 'gold_row'], nulls_last=True).with_columns(
+            pl.col('has_ext').fill_null(False),
+            pl.col('has_gold').fill_null(False),
+        )
+    
+    def _analyze_batch_field_accuracy(self, aligned: pl.DataFrame, field_name: str) -> CellAccuracyResult:
+        """Columnar ``_analyze_field_accuracy`` over an aligned frame."""
+        ext = pl.col(field_name)
+        gold = pl.col(f'{field_name}_gold')
+        compare = self._batch_comparators().get(field_name, self._batch_compare_exact)
+        correct = compare(ext, gold)
+        
+        has_ext = pl.col('has_ext')
+        has_gold = pl.col('has_gold')
+        counts = aligned.select(
+            has_gold.sum().alias('total'),
+            (has_gold & has_ext & correct).sum().alias('correct'),
+            (has_gold & has_ext & ~correct).sum().alias('incorrect'),
+            (has_gold & ~has_ext).sum().alias('missing'),
+            (~has_gold & has_ext).sum().alias('extra'),
+        ).row(0, named=True)
+        
+        error_examples = []
+        for ext_value, gold_value, present in (
+            aligned.filter(has_gold & ~(has_ext & correct))
+            .select(ext, gold, has_ext)
+            .head(5)
+            .iter_rows()
+        ):
+            if isinstance(gold_value, Decimal):
+                ext_value, gold_value = from_money(ext_value), from_money(gold_value)
+            if present:
+                error_examples.append(f"Expected: {gold_value}, Got: {ext_value}")
+            else:
+                error_examples.append(f"Missing: {gold_value}")
+        
+        total_cells = counts['total']
+        correct_cells = counts['correct']
+        incorrect_cells = counts['incorrect']
+        missing_cells = counts['missing']
+        extra_cells = counts['extra']
+        
+        # Calculate metrics
+        accuracy = correct_cells / total_cells if total_cells > 0 else 0.0
+        precision = correct_cells / (correct_cells + incorrect_cells + extra_cells) if (correct_cells + incorrect_cells + extra_cells) > 0 else 0.0
+        recall = correct_cells / (correct_cells + missing_cells) if (correct_cells + missing_cells) > 0 else 0.0
+        f1_score = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
+        
+        return CellAccuracyResult(
+            field_name=field_name,
+            total_cells=total_cells,
+            correct_cells=correct_cells,
+            incorrect_cells=incorrect_cells,
+            missing_cells=missing_cells,
+            extra_cells=extra_cells,
+            accuracy=accuracy,
+            precision=precision,
+            recall=recall,
+            f1_score=f1_score,
+            error_examples=error_examples
+        )
+    
     def _align_transactions(
         self, 
         extracted: List[Transaction], 
@@ -346,6 +544,50 @@ class CellAccuracyAnalyzer:
         
         return False
     
+    def _batch_comparators(self) -> Dict[str, Any]:
+        """Column-expression counterparts of ``field_comparators``."""
+        return {
+            'date': self._batch_compare_exact,
+            'amount_brl': self._batch_compare_amounts,
+            'description': lambda a, b: self._batch_compare_text(a, b, 10),
+            'category': self._batch_compare_categories,
+            'currency_orig': self._batch_compare_exact,
+            'merchant_city': lambda a, b: self._batch_compare_text(a, b, 5),
+            'fx_rate': self._batch_compare_amounts,
+            'card_last4': self._batch_compare_exact,
+        }
+    
+    def _null_safe(self, val1: pl.Expr, val2: pl.Expr, matches: pl.Expr) -> pl.Expr:
+        """Equal when both are null, unequal when one is, else ``matches``."""
+        either_null = val1.is_null() | val2.is_null()
+        return (
+            pl.when(either_null)
+            .then(val1.is_null() & val2.is_null())
+            .otherwise(matches)
+        )
+    
+    def _batch_compare_exact(self, val1: pl.Expr, val2: pl.Expr) -> pl.Expr:
+        """Exact comparison."""
+        return val1.eq_missing(val2)
+    
+    def _batch_compare_amounts(self, val1: pl.Expr, val2: pl.Expr) -> pl.Expr:
+        """Amounts within one cent."""
+        diff = (val1.cast(pl.Float64) - val2.cast(pl.Float64)).abs()
+        return self._null_safe(val1, val2, diff < 0.01)
+    
+    def _batch_compare_categories(self, val1: pl.Expr, val2: pl.Expr) -> pl.Expr:
+        """Case-insensitive exact match."""
+        matches = val1.str.to_uppercase() == val2.str.to_uppercase()
+        return self._null_safe(val1, val2, matches)
+    
+    def _batch_compare_text(self, val1: pl.Expr, val2: pl.Expr, min_length: int) -> pl.Expr:
+        """Equal after upper/strip, or one contains the other when both are long."""
+        text1 = val1.str.to_uppercase().str.strip_chars()
+        text2 = val2.str.to_uppercase().str.strip_chars()
+        long_enough = (text1.str.len_chars() > min_length) & (text2.str.len_chars() > min_length)
+        contained = text1.str.contains(text2, literal=True) | text2.str.contains(text1, literal=True)
+        return self._null_safe(val1, val2, (text1 == text2) | (long_enough & contained))
+    
     def _calculate_overall_accuracy(self, field_accuracies: Dict[str, CellAccuracyResult]) -> float:
         """Calculate weighted overall accuracy."""
         if not field_accuracies:
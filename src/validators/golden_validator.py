@@ -4,10 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import pandas as pd
-
 from ..core.models import ExtractorType, Transaction, ValidationResult
-from ..core.patterns import normalize_amount, normalize_date
+from ..core.normalise import StatementPeriod, parse_amounts, parse_dates
 from .semantic_compare import SemanticComparator, create_default_comparator
 
 
@@ -43,14 +41,26 @@ class GoldenValidator:
         return golden_stem + ".pdf"
 
     def _load_csv_as_transactions(self, csv_path: Path) -> list[Transaction]:
-        """Load CSV file and convert to Transaction objects."""
+        """Load CSV file and convert to Transaction objects.
+
+        Dates and amounts are parsed a column at a time; ``DD/MM`` dates
+        take their year from the period in the file name (``golden_2024-10``).
+        """
+        import polars as pl
+
+        from ..core.transaction_batch import TransactionBatch
+
         try:
-            df = pd.read_csv(csv_path, dtype=str)
+            with open(csv_path, encoding="utf-8") as handle:
+                header = handle.readline()
+            raw = pl.read_csv(
+                csv_path, separator=";" if ";" in header else ",", infer_schema=False
+            )
 
             # Normalize column names
-            df.columns = df.columns.str.lower().str.strip()
+            raw = raw.rename({name: name.lower().strip() for name in raw.columns})
 
-            # Map common column name variations
+            # Map common column name variations (first match wins)
             column_mapping = {
                 "data": "date",
                 "post_date": "date",
@@ -63,51 +73,43 @@ class GoldenValidator:
                 "category": "category",
                 "tipo": "transaction_type",
             }
-
-            df = df.rename(columns=column_mapping)
+            renames = {}
+            for name in raw.columns:
+                target = column_mapping.get(name)
+                if target and target not in raw.columns and target not in renames.values():
+                    renames[name] = target
+            raw = raw.rename(renames)
 
             # Ensure required columns exist
             required_columns = ["date", "description", "amount_brl"]
             for col in required_columns:
-                if col not in df.columns:
+                if col not in raw.columns:
                     raise ValueError(f"Required column '{col}' not found in {csv_path}")
 
-            transactions = []
-
-            for _, row in df.iterrows():
-                try:
-                    # Parse date
-                    date_str = str(row["date"]).strip()
-                    normalized_date = normalize_date(date_str)
-                    year, month, day = normalized_date.split("-")
-                    parsed_date = date(int(year), int(month), int(day))
-
-                    # Parse amount
-                    amount_str = str(row["amount_brl"]).strip()
-                    amount = normalize_amount(amount_str)
-
-                    # Get description
-                    description = str(row["description"]).strip()
-
-                    # Optional fields
-                    category = str(row.get("category", "")).strip() or None
-
-                    transaction = Transaction(
-                        date=parsed_date,
-                        description=description,
-                        amount_brl=amount,
-                        category=category,
-                        confidence_score=1.0,  # Golden data is 100% confident
-                        raw_text=f"Golden: {date_str} | {description} | {amount_str}",
-                    )
-
-                    transactions.append(transaction)
+            raw = raw.with_columns(pl.col("date", "amount_brl").str.strip_chars())
+            description = pl.col("description").fill_null("").str.strip_chars()
+            category = (
+                pl.col("category").str.strip_chars()
+                if "category" in raw.columns
+                else pl.lit(None, dtype=pl.String)
+            )
+            frame = raw.select(
+                description.alias("description"),
+                pl.when(category == "").then(None).otherwise(category).alias("category"),
+                pl.lit(1.0).alias("confidence_score"),  # Golden data is 100% confident
+                pl.format("Golden: {} | {} | {}", "date", description, "amount_brl").alias(
+                    "raw_text"
+                ),
+            ).with_columns(
+                pl.Series("date", parse_dates(raw["date"], StatementPeriod.from_name(csv_path.stem))),
+                pl.Series("amount_brl", parse_amounts(raw["amount_brl"])).fill_null(0),
+            )
 
-                except Exception as e:
-                    print(f"Error parsing row in {csv_path}: {e}")
-                    continue
+            skipped = frame["date"].null_count()
+            if skipped:
+                print(f"Skipped {skipped} rows without a valid date in {csv_path}")
 
-            return transactions
+            return TransactionBatch.from_polars(frame.drop_nulls("date")).to_transactions()
 
         except Exception as e:
             print(f"Error loading CSV {csv_path}: {e}")
@@ -233,6 +235,8 @@ class GoldenValidator:
                 }
             )
 
+        import pandas as pd
+
         df = pd.DataFrame(data)
         df.to_csv(output_path, index=False)
         return True
@@ -277,6 +281,8 @@ class GoldenValidator:
                 }
             )
 
+        import pandas as pd
+
         df = pd.DataFrame(data)
         df.to_csv(golden_path, index=False, sep=";")  # Use semicolon for Brazilian CSV
 
@@ -6,11 +6,23 @@ import re
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any, Final
 
 from ..core.models import Transaction, ValidationResult
 from ..core.patterns import normalize_amount, normalize_date
 
+if TYPE_CHECKING:  # Polars/Arrow load on first batch use
+    import polars as pl
+
+    from ..core.transaction_batch import TransactionBatch
+
+# Dropped from descriptions before comparing
+FILLER_WORDS: Final[frozenset[str]] = frozenset(
+    {"de", "da", "do", "em", "na", "no", "a", "o", "e", "para", "com"}
+)
+
+_KEY: Final[list[str]] = ["key_date", "key_desc", "key_amount"]
+
 
 @dataclass
 class FieldComparison:
@@ -121,6 +133,220 @@ class SemanticComparator:
             false_negatives=fn,
         )
 
+    def compare_batches(
+        self, batch1: TransactionBatch, batch2: TransactionBatch
+    ) -> ValidationResult:
+        """Columnar ``compare_transactions`` for two ``TransactionBatch``es.
+
+        Keys, exact matching and per-field comparison are column operations;
+        only rows left over after the exact join go through the pairwise
+        fuzzy search.
+        """
+        frame1 = self._keyed_frame(batch1)
+        frame2 = self._keyed_frame(batch2)
+
+        exact = frame1.join(frame2, on=_KEY, how="inner", suffix="_2")
+        pairs = list(zip(exact["row"].to_list(), exact["row_2"].to_list()))
+
+        # Fuzzy matching for the remainder, in key order like the row path
+        rest1 = frame1.join(exact, on="row", how="anti")["row"].to_list()
+        rest2 = frame2.join(exact, left_on="row", right_on="row_2", how="anti")["row"].to_list()
+        if rest1 and rest2:
+            remaining = dict(zip(rest2, batch2.take(rest2).to_transactions()))
+            for row1, t1 in zip(rest1, batch1.take(rest1).to_transactions()):
+                best_match = None
+                best_score = 0.0
+                for row2, t2 in remaining.items():
+                    score = self._calculate_similarity(t1, t2)
+                    if (
+                        score > best_score
+                        and score >= self.description_similarity_threshold
+                    ):
+                        best_score = score
+                        best_match = row2
+                if best_match is not None:
+                    pairs.append((row1, best_match))
+                    del remaining[best_match]
+
+        matched1 = {row1 for row1, _ in pairs}
+        matched2 = {row2 for _, row2 in pairs}
+        unmatched1 = [row for row in frame1["row"].to_list() if row not in matched1]
+        unmatched2 = [row for row in frame2["row"].to_list() if row not in matched2]
+
+        tp = len(pairs)
+        fp = len(unmatched1)
+        fn = len(unmatched2)
+
+        precision = tp / (tp + fp) if (tp + fp) > 0 else 1.0
+        recall = tp / (tp + fn) if (tp + fn) > 0 else 1.0
+        f1_score = (
+            2 * precision * recall / (precision + recall)
+            if (precision + recall) > 0
+            else 1.0
+        )
+
+        total_cells, matching_cells, mismatched_cells = self._compare_batch_fields(
+            batch1, batch2, frame1, frame2, pairs
+        )
+        cell_accuracy = matching_cells / total_cells if total_cells > 0 else 1.0
+
+        amount_difference = abs(batch1.total_amount_brl - batch2.total_amount_brl)
+        total_amount_match = amount_difference <= self.amount_tolerance
+
+        for t in batch1.take(unmatched1).to_transactions():
+            mismatched_cells.append(
+                f"Missing in second set: {t.date} {t.description} {t.amount_brl}"
+            )
+        for t in batch2.take(unmatched2).to_transactions():
+            mismatched_cells.append(
+                f"Extra in second set: {t.date} {t.description} {t.amount_brl}"
+            )
+
+        return ValidationResult(
+            cell_accuracy=cell_accuracy,
+            transaction_count_match=len(batch1) == len(batch2),
+            total_amount_match=total_amount_match,
+            amount_difference_brl=amount_difference,
+            mismatched_cells=mismatched_cells,
+            precision=precision,
+            recall=recall,
+            f1_score=f1_score,
+            true_positives=tp,
+            false_positives=fp,
+            false_negatives=fn,
+        )
+
+    def _keyed_frame(self, batch: TransactionBatch) -> pl.DataFrame:
+        """Comparison key and description tokens per row, one row per key.
+
+        Like the dict in ``compare_transactions``, a repeated key keeps its
+        last row.
+        """
+        import polars as pl
+
+        from ..core.transaction_batch import money_text
+
+        amounts = pl.from_arrow(money_text(batch.column("amount_brl"), 2))
+        normalized = self._normalize_description_expr(pl.col("description"))
+        return (
+            batch.to_polars()
+            .select(
+                pl.int_range(pl.len()).alias("row"),
+                pl.col("date").dt.strftime("%Y-%m-%d").alias("key_date"),
+                normalized.alias("key_desc"),
+                pl.col("date").alias("date"),
+                pl.col("amount_brl").alias("amount_brl"),
+                pl.col("category").alias("category"),
+            )
+            .with_columns(
+                amounts.alias("key_amount"),
+                pl.col("key_desc").str.split(" ").list.unique().alias("tokens"),
+            )
+            .unique(subset=_KEY, keep="last", maintain_order=True)
+        )
+
+    def _normalize_description_expr(self, description: pl.Expr) -> pl.Expr:
+        """Column version of ``_normalize_description_for_comparison``."""
+        import polars as pl
+
+        words = (
+            description.str.to_lowercase()
+            .str.replace_all(r"\s+", " ")
+            .str.strip_chars()
+            .str.replace_all(r"[^\w\s]", " ")
+            .str.split(" ")
+        )
+        word = pl.element()
+        kept = words.list.eval(
+            word.filter((word != "") & ~word.is_in(list(FILLER_WORDS)))
+        )
+        return kept.list.join(" ")
+
+    def _compare_batch_fields(
+        self,
+        batch1: TransactionBatch,
+        batch2: TransactionBatch,
+        frame1: pl.DataFrame,
+        frame2: pl.DataFrame,
+        pairs: list[tuple[int, int]],
+    ) -> tuple[int, int, list[str]]:
+        """Columnar ``_compare_transaction_fields`` over matched row pairs."""
+        if not pairs:
+            return 0, 0, []
+
+        import polars as pl
+
+        from ..core.transaction_batch import money
+
+        rows1, rows2 = zip(*pairs)
+        joined = (
+            pl.DataFrame(
+                {"row": rows1, "row_2": rows2},
+                schema={"row": pl.Int64, "row_2": pl.Int64},
+            )
+            .join(frame1, on="row", how="left")
+            .join(frame2, left_on="row_2", right_on="row", how="left", suffix="_2")
+        )
+
+        intersection = pl.col("tokens").list.set_intersection("tokens_2").list.len()
+        union = pl.col("tokens").list.set_union("tokens_2").list.len()
+        empty1 = pl.col("key_desc") == ""
+        empty2 = pl.col("key_desc_2") == ""
+        similarity = (
+            pl.when(pl.col("key_desc") == pl.col("key_desc_2"))
+            .then(1.0)
+            .when(empty1 | empty2)
+            .then(0.0)
+            .otherwise(intersection / union)
+        )
+        both_categories = (
+            pl.col("category").is_not_null()
+            & (pl.col("category") != "")
+            & pl.col("category_2").is_not_null()
+            & (pl.col("category_2") != "")
+        )
+        fields = joined.select(
+            "row",
+            "row_2",
+            (
+                (pl.col("date") - pl.col("date_2")).dt.total_days().abs()
+                <= self.date_tolerance_days
+            ).alias("date"),
+            (similarity >= self.description_similarity_threshold).alias("description"),
+            (
+                (pl.col("amount_brl") - pl.col("amount_brl_2")).abs()
+                <= money(self.amount_tolerance)
+            ).alias("amount_brl"),
+            pl.when(both_categories)
+            .then(
+                pl.col("category").str.to_lowercase()
+                == pl.col("category_2").str.to_lowercase()
+            )
+            .alias("category"),
+        )
+
+        names = ["date", "description", "amount_brl", "category"]
+        counts = fields.select(
+            pl.sum_horizontal(pl.col(names).is_not_null()).sum().alias("total"),
+            pl.sum_horizontal(pl.col(names).fill_null(False)).sum().alias("matching"),
+        ).row(0)
+
+        mismatched_cells = []
+        failed = fields.filter(~pl.all_horizontal(pl.col(names).fill_null(True)))
+        if failed.height:
+            left = batch1.take(failed["row"].to_list()).to_transactions()
+            right = batch2.take(failed["row_2"].to_list()).to_transactions()
+            for flags, row1, t1, t2 in zip(
+                failed.select(names).iter_rows(), failed["row"], left, right
+            ):
+                for name, ok in zip(names, flags):
+                    if ok is False:
+                        mismatched_cells.append(
+                            f"Row {row1 + 1}, {name}: "
+                            f"'{getattr(t1, name)}' vs '{getattr(t2, name)}'"
+                        )
+        return counts[0], counts[1], mismatched_cells
+
     def _create_comparison_key(self, transaction: Transaction) -> tuple:
         """Create a normalized key for transaction comparison."""
         # Normalize components
@@ -299,20 +525,7 @@ class SemanticComparator:
         normalized = re.sub(r"[^\w\s]", " ", normalized)
 
         # Remove common filler words
-        filler_words = {
-            "de",
-            "da",
-            "do",
-            "em",
-            "na",
-            "no",
-            "a",
-            "o",
-            "e",
-            "para",
-            "com",
-        }
-        tokens = [word for word in normalized.split() if word not in filler_words]
+        tokens = [word for word in normalized.split() if word not in FILLER_WORDS]
 
         return " ".join(tokens)
 
@@ -11,6 +11,24 @@ src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
 
+@pytest.fixture(autouse=True, scope="session")
+def no_artifacts():
+    """Keep extractor runs from writing text/CSV artifacts into the repo."""
+    from src.core.artifact_sink import configure_artifact_sink
+
+    configure_artifact_sink(enabled=False)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_prediction_cache(tmp_path_factory):
+    """Keep cached model predictions out of the user's cache directory."""
+    import os
+
+    os.environ["EVOLVE_PREDICTION_CACHE"] = str(
+        tmp_path_factory.mktemp("predictions") / "predictions.sqlite"
+    )
+
+
 @pytest.fixture
 def sample_pdf_path():
     """Path to a sample PDF for testing."""
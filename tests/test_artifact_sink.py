@@ -0,0 +1,43 @@
+"""Tests for the background artifact sink."""
+
+from datetime import date
+from decimal import Decimal
+
+from src.core.artifact_sink import ArtifactSink, ExtractorArtifacts, golden_rows
+from src.core.models import Transaction
+
+
+def _artifacts():
+    return ExtractorArtifacts(
+        extractor="pdfplumber",
+        pdf_name="Itau_2024-10.pdf",
+        title="PDFPlumber Extractor Output",
+        summary=[("Transactions found", 1)],
+        raw_text="28/09 FARMACIA 12,50",
+        rows=golden_rows([Transaction(date(2024, 9, 28), "FARMACIA", Decimal("12.50"))]),
+    )
+
+
+class TestArtifactSink:
+    """Test ArtifactSink writing."""
+
+    def test_writes_text_and_csv_in_background(self, tmp_path):
+        sink = ArtifactSink(tmp_path, enabled=True)
+        sink.submit(_artifacts())
+        sink.close()
+
+        text = (tmp_path / "pdfplumber" / "text" / "Itau_2024-10.txt").read_text()
+        csv_lines = (tmp_path / "pdfplumber" / "csv" / "Itau_2024-10.csv").read_text().splitlines()
+
+        assert text.startswith("PDFPlumber Extractor Output\nPDF: Itau_2024-10.pdf\n")
+        assert text.endswith("28/09 FARMACIA 12,50")
+        assert csv_lines[0].startswith("card_last4;post_date;desc_raw;amount_brl")
+        assert csv_lines[1].split(";")[1:4] == ["2024-09-28", "FARMACIA", "12.50"]
+        assert sink.written == 2
+
+    def test_disabled_sink_writes_nothing(self, tmp_path):
+        sink = ArtifactSink(tmp_path, enabled=False)
+        sink.submit(_artifacts())
+        sink.flush()
+
+        assert not any(tmp_path.iterdir())
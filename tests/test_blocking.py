@@ -0,0 +1,79 @@
+"""Tests for blocked ensemble transaction grouping."""
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from src.core.models import ExtractorType, PipelineResult, Transaction
+from src.merger.blocking import BlockingIndex
+from src.merger.ensemble_merger import EnsembleMerger
+
+EXTRACTORS = (ExtractorType.PDFPLUMBER, ExtractorType.PYMUPDF, ExtractorType.CAMELOT)
+
+
+def _pipeline_results(count, seed=7):
+    """Extractor outputs that disagree slightly on date, amount and text."""
+    rng = random.Random(seed)
+    base = [
+        Transaction(
+            date(2024, 10, 1) + timedelta(days=rng.randrange(5)),
+            f"LOJA {rng.randrange(30)} SAO PAULO",
+            Decimal(rng.randrange(-500, 3000)) / 100 + Decimal(rng.choice(["0", "0.005"])),
+        )
+        for _ in range(count)
+    ]
+    results = []
+    for extractor in EXTRACTORS:
+        transactions = [
+            Transaction(
+                t.date + timedelta(days=rng.choice([0, 0, 1, -1, 2])),
+                t.description + rng.choice(["", " BR", "X"]),
+                t.amount_brl + Decimal(rng.choice(["0", "0.01", "-0.01", "0.011", "0.02"])),
+            )
+            for t in base
+        ]
+        results.append(PipelineResult(transactions, 0.8, extractor, 1.0))
+    return results
+
+
+def _reference_groups(merger, pipeline_results):
+    """The all-pairs grouping the blocking index replaces."""
+    all_transactions = [
+        (t, result.pipeline_name, result.confidence_score)
+        for result in pipeline_results
+        for t in result.transactions
+    ]
+    groups, used = [], set()
+    for i, (trans_i, _, _) in enumerate(all_transactions):
+        if i in used:
+            continue
+        group = [all_transactions[i]]
+        used.add(i)
+        for j, (trans_j, _, _) in enumerate(all_transactions):
+            if j not in used and merger._transactions_similar(trans_i, trans_j):
+                group.append(all_transactions[j])
+                used.add(j)
+        groups.append(group)
+    return groups
+
+
+def test_candidates_cover_every_tolerated_neighbour():
+    """Anything within one day and one cent is a candidate."""
+    anchor = Transaction(date(2024, 10, 2), "A", Decimal("-0.005"))
+    others = [
+        Transaction(date(2024, 10, 1), "B", Decimal("0.005")),
+        Transaction(date(2024, 10, 3), "C", Decimal("-0.015")),
+        Transaction(date(2024, 10, 4), "D", Decimal("-0.005")),
+        Transaction(date(2024, 10, 2), "E", Decimal("0.03")),
+    ]
+    index = BlockingIndex([anchor, *others])
+
+    assert index.candidates(anchor) == [0, 1, 2]
+
+
+def test_grouping_matches_all_pairs_reference():
+    """Blocked grouping returns exactly the all-pairs groups, in order."""
+    merger = EnsembleMerger.__new__(EnsembleMerger)  # skip extractor/model setup
+    results = _pipeline_results(120)
+
+    assert merger._group_similar_transactions(results) == _reference_groups(merger, results)
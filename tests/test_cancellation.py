@@ -0,0 +1,94 @@
+"""Tests for cooperative cancellation of race-mode extractors."""
+
+import asyncio
+import threading
+import time
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.core import cancellation
+from src.core.cancellation import CancellationToken, ExtractionCancelled, cancellation_scope
+from src.core.models import ExtractorType, PipelineResult, Transaction
+from src.extractors.registry import ExtractorRegistry
+from src.merger.ensemble_merger import EnsembleMerger
+
+
+class FakeExtractor:
+    """Extractor that walks ``pages`` pages, or polls a cloud job."""
+
+    def __init__(self, extractor_type, pages=0, page_seconds=0.0, poll=False):
+        self.extractor_type = extractor_type
+        self.pages = pages
+        self.page_seconds = page_seconds
+        self.poll = poll
+        self.pages_done = 0
+        self.returned = threading.Event()
+
+    def extract(self, pdf_path):
+        try:
+            if self.poll:
+                cancellation.sleep(30)  # Waiting for quota before submitting
+                cancellation.mark_billed()
+            for _ in range(self.pages):
+                cancellation.check_cancelled()
+                time.sleep(self.page_seconds)
+                self.pages_done += 1
+            transaction = Transaction(date(2024, 10, 1), "PADARIA", Decimal("12.50"))
+            return PipelineResult([transaction], 0.99, self.extractor_type, 1.0)
+        finally:
+            self.returned.set()
+
+
+def test_scope_functions_are_noops_without_token():
+    """Serial runs never see a token."""
+    cancellation.check_cancelled()
+    cancellation.mark_billed()
+    cancellation.sleep(0)
+
+
+def test_sleep_wakes_on_cancel():
+    """A cancelled token interrupts a sleeping poll loop at once."""
+    token = CancellationToken()
+    threading.Timer(0.05, token.cancel, args=("stop",)).start()
+    start = time.perf_counter()
+
+    with pytest.raises(ExtractionCancelled), cancellation_scope(token):
+        cancellation.sleep(10)
+
+    assert time.perf_counter() - start < 2
+    assert token.stopped and not token.billed
+    assert 0 < token.stop_latency_ms < 2000
+
+
+def test_race_stops_losers_and_reports_savings(sample_pdf_path):
+    """Losers stop at their next cancellation point; unbilled cloud cost is saved."""
+    merger = EnsembleMerger(use_cache=False)
+    merger.extractors = ExtractorRegistry([])
+    winner = FakeExtractor(ExtractorType.PDFPLUMBER)
+    pages = FakeExtractor(ExtractorType.CAMELOT, pages=500, page_seconds=0.01)
+    cloud = FakeExtractor(ExtractorType.TEXTRACT, poll=True)
+    for extractor in (pages, cloud, winner):
+        merger.extractors.register(extractor.extractor_type, extractor)
+
+    start = time.perf_counter()
+    results, cancelled = asyncio.run(
+        merger._run_race_extraction(
+            sample_pdf_path,
+            [ExtractorType.CAMELOT, ExtractorType.TEXTRACT, ExtractorType.PDFPLUMBER],
+            confidence_threshold=0.5,
+        )
+    )
+
+    assert time.perf_counter() - start < 4
+    assert [r.pipeline_name for r in results] == [ExtractorType.PDFPLUMBER]
+    assert pages.returned.is_set() and cloud.returned.is_set()
+    assert pages.pages_done < 500
+
+    by_type = {c.pipeline_name: c for c in cancelled}
+    assert set(by_type) == {ExtractorType.CAMELOT, ExtractorType.TEXTRACT}
+    assert all(c.stopped for c in cancelled)
+    assert by_type[ExtractorType.CAMELOT].cost_avoided_usd == 0.0
+    assert not by_type[ExtractorType.TEXTRACT].billed
+    assert by_type[ExtractorType.TEXTRACT].cost_avoided_usd > 0
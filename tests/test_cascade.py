@@ -0,0 +1,196 @@
+"""Tests for the staged extractor cascade and its cost guard."""
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import pymupdf
+import pytest
+
+from src.core import cancellation
+from src.core.models import (
+    CostEstimate,
+    ExtractorType,
+    PageResult,
+    PipelineResult,
+    Transaction,
+)
+from src.extractors.registry import ExtractorRegistry
+from src.merger.cascade import CostGuard, estimate_cost
+from src.merger.ensemble_merger import EnsembleMerger
+
+
+class FakeExtractor:
+    """Extractor returning one transaction at a fixed confidence."""
+
+    def __init__(self, extractor_type, confidence, paid=False):
+        self.extractor_type = extractor_type
+        self.confidence = confidence
+        self.paid = paid
+        self.calls = 0
+
+    def extract(self, pdf_path):
+        self.calls += 1
+        if self.paid:
+            cancellation.mark_billed()
+        transaction = Transaction(date(2024, 10, 1), "PADARIA", Decimal("12.50"))
+        return PipelineResult([transaction], self.confidence, self.extractor_type, 1.0)
+
+
+@pytest.fixture
+def statement(tmp_path):
+    """Two-page PDF without statement totals."""
+    document = pymupdf.open()
+    for _ in range(2):
+        document.new_page().insert_text((72, 72), "FATURA")
+    path = tmp_path / "statement.pdf"
+    document.save(path)
+    return path
+
+
+def _merger(tmp_path, extractors, **budget):
+    guard = CostGuard(ledger_path=tmp_path / "ledger.json", **budget)
+    merger = EnsembleMerger(use_cache=False, cost_guard=guard)
+    merger.extractors = ExtractorRegistry([])
+    for extractor in extractors:
+        merger.extractors.register(extractor.extractor_type, extractor)
+    return merger
+
+
+def _cascade(merger, statement, threshold):
+    return asyncio.run(merger.cascade.run(statement, threshold))
+
+
+def test_confident_local_result_skips_paid_engines(tmp_path, statement):
+    """A born-digital statement never reaches paid OCR."""
+    paid = FakeExtractor(ExtractorType.AZURE_DOC_INTELLIGENCE, 0.99, paid=True)
+    merger = _merger(tmp_path, [FakeExtractor(ExtractorType.PYMUPDF, 0.99), paid])
+
+    results, _, decisions = _cascade(merger, statement, 0.5)
+
+    assert [r.pipeline_name for r in results] == [ExtractorType.PYMUPDF]
+    assert [(d.stage, d.outcome, d.totals_match) for d in decisions] == [("text", "accepted", None)]
+    assert paid.calls == 0
+    assert merger.cost_guard.pages_today() == 0
+
+
+def test_low_confidence_escalates_and_charges_budget(tmp_path, statement):
+    """Paid OCR runs after the local stages fail and is charged per page."""
+    paid = FakeExtractor(ExtractorType.AZURE_DOC_INTELLIGENCE, 0.99, paid=True)
+    merger = _merger(
+        tmp_path,
+        [FakeExtractor(ExtractorType.PYMUPDF, 0.2), FakeExtractor(ExtractorType.CAMELOT, 0.2), paid],
+    )
+
+    _, _, decisions = _cascade(merger, statement, 0.5)
+
+    assert [(d.stage, d.outcome) for d in decisions] == [
+        ("text", "escalated"),
+        ("tables", "escalated"),
+        ("paid", "accepted"),
+    ]
+    assert decisions[-1].cost == estimate_cost(ExtractorType.AZURE_DOC_INTELLIGENCE, 2)
+    assert merger.cost_guard.pages_today() == 2
+
+
+def test_budget_blocks_paid_engine(tmp_path, statement):
+    """Pages beyond the daily budget are refused, across runs."""
+    paid = FakeExtractor(ExtractorType.AZURE_DOC_INTELLIGENCE, 0.99, paid=True)
+    merger = _merger(tmp_path, [FakeExtractor(ExtractorType.PYMUPDF, 0.2), paid], daily_pages=3)
+
+    _cascade(merger, statement, 0.5)
+    _, _, decisions = _cascade(merger, statement, 0.5)
+
+    assert decisions[-1].outcome == "over_budget"
+    assert "daily budget" in decisions[-1].reason
+    assert paid.calls == 1
+
+
+def test_cost_estimates_add():
+    """Estimates from different providers sum field by field."""
+    total = CostEstimate(textract_pages=2, textract_cost_usd=0.003) + CostEstimate(
+        azure_pages=1, azure_cost_usd=0.001
+    )
+
+    assert total.total_pages == 3
+    assert total.total_cost_usd == pytest.approx(0.004)
+
+
+class PagedExtractor(FakeExtractor):
+    """Text extractor reporting one ``PageResult`` per page."""
+
+    def __init__(self, extractor_type, amounts):
+        super().__init__(extractor_type, 0.2)
+        self.amounts = amounts
+
+    def extract(self, pdf_path):
+        self.calls += 1
+        pages = [
+            PageResult(i, i + 1, [Transaction(date(2024, 10, 1), "PADARIA", Decimal(a))], 0.2)
+            for i, a in enumerate(self.amounts)
+        ]
+        transactions = [t for page in pages for t in page.transactions]
+        return PipelineResult(
+            transactions, 0.2, self.extractor_type, 1.0, page_count=len(pages), page_results=pages
+        )
+
+
+class PageCountingExtractor(FakeExtractor):
+    """Paid extractor remembering how many pages each call received."""
+
+    def __init__(self, extractor_type):
+        super().__init__(extractor_type, 0.99, paid=True)
+        self.pages_seen = []
+
+    def extract(self, pdf_path):
+        with pymupdf.open(pdf_path) as document:
+            self.pages_seen.append(document.page_count)
+        return super().extract(pdf_path)
+
+
+def test_pages_that_reconcile_are_accepted_locally(tmp_path, statement):
+    """Two engines agreeing page by page need no OCR, whatever their confidence."""
+    paid = PageCountingExtractor(ExtractorType.AZURE_DOC_INTELLIGENCE)
+    merger = _merger(
+        tmp_path,
+        [
+            PagedExtractor(ExtractorType.PYMUPDF, ["1.00", "2.00"]),
+            PagedExtractor(ExtractorType.PDFPLUMBER, ["1.00", "2.00"]),
+            paid,
+        ],
+    )
+
+    _, _, decisions = _cascade(merger, statement, 0.5)
+
+    assert [(d.stage, d.outcome, d.reason) for d in decisions] == [
+        ("text", "accepted", "all 2 pages reconcile")
+    ]
+    assert paid.pages_seen == []
+
+
+def test_only_disagreeing_pages_go_to_paid_engine(tmp_path, statement):
+    """The paid engine sees and is charged for the unreconciled page alone."""
+    paid = PageCountingExtractor(ExtractorType.AZURE_DOC_INTELLIGENCE)
+    merger = _merger(
+        tmp_path,
+        [
+            PagedExtractor(ExtractorType.PYMUPDF, ["1.00", "2.00"]),
+            PagedExtractor(ExtractorType.PDFPLUMBER, ["1.00", "3.00"]),
+            paid,
+        ],
+    )
+
+    results, _, decisions = _cascade(merger, statement, 0.5)
+
+    assert [(d.stage, d.outcome, d.pages) for d in decisions] == [
+        ("text", "escalated", [1]),
+        ("paid", "accepted", [1]),
+    ]
+    assert paid.pages_seen == [1]
+    assert merger.cost_guard.pages_today() == 1
+    assert decisions[-1].cost == estimate_cost(ExtractorType.AZURE_DOC_INTELLIGENCE, 1)
+
+    (stitched,) = results
+    assert stitched.raw_data["page_sources"][0] in {"pymupdf", "pdfplumber"}
+    assert stitched.raw_data["page_sources"][1] == ExtractorType.AZURE_DOC_INTELLIGENCE.value
+    assert [t.amount_brl for t in stitched.transactions] == [Decimal("1.00"), Decimal("12.50")]
@@ -0,0 +1,36 @@
+"""Tests for batched fuzzy clustering."""
+
+from datetime import date
+from decimal import Decimal
+
+from src.core.models import Transaction
+from src.merge.cluster_fuzzy import merge_transactions
+
+
+def _tx(day, description, amount, confidence):
+    return Transaction(date(2024, 10, day), description, Decimal(amount), confidence_score=confidence)
+
+
+def test_duplicates_collapse_to_most_confident():
+    """Same date, amount and description merge; the best row survives."""
+    txns = [
+        _tx(1, "PADARIA REAL SAO PAULO", "12.50", 0.6),
+        _tx(1, "MERCADO LIVRE", "99.90", 0.9),
+        _tx(1, "PADARIA REAL SAO PAULO BR", "12.50", 0.8),
+        _tx(2, "PADARIA REAL SAO PAULO", "12.50", 0.7),  # other day
+        _tx(1, "PADARIA REAL SAO PAULO", "12.52", 0.9),  # other amount
+        _tx(1, "MERCADO LIVRE", "99.905", 0.5),  # within a cent
+    ]
+    merged = merge_transactions(txns)
+
+    assert merged == [txns[2], txns[1], txns[3], txns[4]]
+
+
+def test_matches_are_transitive():
+    """Rows linked through a third row form one cluster."""
+    txns = [
+        _tx(1, "UBER TRIP HELP UBER COM", "20.00", 0.1),
+        _tx(1, "UBER TRIP HELP UBER COM SAO PAULO", "20.00", 0.2),
+        _tx(1, "UBER TRIP SAO PAULO", "20.00", 0.3),
+    ]
+    assert merge_transactions(txns, workers=2) == [txns[2]]
@@ -6,6 +6,7 @@ from decimal import Decimal
 import pytest
 
 from src.core.models import Transaction, TransactionType
+from src.core.normalise import StatementPeriod
 from src.core.patterns import classify_transaction, normalize_amount, normalize_date
 
 
@@ -26,9 +27,24 @@ class TestTransactionModel:
         assert transaction.transaction_type == TransactionType.DOMESTIC
         assert transaction.confidence_score == 1.0
 
-    def test_transaction_post_init(self):
-        """Test transaction post-initialization conversions."""
+    def test_ledger_hash_is_lazy_and_cached(self):
+        """Test the ledger hash is computed on first access and kept."""
         transaction = Transaction(
+            date=date(2024, 10, 15),
+            description="Test",
+            amount_brl=Decimal("100.50"),
+        )
+
+        assert not hasattr(transaction, "__dict__")
+        first = transaction.ledger_hash
+        assert len(first) == 8
+        transaction.description = "Changed"
+        assert transaction.ledger_hash == first
+        assert Transaction(date(2024, 10, 15), "X", Decimal("1"), ledger_hash="abc").ledger_hash == "abc"
+
+    def test_transaction_from_raw(self):
+        """Test parse-boundary conversions."""
+        transaction = Transaction.from_raw(
             date=date(2024, 10, 15),
             description="Test",
             amount_brl="100.50",  # String input
@@ -66,6 +82,13 @@ class TestPatterns:
         assert normalize_date("15/03/2024") == "2024-03-15"
         assert normalize_date("1/1") == "2024-01-01"
 
+    def test_normalize_date_statement_period(self):
+        """Test DD/MM dates after the closing month fall in the previous year."""
+        period = StatementPeriod(2025, 1)
+        assert normalize_date("15/03", period) == "2024-03-15"
+        assert normalize_date("05/01", period) == "2025-01-05"
+        assert normalize_date("20/12", StatementPeriod(2024, 10)) == "2023-12-20"
+
     def test_classify_transaction(self):
         """Test transaction classification."""
         assert classify_transaction("RESTAURANTE ITALIANO") == "restaurant"
@@ -0,0 +1,107 @@
+"""Tests for the shared parsed-document session."""
+
+import pytest
+
+from src.core.document_session import (
+    DocumentSession,
+    clear_document_sessions,
+    document_text,
+    get_document_session,
+)
+from src.core.normalise import StatementPeriod
+from src.extractors.page_parallel import extract_page_texts, split_page_ranges
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    clear_document_sessions()
+    yield
+    clear_document_sessions()
+
+
+class TestDocumentSession:
+    """Test DocumentSession caching and registry behaviour."""
+
+    def test_registry_shares_session_by_path(self, sample_pdf_path):
+        """Repeated lookups return the same parsed session."""
+        first = get_document_session(sample_pdf_path)
+        second = get_document_session(str(sample_pdf_path))
+
+        assert first is second
+
+    def test_registry_keys_by_content_hash(self, sample_pdf_path, tmp_path):
+        """A byte-identical copy of the PDF reuses the same session."""
+        copy_path = tmp_path / "copy.pdf"
+        copy_path.write_bytes(sample_pdf_path.read_bytes())
+
+        assert get_document_session(copy_path) is get_document_session(sample_pdf_path)
+
+    def test_page_text_is_computed_once(self, sample_pdf_path):
+        """Page text is cached after the first extraction."""
+        session = DocumentSession.from_path(sample_pdf_path)
+        calls = []
+        page = session.page(0)
+        original = page.extract_text
+
+        def counting_extract_text(*args, **kwargs):
+            calls.append(1)
+            return original(*args, **kwargs)
+
+        page.extract_text = counting_extract_text
+
+        assert session.page_text(0) == session.page_text(0)
+        assert len(calls) == 1
+
+    def test_text_matches_joined_pages(self, sample_pdf_path):
+        """Document text joins the non-empty page texts."""
+        session = DocumentSession.from_path(sample_pdf_path)
+
+        expected = "\n".join(t for t in session.page_texts() if t)
+        assert session.text == expected
+        assert document_text(session) == expected
+        assert document_text("plain") == "plain"
+        assert not session.is_scanned()
+
+    def test_page_range_pdf_holds_only_those_pages(self, sample_pdf_path):
+        """A page-range PDF has the same text as the pages it was cut from."""
+        session = DocumentSession.from_path(sample_pdf_path)
+        stop = min(session.page_count, 2)
+
+        subset = DocumentSession(session.page_range_pdf(1, stop))
+
+        assert subset.page_count == stop - 1
+        assert subset.page_texts() == session.page_texts()[1:stop]
+
+    def test_statement_period_from_due_date(self, sample_pdf_path, tmp_path):
+        """The period comes from the due date printed on the first page."""
+        session = DocumentSession(sample_pdf_path.read_bytes())
+
+        assert session.statement_period == StatementPeriod(2024, 10)
+
+    def test_statement_period_falls_back_to_file_name(self, sample_pdf_path, tmp_path):
+        """Pages without a due date take the period named in the file."""
+        session = DocumentSession.from_path(sample_pdf_path)
+        subset = tmp_path / "Itau_2025-05.p2-2.pdf"
+        subset.write_bytes(session.page_range_pdf(1, 2))
+
+        assert DocumentSession.from_path(subset).statement_period == StatementPeriod(2025, 5)
+        assert DocumentSession(subset.read_bytes()).statement_period is None
+
+
+class TestPageParallel:
+    """Test page-parallel pdfplumber extraction."""
+
+    def test_split_page_ranges_is_contiguous_and_balanced(self):
+        """Ranges cover every page once, in order, within one page of each other."""
+        ranges = split_page_ranges(7, 3)
+
+        assert ranges == [(0, 3), (3, 5), (5, 7)]
+        assert split_page_ranges(2, 8) == [(0, 1), (1, 2)]
+
+    def test_parallel_text_matches_serial(self, sample_pdf_path):
+        """Process-pool extraction returns the serial per-page text in order."""
+        session = DocumentSession.from_path(sample_pdf_path)
+
+        parallel = extract_page_texts(sample_pdf_path, session.page_count, workers=2)
+
+        assert parallel == session.page_texts()
@@ -0,0 +1,99 @@
+"""Tests for the dependency-aware enrichment DAG."""
+
+import asyncio
+import threading
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.core.models import EnsembleResult, Transaction
+from src.enrichment.dag import EnrichmentStage, run_stages, stage_dependencies
+from src.enrichment.pipeline import EnrichmentPipeline
+
+STATEMENT = """ITAU UNICLASS
+Cartão final 1234
+01/10 PADARIA SAO JOSE 12,50
+02/10 AMAZON US 100,00
+USD 18,50 Dólar de Conversão R$ 5,40
+"""
+
+
+def _stage(name, reads=(), writes=(), run=lambda: None):
+    return EnrichmentStage(name, run, frozenset(reads), frozenset(writes))
+
+
+def _result():
+    transactions = [
+        Transaction(date(2024, 10, 1), "PADARIA SAO JOSE", Decimal("12.50")),
+        Transaction(date(2024, 10, 2), "AMAZON US", Decimal("100.00"), currency_orig="USD"),
+    ]
+    return EnsembleResult(transactions, [], 0.8, [], "single_pipeline", 0)
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    return EnrichmentPipeline()
+
+
+def test_pipeline_dependencies(pipeline):
+    """Template matching overlaps FX, IOF and ML; metadata waits for every step it touches."""
+    stages = pipeline.enrichment_stages(_result(), STATEMENT, STATEMENT.splitlines())
+
+    assert stage_dependencies(stages) == {
+        "template": [],
+        "fx": [],
+        "iof": ["fx"],
+        "ml": ["fx"],
+        "metadata": ["template", "fx", "iof", "ml"],
+        "validation": ["fx", "metadata"],
+    }
+
+
+def test_dag_matches_sequential_enrichment(pipeline):
+    """The concurrent schedule fills the same fields as running steps in order."""
+    sequential, concurrent = _result(), _result()
+    for stage in pipeline.enrichment_stages(sequential, STATEMENT, STATEMENT.splitlines()):
+        stage.run()
+
+    asyncio.run(
+        run_stages(
+            pipeline.enrichment_stages(concurrent, STATEMENT, STATEMENT.splitlines()),
+            pipeline.executor,
+        )
+    )
+
+    assert concurrent.final_transactions == sequential.final_transactions
+    assert concurrent.validation_metrics == sequential.validation_metrics
+
+
+def test_independent_stages_run_concurrently():
+    """Two stages touching different fields overlap; a dependent one waits."""
+    both_running = threading.Barrier(2, timeout=5)
+    order = []
+
+    def meet(name):
+        both_running.wait()  # Deadlocks (and times out) if run one at a time
+        order.append(name)
+
+    stages = [
+        _stage("a", writes={"iof_brl"}, run=lambda: meet("a")),
+        _stage("b", writes={"card_last4"}, run=lambda: meet("b")),
+        _stage("c", reads={"iof_brl"}, run=lambda: order.append("c")),
+    ]
+
+    asyncio.run(run_stages(stages))
+
+    assert sorted(order[:2]) == ["a", "b"] and order[2] == "c"
+
+
+def test_failing_stage_propagates():
+    """An error in one stage stops the run and reaches the caller."""
+
+    def fail():
+        raise ValueError("bad statement")
+
+    stages = [_stage("a", writes={"x"}, run=fail), _stage("b", reads={"x"})]
+
+    with pytest.raises(ValueError, match="bad statement"):
+        asyncio.run(run_stages(stages))
@@ -0,0 +1,61 @@
+"""Tests for lazy extractor loading and the import profiler."""
+
+import subprocess
+import sys
+
+from src.core.models import ExtractorType
+from src.extractors import ExtractorRegistry, PdfplumberExtractor
+from src.utils.import_profile import PROJECT_ROOT, package_totals, parse_importtime
+
+HEAVY_MODULES = (
+    "boto3", "camelot", "sklearn", "pandas", "polars", "pyarrow", "azure", "google.cloud"
+)
+
+
+def test_package_imports_skip_heavy_dependencies():
+    """Importing the CLI, core and extractor packages loads no engine SDKs or dataframe libraries."""
+    code = (
+        "import sys, src.cli, src.core, src.extractors\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == "[]"
+
+
+def test_registry_builds_only_requested_extractors():
+    registry = ExtractorRegistry(
+        [ExtractorType.PDFPLUMBER, ExtractorType.CAMELOT],
+        options={ExtractorType.PDFPLUMBER: {"page_workers": 1}},
+    )
+
+    extractor = registry[ExtractorType.PDFPLUMBER]
+
+    assert isinstance(extractor, PdfplumberExtractor)
+    assert registry[ExtractorType.PDFPLUMBER] is extractor
+    assert list(registry.loaded) == [ExtractorType.PDFPLUMBER]
+    assert ExtractorType.GOOGLE_DOC_AI not in registry
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     pandas.core\n"
+        "import time:       300 |        420 |   pandas\n"
+        "import time:        80 |        500 | src.cli\n"
+    )
+
+    timings = parse_importtime(stderr)
+
+    assert [(t.module, t.depth) for t in timings] == [
+        ("pandas.core", 2),
+        ("pandas", 1),
+        ("src.cli", 0),
+    ]
+    assert package_totals(timings) == {"pandas": 420, "src": 80}
@@ -0,0 +1,91 @@
+"""Tests for typed Parquet / Arrow IPC golden output."""
+
+from datetime import date
+from decimal import Decimal
+
+import pyarrow as pa
+import pytest
+
+from src.core.models import Transaction
+from src.core.transaction_batch import TransactionBatch
+from src.utils.golden_io import (
+    GOLDEN_SCHEMA,
+    append_golden_dataset,
+    read_golden,
+    read_golden_dataset,
+    statement_month,
+    write_golden,
+)
+
+
+def _statement(month=10, count=3):
+    return [
+        Transaction(
+            date=date(2024, month, 1 + i),
+            description=f"LOJA {i}",
+            amount_brl=Decimal("10.005") + i,
+            fx_rate=Decimal("5.12345"),
+            installment_seq=1,
+            installment_tot=3,
+        )
+        for i in range(count)
+    ]
+
+
+class TestGoldenFiles:
+    """Test single-file typed output."""
+
+    @pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+    def test_round_trip_is_typed(self, tmp_path, fmt):
+        """Files keep the golden schema and CSV precision."""
+        path = tmp_path / f"golden.{fmt}"
+        write_golden(_statement(), path, fmt)
+        table = read_golden(path)
+
+        assert table.schema == GOLDEN_SCHEMA
+        assert table.column("amount_brl").type == pa.decimal128(18, 2)
+        first = table.to_pylist()[0]
+        assert first["date"] == date(2024, 10, 1)
+        assert first["amount_brl"] == Decimal("10.00")  # half-even, like the CSV
+        assert first["fx_rate"] == Decimal("5.1234")
+        assert first["installment_tot"] == 3
+
+    def test_batch_and_rows_write_the_same_table(self, tmp_path):
+        """A TransactionBatch writes exactly what its rows would."""
+        rows = _statement()
+        write_golden(rows, tmp_path / "rows.parquet", "parquet")
+        write_golden(TransactionBatch.from_transactions(rows), tmp_path / "batch.parquet", "parquet")
+
+        assert read_golden(tmp_path / "rows.parquet").equals(read_golden(tmp_path / "batch.parquet"))
+
+    def test_unknown_format(self, tmp_path):
+        """Unsupported formats are rejected."""
+        with pytest.raises(ValueError):
+            write_golden(_statement(), tmp_path / "golden.xlsx", "xlsx")
+
+
+class TestGoldenDataset:
+    """Test the partitioned statement dataset."""
+
+    def test_statement_month_is_latest_date(self):
+        """The closing month wins over earlier spill-over rows."""
+        rows = _statement(9, 1) + _statement(10, 2)
+        assert statement_month(rows) == "2024-10"
+        assert statement_month(TransactionBatch.from_transactions(rows)) == "2024-10"
+
+    @pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+    def test_append_partitions_by_month(self, tmp_path, fmt):
+        """Statements land in their month; re-appending one is idempotent."""
+        append_golden_dataset(_statement(10), tmp_path, "itau_2024-10", fmt)
+        append_golden_dataset(_statement(11, 2), tmp_path, "itau_2024-11", fmt)
+        partition = append_golden_dataset(_statement(11, 2), tmp_path, "itau_2024-11", fmt)
+
+        assert partition == tmp_path / "statement_month=2024-11"
+        table = read_golden_dataset(tmp_path, fmt)
+        months = sorted(table.column("statement_month").to_pylist())
+        assert months == ["2024-10"] * 3 + ["2024-11"] * 2
+
+    def test_dataset_rejects_csv(self, tmp_path):
+        """CSV has no dataset form."""
+        with pytest.raises(ValueError):
+            append_golden_dataset(_statement(), tmp_path, "x", "csv")
@@ -0,0 +1,93 @@
+"""Tests for incremental (streaming) ensemble merging."""
+
+import asyncio
+import time
+from datetime import date
+from decimal import Decimal
+
+from src.core.models import ExtractorType, PipelineResult, Transaction
+from src.extractors.registry import ExtractorRegistry
+from src.merger.ensemble_merger import EnsembleMerger
+from src.merger.incremental import IncrementalMerge
+
+
+def _transaction(day, description, amount):
+    return Transaction(date(2024, 10, day), description, Decimal(amount))
+
+
+class SlowExtractor:
+    """Extractor returning fixed transactions after ``seconds``."""
+
+    def __init__(self, extractor_type, transactions, seconds=0.0):
+        self.extractor_type = extractor_type
+        self.transactions = transactions
+        self.seconds = seconds
+
+    def extract(self, pdf_path):
+        time.sleep(self.seconds)
+        return PipelineResult(self.transactions, 0.95, self.extractor_type, 1.0)
+
+
+def _bare_merger():
+    return EnsembleMerger.__new__(EnsembleMerger)  # skip extractor/model setup
+
+
+def test_folding_matches_merging_everything_at_once():
+    """Each fold refines the running merge towards the batch result."""
+    merger = _bare_merger()
+    pymupdf = PipelineResult(
+        [_transaction(1, "PADARIA", "12.50"), _transaction(3, "POSTO", "80.00")],
+        0.9,
+        ExtractorType.PYMUPDF,
+        1.0,
+    )
+    camelot = PipelineResult(
+        [_transaction(1, "PADARIA SAO JOSE", "12.50"), _transaction(5, "FARMACIA", "20.00")],
+        0.8,
+        ExtractorType.CAMELOT,
+        1.0,
+    )
+
+    merge = IncrementalMerge(merger)
+    merge.add(pymupdf)
+    assert merge.merged() == (pymupdf.transactions, "single_pipeline", 0)
+
+    merge.add(camelot)
+    transactions, strategy, conflicts = merge.merged()
+    assert [t.description for t in transactions] == ["PADARIA", "POSTO", "FARMACIA"]
+    assert (strategy, conflicts) == ("ensemble_merge_2_pipelines", 1)
+    assert merge.merged() == merger._merge_pipeline_results([pymupdf, camelot])
+
+
+def test_stream_yields_fastest_engine_first(sample_pdf_path):
+    """Provisional merges arrive as engines finish; the enriched result comes last."""
+    merger = EnsembleMerger(use_cache=False)
+    merger.extractors = ExtractorRegistry([])
+    fast = SlowExtractor(ExtractorType.PYMUPDF, [_transaction(1, "PADARIA", "12.50")])
+    slow = SlowExtractor(
+        ExtractorType.PDFPLUMBER,
+        [_transaction(1, "PADARIA", "12.50"), _transaction(2, "POSTO", "80.00")],
+        seconds=0.3,
+    )
+    for extractor in (fast, slow):
+        merger.extractors.register(extractor.extractor_type, extractor)
+
+    async def collect():
+        return [
+            result
+            async for result in merger.stream_ensemble(
+                sample_pdf_path,
+                enabled_extractors=[ExtractorType.PDFPLUMBER, ExtractorType.PYMUPDF],
+                use_race_mode=False,
+            )
+        ]
+
+    first, second, final = asyncio.run(collect())
+
+    assert first.contributing_pipelines == [ExtractorType.PYMUPDF]
+    assert first.merge_strategy == "provisional_single_pipeline"
+    assert len(second.final_transactions) == 2
+    assert second.merge_strategy == "provisional_ensemble_merge_2_pipelines"
+    # The final merge keeps the requested extractor order
+    assert final.contributing_pipelines == [ExtractorType.PDFPLUMBER, ExtractorType.PYMUPDF]
+    assert len(final.final_transactions) == 2
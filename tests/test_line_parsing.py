@@ -0,0 +1,106 @@
+"""Tests for the streaming line-parser pipeline."""
+
+from decimal import Decimal
+
+from src.classifiers.row_classifier import classify_row
+from src.core.line_classifier import ITAU_FEATURES, ITAU_LINE_RULES, LineClassifier
+from src.core.models import ExtractorType, TransactionType
+from src.extractors.line_pipeline import ItauLineParser, ParseStats
+
+PAGE_1 = "Itaú Unibanco página 1\n28/09 FARMACIA SAO JOAO 12,50\n"
+PAGE_2 = "30/09 UBER TRIP 23,10"
+
+
+class TestItauLineParser:
+    """Test ItauLineParser stages."""
+
+    def test_streams_before_last_page_is_read(self):
+        """The first transaction is emitted before the second page is requested."""
+        requested = []
+
+        def pages():
+            requested.append(1)
+            yield PAGE_1
+            requested.append(2)
+            yield PAGE_2
+
+        stream = ItauLineParser(ExtractorType.PDFPLUMBER).iter_transactions(pages())
+        first = next(stream)
+
+        assert first.amount_brl == Decimal("12.50")
+        assert requested == [1]
+        assert [t.amount_brl for t in stream] == [Decimal("23.10")]
+
+    def test_stats_match_joined_text(self):
+        """Line count and preview match splitting the concatenated page text."""
+        stats = ParseStats()
+        parser = ItauLineParser(ExtractorType.PDFPLUMBER)
+
+        transactions = list(parser.iter_transactions([PAGE_1, "", PAGE_2], stats))
+        all_text = PAGE_1 + "\n" + PAGE_2 + "\n"
+
+        assert len(transactions) == 2
+        assert stats.lines == len(all_text.split("\n"))
+        assert stats.preview == all_text[:1000]
+
+    def test_header_lines_are_dropped(self):
+        """Page furniture never becomes a transaction."""
+        parser = ItauLineParser(ExtractorType.PDFPLUMBER)
+
+        transactions = parser.parse_lines(["VALOR TOTAL 1.234,56", "  ", "05/10 PADARIA 9,90"])
+
+        assert [t.description for t in transactions] == ["PADARIA"]
+        assert all(t.source_extractor == ExtractorType.PDFPLUMBER for t in transactions)
+
+    def test_national_posting_skips_fallback(self):
+        """A DD/MM national posting is built by the national pattern, not the fallback."""
+        parser = ItauLineParser(ExtractorType.PDFPLUMBER)
+
+        (transaction,) = parser.parse_lines(["15/09 PADARIA SAO JOSE 12,50"])
+
+        assert transaction.transaction_type == TransactionType.DOMESTIC
+        assert transaction.date.isoformat() == "2024-09-15"
+        assert transaction.amount_brl == Decimal("12.50")
+        assert transaction.confidence_score == 0.95
+
+    def test_fx_posting_is_international(self):
+        """An original-currency posting keeps both amounts and its rate."""
+        parser = ItauLineParser(ExtractorType.PDFPLUMBER)
+
+        (transaction,) = parser.parse_lines(["15/09 AMAZON WEB SERVICES 10,00 55,20"])
+
+        assert transaction.transaction_type == TransactionType.INTERNATIONAL
+        assert transaction.date.isoformat() == "2024-09-15"
+        assert transaction.amount_orig == Decimal("10.00")
+        assert transaction.amount_brl == Decimal("55.20")
+        assert transaction.currency_orig == "USD"
+        assert transaction.fx_rate == Decimal("5.52")
+
+
+class TestLineClassifier:
+    """Test the single-pass catalogue classifier."""
+
+    def test_first_matching_rule_wins(self):
+        """A line gets the kind and groups of the first rule it matches."""
+        classifier = LineClassifier(ITAU_LINE_RULES, features=ITAU_FEATURES)
+
+        match = classifier.classify("28/09 FARMACIA SAO JOAO 12,50")
+
+        assert match.kind == "posting_national"
+        assert match.groups == {"date": "28/09", "desc": "FARMACIA SAO JOAO", "amount": "12,50"}
+        assert match.features == {"dated"}
+        assert not classifier.classify("texto solto")
+        assert classifier.hits == {"posting_national": 1, "other": 1, "feature:dated": 1}
+
+    def test_keyword_sets_match_any_keyword(self):
+        """Keyword lookups agree with a plain substring scan."""
+        classifier = LineClassifier([], keyword_sets={"summary": ["total", "saldo anterior"]})
+
+        assert classifier.has_keyword("summary", "saldo anterior da fatura")
+        assert not classifier.has_keyword("summary", "farmacia")
+
+    def test_classify_row(self):
+        """Rows are bucketed by summary keywords, then by a leading date."""
+        assert classify_row("Total dos lançamentos atuais 1.234,56") == "summary"
+        assert classify_row("28/09 FARMACIA 12,50") == "transaction"
+        assert classify_row("texto solto") == "noise"
@@ -0,0 +1,128 @@
+"""Tests for batched ML inference in the enrichment models."""
+
+import copy
+from datetime import date
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from src.core.models import Transaction
+from src.core.transaction_batch import TransactionBatch
+from src.enrichment.ml_enricher import MLEnricher
+from src.ml.models.category_classifier import CategoryClassifier
+from src.ml.models.fx_predictor import FXRatePredictor
+from src.ml.models.merchant_extractor import MerchantCityExtractor
+
+DESCRIPTIONS = [
+    "PADARIA SAO JOSE",
+    "PADARIA CENTRAL",
+    "POSTO SHELL SAO PAULO",
+    "POSTO IPIRANGA",
+    "DROGARIA SAO PAULO",
+    "DROGA RAIA",
+    "NETFLIX.COM",
+    "SPOTIFY BR",
+]
+CATEGORIES = ["ALIMENTACAO", "ALIMENTACAO", "VEICULOS", "VEICULOS", "SAUDE", "SAUDE", "LAZER", "LAZER"]
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    classifier = CategoryClassifier()
+    classifier.train(
+        pd.DataFrame({"description_text": DESCRIPTIONS * 5, "target_category": CATEGORIES * 5})
+    )
+    return classifier
+
+
+def test_category_batch_matches_per_row(classifier):
+    """One predict_proba call gives each row's predict label and confidence."""
+    descriptions = DESCRIPTIONS + ["PADARIA NOVA", ""]
+
+    expected = [
+        (classifier.predict([d])[0], classifier.get_confidence([d])[0]) for d in descriptions
+    ]
+
+    assert classifier.predict_batch(descriptions) == pytest.approx(expected)
+    assert classifier.predict_batch([]) == []
+
+
+def test_fx_batch_prefers_reasonable_implied_rate():
+    """Implied rates win with high confidence; the rest fall back to the model."""
+    predictor = FXRatePredictor()  # untrained: currency-average fallback
+
+    predictions = predictor.predict_batch(
+        [54.0, 10.0, 0.0], [10.0, 10.0, 0.0], ["USD", "USD", "EUR"], ["AMAZON", "", ""]
+    )
+
+    assert predictions == [(pytest.approx(5.4), 0.95), (5.2, 0.5), (5.8, 0.5)]
+    assert predictions[0] == predictor.predict_single(54.0, 10.0, "USD", "AMAZON")
+
+
+def test_merchant_batch_matches_per_row():
+    extractor = MerchantCityExtractor()
+    descriptions = DESCRIPTIONS + DESCRIPTIONS[:3]
+
+    assert extractor.extract_batch(descriptions) == [
+        extractor.extract_merchant_and_city(d) for d in descriptions
+    ]
+
+
+def test_enricher_batch_matches_per_row(tmp_path, classifier):
+    """Routing through the batch APIs fills the same fields as row by row."""
+    enricher = MLEnricher(models_dir=tmp_path)  # no models on disk
+    enricher.category_classifier = classifier
+    enricher.merchant_extractor = MerchantCityExtractor()
+    enricher.fx_predictor = FXRatePredictor()
+    transactions = [
+        Transaction(date(2024, 10, i + 1), description, Decimal("10.00"), category="")
+        for i, description in enumerate(DESCRIPTIONS)
+    ]
+    transactions.append(
+        Transaction(
+            date(2024, 10, 20),
+            "AMAZON US",
+            Decimal("54.00"),
+            currency_orig="USD",
+            amount_orig=Decimal("10.00"),
+        )
+    )
+    row_by_row = copy.deepcopy(transactions)
+
+    enricher.enrich_transactions(transactions)
+    for transaction in row_by_row:
+        enricher.enrich_transaction(transaction)
+
+    assert transactions == row_by_row
+    assert all(t.category for t in transactions)
+
+
+def test_enricher_columns_match_rows(tmp_path, classifier):
+    """The columnar path fills the same fields without building rows."""
+    enricher = MLEnricher(models_dir=tmp_path)  # no models on disk
+    enricher.category_classifier = classifier
+    enricher.merchant_extractor = MerchantCityExtractor()
+    enricher.fx_predictor = FXRatePredictor()
+    transactions = [
+        Transaction(date(2024, 10, i + 1), description, Decimal("10.00"), category="")
+        for i, description in enumerate(DESCRIPTIONS)
+    ]
+    transactions[0].category = "FIXED"
+    transactions.append(
+        Transaction(
+            date(2024, 10, 20),
+            "AMAZON US",
+            Decimal("54.00"),
+            currency_orig="EUR",
+            amount_orig=Decimal("10.00"),
+        )
+    )
+    batch = TransactionBatch.from_transactions(transactions)
+
+    enriched = enricher.enrich_batch(batch)
+    enricher.enrich_transactions(transactions)
+
+    assert enriched.to_transactions() == TransactionBatch.from_transactions(transactions).to_transactions()
+    assert enriched.column("category")[0].as_py() == "FIXED"
+    assert enriched.column("fx_rate")[8].as_py() > 0 and enriched.column("amount_usd")[8].as_py() > 0
@@ -0,0 +1,71 @@
+"""Tests for the process-wide model registry."""
+
+import json
+import os
+
+import joblib
+import numpy as np
+
+from src.enrichment.ml_enricher import MLEnricher
+from src.ml.model_registry import ModelRegistry, load_json
+
+
+def _counting_loader(calls):
+    def loader(path):
+        calls.append(path)
+        return load_json(path)
+
+    return loader
+
+
+def test_artifact_loads_once_until_content_changes(tmp_path):
+    """A touched but identical file is not reloaded; new content is."""
+    registry = ModelRegistry()
+    path = tmp_path / "patterns.json"
+    path.write_text(json.dumps({"cities": ["CURITIBA"]}))
+    calls = []
+    loader = _counting_loader(calls)
+
+    assert registry.get(path, loader) is registry.get(path, loader)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert registry.generation(path) == 1
+    assert len(calls) == 1
+
+    path.write_text(json.dumps({"cities": ["CURITIBA", "RECIFE"]}))
+    assert registry.get(path, loader) == {"cities": ["CURITIBA", "RECIFE"]}
+    assert registry.generation(path) == 2
+    assert len(calls) == 2
+
+    (entry,) = registry.stats()
+    assert entry.path == path.resolve()
+    assert entry.load_seconds >= 0 and len(entry.sha256) == 64
+
+
+def test_joblib_arrays_are_memory_mapped(tmp_path):
+    """Uncompressed joblib arrays come back as read-only memory maps."""
+    path = tmp_path / "model.joblib"
+    joblib.dump({"weights": np.arange(1000.0)}, path)
+
+    weights = ModelRegistry().get(path)["weights"]
+
+    assert isinstance(weights, np.memmap)
+    assert not weights.flags.writeable
+    assert weights[999] == 999.0
+
+
+def test_enricher_reloads_changed_artifacts(tmp_path):
+    """Every enricher shares one load; a retrained artifact is picked up."""
+    path = tmp_path / "merchant_patterns.json"
+    patterns = {"brazilian_cities": ["CURITIBA"], "common_merchants": [], "is_trained": True}
+    path.write_text(json.dumps(patterns))
+
+    first, second = MLEnricher(models_dir=tmp_path), MLEnricher(models_dir=tmp_path)
+    assert first.merchant_extractor.brazilian_cities == {"CURITIBA"}
+    assert not second.refresh_models()
+
+    path.write_text(json.dumps({**patterns, "brazilian_cities": ["CURITIBA", "RECIFE"]}))
+
+    assert first.refresh_models()
+    assert first.merchant_extractor.brazilian_cities == {"CURITIBA", "RECIFE"}
+    assert second.refresh_models()
@@ -0,0 +1,107 @@
+"""Tests for the scalar and batch Brazilian amount/date parsers."""
+
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from src.core.normalise import (
+    StatementPeriod,
+    parse_amount,
+    parse_amounts,
+    parse_date,
+    parse_dates,
+)
+from src.ml.training_data_prep import TrainingDataPreparator
+
+AMOUNTS = [
+    "1.234,56", "1,234.56", "156,78", "156.78", "R$ -1.234,56", "- 1.234,56",
+    "1.234,56-", "1.234.567", "1,234,567", "12,3456", "0", "170.50",
+    "", ",", "abc", None,
+]
+
+DATES = [
+    "2024-3-5", "03/10", "1/1/24", "15/03/2024 extra", "25/12", "05/01",
+    "31/02/2024", "13/13", "x", "", None,
+]
+
+
+class TestScalar:
+    """Test the scalar path."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("1.234,56", "1234.56"),
+            ("1,234.56", "1234.56"),
+            ("156,78", "156.78"),
+            ("156.78", "156.78"),
+            ("R$ -1.234,56", "-1234.56"),
+            ("1.234.567", "1234567"),
+            ("", None),
+            ("abc", None),
+        ],
+    )
+    def test_parse_amount(self, text, expected):
+        """Brazilian and US separators both parse."""
+        assert parse_amount(text) == (None if expected is None else Decimal(expected))
+
+    def test_year_comes_from_statement_period(self):
+        """DD/MM dates after the closing month belong to the previous year."""
+        period = StatementPeriod(2025, 1)
+
+        assert parse_date("25/12", period) == date(2024, 12, 25)
+        assert parse_date("05/01", period) == date(2025, 1, 5)
+        assert parse_date("05/01/2023", period) == date(2023, 1, 5)
+        assert parse_date("31/02", period) is None
+
+    def test_period_from_name(self):
+        """File stems name their statement period."""
+        assert StatementPeriod.from_name("golden_2024-10") == StatementPeriod(2024, 10)
+        assert StatementPeriod.from_name("statement") is None
+
+
+class TestBatch:
+    """Test the batch path against the scalar path."""
+
+    @pytest.mark.parametrize("wrap", [list, pa.array, lambda v: np.array([x or "" for x in v])])
+    def test_amounts_match_scalar(self, wrap):
+        """Every input kind parses like the scalar path."""
+        parsed = parse_amounts(wrap(AMOUNTS))
+
+        assert parsed.type == pa.decimal128(38, 10)
+        assert parsed.to_pylist() == [parse_amount(text) for text in AMOUNTS]
+
+    def test_dates_match_scalar(self):
+        """Dates parse like the scalar path for a given period."""
+        period = StatementPeriod(2025, 1)
+        parsed = parse_dates(pa.array(DATES), period)
+
+        assert parsed.type == pa.date32()
+        assert parsed.to_pylist() == [parse_date(text, period) for text in DATES]
+
+    def test_period_inferred_from_column(self):
+        """Without a period, the latest full date closes the statement."""
+        parsed = parse_dates(["25/12", "05/01", "2025-01-20"])
+
+        assert parsed.to_pylist() == [date(2024, 12, 25), date(2025, 1, 5), date(2025, 1, 20)]
+
+
+def test_training_prep_loads_golden_columns(tmp_path):
+    """Golden CSVs load through the batch path with the row rules."""
+    golden = tmp_path / "golden_2025-01.csv"
+    golden.write_text(
+        "post_date;desc_raw;amount_brl;installment_seq;installment_tot;currency_orig;fx_rate\n"
+        "28/12;LOJA A;1.234,56;0;0;;0\n"
+        "2025-01-05;LOJA B;49.90;2;10;USD;5,1234\n"
+        ";SEM DATA;1,00;;;;\n"
+    )
+    transactions = TrainingDataPreparator().load_golden_transactions(golden)
+
+    assert [t.date for t in transactions] == [date(2024, 12, 28), date(2025, 1, 5)]
+    assert [t.amount_brl for t in transactions] == [Decimal("1234.56"), Decimal("49.90")]
+    assert [(t.installment_seq, t.installment_tot) for t in transactions] == [(1, 1), (2, 10)]
+    assert [t.currency_orig for t in transactions] == ["BRL", "USD"]
+    assert transactions[1].fx_rate == Decimal("5.1234")
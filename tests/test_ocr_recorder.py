@@ -0,0 +1,60 @@
+"""Tests for the cloud OCR record/replay layer."""
+
+from decimal import Decimal
+
+import pytest
+
+from src.core.document_session import get_document_session
+from src.core.ocr_recorder import OCRRecorder, RecordingNotFoundError
+from src.extractors.textract_extractor import TEXTRACT_FEATURE_TYPES, TextractExtractor
+
+
+class TestOCRRecorder:
+    """Test OCRRecorder modes."""
+
+    def test_record_then_replay_without_live_call(self, tmp_path):
+        """A recorded response is served back in replay mode."""
+        params = {"model_id": "prebuilt-layout"}
+        recorder = OCRRecorder(tmp_path, mode="record")
+        recorder.call("azure", "abc", params, lambda: {"pages": [1, 2]})
+
+        def live():
+            raise AssertionError("replay must not call the service")
+
+        replayer = OCRRecorder(tmp_path, mode="replay")
+
+        assert replayer.call("azure", "abc", params, live) == {"pages": [1, 2]}
+        with pytest.raises(RecordingNotFoundError):
+            replayer.call("azure", "abc", {"model_id": "prebuilt-read"}, live)
+
+    def test_passthrough_stores_nothing(self, tmp_path):
+        """Passthrough calls the service and leaves the store empty."""
+        recorder = OCRRecorder(tmp_path, mode="passthrough")
+
+        assert recorder.call("textract", "abc", {}, lambda: "live") == "live"
+        assert not any(tmp_path.iterdir())
+
+    def test_textract_replays_offline(self, tmp_path, sample_pdf_path):
+        """Textract parses a recorded response with no client or bucket."""
+        content_hash = get_document_session(sample_pdf_path).content_hash
+        params = {"FeatureTypes": TEXTRACT_FEATURE_TYPES}
+        response = {
+            "Blocks": [
+                {"BlockType": "PAGE", "Id": "p1"},
+                {"BlockType": "LINE", "Id": "l1", "Text": "28/09 FARMACIA 12,50"},
+            ]
+        }
+        OCRRecorder(tmp_path, mode="record").call(
+            "textract", content_hash, params, lambda: response
+        )
+
+        extractor = TextractExtractor()
+        extractor.textract = None
+        extractor.recorder = OCRRecorder(tmp_path, mode="replay")
+        extractor._save_individual_outputs = lambda *args: None
+
+        result = extractor.extract(sample_pdf_path)
+
+        assert result.error_message is None
+        assert [t.amount_brl for t in result.transactions] == [Decimal("12.50")]
+        assert result.page_count == 1
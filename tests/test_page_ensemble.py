@@ -0,0 +1,73 @@
+"""Tests for per-page reconciliation and stitching."""
+
+from datetime import date
+from decimal import Decimal
+
+from src.core.models import ExtractorType, PageResult, PipelineResult, Transaction
+from src.merger.page_ensemble import failing_pages, page_ranges, stitch
+
+
+def _page(index, *amounts, confidence=0.9, error=None):
+    transactions = [Transaction(date(2024, 10, 1), "LOJA", Decimal(a)) for a in amounts]
+    return PageResult(index, index + 1, transactions, confidence, error)
+
+
+def _result(extractor_type, pages, confidence=0.9):
+    return PipelineResult(
+        [t for page in pages for t in page.transactions],
+        confidence,
+        extractor_type,
+        1.0,
+        page_count=len(pages),
+        page_results=pages,
+    )
+
+
+def test_failing_pages_flags_disagreement_and_unread_pages():
+    pymupdf = _result(
+        ExtractorType.PYMUPDF, [_page(0, "1.00"), _page(1, "2.00"), _page(2, error="no text layer")]
+    )
+    pdfplumber = _result(
+        ExtractorType.PDFPLUMBER,
+        [_page(0, "1.00"), _page(1, "2.50"), _page(2, error="no text layer")],
+    )
+
+    assert failing_pages([pymupdf, pdfplumber], 3, 0.8) == [1, 2]
+
+
+def test_single_engine_pages_need_confidence():
+    result = _result(
+        ExtractorType.PYMUPDF, [_page(0, "1.00", confidence=0.5), _page(1), _page(2, "3.00")]
+    )
+
+    # A page without postings (cover, summary) has nothing to get wrong
+    assert failing_pages([result], 3, 0.8) == [0]
+
+
+def test_results_without_pages_fail_everything():
+    camelot = PipelineResult([], 0.9, ExtractorType.CAMELOT, 1.0, page_count=2)
+
+    assert failing_pages([camelot], 2, 0.8) == [0, 1]
+
+
+def test_page_ranges_merge_contiguous_pages():
+    assert page_ranges([7, 2, 3, 4, 0]) == [(0, 1), (2, 5), (7, 8)]
+    assert page_ranges([]) == []
+
+
+def test_stitch_replaces_ranges_and_keeps_best_local_pages():
+    pymupdf = _result(ExtractorType.PYMUPDF, [_page(0, "1.00", confidence=0.7), _page(1, "2.00")])
+    pdfplumber = _result(
+        ExtractorType.PDFPLUMBER, [_page(0, "1.00", confidence=0.8), _page(1, "2.50")]
+    )
+    textract = _result(ExtractorType.TEXTRACT, [_page(0, "2.25")], confidence=0.95)
+    failed = PipelineResult([], 0.0, ExtractorType.TEXTRACT, 1.0, error_message="timeout")
+
+    stitched = stitch(
+        [pymupdf, pdfplumber], [(1, 2, textract), (2, 3, failed)], 3, ExtractorType.TEXTRACT
+    )
+
+    assert [t.amount_brl for t in stitched.transactions] == [Decimal("1.00"), Decimal("2.25")]
+    assert stitched.raw_data["page_sources"] == {0: "pdfplumber", 1: "textract"}
+    assert stitched.confidence_score == 0.95
+    assert stitched.page_results[-1].error_message == "no engine read this page"
@@ -0,0 +1,118 @@
+"""Tests for the persistent cache of model predictions."""
+
+import json
+
+import pandas as pd
+
+from src.core.metrics import get_metrics
+from src.enrichment.ml_enricher import MLEnricher
+from src.ml.models.category_classifier import CategoryClassifier
+from src.ml.models.merchant_extractor import MerchantCityExtractor
+from src.ml.prediction_cache import PredictionCache, model_version
+from src.ml.vocabulary_matcher import VocabularyMatcher
+
+
+def test_memory_then_disk_hits(tmp_path):
+    """Entries survive a new process through the SQLite tier."""
+    path = tmp_path / "predictions.sqlite"
+    cache = PredictionCache(path)
+    cache.put_many("category", "v1", {"PADARIA": ["ALIMENTACAO", 0.9]})
+
+    assert cache.get_many("category", "v1", ["PADARIA", "POSTO"]) == {"PADARIA": ["ALIMENTACAO", 0.9]}
+    assert cache.stats["category"] == {"memory_hits": 1, "disk_hits": 0, "misses": 1}
+
+    fresh = PredictionCache(path)
+    assert fresh.get_many("category", "v1", ["PADARIA"]) == {"PADARIA": ["ALIMENTACAO", 0.9]}
+    assert fresh.stats["category"]["disk_hits"] == 1
+    assert fresh.hit_rate("category") == 1.0
+
+
+def test_new_version_drops_old_predictions(tmp_path):
+    """A retrained model never sees its predecessor's predictions."""
+    path = tmp_path / "predictions.sqlite"
+    cache = PredictionCache(path)
+    cache.put_many("category", "v1", {"PADARIA": ["ALIMENTACAO", 0.9]})
+    cache.put_many("merchant_city", "v1", {"PADARIA": ["PADARIA", None]})
+
+    assert cache.get_many("category", "v2", ["PADARIA"]) == {}
+    assert cache.get_many("category", "v1", ["PADARIA"]) == {}
+    assert PredictionCache(path).get_many("merchant_city", "v1", ["PADARIA"]) == {
+        "PADARIA": ["PADARIA", None]
+    }
+
+
+def test_version_covers_helper_sources():
+    """Code the model calls into versions its predictions too."""
+    sha = "0" * 64
+    merchant = model_version(sha, MerchantCityExtractor, VocabularyMatcher)
+
+    assert merchant != model_version(sha, MerchantCityExtractor)
+    assert merchant == model_version(sha, MerchantCityExtractor, VocabularyMatcher)
+    assert merchant != model_version("1" * 64, MerchantCityExtractor, VocabularyMatcher)
+
+
+def test_memory_tier_is_bounded(tmp_path):
+    cache = PredictionCache(tmp_path / "predictions.sqlite", max_entries=2)
+    cache.put_many("category", "v1", {"A": 1, "B": 2, "C": 3})
+
+    assert cache.get_many("category", "v1", ["A", "B", "C"]) == {"A": 1, "B": 2, "C": 3}
+    assert cache.stats["category"] == {"memory_hits": 2, "disk_hits": 1, "misses": 0}
+
+
+def test_unwritable_store_falls_back_to_memory(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = PredictionCache(blocker / "predictions.sqlite")
+    cache.put_many("category", "v1", {"A": 1})
+
+    assert cache.get_many("category", "v1", ["A"]) == {"A": 1}
+
+
+def test_classifier_predicts_only_uncached_descriptions(tmp_path):
+    """Cached predictions equal fresh ones and skip the model."""
+    classifier = CategoryClassifier()
+    classifier.train(
+        pd.DataFrame({
+            "description_text": ["PADARIA SAO JOSE", "POSTO SHELL", "DROGA RAIA"] * 5,
+            "target_category": ["ALIMENTACAO", "VEICULOS", "SAUDE"] * 5,
+        })
+    )
+    uncached = classifier.predict_batch(["PADARIA NOVA", "POSTO SHELL"])
+
+    classifier.model_version = model_version("0" * 64, CategoryClassifier)
+    classifier.prediction_cache = PredictionCache(tmp_path / "predictions.sqlite")
+    assert classifier.predict_batch(["PADARIA NOVA", "POSTO SHELL"]) == uncached
+    classifier.pipeline = None  # any model call would now fail
+    assert classifier.predict_batch(["PADARIA NOVA", "POSTO SHELL", "posto  shell"]) == [
+        *uncached,
+        uncached[1],
+    ]
+    assert classifier.prediction_cache.stats["category"]["misses"] == 2
+
+
+def test_enricher_records_cache_hit_rate(tmp_path):
+    """A second enrichment of the same descriptions is served from the cache."""
+    from datetime import date
+    from decimal import Decimal
+
+    from src.core.models import Transaction
+
+    patterns = {"brazilian_cities": ["CURITIBA"], "common_merchants": [], "is_trained": True}
+    (tmp_path / "merchant_patterns.json").write_text(json.dumps(patterns))
+    enricher = MLEnricher(tmp_path, prediction_cache=PredictionCache(tmp_path / "predictions.sqlite"))
+    assert isinstance(enricher.merchant_extractor, MerchantCityExtractor)
+
+    def statement():
+        return [
+            Transaction(date=date(2024, 10, 1), description=f"PADARIA {i} CURITIBA",
+                        amount_brl=Decimal("10.00"))
+            for i in range(4)
+        ]
+
+    get_metrics().reset()
+    enricher.enrich_transactions(statement())
+    enricher.enrich_transactions(statement())
+
+    stats = get_metrics().get_summary()["prediction_cache"]["merchant_city"]
+    assert (stats["hits"], stats["misses"]) == (4, 4)
+    assert stats["hit_rate"] == 0.5
@@ -0,0 +1,52 @@
+"""Tests for the PyMuPDF text backend."""
+
+from datetime import date
+
+import pytest
+
+from src.core.document_session import DocumentSession
+from src.core.models import ExtractorType
+from src.extractors.line_pipeline import ItauLineParser
+from src.extractors.pdfplumber_extractor import PdfplumberExtractor
+from src.extractors.pymupdf_extractor import PyMuPDFExtractor, words_to_text
+
+
+def test_words_to_text_clusters_visual_lines():
+    """Words within the y tolerance share a line and are read left to right."""
+    words = [
+        (200.0, 101.5, 230.0, 110.0, "12,50", 0, 0, 2),
+        (10.0, 100.0, 40.0, 110.0, "28/09", 0, 0, 0),
+        (50.0, 100.4, 120.0, 110.0, "FARMACIA", 1, 0, 0),
+        (10.0, 120.0, 40.0, 130.0, "30/09", 0, 1, 0),
+    ]
+
+    assert words_to_text(words) == "28/09 FARMACIA 12,50\n30/09"
+
+
+def test_extract_matches_pdfplumber_parse(sample_pdf_path):
+    """PyMuPDF text feeds the shared line parser to the same amounts."""
+    result = PyMuPDFExtractor().extract(sample_pdf_path)
+    session = DocumentSession.from_path(sample_pdf_path)
+    expected = ItauLineParser(ExtractorType.PDFPLUMBER).parse_lines(session.lines)
+
+    assert result.success
+    assert result.pipeline_name == ExtractorType.PYMUPDF
+    assert result.page_count == session.page_count
+    assert sorted(t.amount_brl for t in result.transactions) == sorted(
+        t.amount_brl for t in expected
+    )
+
+
+@pytest.mark.parametrize("extractor", [PyMuPDFExtractor, PdfplumberExtractor])
+def test_dates_fall_in_statement_year(extractor, sample_pdf_path, tmp_path):
+    """DD/MM postings take their year from the statement, not the clock."""
+    # A neutral file name: the period has to come from the due date in the text
+    pdf_path = tmp_path / "statement.pdf"
+    pdf_path.write_bytes(sample_pdf_path.read_bytes())
+
+    result = extractor().extract(pdf_path)
+
+    assert result.transactions
+    # The 2024-10 statement lists postings from 2023-11 through 2024-10
+    assert all(date(2023, 11, 1) <= t.date <= date(2024, 10, 31) for t in result.transactions)
+    assert sum(t.date.year == 2024 for t in result.transactions) > len(result.transactions) / 2
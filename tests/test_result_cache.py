@@ -0,0 +1,55 @@
+"""Tests for the on-disk extractor result cache."""
+
+import os
+
+from src.core.models import ExtractorType, PipelineResult
+from src.core.result_cache import ResultCache, extractor_version
+from src.extractors.pymupdf_extractor import PyMuPDFExtractor
+
+
+def _result(payload: str = "") -> PipelineResult:
+    return PipelineResult(
+        transactions=[],
+        confidence_score=0.5,
+        pipeline_name=ExtractorType.PYMUPDF,
+        processing_time_ms=12.0,
+        raw_data={"raw_text": payload},
+    )
+
+
+class TestResultCache:
+    """Test ResultCache keys, round trips and eviction."""
+
+    def test_round_trip_keeps_raw_data(self, tmp_path):
+        """A stored result comes back with its raw data."""
+        cache = ResultCache(tmp_path)
+        key = ResultCache.make_key("abc", ExtractorType.PYMUPDF, "v1")
+
+        assert cache.get(key) is None
+        cache.put(key, _result("page text"))
+
+        assert cache.get(key).raw_data == {"raw_text": "page text"}
+        assert key != ResultCache.make_key("abc", ExtractorType.PDFPLUMBER, "v1")
+        assert key != ResultCache.make_key("abc", ExtractorType.PYMUPDF, "v2")
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Past the size bound, the entry read longest ago is dropped first."""
+        cache = ResultCache(tmp_path, max_bytes=10**9)
+        keys = [ResultCache.make_key(str(i), ExtractorType.PYMUPDF, "v") for i in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, _result("x" * 1000))
+            path = cache._path(key)
+            os.utime(path, (1000 + age, 1000 + age))
+        cache.get(keys[0])
+
+        cache.max_bytes = 2 * cache._path(keys[0]).stat().st_size
+        cache._evict()
+
+        assert [cache.get(key) is not None for key in keys] == [True, False, True]
+
+    def test_extractor_version_is_stable(self):
+        """The version hash is deterministic for an extractor class."""
+        version = extractor_version(PyMuPDFExtractor())
+
+        assert version == extractor_version(PyMuPDFExtractor())
+        assert len(version) == 16
@@ -0,0 +1,199 @@
+"""Tests for the columnar TransactionBatch and the batch-native stages."""
+
+import asyncio
+from dataclasses import fields
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pyarrow as pa
+
+from src.core.models import EnsembleResult, ExtractorType, Transaction
+from src.core.transaction_batch import COLUMNS, TRANSACTION_SCHEMA, TransactionBatch
+from src.enrichment.iof_calculator import IOFCalculator
+from src.enrichment.metadata_enricher import MetadataEnricher
+from src.enrichment.pdf_validator import PDFValidator
+from src.utils.csv_helpers import write_golden_csv
+from src.validators.cell_accuracy_analyzer import CellAccuracyAnalyzer
+from src.validators.semantic_compare import SemanticComparator
+
+
+def _transactions():
+    return [
+        Transaction(
+            date=date(2024, 10, 1) + timedelta(days=i),
+            description=f"LOJA {i} DE TESTE",
+            amount_brl=Decimal("12.35") * i - Decimal("3.10"),
+            card_last4="1234" if i % 2 else None,
+            fx_rate=Decimal("5.1234") if i % 3 == 0 else Decimal("0.00"),
+            currency_orig="USD" if i % 3 == 0 else "",
+            amount_orig=Decimal("2.50") if i % 3 == 0 else Decimal("0.00"),
+            source_extractor=ExtractorType.PDFPLUMBER,
+            bbox=(1.0, 2.0, 3.0, 4.0) if i == 2 else None,
+        )
+        for i in range(6)
+    ]
+
+
+class TestTransactionBatch:
+    """Test conversions between rows, Arrow and Polars."""
+
+    def test_schema_follows_transaction_fields(self):
+        """Columns map positionally onto the dataclass."""
+        assert COLUMNS == tuple(f.name for f in fields(Transaction))
+
+    def test_round_trip_through_rows(self):
+        """Rows survive a trip through the batch unchanged."""
+        transactions = _transactions()
+        batch = TransactionBatch.from_transactions(transactions)
+
+        assert len(batch) == 6
+        assert batch.to_transactions() == transactions
+        assert batch.total_amount_brl == sum(t.amount_brl for t in transactions)
+        assert TransactionBatch.from_transactions([]).to_transactions() == []
+
+    def test_arrow_is_zero_copy(self):
+        """Arrow in and out hands back the same table."""
+        table = TransactionBatch.from_transactions(_transactions()).to_arrow()
+
+        assert table.schema == TRANSACTION_SCHEMA
+        assert TransactionBatch.from_arrow(table).to_arrow() is table
+
+    def test_missing_optional_columns_take_defaults(self):
+        """A minimal table is filled in with the model defaults."""
+        table = pa.table(
+            {
+                "date": [date(2024, 10, 1)],
+                "description": ["X"],
+                "amount_brl": [Decimal("1.50")],
+            }
+        )
+        (transaction,) = TransactionBatch.from_arrow(table).to_transactions()
+
+        assert transaction == Transaction(date(2024, 10, 1), "X", Decimal("1.50"))
+
+    def test_replace_rows(self):
+        """Replaced rows land at their indices; the rest keep their order."""
+        batch = TransactionBatch.from_transactions(_transactions())
+        replaced = batch.replace_rows([4, 1], batch.take([0, 5]))
+
+        descriptions = [t.description for t in replaced.to_transactions()]
+        assert descriptions == [
+            "LOJA 0 DE TESTE",
+            "LOJA 5 DE TESTE",
+            "LOJA 2 DE TESTE",
+            "LOJA 3 DE TESTE",
+            "LOJA 0 DE TESTE",
+            "LOJA 5 DE TESTE",
+        ]
+
+
+class TestBatchStages:
+    """Test batch-native stages against their row counterparts."""
+
+    def test_golden_csv_matches_row_writer(self, tmp_path):
+        """Both writers produce the same bytes."""
+        transactions = _transactions()
+        write_golden_csv(transactions, tmp_path / "rows.csv")
+        write_golden_csv(TransactionBatch.from_transactions(transactions), tmp_path / "batch.csv")
+
+        assert (tmp_path / "rows.csv").read_text() == (tmp_path / "batch.csv").read_text()
+
+    def test_enrichers_fill_nulls(self):
+        """IOF and metadata enrichers fill missing cells only."""
+        table = TransactionBatch.from_transactions(_transactions()).to_arrow()
+        for name in ("iof_brl", "installment_seq", "currency_orig", "amount_usd"):
+            index = table.schema.get_field_index(name)
+            table = table.set_column(index, name, pa.nulls(table.num_rows, table.schema.field(name).type))
+        batch = MetadataEnricher().enrich_batch(IOFCalculator().enrich_batch(TransactionBatch.from_arrow(table)))
+
+        rows = batch.to_transactions()
+        # Currency was nulled too, so every row is taxed as national
+        assert rows[0].iof_brl == Decimal("3.10") * Decimal("0.0038")
+        assert rows[1].iof_brl == rows[1].amount_brl * Decimal("0.0038")
+        assert [t.installment_seq for t in rows] == [1] * 6
+        assert rows[3].currency_orig == "BRL"
+        assert abs(rows[3].amount_usd - rows[3].amount_brl / Decimal("5.1234")) < Decimal("1e-9")
+        assert rows[1].amount_usd is None
+
+    def test_batch_enrichment_matches_rows(self):
+        """Columnar enrichment leaves the same transactions, totals and completeness."""
+        from src.enrichment.pipeline import EnrichmentPipeline
+
+        pipeline = EnrichmentPipeline()
+        text = "TOTAL NACIONAL R$ 40,00\n"
+
+        rows = asyncio.run(
+            pipeline.enrich_extraction_result(
+                EnsembleResult(_transactions(), [], 0.5, [], "test", 0), pdf_text=text
+            )
+        )
+        batch = asyncio.run(
+            pipeline.enrich_batch(TransactionBatch.from_transactions(_transactions()), pdf_text=text)
+        )
+
+        assert batch.to_transactions() == rows.final_transactions
+        assert pipeline.pdf_validator.validate_batch_totals(batch, text) == rows.validation_metrics
+        assert pipeline._batch_completeness(batch) == pipeline._enrichment_completeness(
+            rows.final_transactions
+        )
+
+    def test_pdf_totals_match_rows(self):
+        """Batch totals validate the same as row totals."""
+        transactions = _transactions()
+        text = "TOTAL NACIONAL R$ 40,00 TOTAL INTERNACIONAL R$ 34,00"
+        result = EnsembleResult(transactions, [], 1.0, [], "test", 0)
+
+        validator = PDFValidator()
+        assert validator.validate_batch_totals(
+            TransactionBatch.from_transactions(transactions), text
+        ) == validator.validate_totals(result, text)
+
+    def test_semantic_compare_matches_rows(self):
+        """Batch comparison reports the same metrics and mismatches."""
+        golden = _transactions()
+        extracted = golden[:4] + [
+            Transaction(golden[4].date, "LOJA 4 TESTE X", golden[4].amount_brl + Decimal("0.50")),
+            Transaction(date(2024, 12, 1), "OUTRA", Decimal("9.99")),
+        ]
+
+        comparator = SemanticComparator(description_similarity_threshold=0.5)
+        rows = comparator.compare_transactions(extracted, golden)
+        batch = comparator.compare_batches(
+            TransactionBatch.from_transactions(extracted),
+            TransactionBatch.from_transactions(golden),
+        )
+        assert batch == rows
+
+    def test_cell_accuracy_matches_rows(self, tmp_path):
+        """Batch health report agrees with the row report."""
+        golden_csv = tmp_path / "golden.csv"
+        golden_csv.write_text(
+            "post_date;desc_raw;amount_brl;category;currency_orig;merchant_city;fx_rate;card_last4\n"
+            "2024-10-01;LOJA 0 DE TESTE;-3,10;A;BRL;SAO PAULO;0;1234\n"
+            "2024-10-02;LOJA 1 DE TESTE;9,25;A;BRL;SAO PAULO;0;1234\n"
+            "2024-10-02;LOJA 1 DE TESTE;9,25;B;USD;RIO;5.12;1234\n"
+            "2024-10-09;NAO EXTRAIDA;1,00;A;BRL;RIO;0;1234\n"
+        )
+        extracted = [
+            Transaction(date(2024, 10, 1), "LOJA 0 DE TESTE", Decimal("-3.10"), category="a",
+                        currency_orig="BRL", merchant_city="SAO PAULO", card_last4="1234"),
+            Transaction(date(2024, 10, 2), "LOJA 1", Decimal("9.25"), category="A",
+                        currency_orig="BRL", merchant_city="SAO PA", card_last4="9999"),
+            Transaction(date(2024, 10, 5), "EXTRA", Decimal("7.00"), category="A",
+                        currency_orig="BRL", merchant_city="RIO", card_last4="1234"),
+        ]
+
+        analyzer = CellAccuracyAnalyzer()
+        rows = analyzer.analyze_extraction_health(extracted, golden_csv, "x", "x.pdf")
+        batch = analyzer.analyze_batch_health(
+            TransactionBatch.from_transactions(extracted), golden_csv, "x", "x.pdf"
+        )
+
+        assert batch.overall_accuracy == rows.overall_accuracy
+        assert batch.health_grade == rows.health_grade
+        assert batch.transaction_level_f1 == rows.transaction_level_f1
+        for name, expected in rows.field_accuracies.items():
+            actual = batch.field_accuracies[name]
+            assert (actual.correct_cells, actual.incorrect_cells, actual.missing_cells, actual.extra_cells) == (
+                expected.correct_cells, expected.incorrect_cells, expected.missing_cells, expected.extra_cells
+            )
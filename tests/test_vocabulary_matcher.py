@@ -0,0 +1,56 @@
+"""Tests for the Aho-Corasick vocabulary matcher."""
+
+import random
+
+from src.ml.models.merchant_extractor import MerchantCityExtractor
+from src.ml.vocabulary_matcher import VocabularyMatcher
+
+
+def _brute_force_longest(terms, text):
+    """Reference: scan every term, keep the longest (leftmost on ties)."""
+    best = None
+    for term in terms:
+        position = text.find(term)
+        if position < 0:
+            continue
+        key = (-len(term), position + len(term))
+        if best is None or key < best[0]:
+            best = (key, term)
+    return best[1] if best else None
+
+
+def test_longest_overlapping_term_wins():
+    matcher = VocabularyMatcher(["SAO JOSE", "SAO JOSE DOS CAMPOS", "JOSE", "CAMPOS", ""])
+
+    assert len(matcher) == 4
+    assert matcher.longest("PADARIA SAO JOSE DOS CAMPOS 01") == "SAO JOSE DOS CAMPOS"
+    assert matcher.longest("POSTO SAO JOSE") == "SAO JOSE"
+    assert matcher.longest("SAO JOSAO JOSE") == "SAO JOSE"  # needs a failure link
+    assert matcher.longest("CAMPOS JOSE") == "CAMPOS"
+    assert matcher.longest("sao jose") is None
+    assert VocabularyMatcher([]).longest("SAO JOSE") is None
+
+
+def test_matches_brute_force_on_random_vocabularies():
+    rng = random.Random(3)
+    for _ in range(200):
+        terms = {"".join(rng.choices("ABC ", k=rng.randint(1, 5))) for _ in range(rng.randint(1, 12))}
+        text = "".join(rng.choices("ABC ", k=rng.randint(0, 20)))
+        assert VocabularyMatcher(terms).longest(text) == _brute_force_longest(terms, text), (terms, text)
+
+
+def test_extractor_prefers_longest_learned_city():
+    """The learned-city lookup no longer depends on set iteration order."""
+    extractor = MerchantCityExtractor()
+    extractor.brazilian_cities = ["SAO JOSE", "SAO JOSE DOS CAMPOS"]
+    extractor.common_merchants = ["PADARIA", "PADARIA REAL"]
+    extractor.is_trained = True
+
+    assert extractor.extract_merchant_and_city("PADARIA REAL SAO JOSE DOS CAMPOS") == (
+        "Padaria Real",
+        "SAO JOSE DOS CAMPOS",
+    )
+    assert extractor.extract_merchant("PADARIA REAL 01") == "PADARIA REAL"
+
+    extractor.brazilian_cities = ["SAO JOSE"]
+    assert extractor.extract_city("PADARIA REAL SAO JOSE DOS CAMPOS") == "SAO JOSE"
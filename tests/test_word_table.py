@@ -0,0 +1,73 @@
+"""Tests for the NumPy word table and the row helpers built on it."""
+
+from src.core.word_table import WordTable
+from src.extractors.itau_patterns import ItauPatterns
+from src.utils.row_builder import cluster_words, rows_to_strings
+
+
+def _word(text, x0, top, x1=None, bottom=None):
+    return {
+        "text": text,
+        "x0": x0,
+        "x1": x0 + 20 if x1 is None else x1,
+        "top": top,
+        "bottom": top + 8 if bottom is None else bottom,
+    }
+
+
+WORDS = [
+    _word("12,50", 200.0, 101.5),
+    _word("28/09", 10.0, 100.0),
+    _word("FARMACIA", 50.0, 100.4),
+    _word("30/09", 10.0, 120.0),
+]
+
+
+class TestWordTable:
+    """Test row grouping and reductions."""
+
+    def test_group_rows_splits_on_top_gaps(self):
+        """Rows break where consecutive tops jump past the tolerance."""
+        table = WordTable.from_dicts(WORDS)
+        order, starts = table.group_rows(3.0)
+
+        assert table.row_texts(order, starts) == ["28/09 FARMACIA 12,50", "30/09"]
+        assert table.row_bboxes(order, starts).tolist() == [
+            [10.0, 100.0, 220.0, 109.5],
+            [10.0, 120.0, 30.0, 128.0],
+        ]
+
+    def test_normalised_ocr_keys(self):
+        """Textract/Azure-style left/y/width/height words are accepted."""
+        table = WordTable.from_dicts(
+            [{"text": "TOTAL", "left": 5.0, "y": 40.0, "width": 30.0, "height": 6.0}]
+        )
+
+        assert table.bbox() == (5.0, 40.0, 35.0, 46.0)
+
+    def test_empty_table(self):
+        table = WordTable.from_dicts([])
+
+        assert table.text() == ""
+        assert table.bbox() == (0, 0, 0, 0)
+
+
+def test_group_by_y_and_bbox():
+    rows = ItauPatterns.group_by_y(WORDS)
+
+    assert [[w["text"] for w in row] for row in rows] == [
+        ["28/09", "FARMACIA", "12,50"],
+        ["30/09"],
+    ]
+    assert ItauPatterns.calculate_bbox(rows[0]) == (10.0, 100.0, 220.0, 109.5)
+
+
+def test_cluster_words_leaves_input_untouched():
+    """Row clustering no longer writes a ``top`` key into OCR words."""
+    words = [{"text": "A", "x0": 1.0, "y": 10.0}, {"text": "B", "x0": 0.0, "y": 11.0}]
+
+    rows = cluster_words(words)
+
+    assert [[w["text"] for w in row] for row in rows] == [["B", "A"]]
+    assert all("top" not in word for word in words)
+    assert rows_to_strings(rows) == [{"text": "B A", "bbox": (0.0, 10.0, 1.0, 11.0)}]
@@ -83,8 +83,10 @@ for pdf_path in all_pdfs:
                 extractor._save_transactions_to_csv(result.transactions, csv_path)
             else:
                 # Fallback: write minimal CSV
+                from dataclasses import asdict
+
                 import pandas as pd
-                df = pd.DataFrame([t.__dict__ for t in result.transactions])
+                df = pd.DataFrame([asdict(t) for t in result.transactions])
                 df.to_csv(csv_path, index=False, sep=";")
             # Save TXT
             txt_path = get_output_path(name, "text", pdf_path)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark Learned City Lookup
+=============================
+
+Usage:
+    python tools/benchmark_city_lookup.py --cities 100 1000 5570 --descriptions 20000
+
+- Builds a synthetic vocabulary of --cities municipality-like names and
+  --descriptions statement descriptions, a third of which name a city.
+- "linear": the old lookup, ``city in description`` for every learned city.
+- "automaton": VocabularyMatcher.longest, as MerchantCityExtractor now does.
+- Checks that both find a city in the same descriptions.
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ml.vocabulary_matcher import VocabularyMatcher
+
+SYLLABLES = ["SAO", "SANTA", "RIO", "BOM", "JARDIM", "NOVA", "PORTO", "VILA", "ALTO", "CAMPO",
+             "LAGOA", "SERRA", "VERDE", "BRANCO", "ALEGRE", "GRANDE", "BELA", "VISTA", "DO", "DAS"]
+MERCHANTS = ["PADARIA SAO JOSE", "SUPERMERCADO EXTRA", "POSTO SHELL", "DROGA RAIA", "LOJAS AMERICANAS"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark linear vs automaton city lookup")
+    parser.add_argument('--cities', type=int, nargs='+', default=[100, 1_000, 5_570], help='Vocabulary sizes')
+    parser.add_argument('--descriptions', type=int, default=20_000, help='Descriptions looked up')
+    return parser.parse_args()
+
+
+def city_names(count, rng):
+    names = set()
+    while len(names) < count:
+        names.add(" ".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+    return sorted(names)
+
+
+def linear_lookup(cities, description):
+    """Reference: the lookup MerchantCityExtractor used before the automaton."""
+    for city in cities:
+        if city in description:
+            return city
+    return None
+
+
+def timed(func, rows):
+    start = time.perf_counter()
+    found = [func(row) for row in rows]
+    return time.perf_counter() - start, found
+
+
+def main():
+    args = parse_args()
+    print(f"{'cities':>8}{'build (s)':>11}{'linear (s)':>12}{'automaton (s)':>15}{'speedup':>10}")
+    for size in args.cities:
+        rng = random.Random(size)
+        cities = city_names(size, rng)
+        descriptions = [
+            f"{rng.choice(MERCHANTS)} {rng.choice(cities) if i % 3 == 0 else ''} {rng.randint(1, 99):02d}"
+            for i in range(args.descriptions)
+        ]
+
+        start = time.perf_counter()
+        matcher = VocabularyMatcher(cities)
+        build = time.perf_counter() - start
+
+        before, linear = timed(lambda d: linear_lookup(cities, d), descriptions)
+        after, automaton = timed(matcher.longest, descriptions)
+        assert [c is None for c in linear] == [c is None for c in automaton]
+        print(f"{size:>8}{build:>11.3f}{before:>12.3f}{after:>15.3f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark Fuzzy Clustering
+==========================
+
+Usage:
+    python tools/benchmark_cluster_fuzzy.py --rows 100000 --workers 4
+
+- Builds a synthetic multi-month ledger of --rows transactions in which
+  about a third are re-extracted duplicates (same date and amount,
+  slightly different description).
+- "before": the cluster-scanning merge_transactions, kept here as a
+  reference; it runs on the first --reference-rows only (quadratic).
+- "after": the bucketed cdist + union-find merge_transactions, at 1 and
+  --workers threads.
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.models import Transaction
+from src.merge.cluster_fuzzy import _similar, merge_transactions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark batched fuzzy clustering")
+    parser.add_argument('--rows', type=int, default=100_000, help='Transactions in the ledger')
+    parser.add_argument('--reference-rows', type=int, default=5_000, help='Rows for the reference')
+    parser.add_argument('--workers', type=int, default=4, help='cdist worker threads')
+    return parser.parse_args()
+
+
+def reference_merge(txns):
+    """Reference: scan every cluster's first row for each transaction."""
+    clusters = []
+    for tx in txns:
+        match = None
+        for cluster in clusters:
+            cand = cluster[0]
+            if (
+                cand.date == tx.date
+                and abs(cand.amount_brl - tx.amount_brl) < 0.01
+                and _similar(cand.description, tx.description)
+            ):
+                match = cluster
+                break
+        if match:
+            match.append(tx)
+        else:
+            clusters.append([tx])
+    return [max(cluster, key=lambda t: t.confidence_score) for cluster in clusters]
+
+
+def ledger(count, seed=3):
+    rng = random.Random(seed)
+    start = date(2023, 1, 1)
+    txns = []
+    while len(txns) < count:
+        tx = Transaction(start + timedelta(days=rng.randrange(730)),
+                         f"MERCHANT {rng.randrange(5000)} SAO PAULO",
+                         Decimal(rng.randrange(100, 50_000)) / 100,
+                         confidence_score=rng.random())
+        txns.append(tx)
+        if rng.random() < 0.5:
+            txns.append(Transaction(tx.date, tx.description + " BR", tx.amount_brl,
+                                    confidence_score=rng.random()))
+    rng.shuffle(txns)
+    return txns[:count]
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    args = parse_args()
+    txns = ledger(args.rows)
+    sample = txns[:args.reference_rows]
+
+    before, before_s = timed(reference_merge, sample)
+    after, after_s = timed(merge_transactions, sample)
+    print(f"{len(sample)} rows: before {before_s:.3f}s ({len(before)} rows kept), "
+          f"after {after_s:.3f}s ({len(after)} rows kept), same result: {before == after}")
+
+    for workers in (1, args.workers):
+        merged, seconds = timed(merge_transactions, txns, workers=workers)
+        print(f"{len(txns)} rows, workers={workers}: {seconds:.3f}s ({len(merged)} rows kept)")
+
+
+if __name__ == "__main__":
+    main()
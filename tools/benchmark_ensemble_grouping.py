@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark Ensemble Grouping
+===========================
+
+Usage:
+    python tools/benchmark_ensemble_grouping.py --sizes 300 600 1200 2400
+
+- Golden check: runs the local extractors (PyMuPDF, pdfplumber) on each
+  --pdf, feeds their outputs to the grouping step and checks the blocked
+  grouping equals the all-pairs reference.
+- Scaling: five synthetic extractor outputs of N transactions each (dates
+  and amounts jittered within tolerance). "before" is the all-pairs
+  reference, "after" EnsembleMerger._group_similar_transactions with the
+  blocking index. Time per transaction should stay flat for "after".
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.models import ExtractorType, PipelineResult, Transaction
+from src.extractors.registry import ExtractorRegistry
+from src.merger.ensemble_merger import EnsembleMerger
+
+EXTRACTORS = (
+    ExtractorType.PYMUPDF,
+    ExtractorType.PDFPLUMBER,
+    ExtractorType.CAMELOT,
+    ExtractorType.TEXTRACT,
+    ExtractorType.AZURE_DOC_INTELLIGENCE,
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark blocked ensemble grouping")
+    parser.add_argument('--pdf', nargs='*', default=['data/incoming/Itau_2024-10.pdf',
+                                                     'data/incoming/Itau_2025-05.pdf'],
+                        help='Statements for the golden check')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[300, 600, 1200, 2400],
+                        help='Transactions per extractor')
+    parser.add_argument('--reference-max', type=int, default=1200,
+                        help='Largest size to also time the all-pairs reference on')
+    return parser.parse_args()
+
+
+def reference_groups(merger, pipeline_results):
+    """Reference: the all-pairs grouping used before the blocking index."""
+    all_transactions = [
+        (t, result.pipeline_name, result.confidence_score)
+        for result in pipeline_results
+        for t in result.transactions
+    ]
+    groups, used = [], set()
+    for i, (trans_i, _, _) in enumerate(all_transactions):
+        if i in used:
+            continue
+        group = [all_transactions[i]]
+        used.add(i)
+        for j, (trans_j, _, _) in enumerate(all_transactions):
+            if j not in used and merger._transactions_similar(trans_i, trans_j):
+                group.append(all_transactions[j])
+                used.add(j)
+        groups.append(group)
+    return groups
+
+
+def synthetic_results(count, seed=1):
+    rng = random.Random(seed)
+    start = date(2024, 1, 1)
+    base = [
+        Transaction(start + timedelta(days=rng.randrange(30)), f"MERCHANT {rng.randrange(400)} SAO PAULO",
+                    Decimal(rng.randrange(100, 200_000)) / 100)
+        for _ in range(count)
+    ]
+    return [
+        PipelineResult(
+            [Transaction(t.date + timedelta(days=rng.choice([0, 0, 0, 1])),
+                         t.description + rng.choice(["", " BR"]),
+                         t.amount_brl + Decimal(rng.choice(["0", "0", "0.01"])))
+             for t in base],
+            0.8, extractor, 1.0,
+        )
+        for extractor in EXTRACTORS
+    ]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def golden_check(merger, pdfs):
+    registry = ExtractorRegistry([ExtractorType.PYMUPDF, ExtractorType.PDFPLUMBER])
+    for pdf in map(Path, pdfs):
+        if not pdf.exists():
+            print(f"{pdf}: missing, skipped")
+            continue
+        results = [extractor.extract(pdf) for _, extractor in registry.items()]
+        results = [r for r in results if r.transactions]
+        blocked = merger._group_similar_transactions(results)
+        same = blocked == reference_groups(merger, results)
+        rows = sum(len(r.transactions) for r in results)
+        print(f"{pdf.name}: {rows} rows from {len(results)} extractors -> "
+              f"{len(blocked)} groups, identical to reference: {same}")
+
+
+def main():
+    args = parse_args()
+    merger = EnsembleMerger.__new__(EnsembleMerger)  # skip extractor/model setup
+
+    golden_check(merger, args.pdf)
+
+    print(f"\n{'rows/extractor':>15}{'before (s)':>12}{'after (s)':>12}{'after us/row':>14}")
+    for size in args.sizes:
+        results = synthetic_results(size)
+        after, after_s = timed(merger._group_similar_transactions, results)
+        per_row = after_s / (size * len(EXTRACTORS)) * 1e6
+        if size <= args.reference_max:
+            before, before_s = timed(reference_groups, merger, results)
+            assert before == after, "blocked grouping differs from the reference"
+            print(f"{size:>15}{before_s:>12.3f}{after_s:>12.3f}{per_row:>14.1f}")
+        else:
+            print(f"{size:>15}{'-':>12}{after_s:>12.3f}{per_row:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
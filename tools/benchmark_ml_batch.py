@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark ML Batch Inference
+============================
+
+Usage:
+    python tools/benchmark_ml_batch.py --sizes 10 1000 100000
+
+- Builds synthetic statement descriptions (and FX rows) of each --sizes.
+- "per-row": predict_single / extract_merchant_and_city once per row, the
+  way MLEnricher used to call the models. At large sizes it runs on the
+  first --row-cap rows and the time is scaled up (marked with ~).
+- "batch": predict_batch / extract_batch over all rows in one call.
+- The category model is models/category_classifier.joblib when present,
+  otherwise a small classifier trained on the synthetic descriptions.
+"""
+import argparse
+import contextlib
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+from src.ml.models.category_classifier import CategoryClassifier
+from src.ml.models.fx_predictor import FXRatePredictor
+from src.ml.models.merchant_extractor import MerchantCityExtractor
+
+MERCHANTS = [
+    ("PADARIA SAO JOSE", "ALIMENTACAO"),
+    ("SUPERMERCADO EXTRA", "ALIMENTACAO"),
+    ("POSTO SHELL", "VEICULOS"),
+    ("AUTO POSTO IPIRANGA", "VEICULOS"),
+    ("DROGARIA SAO PAULO", "SAUDE"),
+    ("DROGA RAIA", "SAUDE"),
+    ("NETFLIX.COM", "LAZER"),
+    ("CINEMARK", "LAZER"),
+]
+CITIES = ["SAO PAULO", "RIO DE JANEIRO", "CURITIBA", "Campinas SP", ""]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark per-row vs batch ML inference")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1_000, 100_000], help='Row counts')
+    parser.add_argument('--row-cap', type=int, default=1_000, help='Most rows timed per-row')
+    parser.add_argument('--models-dir', type=Path, default=Path('models'), help='Trained models')
+    return parser.parse_args()
+
+
+def descriptions(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(MERCHANTS)[0]} {rng.choice(CITIES)} {rng.randint(1, 99):02d}".strip()
+        for _ in range(count)
+    ]
+
+
+def category_classifier(models_dir):
+    classifier = CategoryClassifier()
+    model_path = models_dir / "category_classifier.joblib"
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            classifier.load_model(model_path)
+            return classifier, str(model_path)
+        except Exception:
+            names, categories = zip(*MERCHANTS)
+            classifier.train(
+                pd.DataFrame({
+                    'description_text': list(names) * 5,
+                    'target_category': list(categories) * 5,
+                })
+            )
+            return classifier, "synthetic classifier"
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def per_row_seconds(func, rows, cap):
+    """Time ``func`` on each of the first ``cap`` rows, scaled to all rows."""
+    sample = rows[:cap]
+    seconds = timed(lambda: [func(row) for row in sample])
+    return seconds * len(rows) / len(sample), len(sample) < len(rows)
+
+
+def main():
+    args = parse_args()
+    classifier, source = category_classifier(args.models_dir)
+    merchants = MerchantCityExtractor()
+    fx = FXRatePredictor()
+    print(f"Category model: {source}; FX predictor: {'trained' if fx.is_trained else 'fallback'}\n")
+
+    print(f"{'model':<10}{'rows':>9}{'per-row (s)':>14}{'batch (s)':>12}{'speedup':>10}")
+    for size in args.sizes:
+        texts = descriptions(size)
+        rng = random.Random(size)
+        fx_rows = [
+            (round(rng.uniform(10, 500), 2), round(rng.uniform(1, 100), 2), rng.choice(['USD', 'EUR']), text)
+            for text in texts
+        ]
+        fx_columns = [list(column) for column in zip(*fx_rows)]
+
+        cases = (
+            ('category', classifier.predict_single, texts,
+             lambda: classifier.predict_batch(texts)),
+            ('merchant', merchants.extract_merchant_and_city, texts,
+             lambda: merchants.extract_batch(texts)),
+            ('fx', lambda row: fx.predict_single(*row), fx_rows,
+             lambda: fx.predict_batch(*fx_columns)),
+        )
+        for name, single, rows, batch in cases:
+            before, scaled = per_row_seconds(single, rows, args.row_cap)
+            after = timed(batch)
+            mark = '~' if scaled else ' '
+            print(f"{name:<10}{size:>9}{mark:>3}{before:>11.3f}{after:>12.3f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
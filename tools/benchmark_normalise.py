@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark Normalise
+===================
+
+Usage:
+    python tools/benchmark_normalise.py --rows 500000
+
+- Builds a column of --rows Brazilian amounts ("-1.234,56") and DD/MM dates.
+- "scalar": parse_amount / parse_date in a Python loop.
+- "batch": parse_amounts / parse_dates over the whole column.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pyarrow as pa
+
+from src.core.normalise import (
+    StatementPeriod,
+    parse_amount,
+    parse_amounts,
+    parse_date,
+    parse_dates,
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs batch parsing")
+    parser.add_argument('--rows', type=int, default=500_000, help='Values per column')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes (best is reported)')
+    return parser.parse_args()
+
+
+def best_seconds(repeat, func):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    args = parse_args()
+    amounts = [f"{'-' if i % 9 == 0 else ''}{i % 4000:,}.{i % 100:02d}".translate(str.maketrans(",.", ".,"))
+               for i in range(args.rows)]
+    dates = [f"{i % 28 + 1:02d}/{i % 12 + 1:02d}" for i in range(args.rows)]
+    period = StatementPeriod(2024, 10)
+    amount_column, date_column = pa.array(amounts), pa.array(dates)
+    print(f"Rows: {args.rows}, best of {args.repeat} passes\n")
+
+    stages = (
+        ('amounts', lambda: [parse_amount(a) for a in amounts], lambda: parse_amounts(amount_column)),
+        ('dates', lambda: [parse_date(d, period) for d in dates], lambda: parse_dates(date_column, period)),
+    )
+    print(f"{'column':<12}{'scalar (s)':>12}{'batch (s)':>12}{'speedup':>9}")
+    for name, scalar, batch in stages:
+        before = best_seconds(args.repeat, scalar)
+        after = best_seconds(args.repeat, batch)
+        print(f"{name:<12}{before:>12.3f}{after:>12.3f}{before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark Page-Parallel pdfplumber Extraction
+=============================================
+
+Usage:
+    python tools/benchmark_page_parallel.py --pdf-dir data/raw_unlabelled --workers 4
+
+- Extracts per-page text from every PDF serially and with a process pool.
+- Verifies the parallel output is identical to the serial output.
+- Prints per-file timings and the overall speedup.
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.document_session import DocumentSession
+from src.extractors.page_parallel import extract_page_texts
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark page-parallel pdfplumber extraction")
+    parser.add_argument('--pdf-dir', default='data/raw_unlabelled', help='Directory of PDFs to benchmark')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Worker processes')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per file (best time is kept)')
+    return parser.parse_args()
+
+
+def serial_texts(pdf_path):
+    return DocumentSession.from_path(pdf_path).page_texts()
+
+
+def parallel_texts(pdf_path, workers):
+    page_count = DocumentSession.from_path(pdf_path).page_count
+    return extract_page_texts(pdf_path, page_count, workers)
+
+
+def best_of(repeat, func, *args):
+    best, output = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, output
+
+
+def main():
+    args = parse_args()
+    pdfs = sorted(Path(args.pdf_dir).glob('*.pdf'))
+    if not pdfs:
+        print(f"No PDFs found in {args.pdf_dir}")
+        sys.exit(1)
+
+    print(f"Benchmarking {len(pdfs)} PDFs with {args.workers} workers (cpu_count={os.cpu_count()})")
+    print(f"{'file':<24}{'pages':>6}{'serial s':>10}{'parallel s':>12}{'speedup':>9}  identical")
+
+    total_serial = total_parallel = 0.0
+    for pdf_path in pdfs:
+        serial_time, serial = best_of(args.repeat, serial_texts, pdf_path)
+        parallel_time, parallel = best_of(args.repeat, parallel_texts, pdf_path, args.workers)
+        total_serial += serial_time
+        total_parallel += parallel_time
+        print(
+            f"{pdf_path.name:<24}{len(serial):>6}{serial_time:>10.3f}{parallel_time:>12.3f}"
+            f"{serial_time / parallel_time:>8.2f}x  {serial == parallel}"
+        )
+
+    print(f"\nTotal: serial {total_serial:.3f}s, parallel {total_parallel:.3f}s, "
+          f"speedup {total_serial / total_parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
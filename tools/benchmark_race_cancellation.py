@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark Race Cancellation
+===========================
+
+Usage:
+    python tools/benchmark_race_cancellation.py --extractors pymupdf pdfplumber
+
+- Races the given extractors on each --pdf, plus the first one repeated
+  --long times (a long statement, where losers have the most left to do),
+  with the result cache off and a fresh document session per run.
+- "before": the race loop that only cancelled the asyncio tasks, kept here
+  as a reference; losing extractors run to completion on their threads.
+- "after": EnsembleMerger._run_race_extraction with cancellation tokens.
+- Reports wall time until asyncio.run returns (it joins the executor
+  threads) and the process CPU time spent, i.e. including the losers.
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.document_session import clear_document_sessions
+from src.core.models import ExtractorType
+from src.merger.ensemble_merger import EnsembleMerger
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark cancellable race mode")
+    parser.add_argument('--pdf', nargs='*', default=['data/incoming/Itau_2024-10.pdf',
+                                                     'data/incoming/Itau_2025-05.pdf'],
+                        help='Statements to race on')
+    parser.add_argument('--extractors', nargs='+', default=['pymupdf', 'pdfplumber'],
+                        help='Extractor types to race (ExtractorType values)')
+    parser.add_argument('--long', type=int, default=10,
+                        help='Copies of the first --pdf in the long statement (0: none)')
+    parser.add_argument('--threshold', type=float, default=0.5, help='Race confidence threshold')
+    return parser.parse_args()
+
+
+async def reference_race(merger, pdf_path, extractor_types, confidence_threshold):
+    """Reference: cancel the asyncio tasks only; the threads keep running."""
+    tasks = [
+        asyncio.create_task(merger._run_single_extractor(extractor_type, pdf_path))
+        for extractor_type in extractor_types
+        if extractor_type in merger.extractors
+    ]
+    results, remaining = [], set(tasks)
+    while remaining:
+        done, remaining = await asyncio.wait(remaining, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            result = task.result()
+            results.append(result)
+            if result.success and result.confidence_score >= confidence_threshold:
+                for pending in remaining:
+                    pending.cancel()
+                await asyncio.gather(*remaining, return_exceptions=True)
+                return results, []
+    return results, []
+
+
+def long_statement(pdf_path, copies):
+    import pymupdf
+
+    source = pymupdf.open(pdf_path)
+    target = pymupdf.open()
+    for _ in range(copies):
+        target.insert_pdf(source)
+    path = Path(tempfile.mkdtemp()) / f"{pdf_path.stem}_x{copies}.pdf"
+    target.save(path)
+    return path
+
+
+def run(race, merger, pdf_path, extractor_types, threshold):
+    clear_document_sessions()
+    wall, cpu = time.perf_counter(), time.process_time()
+    results, cancelled = asyncio.run(race(pdf_path, extractor_types, threshold))
+    return results, cancelled, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def main():
+    args = parse_args()
+    extractor_types = [ExtractorType(value) for value in args.extractors]
+    merger = EnsembleMerger(use_cache=False)
+
+    def before(*race_args):
+        return reference_race(merger, *race_args)
+
+    pdfs = [Path(pdf) for pdf in args.pdf]
+    if args.long and pdfs and pdfs[0].exists():
+        pdfs.append(long_statement(pdfs[0], args.long))
+
+    print(f"{'pdf':<22}{'mode':<8}{'winner':<12}{'wall (s)':>10}{'cpu (s)':>10}  losers")
+    for pdf in pdfs:
+        if not pdf.exists():
+            print(f"{pdf}: missing, skipped")
+            continue
+        for mode, race in (('before', before), ('after', merger._run_race_extraction)):
+            results, cancelled, wall, cpu = run(race, merger, pdf, extractor_types, args.threshold)
+            winner = results[-1].pipeline_name.value if results else '-'
+            losers = ", ".join(
+                f"{c.pipeline_name.value} {c.cpu_seconds:.2f}s cpu, stopped in {c.stop_latency_ms:.0f} ms"
+                for c in cancelled
+            )
+            print(f"{pdf.name:<22}{mode:<8}{winner:<12}{wall:>10.2f}{cpu:>10.2f}  {losers}")
+
+
+if __name__ == "__main__":
+    main()
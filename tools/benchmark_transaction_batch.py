@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark Transaction Batch
+===========================
+
+Usage:
+    python tools/benchmark_transaction_batch.py --rows 200000
+
+- Builds a synthetic multi-cardholder ledger of --rows transactions.
+- "rows": the list[Transaction] stages (per-row IOF and metadata enrichment,
+  completeness scoring, the full enrichment pipeline with the models in
+  models/, semantic comparison against itself, golden CSV). The row comparison
+  is quadratic, so it runs on the first --compare-rows.
+- "batch": the same stages on a TransactionBatch that already exists.
+- "batch+conv": the batch stage plus building the batch from the rows and,
+  for stages that return transactions, converting them back. This is what
+  a caller holding list[Transaction] pays; the speedup is against it.
+"""
+import argparse
+import asyncio
+import copy
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.models import EnsembleResult, ExtractorType, Transaction
+from src.core.transaction_batch import TransactionBatch
+from src.enrichment.iof_calculator import IOFCalculator
+from src.enrichment.metadata_enricher import MetadataEnricher
+from src.enrichment.pipeline import EnrichmentPipeline
+from src.utils.csv_helpers import write_golden_csv
+from src.validators.semantic_compare import SemanticComparator
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the columnar TransactionBatch")
+    parser.add_argument('--rows', type=int, default=200_000, help='Transactions in the ledger')
+    parser.add_argument('--compare-rows', type=int, default=5_000, help='Rows for the comparison stage')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes (best is reported)')
+    return parser.parse_args()
+
+
+def ledger(count):
+    start = date(2024, 1, 1)
+    return [
+        Transaction(
+            start + timedelta(days=i % 365),
+            f"MERCHANT {i % 997} SAO PAULO",
+            Decimal(i % 50_000 - 1_000) / 100,
+            card_last4=f"{i % 40:04d}",
+            currency_orig="USD" if i % 7 == 0 else "",
+            amount_orig=Decimal(i % 900) / 100 if i % 7 == 0 else Decimal("0.00"),
+            fx_rate=Decimal("5.4321") if i % 7 == 0 else Decimal("0.00"),
+            source_extractor=ExtractorType.PDFPLUMBER,
+        )
+        for i in range(count)
+    ]
+
+
+def best_seconds(repeat, func, make_input):
+    best = float('inf')
+    for _ in range(repeat):
+        data = make_input()
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    args = parse_args()
+    transactions = ledger(args.rows)
+    batch = TransactionBatch.from_transactions(transactions)
+    pipeline = EnrichmentPipeline.__new__(EnrichmentPipeline)  # skip model loading
+    full_pipeline = EnrichmentPipeline()  # with the models in models/, if any
+    iof, metadata = IOFCalculator(), MetadataEnricher()
+    comparator = SemanticComparator()
+    sample = transactions[:args.compare_rows]
+    sample_batch = TransactionBatch.from_transactions(sample)
+    out = Path(tempfile.mkdtemp()) / "golden.csv"
+    print(f"Rows: {args.rows}, best of {args.repeat} passes\n")
+
+    def enrich_rows(rows):
+        for t in rows:
+            iof.enrich_transaction(t)
+            metadata.enrich_transaction(t)
+        pipeline._enrichment_completeness(rows)
+
+    def enrich_batch(data):
+        pipeline._batch_completeness(metadata.enrich_batch(iof.enrich_batch(data)))
+
+    def pipeline_rows(rows):
+        result = EnsembleResult(rows, [], 0.5, [], "benchmark", 0)
+        asyncio.run(full_pipeline.enrich_extraction_result(result))
+
+    def pipeline_batch(data):
+        return asyncio.run(full_pipeline.enrich_batch(data))
+
+    # (name, rows, batch, mutates rows, batch returns transactions)
+    stages = (
+        ('enrich + completeness', enrich_rows, enrich_batch, True, True),
+        ('enrichment pipeline', pipeline_rows, pipeline_batch, True, True),
+        ('semantic compare', lambda _: comparator.compare_transactions(sample, sample),
+         lambda _: comparator.compare_batches(sample_batch, sample_batch), False, False),
+        ('golden CSV', lambda rows: write_golden_csv(rows, out),
+         lambda data: write_golden_csv(data, out), False, False),
+    )
+
+    print(f"{'stage':<24}{'rows (s)':>12}{'batch (s)':>12}{'batch+conv (s)':>16}{'speedup':>9}")
+    to_batch = best_seconds(args.repeat, TransactionBatch.from_transactions, lambda: transactions)
+    to_rows = best_seconds(args.repeat, TransactionBatch.to_transactions, lambda: batch)
+    for name, rows_func, batch_func, mutates, returns_rows in stages:
+        make_rows = (lambda: copy.deepcopy(transactions)) if mutates else (lambda: transactions)
+        before = best_seconds(args.repeat, rows_func, make_rows)
+        after = best_seconds(args.repeat, batch_func, lambda: batch)
+        # The comparison stage converts only its --compare-rows sample
+        scale = args.compare_rows / args.rows if name == 'semantic compare' else 1
+        converted = after + scale * (2 * to_batch if name == 'semantic compare' else to_batch)
+        if returns_rows:
+            converted += to_rows
+        print(f"{name:<24}{before:>12.3f}{after:>12.3f}{converted:>16.3f}{before / converted:>8.1f}x")
+
+    print(f"\nlist -> batch {to_batch:.3f}s, batch -> list {to_rows:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
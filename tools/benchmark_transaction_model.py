@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark Transaction Model
+===========================
+
+Usage:
+    python tools/benchmark_transaction_model.py --rows 100000
+
+- Builds a synthetic ledger of --rows transactions with Decimal amounts, as
+  the extractors do after parsing.
+- "before": the previous plain dataclass, kept here as a reference, whose
+  __post_init__ re-coerced seven money fields and hashed every row.
+- "after": the slotted Transaction, with the ledger hash computed lazily.
+- Reports objects/sec for construction, construction + reading every hash,
+  and bytes/object (tracemalloc) for the whole ledger.
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.models import ExtractorType, Transaction, TransactionType
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the Transaction model")
+    parser.add_argument('--rows', type=int, default=100_000, help='Transactions in the ledger')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes (best is reported)')
+    return parser.parse_args()
+
+
+@dataclass
+class ReferenceTransaction:
+    """Reference: the Transaction dataclass before slots and lazy hashing."""
+
+    date: date
+    description: str
+    amount_brl: Decimal
+    card_last4: str = "0000"
+    installment_seq: int = 0
+    installment_tot: int = 0
+    fx_rate: Decimal = Decimal("0.00")
+    iof_brl: Decimal = Decimal("0.00")
+    category: str = "DIVERSOS"
+    merchant_city: str = ""
+    ledger_hash: str = ""
+    prev_bill_amount: Decimal = Decimal("0.00")
+    interest_amount: Decimal = Decimal("0.00")
+    amount_orig: Decimal = Decimal("0.00")
+    currency_orig: str = ""
+    amount_usd: Decimal = Decimal("0.00")
+    transaction_type: TransactionType = TransactionType.DOMESTIC
+    confidence_score: float = 1.0
+    bbox: tuple[float, float, float, float] | None = None
+    card_last4: str | None = None
+    source_extractor: ExtractorType | None = None
+    raw_text: str | None = None
+
+    def __post_init__(self):
+        if not isinstance(self.amount_brl, Decimal):
+            self.amount_brl = Decimal(str(self.amount_brl))
+        if not isinstance(self.fx_rate, Decimal):
+            self.fx_rate = Decimal(str(self.fx_rate))
+        if not isinstance(self.iof_brl, Decimal):
+            self.iof_brl = Decimal(str(self.iof_brl))
+        if not isinstance(self.prev_bill_amount, Decimal):
+            self.prev_bill_amount = Decimal(str(self.prev_bill_amount))
+        if not isinstance(self.interest_amount, Decimal):
+            self.interest_amount = Decimal(str(self.interest_amount))
+        if not isinstance(self.amount_orig, Decimal):
+            self.amount_orig = Decimal(str(self.amount_orig))
+        if not isinstance(self.amount_usd, Decimal):
+            self.amount_usd = Decimal(str(self.amount_usd))
+
+        if not self.ledger_hash:
+            from src.core.patterns import generate_ledger_hash
+            self.ledger_hash = generate_ledger_hash(
+                self.date.isoformat(), self.description, self.amount_brl
+            )
+
+        if self.currency_orig == "USD" and self.amount_orig > 0:
+            self.amount_usd = self.amount_orig
+
+
+def ledger_rows(count):
+    start = date(2024, 1, 1)
+    return [
+        (start + timedelta(days=i % 365), f"MERCHANT {i % 997} SAO PAULO", Decimal(i % 50_000) / 100)
+        for i in range(count)
+    ]
+
+
+def build(cls, rows):
+    return [
+        cls(day, description, amount, category="DIVERSOS", source_extractor=ExtractorType.PDFPLUMBER)
+        for day, description, amount in rows
+    ]
+
+
+def build_and_hash(cls, rows):
+    ledger = build(cls, rows)
+    for t in ledger:
+        t.ledger_hash
+    return ledger
+
+
+def best_seconds(repeat, func, *args):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bytes_per_object(cls, rows):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    ledger = build(cls, rows)
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return size / len(ledger)
+
+
+def main():
+    args = parse_args()
+    rows = ledger_rows(args.rows)
+    print(f"Rows: {args.rows}, best of {args.repeat} passes\n")
+
+    header = f"{'measure':<28}{'before':>14}{'after':>14}{'ratio':>8}"
+    print(header)
+    for name, func in (('construct (obj/s)', build), ('construct + hash (obj/s)', build_and_hash)):
+        before = args.rows / best_seconds(args.repeat, func, ReferenceTransaction, rows)
+        after = args.rows / best_seconds(args.repeat, func, Transaction, rows)
+        print(f"{name:<28}{before:>14,.0f}{after:>14,.0f}{after / before:>7.2f}x")
+
+    before = bytes_per_object(ReferenceTransaction, rows)
+    after = bytes_per_object(Transaction, rows)
+    print(f"{'memory (bytes/obj)':<28}{before:>14,.0f}{after:>14,.0f}{after / before:>7.2f}x")
+
+    same = all(
+        a.ledger_hash == b.ledger_hash
+        for a, b in zip(build(ReferenceTransaction, rows[:1000]), build(Transaction, rows[:1000]))
+    )
+    print(f"\nLedger hashes match: {same}")
+
+
+if __name__ == "__main__":
+    main()
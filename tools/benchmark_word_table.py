@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark Vectorised Row Clustering
+===================================
+
+Usage:
+    python tools/benchmark_word_table.py --pdf data/incoming/Itau_2024-10.pdf --pages 50
+
+- Loads pdfplumber word dicts from --pdf and cycles its pages up to --pages
+  (a 50-page statement by default).
+- "before": the per-word Python versions of group_by_y/calculate_bbox and
+  cluster_words/rows_to_strings, kept here as references.
+- "after": the same steps backed by WordTable (row boxes come from one
+  reduceat per column instead of a min/max per row).
+- Checks both produce the same rows, texts and boxes and prints ms per pass.
+"""
+import argparse
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.document_session import DocumentSession
+from src.core.word_table import WordTable
+from src.extractors.itau_patterns import ItauPatterns
+from src.utils.row_builder import cluster_words, rows_to_strings
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark vectorised row clustering")
+    parser.add_argument('--pdf', default='data/incoming/Itau_2024-10.pdf', help='Statement to read words from')
+    parser.add_argument('--pages', type=int, default=50, help='Pages in the synthetic statement')
+    parser.add_argument('--repeat', type=int, default=10, help='Passes over the pages')
+    return parser.parse_args()
+
+
+def load_pages(pdf_path, pages):
+    session = DocumentSession.from_path(pdf_path)
+    source = [session.words(i) for i in range(session.page_count)]
+    return [[dict(word) for word in source[i % len(source)]] for i in range(pages)]
+
+
+def reference_group_by_y(words, tolerance=3.0):
+    """Reference: the sort-and-walk ItauPatterns.group_by_y used to do."""
+    if not words:
+        return []
+    sorted_words = sorted(words, key=lambda w: w.get('top', w.get('y0', 0)))
+    rows = []
+    current_row = [sorted_words[0]]
+    current_y = sorted_words[0].get('top', sorted_words[0].get('y0', 0))
+    for word in sorted_words[1:]:
+        word_y = word.get('top', word.get('y0', 0))
+        if abs(word_y - current_y) <= tolerance:
+            current_row.append(word)
+        else:
+            current_row.sort(key=lambda w: w.get('x0', w.get('left', 0)))
+            rows.append(current_row)
+            current_row = [word]
+            current_y = word_y
+    current_row.sort(key=lambda w: w.get('x0', w.get('left', 0)))
+    rows.append(current_row)
+    return rows
+
+
+def reference_calculate_bbox(words):
+    x0s = [w.get('x0', w.get('left', 0)) for w in words]
+    y0s = [w.get('top', w.get('y0', 0)) for w in words]
+    x1s = [w.get('x1', w.get('right', 0)) for w in words]
+    y1s = [w.get('bottom', w.get('y1', 0)) for w in words]
+    return (min(x0s), min(y0s), max(x1s), max(y1s))
+
+
+def reference_cluster_words(words, y_tol=2.0):
+    """Reference: the bucket-rounding cluster_words used to do."""
+    buckets = defaultdict(list)
+    for w in words:
+        buckets[int(round(w["top"] / y_tol))].append(w)
+    return [sorted(group, key=lambda o: o["x0"]) for _, group in sorted(buckets.items())]
+
+
+def reference_rows_to_strings(rows):
+    results = []
+    for row in rows:
+        text = " ".join(w["text"] for w in row).strip()
+        bbox = (
+            min(w["x0"] for w in row),
+            min(w["top"] for w in row),
+            max(w.get("x1", w["x0"] + w.get("width", 0)) for w in row),
+            max(w.get("bottom", w["top"] + w.get("height", 0)) for w in row),
+        )
+        results.append({"text": text, "bbox": bbox})
+    return results
+
+
+def group_before(page):
+    return reference_group_by_y(page)
+
+
+def group_after(page):
+    return ItauPatterns.group_by_y(page)
+
+
+def boxes_before(page):
+    return [reference_calculate_bbox(row) for row in reference_group_by_y(page)]
+
+
+def boxes_after(page):
+    table = WordTable.from_dicts(page)
+    return [tuple(box) for box in table.row_bboxes(*table.group_rows()).tolist()]
+
+
+def row_builder_before(page):
+    return reference_rows_to_strings(reference_cluster_words(page))
+
+
+def row_builder_after(page):
+    return rows_to_strings(cluster_words(page))
+
+
+def best_ms(repeat, func, pages):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            func(page)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    args = parse_args()
+    pages = load_pages(args.pdf, args.pages)
+    words = sum(len(page) for page in pages)
+    print(f"Pages: {len(pages)}, words: {words}, best of {args.repeat} passes\n")
+
+    # Row membership may differ only where a chain of close tops spans more
+    # than the tolerance (anchor vs. chain split) or straddles a bucket edge
+    pairs = (
+        ('group_by_y', group_before, group_after),
+        ('group_by_y + box per row', boxes_before, boxes_after),
+        ('cluster_words + rows_to_strings', row_builder_before, row_builder_after),
+    )
+    print(f"{'step':<34}{'before ms':>10}{'after ms':>10}{'speedup':>9}{'same pages':>12}")
+    for name, before, after in pairs:
+        same = sum(before(page) == after(page) for page in pages)
+        before_ms = best_ms(args.repeat, before, pages)
+        after_ms = best_ms(args.repeat, after, pages)
+        print(f"{name:<34}{before_ms:>10.1f}{after_ms:>10.1f}"
+              f"{before_ms / after_ms:>8.2f}x{same:>7}/{len(pages)}")
+
+
+if __name__ == "__main__":
+    main()
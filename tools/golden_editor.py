@@ -123,11 +123,17 @@ def style_dataframe_by_confidence(df: pd.DataFrame) -> pd.DataFrame:
 
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes
-def run_extraction(pdf_path: str) -> dict[str, Any]:
-    """Run extraction and cache results."""
+def run_extraction(pdf_path: str, _on_provisional=None) -> dict[str, Any]:
+    """Run extraction and cache results.
+
+    ``_on_provisional`` (not part of the cache key) receives each
+    provisional merge while slower extractors are still running.
+    """
     try:
         merger = EnsembleMerger()
-        result = asyncio.run(merger.extract_with_ensemble(Path(pdf_path)))
+        result = asyncio.run(
+            merger.extract_with_ensemble(Path(pdf_path), on_provisional=_on_provisional)
+        )
 
         return {
             "success": True,
@@ -197,7 +203,17 @@ def main():
     # Extract button
     if st.sidebar.button("🚀 Extract Transactions", type="primary"):
         with st.spinner("Extracting transactions..."):
-            result = run_extraction(str(selected_pdf_path))
+            progress = st.empty()
+
+            def show_provisional(provisional):
+                pipelines = ", ".join(p.value for p in provisional.contributing_pipelines)
+                progress.info(
+                    f"{len(provisional.final_transactions)} transactions so far "
+                    f"from {pipelines}; refining..."
+                )
+
+            result = run_extraction(str(selected_pdf_path), show_provisional)
+            progress.empty()
             st.session_state.extraction_result = result
 
             if result["success"]:
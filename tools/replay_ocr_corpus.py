@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Re-run Cloud OCR Parsers over Recorded Responses
+================================================
+
+Usage:
+    # once, with credentials: capture raw responses
+    python tools/replay_ocr_corpus.py --pdf-dir data/incoming --mode record
+    # afterwards, offline: re-evaluate parser changes in seconds
+    python tools/replay_ocr_corpus.py --pdf-dir data/incoming
+
+- Runs the selected cloud extractors over every PDF in --pdf-dir through the
+  OCR recorder (replay by default: no network, no cost).
+- Prints transactions, total BRL and parse time per PDF and extractor.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.artifact_sink import configure_artifact_sink
+from src.core.ocr_recorder import set_ocr_recorder_mode
+
+EXTRACTORS = ('textract', 'azure', 'google')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Re-run cloud OCR parsers over recorded responses")
+    parser.add_argument('--pdf-dir', default='data/incoming', help='Directory of PDFs')
+    parser.add_argument('--mode', default='replay', choices=['replay', 'record'], help='Recorder mode')
+    parser.add_argument('--extractors', default=','.join(EXTRACTORS), help='Comma-separated subset of: ' + ', '.join(EXTRACTORS))
+    return parser.parse_args()
+
+
+def build_extractors(names):
+    extractors = {}
+    for name in names:
+        try:
+            if name == 'textract':
+                from src.extractors.textract_extractor import TextractExtractor
+                extractors[name] = TextractExtractor()
+            elif name == 'azure':
+                from src.extractors.azure_extractor import AzureDocIntelligenceExtractor
+                extractors[name] = AzureDocIntelligenceExtractor()
+            elif name == 'google':
+                from src.extractors.google_extractor import GoogleDocumentAIExtractor
+                extractors[name] = GoogleDocumentAIExtractor()
+        except (ImportError, ValueError) as e:
+            print(f"⚠️  Skipping {name}: {e}")
+    return extractors
+
+
+def main():
+    args = parse_args()
+    set_ocr_recorder_mode(args.mode)
+    # Keep the run read-only: no per-extractor output files
+    configure_artifact_sink(enabled=False)
+    extractors = build_extractors([n.strip() for n in args.extractors.split(',') if n.strip()])
+    pdfs = sorted(Path(args.pdf_dir).glob('*.pdf'))
+    if not extractors or not pdfs:
+        print("Nothing to run")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    print(f"{'PDF':<24}{'extractor':<10}{'txns':>6}{'total BRL':>14}{'ms':>9}  note")
+    for pdf_path in pdfs:
+        for name, extractor in extractors.items():
+            result = extractor.extract(pdf_path)
+            note = result.error_message or ''
+            if 'No recorded' in note:
+                note = 'not recorded'
+            total = sum(t.amount_brl for t in result.transactions)
+            print(f"{pdf_path.name:<24}{name:<10}{len(result.transactions):>6}{total:>14,.2f}"
+                  f"{result.processing_time_ms:>9.1f}  {note[:60]}")
+    print(f"\nDone in {time.perf_counter() - start:.2f}s ({args.mode})")
+
+
+if __name__ == "__main__":
+    main()